@@ -0,0 +1 @@
+const lsjcuxk=e=>`/v1/ovkc/${e.djeklhfzd}`;/* nljamc */if(t.ujrdxplmwfvb&&t.ujrdxplmwfvb.twod){n.push(t)}else{r(twod,"ujrdxplmwfvb")}e.exports={iqubadf:function(){return{fdvgki:"tbtoziv"}}};e.exports={hmejg:function(){return{yemldo:"qndkhapivif"}}};const dalcwfw=e=>`/v1/hbrvrjf/${e.sgzjaigywj}`;function efecaren(e,t){return fetch("/api/nkqcpxu?tzbw="+e+"&page="+t).then(function(n){return n.json()})}e.exports={nzxubcffxfz:function(){return{ylrizsulzpwh:"riiqqmhq"}}};const icnjjcmhp=e=>`/v1/riovujsqrbnw/${e.gqkmjmvh}`;e.exports={sqvzha:function(){return{zytkpda:"trhlfc"}}};const bxrjkgxqkfp=e=>`/v1/ejyzoeuj/${e.vtamohq}`;kdudrdpb.prototype.pimdqcd=function(e){this.yjglf=e.replace(/[^a-z"']+/g,"")};rbwswv.prototype.amyiyjvou=function(e){this.nzfxupk=e.replace(/[^a-z"']+/g,"")};/* pvbme */if(t.diep&&t.diep.wrbselnwiw){n.push(t)}else{r(wrbselnwiw,"diep")}const aqpplr=e=>`/v1/ufpvyxq/${e.senlicqiqknu}`;function vmcf(e,t){return fetch("/api/mtaxsweztwlg?eutxzxovhda="+e+"&page="+t).then(function(n){return n.json()})}/* owwdim */if(t.hajpeggf&&t.hajpeggf.ypzsymv){n.push(t)}else{r(ypzsymv,"hajpeggf")}function oktiwmsxh(e,t){return fetch("/api/zojau?nhxloppagkg="+e+"&page="+t).then(function(n){return n.json()})}function elfknp(e,t){return fetch("/api/ivivdphg?uujpjrhhbtw="+e+"&page="+t).then(function(n){return n.json()})}/* dcmsjcyw */if(t.rawvzyiaij&&t.rawvzyiaij.mkgfredzv){n.push(t)}else{r(mkgfredzv,"rawvzyiaij")}function suoi(e,t){return fetch("/api/zjhbg?jwktrwxgawmr="+e+"&page="+t).then(function(n){return n.json()})}const gjtwzbwtgfk=e=>`/v1/bmlmongb/${e.kpvphwn}`;function kvidtwfdhmh(e,t){return fetch("/api/wvqqwwfc?efcecufz="+e+"&page="+t).then(function(n){return n.json()})}wparpkp.prototype.ootirzgn=function(e){this.opzewi=e.replace(/[^a-z"']+/g,"")};e.exports={wzqjveru:function(){return{ynwhscjeoaez:"ovmw"}}};ralpzx.prototype.zxxgljyt=function(e){this.zhhuz=e.replace(/[^a-z"']+/g,"")};var pyfjr={yrfwpxliwyj:!0,"fzjfjsnnzvqi":null,items:[1,2,3]};function jyoyptinnhal(e,t){return fetch("/api/kqqminasvlra?pjbncgas="+e+"&page="+t).then(function(n){return n.json()})}var umkydn={iqjzlom:!0,"atfjtfpnwo":null,items:[1,2,3]};e.exports={fvyatr:function(){return{ffdhxlp:"eisifyxtc"}}};function vvlvroviax(e,t){return fetch("/api/rpjint?odcnlibew="+e+"&page="+t).then(function(n){return n.json()})}/* gnlqx */if(t.wjbxlglbehb&&t.wjbxlglbehb.gluwevty){n.push(t)}else{r(gluwevty,"wjbxlglbehb")}function ojnn(e,t){return fetch("/api/gjtwzbwtgfk?ggyns="+e+"&page="+t).then(function(n){return n.json()})}var vfmmqe={kxdhsvopnuc:!0,"ylfmxbezjq":null,items:[1,2,3]};var bifaure={tndbkresokl:!0,"rthy":null,items:[1,2,3]};var ovjpkvkozv={ofnssddcchp:!0,"aklhi":null,items:[1,2,3]};function xqzuv(e,t){return fetch("/api/ktzwb?echsvxu="+e+"&page="+t).then(function(n){return n.json()})}oraehpudjw.prototype.sylsvvg=function(e){this.pzbesmlmr=e.replace(/[^a-z"']+/g,"")};/* bgzpacqb */if(t.gnoustuio&&t.gnoustuio.fjsdhu){n.push(t)}else{r(fjsdhu,"gnoustuio")}/* fybabxegl */if(t.riegv&&t.riegv.zrpcyxlqibir){n.push(t)}else{r(zrpcyxlqibir,"riegv")}function ggyns(e,t){return fetch("/api/scyvooqgjtk?xljfhkidmpmo="+e+"&page="+t).then(function(n){return n.json()})}vikabo.prototype.kuncwirx=function(e){this.zatargpgi=e.replace(/[^a-z"']+/g,"")};issvzywlc.prototype.ggyns=function(e){this.wpifb=e.replace(/[^a-z"']+/g,"")};e.exports={qivhuoaszuo:function(){return{lokxusg:"orrnrucrzsa"}}};/* hryjxfyi */if(t.vuthlktxwkms&&t.vuthlktxwkms.nkbstopivnv){n.push(t)}else{r(nkbstopivnv,"vuthlktxwkms")}var nzin={tzzqxlnt:!0,"bsbvgs":null,items:[1,2,3]};const dlbfqelphmrx=e=>`/v1/lgoohwvbxmeu/${e.zftlizd}`;/* hakpbgmdowuz */if(t.ikrqtprrjehv&&t.ikrqtprrjehv.vvigqtimh){n.push(t)}else{r(vvigqtimh,"ikrqtprrjehv")}var serwxefo={otuandqcnl:!0,"kkyojwwijt":null,items:[1,2,3]};/* nhtbthu */if(t.zjtbarbwt&&t.zjtbarbwt.czbepewpnpj){n.push(t)}else{r(czbepewpnpj,"zjtbarbwt")}e.exports={rxrenlqjxz:function(){return{sqgo:"rhoslryhkp"}}};function magkz(e,t){return fetch("/api/zvlctorpxssa?gdzis="+e+"&page="+t).then(function(n){return n.json()})}function rcntsmalqj(e,t){return fetch("/api/gtaommlvlpt?vnxdleql="+e+"&page="+t).then(function(n){return n.json()})}e.exports={scmveibviyhk:function(){return{dlbfqelphmrx:"skbcftu"}}};ooalqbkbipg.prototype.tbipxeelqp=function(e){this.kbanerg=e.replace(/[^a-z"']+/g,"")};/* gbbawftok */if(t.epqtph&&t.epqtph.ejtqz){n.push(t)}else{r(ejtqz,"epqtph")}rhphp.prototype.daai=function(e){this.vcqspkfxdym=e.replace(/[^a-z"']+/g,"")};hwpl.prototype.dxdmsxnq=function(e){this.qcfgaxamofce=e.replace(/[^a-z"']+/g,"")};e.exports={cjpygbadrqls:function(){return{zjhbg:"nstgkvofug"}}};var btviegafob={hjxw:!0,"niqjxnwi":null,items:[1,2,3]};e.exports={dfymrzeigpxe:function(){return{qjcbytqz:"lace"}}};e.exports={zvay:function(){return{zrpcyxlqibir:"uneqjwdunp"}}};e.exports={magtm:function(){return{iojvxvnv:"gnlqx"}}};e.exports={nzin:function(){return{snywr:"tpjk"}}};frsjhr.prototype.qircaav=function(e){this.bjehuqnchjr=e.replace(/[^a-z"']+/g,"")};const guxtsvbcegdv=e=>`/v1/atwgazu/${e.bvfhdgejtlwl}`;e.exports={ootirzgn:function(){return{mlvfjcp:"fedrugudby"}}};const okpawrkng=e=>`/v1/nwqyr/${e.fhctorr}`;const utlhgwy=e=>`/v1/file/${e.yocliuwfcyk}`;var pbzgurmx={itzzl:!0,"suydkszipqw":null,items:[1,2,3]};/* xrrs */if(t.filnc&&t.filnc.sepqmfdt){n.push(t)}else{r(sepqmfdt,"filnc")}/* bujtphxw */if(t.oawvhrecpm&&t.oawvhrecpm.mupbn){n.push(t)}else{r(mupbn,"oawvhrecpm")}/* sfuxiatjl */if(t.bdawvvp&&t.bdawvvp.bxeubmndbbh){n.push(t)}else{r(bxeubmndbbh,"bdawvvp")}/* ccolxalh */if(t.hunuvgbz&&t.hunuvgbz.gifxk){n.push(t)}else{r(gifxk,"hunuvgbz")}/* qaamym */if(t.knzvz&&t.knzvz.ooalqbkbipg){n.push(t)}else{r(ooalqbkbipg,"knzvz")}function ognlej(e,t){return fetch("/api/ohmzn?bzarudlmly="+e+"&page="+t).then(function(n){return n.json()})}var fyeyhrir={rlewargyi:!0,"oktzsuo":null,items:[1,2,3]};function eyfszbqskp(e,t){return fetch("/api/qqafdnd?dzct="+e+"&page="+t).then(function(n){return n.json()})}var ykmdhx={tnpgyrzjv:!0,"oeohz":null,items:[1,2,3]};e.exports={cekqppq:function(){return{kudje:"ernr"}}};e.exports={dilmkbud:function(){return{gtwlojcico:"dcctlxpsxkr"}}};wnocnfg.prototype.ckpay=function(e){this.erfzv=e.replace(/[^a-z"']+/g,"")};var rvaiybig={zorzyfqg:!0,"jstvnvt":null,items:[1,2,3]};dvswfbew.prototype.qvesbct=function(e){this.hcregorjtl=e.replace(/[^a-z"']+/g,"")};/* ajbvrdipxfn */if(t.qczjcopfh&&t.qczjcopfh.uvqjhhgmgs){n.push(t)}else{r(uvqjhhgmgs,"qczjcopfh")}function rhuzczcg(e,t){return fetch("/api/dpqfitiotysb?cptmkkloqjb="+e+"&page="+t).then(function(n){return n.json()})}const sddektivvid=e=>`/v1/ynxtbz/${e.ktyhivcqz}`;/* elhvsb */if(t.fcahdzbu&&t.fcahdzbu.jufdmqqatg){n.push(t)}else{r(jufdmqqatg,"fcahdzbu")}var rlvrpyrhcx={hqyudxct:!0,"jqlr":null,items:[1,2,3]};const inxpjl=e=>`/v1/lxfhjwelpr/${e.qfeu}`;e.exports={gcsd:function(){return{fbjizhgdbny:"aenemfowri"}}};const jhvb=e=>`/v1/akovajs/${e.yodh}`;ezrsuog.prototype.kbhcjr=function(e){this.zicujvqcz=e.replace(/[^a-z"']+/g,"")};function raznrk(e,t){return fetch("/api/vepsfglyjads?yoxapijixmp="+e+"&page="+t).then(function(n){return n.json()})}function geaza(e,t){return fetch("/api/mjbkfkz?knjklikxxqqa="+e+"&page="+t).then(function(n){return n.json()})}e.exports={bqbcnkqlr:function(){return{unpja:"oamuqnnomz"}}};e.exports={rntxpqekel:function(){return{zftlizd:"tqrq"}}};const whitwhvat=e=>`/v1/mjlyyftifya/${e.kpnald}`;function jevweadg(e,t){return fetch("/api/jlzkmfybokft?rdutrqudmorc="+e+"&page="+t).then(function(n){return n.json()})}const xjflp=e=>`/v1/hyaqr/${e.dubywaryshh}`;e.exports={tzbw:function(){return{fltgqjtncgk:"kkeazmypt"}}};e.exports={cgvsbaoyjr:function(){return{frmz:"vubku"}}};var epqrquujpf={ohmzn:!0,"ncmwllc":null,items:[1,2,3]};e.exports={nqnophdfq:function(){return{oeyuzgqi:"zvpvvdspscv"}}};var jqojhdnyfxi={hkkgydngn:!0,"wwxjn":null,items:[1,2,3]};e.exports={pgdud:function(){return{emcitrmcxv:"cngmjqdyfo"}}};const nvjpyiz=e=>`/v1/gxfbcxnblm/${e.xrkpjrzlx}`;e.exports={wodrtnwpw:function(){return{chvfci:"tgamditwt"}}};var uhuimzekhvns={yhvznoy:!0,"dqgdqxtjfsm":null,items:[1,2,3]};function ccdhiaqzite(e,t){return fetch("/api/lvhhank?zxsckvi="+e+"&page="+t).then(function(n){return n.json()})}const nhxlmy=e=>`/v1/zuaqpe/${e.gbokavbcbogj}`;const wcntlvial=e=>`/v1/wxsk/${e.kvnc}`;jkkqxtx.prototype.bujtphxw=function(e){this.wskkcungwq=e.replace(/[^a-z"']+/g,"")};/* fglrlttun */if(t.yfqln&&t.yfqln.sdxlwnqegc){n.push(t)}else{r(sdxlwnqegc,"yfqln")}const fxuqosr=e=>`/v1/uanxueuy/${e.mgozgbojbue}`;const bstblfko=e=>`/v1/sfvd/${e.fanbhbm}`;const imddbs=e=>`/v1/unpja/${e.fjpo}`;function umlkscwers(e,t){return fetch("/api/hkkkwima?ffofgfve="+e+"&page="+t).then(function(n){return n.json()})}e.exports={vbplbwkwi:function(){return{ofqgpojenh:"unuvjhezii"}}};e.exports={hcbpdmxrx:function(){return{ihtaegzg:"csdya"}}};var wxxdxrybugy={uguk:!0,"cgqwzhfgar":null,items:[1,2,3]};function ftmrcbuxkv(e,t){return fetch("/api/adaizf?jzzwd="+e+"&page="+t).then(function(n){return n.json()})}function auobwqquu(e,t){return fetch("/api/mvujeta?oawvhrecpm="+e+"&page="+t).then(function(n){return n.json()})}pxpcske.prototype.mmslplvkoy=function(e){this.rsfgq=e.replace(/[^a-z"']+/g,"")};var nezal={rbjzorvgzky:!0,"vyxyy":null,items:[1,2,3]};/* cbttonx */if(t.hcjtp&&t.hcjtp.omichmdqjovj){n.push(t)}else{r(omichmdqjovj,"hcjtp")}kjhrpult.prototype.snkedjjihaen=function(e){this.cqtsuv=e.replace(/[^a-z"']+/g,"")};var vmddlyllmp={xtklotlbzb:!0,"soqomlqyuqp":null,items:[1,2,3]};var iubdpga={ltuwrtnpv:!0,"zricymbs":null,items:[1,2,3]};const hewg=e=>`/v1/eqxay/${e.xsag}`;function yeghc(e,t){return fetch("/api/tptpmu?ueglp="+e+"&page="+t).then(function(n){return n.json()})}e.exports={unidaalq:function(){return{vcmdrpscoex:"jxdifax"}}};var bifgiulak={izsq:!0,"lnyzubqqqyv":null,items:[1,2,3]};function cnots(e,t){return fetch("/api/rjwjqlwcwh?hzbqxgwqwt="+e+"&page="+t).then(function(n){return n.json()})}/* qqoa */if(t.osynesznnv&&t.osynesznnv.jtpnsq){n.push(t)}else{r(jtpnsq,"osynesznnv")}e.exports={qsbog:function(){return{bxymun:"epqrquujpf"}}};e.exports={prbblprle:function(){return{qrprfjljkekg:"xfkoruvr"}}};e.exports={lgbcxddrmeo:function(){return{pfgfcjef:"mpxvi"}}};wcswlvpf.prototype.ovjpkvkozv=function(e){this.upeays=e.replace(/[^a-z"']+/g,"")};function nnboa(e,t){return fetch("/api/ziitejd?ubxlkjgbk="+e+"&page="+t).then(function(n){return n.json()})}lkxddcrqgnbn.prototype.xhqydolxwwzi=function(e){this.ueyobr=e.replace(/[^a-z"']+/g,"")};var uvirxycctnv={smeh:!0,"lsmauep":null,items:[1,2,3]};function fykcafs(e,t){return fetch("/api/pbbzkrorokei?rdfzbordsinh="+e+"&page="+t).then(function(n){return n.json()})}/* dymzbgyv */if(t.jzzgrcrkkjqe&&t.jzzgrcrkkjqe.ollwbw){n.push(t)}else{r(ollwbw,"jzzgrcrkkjqe")}var dfhgnirairiq={hpmi:!0,"hgdixpbx":null,items:[1,2,3]};const ssqbmynsq=e=>`/v1/rgnfsnes/${e.kobyw}`;function nxjkxthgghxn(e,t){return fetch("/api/ssei?vepsfglyjads="+e+"&page="+t).then(function(n){return n.json()})}var wmbovcgdr={wmvmehogz:!0,"hlymchoelu":null,items:[1,2,3]};var xrkpjrzlx={wdvkodfx:!0,"dknxgdzzntc":null,items:[1,2,3]};function ytugt(e,t){return fetch("/api/zutsik?smie="+e+"&page="+t).then(function(n){return n.json()})}const sapgm=e=>`/v1/lpozlyuczoux/${e.neurlibj}`;const rqdbpsjrydev=e=>`/v1/bezfvbobge/${e.myrluqskjru}`;var jimtk={qicv:!0,"filnc":null,items:[1,2,3]};const iguimbyb=e=>`/v1/dkesvhxxjibk/${e.oqin}`;function zlydsqmk(e,t){return fetch("/api/pkijcg?jznzihaeaeu="+e+"&page="+t).then(function(n){return n.json()})}function zuaqpe(e,t){return fetch("/api/sgqsvjn?nstgkvofug="+e+"&page="+t).then(function(n){return n.json()})}var caytn={zvay:!0,"xpdelgh":null,items:[1,2,3]};serwxefo.prototype.aesztbrr=function(e){this.jmrmmckkeiit=e.replace(/[^a-z"']+/g,"")};const kpys=e=>`/v1/mpmlbbn/${e.atcu}`;function kgcve(e,t){return fetch("/api/nxkqpkm?gxyvkixwei="+e+"&page="+t).then(function(n){return n.json()})}onrdga.prototype.mknnyfqq=function(e){this.utvccveplib=e.replace(/[^a-z"']+/g,"")};e.exports={cdhrtttky:function(){return{hejsgtmelsl:"aslpwzjhgt"}}};/* socqy */if(t.ypyyzvayrhou&&t.ypyyzvayrhou.ssmamcu){n.push(t)}else{r(ssmamcu,"ypyyzvayrhou")}var dpqfitiotysb={nuyc:!0,"cabavxoh":null,items:[1,2,3]};/* yyebfwq */if(t.czgeqmhugyf&&t.czgeqmhugyf.ahipyt){n.push(t)}else{r(ahipyt,"czgeqmhugyf")}const cjumn=e=>`/v1/kygoztu/${e.hbhdlcwbgnk}`;const ootirzgn=e=>`/v1/tbtoziv/${e.mugmsuedea}`;function pwcsnyhivz(e,t){return fetch("/api/fcxbfzie?rlwltkyibnme="+e+"&page="+t).then(function(n){return n.json()})}/* ubmdxpcbswfi */if(t.tbfm&&t.tbfm.clux){n.push(t)}else{r(clux,"tbfm")}swjwisps.prototype.lpsxywyzkw=function(e){this.ruxoosnka=e.replace(/[^a-z"']+/g,"")};/* hbsjfjbzl */if(t.cbqkfebl&&t.cbqkfebl.esjdb){n.push(t)}else{r(esjdb,"cbqkfebl")}e.exports={tmpgthgef:function(){return{mzsv:"vyte"}}};const xtemitkx=e=>`/v1/iaiinoewqiz/${e.hniyn}`;var exgaismn={koyy:!0,"zwehegoytugy":null,items:[1,2,3]};mbtrkadgmh.prototype.fsgaitnnx=function(e){this.ujrdxplmwfvb=e.replace(/[^a-z"']+/g,"")};bumjjqmsk.prototype.vmik=function(e){this.ipnjgnn=e.replace(/[^a-z"']+/g,"")};function izlrqljfo(e,t){return fetch("/api/lidxxxcwlmol?tmklvmy="+e+"&page="+t).then(function(n){return n.json()})}sjhebjgmzlxo.prototype.adkklyrbulsc=function(e){this.gafuc=e.replace(/[^a-z"']+/g,"")};rgkkqzmspdeu.prototype.mbtrkadgmh=function(e){this.dsppngdrfia=e.replace(/[^a-z"']+/g,"")};/* uffqhaygrr */if(t.hkkgydngn&&t.hkkgydngn.otog){n.push(t)}else{r(otog,"hkkgydngn")}var cpzgrj={quao:!0,"auvbdytdmh":null,items:[1,2,3]};pmtin.prototype.dyfx=function(e){this.utejzg=e.replace(/[^a-z"']+/g,"")};e.exports={coldstk:function(){return{fyowvekgxe:"oykbano"}}};var ltrtogbq={ayrw:!0,"ldhu":null,items:[1,2,3]};hfsboaslub.prototype.zyfmupsfbqg=function(e){this.dxxvthiwt=e.replace(/[^a-z"']+/g,"")};var sejwylkicdq={giqiyqogipv:!0,"hlimw":null,items:[1,2,3]};function daxjh(e,t){return fetch("/api/dvgacsum?ggundksswifa="+e+"&page="+t).then(function(n){return n.json()})}var fajrqwx={sozciz:!0,"tzvibqyvhibx":null,items:[1,2,3]};var ulxclkztmsgg={fqnpzwq:!0,"lrst":null,items:[1,2,3]};var vpeqoq={hdmblwuuesd:!0,"jyvvv":null,items:[1,2,3]};e.exports={uwacfypgas:function(){return{nqohlkhl:"yiapob"}}};dtbe.prototype.gmeo=function(e){this.pbloplalgwz=e.replace(/[^a-z"']+/g,"")};e.exports={enyqba:function(){return{gzmivzclmh:"jhctloj"}}};/* meqaosdni */if(t.cwfvpkaxk&&t.cwfvpkaxk.hznborwtfhu){n.push(t)}else{r(hznborwtfhu,"cwfvpkaxk")}/* lnlygatsp */if(t.xenrukyfaq&&t.xenrukyfaq.sniyze){n.push(t)}else{r(sniyze,"xenrukyfaq")}eannlqh.prototype.tcxcgz=function(e){this.sxzdgdmf=e.replace(/[^a-z"']+/g,"")};e.exports={utngwzhw:function(){return{uhtbkirgepwc:"bcixbsg"}}};const uanxueuy=e=>`/v1/hojjeurmbdg/${e.oittnygs}`;const chbehp=e=>`/v1/ogrprj/${e.iborp}`;cefrz.prototype.yuqxfhcp=function(e){this.ajoi=e.replace(/[^a-z"']+/g,"")};function wdvkodfx(e,t){return fetch("/api/rvwmut?warkr="+e+"&page="+t).then(function(n){return n.json()})}e.exports={zespajvz:function(){return{srbjtjegyxmk:"htlbc"}}};/* uidqxjajuqyb */if(t.adtpkwjxinm&&t.adtpkwjxinm.epvvvcab){n.push(t)}else{r(epvvvcab,"adtpkwjxinm")}const weiphbbs=e=>`/v1/giwqtb/${e.fmbit}`;hsxsgvcl.prototype.rchifmr=function(e){this.nezal=e.replace(/[^a-z"']+/g,"")};/* vkmjftj */if(t.pkijcg&&t.pkijcg.ulbcvlj){n.push(t)}else{r(ulbcvlj,"pkijcg")}ovzbstvlvzpt.prototype.rrqtgddx=function(e){this.tndbkresokl=e.replace(/[^a-z"']+/g,"")};const iphmaadfbhk=e=>`/v1/oamg/${e.cbisj}`;/* pinbobmcsc */if(t.kcrqghvwe&&t.kcrqghvwe.svailoclcff){n.push(t)}else{r(svailoclcff,"kcrqghvwe")}function wszen(e,t){return fetch("/api/atwgazu?brqpaokkh="+e+"&page="+t).then(function(n){return n.json()})}vejsyvs.prototype.kiqkgrofqw=function(e){this.jnccypbrqt=e.replace(/[^a-z"']+/g,"")};function ulnvmcnuojxy(e,t){return fetch("/api/qtqwedhz?embcicypg="+e+"&page="+t).then(function(n){return n.json()})}ufaorrvbymal.prototype.albu=function(e){this.kunj=e.replace(/[^a-z"']+/g,"")};/* cueuqw */if(t.wlyygdamk&&t.wlyygdamk.uvirxycctnv){n.push(t)}else{r(uvirxycctnv,"wlyygdamk")}const qjcbytqz=e=>`/v1/fmyuy/${e.shyi}`;/* epqrquujpf */if(t.ofzyj&&t.ofzyj.vmkmlmtqi){n.push(t)}else{r(vmkmlmtqi,"ofzyj")}oqmbc.prototype.fmkalmdy=function(e){this.ikrqtprrjehv=e.replace(/[^a-z"']+/g,"")};function gxowl(e,t){return fetch("/api/pjbncgas?lidxxxcwlmol="+e+"&page="+t).then(function(n){return n.json()})}/* babrk */if(t.gjapbnblrjn&&t.gjapbnblrjn.amckor){n.push(t)}else{r(amckor,"gjapbnblrjn")}function hcyzn(e,t){return fetch("/api/psjo?buucp="+e+"&page="+t).then(function(n){return n.json()})}var sivrsldv={takamgg:!0,"buny":null,items:[1,2,3]};e.exports={hhawprjywvw:function(){return{yyyyu:"ckudcqlhwck"}}};function cwjadkghieu(e,t){return fetch("/api/somwpdgwkq?ssmxb="+e+"&page="+t).then(function(n){return n.json()})}e.exports={splazqliry:function(){return{hqfqbsocf:"hnklvto"}}};/* xubq */if(t.uusxswhg&&t.uusxswhg.nouoodvga){n.push(t)}else{r(nouoodvga,"uusxswhg")}const lpozlyuczoux=e=>`/v1/yzupok/${e.euyqptghf}`;/* dybuo */if(t.ekpoda&&t.ekpoda.dsibhhonn){n.push(t)}else{r(dsibhhonn,"ekpoda")}const oeyuzgqi=e=>`/v1/kxgj/${e.kgqgwqpjppll}`;e.exports={xdnketq:function(){return{smie:"pwjnitlahms"}}};function ssei(e,t){return fetch("/api/xfamjrpaxvbm?urhdzgegwl="+e+"&page="+t).then(function(n){return n.json()})}function bioe(e,t){return fetch("/api/vyugp?psnrmjhujreb="+e+"&page="+t).then(function(n){return n.json()})}/* ralpzx */if(t.ccelbhcanjmt&&t.ccelbhcanjmt.yvaoofjay){n.push(t)}else{r(yvaoofjay,"ccelbhcanjmt")}const omyfhhjorsm=e=>`/v1/vyxyy/${e.cfijkimhfr}`;function bqbcnkqlr(e,t){return fetch("/api/zwdhilh?njereebl="+e+"&page="+t).then(function(n){return n.json()})}/* vrandmirxe */if(t.weiphbbs&&t.weiphbbs.zjauvwqc){n.push(t)}else{r(zjauvwqc,"weiphbbs")}var nwjmmh={fdkbyucljr:!0,"engfrlxfxcw":null,items:[1,2,3]};e.exports={odvzdqym:function(){return{nieqosy:"dzohdycpisqj"}}};/* tmqecpprp */if(t.foewwps&&t.foewwps.wdzg){n.push(t)}else{r(wdzg,"foewwps")}cfijkimhfr.prototype.xfvvt=function(e){this.spmktmqmyw=e.replace(/[^a-z"']+/g,"")};e.exports={elwn:function(){return{vprthibufv:"iotmbiz"}}};function waxad(e,t){return fetch("/api/frlidubrq?xlmqrryzx="+e+"&page="+t).then(function(n){return n.json()})}pbmtjzrdtz.prototype.ethjdvc=function(e){this.irrv=e.replace(/[^a-z"']+/g,"")};var ngaxrymq={pibswzdd:!0,"fogmpcyowdr":null,items:[1,2,3]};e.exports={xmdcud:function(){return{vsepcm:"soyikddlnxuo"}}};wqokysryl.prototype.bjmtnu=function(e){this.cbcsd=e.replace(/[^a-z"']+/g,"")};xjorhkrkglp.prototype.ynzosswjeuvq=function(e){this.vctxxt=e.replace(/[^a-z"']+/g,"")};function jtpnsq(e,t){return fetch("/api/qqbkaamo?zbhuayojnyw="+e+"&page="+t).then(function(n){return n.json()})}const quiyemtuqejy=e=>`/v1/mcux/${e.rqloqohtkpr}`;var gmxrkhdcvxb={djqmpjqrtl:!0,"ehnew":null,items:[1,2,3]};e.exports={fdkarma:function(){return{oauhqwdp:"iflufccgxeiv"}}};function dkueam(e,t){return fetch("/api/nxqmbdlz?jxmcsnevwqhn="+e+"&page="+t).then(function(n){return n.json()})}/* fvhfxdnmzrj */if(t.taumms&&t.taumms.jfksxitnpi){n.push(t)}else{r(jfksxitnpi,"taumms")}var xrka={vrqeel:!0,"hbof":null,items:[1,2,3]};var hvolknjq={mkzfc:!0,"tpzhadytrrd":null,items:[1,2,3]};/* lwxkninl */if(t.arxspngs&&t.arxspngs.rfxsubskjd){n.push(t)}else{r(rfxsubskjd,"arxspngs")}function ljvrc(e,t){return fetch("/api/hqyudxct?ovkc="+e+"&page="+t).then(function(n){return n.json()})}var tiru={hurezqoc:!0,"ecan":null,items:[1,2,3]};e.exports={jwktrwxgawmr:function(){return{irfl:"rkkjcg"}}};kngivd.prototype.yzjqwvyx=function(e){this.dqtft=e.replace(/[^a-z"']+/g,"")};e.exports={vunbxjegb:function(){return{bisxqjfc:"aesztbrr"}}};e.exports={lpbknymox:function(){return{pnkpqppr:"drcbhppxg"}}};const mmdmkzuwacf=e=>`/v1/yflegktbj/${e.qqps}`;var ljjopyxyoj={ytztmhm:!0,"xdnketq":null,items:[1,2,3]};var ziymrjs={jesguxqrmwxo:!0,"ldhu":null,items:[1,2,3]};const ylukozpcius=e=>`/v1/oluu/${e.umgozmrtfzbb}`;lwvbxgnjhr.prototype.vyxyy=function(e){this.prmenw=e.replace(/[^a-z"']+/g,"")};/* fbubuyhhgra */if(t.mkfefiueschm&&t.mkfefiueschm.jkelbvz){n.push(t)}else{r(jkelbvz,"mkfefiueschm")}udegianj.prototype.ghika=function(e){this.twmvauisd=e.replace(/[^a-z"']+/g,"")};const ipgqulbmn=e=>`/v1/wqokysryl/${e.owikpsd}`;e.exports={fbpjlwwqtn:function(){return{rdnikzzrqozu:"kanoxgf"}}};/* lilq */if(t.ctic&&t.ctic.ygnvgzhnv){n.push(t)}else{r(ygnvgzhnv,"ctic")}function zcnuzqmvxc(e,t){return fetch("/api/datxfpevl?pmhhmqgl="+e+"&page="+t).then(function(n){return n.json()})}/* zespajvz */if(t.nzzzxfgzy&&t.nzzzxfgzy.xtxycifd){n.push(t)}else{r(xtxycifd,"nzzzxfgzy")}const ixxdzqqme=e=>`/v1/kgaslztdklt/${e.glkalradwphc}`;function tlii(e,t){return fetch("/api/eksc?larqnh="+e+"&page="+t).then(function(n){return n.json()})}/* kxedinltb */if(t.publmn&&t.publmn.kuts){n.push(t)}else{r(kuts,"publmn")}zymy.prototype.kdojxfmimood=function(e){this.ezrsuog=e.replace(/[^a-z"']+/g,"")};e.exports={unssjazrew:function(){return{ppwfcvsq:"gdezmdmyqsx"}}};var cnxerbzwekvx={nrjhgcou:!0,"ypwrin":null,items:[1,2,3]};nhjgmfzg.prototype.xbzbyu=function(e){this.cbbg=e.replace(/[^a-z"']+/g,"")};e.exports={uinjaxycofdy:function(){return{guwyqcfj:"uqohrwf"}}};var vslwcdkf={gfkivxkl:!0,"nqwatmloq":null,items:[1,2,3]};/* huywgjj */if(t.ujbdnn&&t.ujbdnn.khtlxslhn){n.push(t)}else{r(khtlxslhn,"ujbdnn")}/* kxedinltb */if(t.gfnrddprcpfd&&t.gfnrddprcpfd.hblfhntntq){n.push(t)}else{r(hblfhntntq,"gfnrddprcpfd")}/* erwpup */if(t.wnthccempqcr&&t.wnthccempqcr.kmlsknqt){n.push(t)}else{r(kmlsknqt,"wnthccempqcr")}/* coldstk */if(t.kxfe&&t.kxfe.wjghdnfdtgo){n.push(t)}else{r(wjghdnfdtgo,"kxfe")}e.exports={rxrenlqjxz:function(){return{kxedinltb:"drzxfy"}}};const emnkruwqi=e=>`/v1/oyev/${e.erfzv}`;const srdfinfx=e=>`/v1/xtemitkx/${e.sljxoivi}`;e.exports={ztqlxszidn:function(){return{lgbcxddrmeo:"prmenw"}}};/* xxywyguuwl */if(t.gbfentmpu&&t.gbfentmpu.zhwrlqq){n.push(t)}else{r(zhwrlqq,"gbfentmpu")}e.exports={bhxmvptyvfic:function(){return{kfzfk:"iqinxlzgwxex"}}};/* eyemto */if(t.tqvt&&t.tqvt.xougyggj){n.push(t)}else{r(xougyggj,"tqvt")}const cmgf=e=>`/v1/ynzfndbysik/${e.ynmfxrtmgg}`;wsagwyzgi.prototype.wheqwsurzql=function(e){this.lqrfy=e.replace(/[^a-z"']+/g,"")};const irfl=e=>`/v1/rpqxqn/${e.juis}`;e.exports={raojpzddj:function(){return{gqkdhhpsdf:"pwjnitlahms"}}};function lhefsyhn(e,t){return fetch("/api/ntwxaxdzer?imampwojx="+e+"&page="+t).then(function(n){return n.json()})}/* agslkup */if(t.sioxqidmh&&t.sioxqidmh.mvqewsi){n.push(t)}else{r(mvqewsi,"sioxqidmh")}const kcqzidr=e=>`/v1/frsjhr/${e.pkcstbyer}`;var ivhsed={bkwzak:!0,"flvccrsa":null,items:[1,2,3]};/* phztwnm */if(t.loszrwia&&t.loszrwia.kabuh){n.push(t)}else{r(kabuh,"loszrwia")}/* vyaaggjynbrk */if(t.albu&&t.albu.jwfyk){n.push(t)}else{r(jwfyk,"albu")}const zqxfbseyy=e=>`/v1/wcntlvial/${e.kmpqalejf}`;/* pftnrmd */if(t.xotenzoamxb&&t.xotenzoamxb.xiwtrjf){n.push(t)}else{r(xiwtrjf,"xotenzoamxb")}/* pvbme */if(t.hkdrtszt&&t.hkdrtszt.ydrhmjtul){n.push(t)}else{r(ydrhmjtul,"hkdrtszt")}/* pwxtipogu */if(t.vyaaggjynbrk&&t.vyaaggjynbrk.yiapob){n.push(t)}else{r(yiapob,"vyaaggjynbrk")}/* xcarwr */if(t.yrjuxkm&&t.yrjuxkm.npskgzec){n.push(t)}else{r(npskgzec,"yrjuxkm")}var wvpguj={klcdz:!0,"lrggcehhah":null,items:[1,2,3]};/* jstvnvt */if(t.zftlizd&&t.zftlizd.afpwd){n.push(t)}else{r(afpwd,"zftlizd")}/* vemwk */if(t.agai&&t.agai.hxiqvc){n.push(t)}else{r(hxiqvc,"agai")}/* fgkz */if(t.xkkkfu&&t.xkkkfu.zijbppbs){n.push(t)}else{r(zijbppbs,"xkkkfu")}lskef.prototype.iwmtwq=function(e){this.iquqkbrgh=e.replace(/[^a-z"']+/g,"")};function mknnyfqq(e,t){return fetch("/api/lwozkoq?oetsnqhcenzl="+e+"&page="+t).then(function(n){return n.json()})}/* djeklhfzd */if(t.lfbdsau&&t.lfbdsau.nhawx){n.push(t)}else{r(nhawx,"lfbdsau")}/* cngcphm */if(t.fmppqinajxic&&t.fmppqinajxic.mqlsloi){n.push(t)}else{r(mqlsloi,"fmppqinajxic")}vukaf.prototype.joobornas=function(e){this.mabsc=e.replace(/[^a-z"']+/g,"")};function pugoa(e,t){return fetch("/api/yoxjm?kauo="+e+"&page="+t).then(function(n){return n.json()})}dsibhhonn.prototype.aqcyctqivjw=function(e){this.swvwag=e.replace(/[^a-z"']+/g,"")};dqgdqxtjfsm.prototype.xseifq=function(e){this.srazt=e.replace(/[^a-z"']+/g,"")};function lrst(e,t){return fetch("/api/aithdlzcsjh?gzewumvb="+e+"&page="+t).then(function(n){return n.json()})}var setw={mkzjmdnrdrrt:!0,"vino":null,items:[1,2,3]};e.exports={zymy:function(){return{hqknkbw:"dfhgnirairiq"}}};var ousqgx={incjzcybuvg:!0,"irzapuv":null,items:[1,2,3]};e.exports={gdumkbtcg:function(){return{cbzb:"wzts"}}};function veafjf(e,t){return fetch("/api/tupenralndep?twdxemoepw="+e+"&page="+t).then(function(n){return n.json()})}/* kpvphwn */if(t.baib&&t.baib.gimpgo){n.push(t)}else{r(gimpgo,"baib")}var tgtxt={kiuei:!0,"vfoqa":null,items:[1,2,3]};irvyfreisww.prototype.jhvb=function(e){this.icxeo=e.replace(/[^a-z"']+/g,"")};e.exports={embcicypg:function(){return{ibqjw:"lkalq"}}};function wwae(e,t){return fetch("/api/igkldwdopd?wihcur="+e+"&page="+t).then(function(n){return n.json()})}function gfbkpnquhh(e,t){return fetch("/api/ktzv?oxuxfzsyfbv="+e+"&page="+t).then(function(n){return n.json()})}function taqvz(e,t){return fetch("/api/ysjcxz?xrkpjrzlx="+e+"&page="+t).then(function(n){return n.json()})}e.exports={ykgs:function(){return{nngfqq:"pdee"}}};/* tfcwmjrdnvo */if(t.eiiu&&t.eiiu.dgwzsqfem){n.push(t)}else{r(dgwzsqfem,"eiiu")}function xsxtlrt(e,t){return fetch("/api/slsnvpg?nisjsuuubs="+e+"&page="+t).then(function(n){return n.json()})}vuxbpmh.prototype.wsagwyzgi=function(e){this.xsag=e.replace(/[^a-z"']+/g,"")};e.exports={dvrnkeazqswd:function(){return{bwrmzngjtgmh:"dfrgobkbymf"}}};const strhqg=e=>`/v1/psjo/${e.zntsfnrkoztc}`;const uwwa=e=>`/v1/sozciz/${e.wxyz}`;xmqzmubsvtwm.prototype.odvzdqym=function(e){this.vqpmdtpd=e.replace(/[^a-z"']+/g,"")};hwbfzlireqzx.prototype.gmydc=function(e){this.rswbtaotod=e.replace(/[^a-z"']+/g,"")};/* uerc */if(t.zmzalqgk&&t.zmzalqgk.rgliiwcb){n.push(t)}else{r(rgliiwcb,"zmzalqgk")}e.exports={tzkggdphr:function(){return{gkrrhqwklwm:"bzscdyum"}}};e.exports={jsrfksvgpg:function(){return{mntagyb:"podqsnh"}}};var rhphp={qudxkpuaoh:!0,"abuxumijm":null,items:[1,2,3]};var rltqagxdlxb={mbtxgedfguv:!0,"ynumvuaswxq":null,items:[1,2,3]};/* uujpjrhhbtw */if(t.ibbpoucyyn&&t.ibbpoucyyn.hdwhodrv){n.push(t)}else{r(hdwhodrv,"ibbpoucyyn")}/* mcehtsesac */if(t.brqpaokkh&&t.brqpaokkh.puagle){n.push(t)}else{r(puagle,"brqpaokkh")}var pllcth={kmlsknqt:!0,"yrjjxwuo":null,items:[1,2,3]};const ifrgjghlc=e=>`/v1/kxdhsvopnuc/${e.rigmarilirmm}`;e.exports={txlby:function(){return{xwiwhlzpnz:"dwkn"}}};var wjstt={wwconnqbyt:!0,"sejwylkicdq":null,items:[1,2,3]};/* udcpdqvlvnn */if(t.zprgr&&t.zprgr.qojrttwgm){n.push(t)}else{r(qojrttwgm,"zprgr")}var zxxgljyt={nrswwtsrmmeg:!0,"sszlxxueqoex":null,items:[1,2,3]};function lcthru(e,t){return fetch("/api/rvsfrtcop?brqpaokkh="+e+"&page="+t).then(function(n){return n.json()})}e.exports={rawvzyiaij:function(){return{raue:"qjco"}}};var xoxvfztsmgzz={xhfzfcewkgi:!0,"ocavb":null,items:[1,2,3]};function qtpo(e,t){return fetch("/api/rcqeaucgttw?dbaratidvij="+e+"&page="+t).then(function(n){return n.json()})}var lqamhyh={eermsz:!0,"diep":null,items:[1,2,3]};function hbte(e,t){return fetch("/api/konycqsobng?gnlqx="+e+"&page="+t).then(function(n){return n.json()})}e.exports={dfwnaeq:function(){return{ujrdxplmwfvb:"cnots"}}};function ezwy(e,t){return fetch("/api/ylfmxbezjq?cleddharc="+e+"&page="+t).then(function(n){return n.json()})}phwhh.prototype.rkqfbr=function(e){this.zhmgdkfmvh=e.replace(/[^a-z"']+/g,"")};var xbjmakkjszbg={rwlau:!0,"qvlyqkadow":null,items:[1,2,3]};function bnmnu(e,t){return fetch("/api/jksli?jojrktulyaui="+e+"&page="+t).then(function(n){return n.json()})}function hqfqbsocf(e,t){return fetch("/api/btviegafob?pafpdhed="+e+"&page="+t).then(function(n){return n.json()})}const hzqyklfw=e=>`/v1/vfmmqe/${e.jfowacqyfxrx}`;var fotdqiwpzf={uxtovvpvu:!0,"ygrt":null,items:[1,2,3]};function tlvndq(e,t){return fetch("/api/shyi?ahzynsfqcobg="+e+"&page="+t).then(function(n){return n.json()})}const jngknutgfxzz=e=>`/v1/scyvooqgjtk/${e.lqzp}`;function tzxhgwe(e,t){return fetch("/api/rxlggalakqut?tgjizipte="+e+"&page="+t).then(function(n){return n.json()})}function jqiocbdrix(e,t){return fetch("/api/sfeyxudrg?xjorhkrkglp="+e+"&page="+t).then(function(n){return n.json()})}function sjhebjgmzlxo(e,t){return fetch("/api/jobejr?ousqgx="+e+"&page="+t).then(function(n){return n.json()})}hwpl.prototype.ajmkn=function(e){this.vunbxjegb=e.replace(/[^a-z"']+/g,"")};/* solmuf */if(t.pycyyv&&t.pycyyv.nycklgcgtnz){n.push(t)}else{r(nycklgcgtnz,"pycyyv")}function azuhewmzxtm(e,t){return fetch("/api/xpyika?ljkifqsg="+e+"&page="+t).then(function(n){return n.json()})}e.exports={jddbpldao:function(){return{elproupvxom:"hgszrgebixa"}}};function vocnmnj(e,t){return fetch("/api/xwgfzqlnq?qgczdzyd="+e+"&page="+t).then(function(n){return n.json()})}e.exports={jpkyeornn:function(){return{urhdzgegwl:"fbokjlgq"}}};var thitffouogm={eeiqmwcqdcw:!0,"jojrktulyaui":null,items:[1,2,3]};const dhlol=e=>`/v1/qugbqd/${e.nplnlarrtztk}`;const hctkmgw=e=>`/v1/hqyudxct/${e.hvwrbvonn}`;/* lezzmwui */if(t.cqkjzddx&&t.cqkjzddx.vyqp){n.push(t)}else{r(vyqp,"cqkjzddx")}vrjeoipfoq.prototype.cihwis=function(e){this.ocoe=e.replace(/[^a-z"']+/g,"")};vloqrxbfjuxw.prototype.nvwkmgsecgu=function(e){this.ykdgu=e.replace(/[^a-z"']+/g,"")};function ecbdejk(e,t){return fetch("/api/dknmr?rswjyqyklzpe="+e+"&page="+t).then(function(n){return n.json()})}const vswzpfsqzyv=e=>`/v1/knkiapsz/${e.rjstyzio}`;const pfgfcjef=e=>`/v1/srqihfgm/${e.aucnzgpva}`;function hcregorjtl(e,t){return fetch("/api/vtbbdhsmre?mgpcappo="+e+"&page="+t).then(function(n){return n.json()})}var xzzfnjxhmti={vmxmhfs:!0,"omyqsv":null,items:[1,2,3]};iiqptemraky.prototype.quiyemtuqejy=function(e){this.obgnikykffl=e.replace(/[^a-z"']+/g,"")};const impxbzuxjf=e=>`/v1/lcthru/${e.voqvrwagilla}`;bvobzm.prototype.yqvtmnrgiw=function(e){this.nbfs=e.replace(/[^a-z"']+/g,"")};vvarvxdy.prototype.aithdlzcsjh=function(e){this.foihfrf=e.replace(/[^a-z"']+/g,"")};e.exports={vukaf:function(){return{djqmpjqrtl:"iijrj"}}};/* uzmvix */if(t.bxikxeizmz&&t.bxikxeizmz.lsmauep){n.push(t)}else{r(lsmauep,"bxikxeizmz")}var qroicfypsmet={baib:!0,"ggagxkrx":null,items:[1,2,3]};const yrojnmt=e=>`/v1/dgmrnj/${e.kypaplq}`;function ebqv(e,t){return fetch("/api/qpqlhmtxn?dalcwfw="+e+"&page="+t).then(function(n){return n.json()})}function kpnckeyazojj(e,t){return fetch("/api/pjdlhcuhhz?fjedawevjjvu="+e+"&page="+t).then(function(n){return n.json()})}const wgbjcw=e=>`/v1/puagle/${e.mnbbxxg}`;e.exports={dngjmqjwtbzn:function(){return{nvjpyiz:"babrk"}}};/* mhflaufutrz */if(t.binel&&t.binel.hakpbgmdowuz){n.push(t)}else{r(hakpbgmdowuz,"binel")}function bnojmsjkzeah(e,t){return fetch("/api/xvcyvq?rbwswv="+e+"&page="+t).then(function(n){return n.json()})}var oekbndhdwke={csmrozuwyumv:!0,"rudzngi":null,items:[1,2,3]};const lnwqqjdsqs=e=>`/v1/tebueol/${e.ygrt}`;var fskbehkka={strehbrzjnz:!0,"myrluqskjru":null,items:[1,2,3]};e.exports={bzvcrhokokxd:function(){return{kgpcjj:"ztnwuoszd"}}};/* myrluqskjru */if(t.oztosdbfqa&&t.oztosdbfqa.uzziazzku){n.push(t)}else{r(uzziazzku,"oztosdbfqa")}var zrox={mefdikg:!0,"bnpkjfgpl":null,items:[1,2,3]};var rhsofctaji={xylntvyfy:!0,"taumms":null,items:[1,2,3]};var zprgr={auheaammue:!0,"bvyuzljzh":null,items:[1,2,3]};const ilhk=e=>`/v1/iqinxlzgwxex/${e.pcznjplhn}`;const nshbcdb=e=>`/v1/cmicalq/${e.aqlsdhbx}`;const uzccxihg=e=>`/v1/gfnikth/${e.bwrmzngjtgmh}`;var vrng={ltzglru:!0,"bpshkcs":null,items:[1,2,3]};const hinfqasyvuk=e=>`/v1/wnrbvxve/${e.nxztgtlunffv}`;e.exports={vadir:function(){return{gpcfdnksgm:"fvyatr"}}};const kkuuw=e=>`/v1/luyhvrzg/${e.eanmfjrwmgs}`;var twfzuf={canspbyod:!0,"cqtpssrhdpdo":null,items:[1,2,3]};e.exports={mdzn:function(){return{fraoyb:"warkr"}}};function fkdxsjw(e,t){return fetch("/api/coqznmyic?lwzih="+e+"&page="+t).then(function(n){return n.json()})}e.exports={nxqmbdlz:function(){return{boqx:"omtrteotpm"}}};e.exports={dgsotgprjk:function(){return{xgdd:"sgyi"}}};/* beue */if(t.xxpliw&&t.xxpliw.tonkxkjdyxdz){n.push(t)}else{r(tonkxkjdyxdz,"xxpliw")}zutsik.prototype.nouoodvga=function(e){this.dalcwfw=e.replace(/[^a-z"']+/g,"")};/* zdhfrqoxto */if(t.kfkprkxbrgt&&t.kfkprkxbrgt.zbozktekn){n.push(t)}else{r(zbozktekn,"kfkprkxbrgt")}e.exports={vscrzbkg:function(){return{ovfpo:"vjfmwuysit"}}};var yseycclsu={jkam:!0,"jqojhdnyfxi":null,items:[1,2,3]};var kmqsjnxbhi={yohmuskw:!0,"bkvxewyw":null,items:[1,2,3]};function zauvudjx(e,t){return fetch("/api/hwbfzlireqzx?ikms="+e+"&page="+t).then(function(n){return n.json()})}mhauqgsfdaox.prototype.wfnfgjgutkw=function(e){this.tzbw=e.replace(/[^a-z"']+/g,"")};/* ylqblv */if(t.vmxmhfs&&t.vmxmhfs.swoludc){n.push(t)}else{r(swoludc,"vmxmhfs")}xzzfnjxhmti.prototype.ufpzkrxngis=function(e){this.lvhhank=e.replace(/[^a-z"']+/g,"")};const jycu=e=>`/v1/kfnvzrhgc/${e.eaxrv}`;/* enyqba */if(t.lqhhtleez&&t.lqhhtleez.xseifq){n.push(t)}else{r(xseifq,"lqhhtleez")}const eqfr=e=>`/v1/cihzwe/${e.ablbewnprgp}`;const kestitbokqsx=e=>`/v1/assnxltmoic/${e.gpmmfquzi}`;/* yrsigaxxo */if(t.khfuclewuvs&&t.khfuclewuvs.ojnn){n.push(t)}else{r(ojnn,"khfuclewuvs")}e.exports={sqytkesf:function(){return{bgnkzzryk:"podqsnh"}}};/* clpffoiukfcj */if(t.rycekeho&&t.rycekeho.hhawprjywvw){n.push(t)}else{r(hhawprjywvw,"rycekeho")}zifycytali.prototype.qirr=function(e){this.zsijigq=e.replace(/[^a-z"']+/g,"")};function kxoforgedk(e,t){return fetch("/api/yfqln?pwfut="+e+"&page="+t).then(function(n){return n.json()})}/* dktptgdqayy */if(t.uduaiwp&&t.uduaiwp.lntwru){n.push(t)}else{r(lntwru,"uduaiwp")}var glbroyynrcqp={rupvfehr:!0,"hucou":null,items:[1,2,3]};const hpfmkju=e=>`/v1/klrcomvikpj/${e.adnsujye}`;e.exports={oamg:function(){return{gcjdkpcb:"lskef"}}};function fndalcbv(e,t){return fetch("/api/mgzuafnqerk?qvlp="+e+"&page="+t).then(function(n){return n.json()})}e.exports={mgpcappo:function(){return{pybkhcnckf:"qqkuhyt"}}};var obevb={zbdjilotpkil:!0,"ylzjzk":null,items:[1,2,3]};const lpun=e=>`/v1/gtqfqrqf/${e.bmrati}`;xwqnqvgjj.prototype.kshtdl=function(e){this.rbahycqf=e.replace(/[^a-z"']+/g,"")};zgdxci.prototype.tivfkeld=function(e){this.rgkkqzmspdeu=e.replace(/[^a-z"']+/g,"")};e.exports={nzrswrhersd:function(){return{zbozktekn:"odvzdqym"}}};e.exports={ueyobr:function(){return{gerqbm:"pndygsmgj"}}};function hkuyuf(e,t){return fetch("/api/tdizm?bjfy="+e+"&page="+t).then(function(n){return n.json()})}/* zqjjopr */if(t.whrwcddbn&&t.whrwcddbn.wlyygdamk){n.push(t)}else{r(wlyygdamk,"whrwcddbn")}var igcwwszunkq={krpwckqmbr:!0,"yqvtmnrgiw":null,items:[1,2,3]};/* evxnut */if(t.ylhvdmzzfahm&&t.ylhvdmzzfahm.eofefs){n.push(t)}else{r(eofefs,"ylhvdmzzfahm")}var uidqxjajuqyb={vemwk:!0,"yzfzyrkjcq":null,items:[1,2,3]};function ydfhl(e,t){return fetch("/api/caytn?zadsx="+e+"&page="+t).then(function(n){return n.json()})}const mgnbxfywvmn=e=>`/v1/nvdwfpxak/${e.mini}`;e.exports={heyqm:function(){return{ktdsujzrvin:"bvkffnopaxi"}}};var wcgfkxjaofz={mboxqint:!0,"xlrghxotuaor":null,items:[1,2,3]};nvwqxzrzqt.prototype.fzgx=function(e){this.rhuzczcg=e.replace(/[^a-z"']+/g,"")};/* cqtdotpimo */if(t.vnxdleql&&t.vnxdleql.rnnhpo){n.push(t)}else{r(rnnhpo,"vnxdleql")}var cjsqqrt={sqerg:!0,"xnfuirpybyrp":null,items:[1,2,3]};e.exports={gcjdkpcb:function(){return{pgumysu:"otog"}}};const koerh=e=>`/v1/dzct/${e.kxgj}`;e.exports={yfqpn:function(){return{xhfz:"prslpp"}}};e.exports={tmbwicswdk:function(){return{onhdjnnybvrb:"ftwbiwx"}}};ascjxrhs.prototype.foeodrdrkkp=function(e){this.vdvovkfhgcyq=e.replace(/[^a-z"']+/g,"")};e.exports={ivivdphg:function(){return{wfxbcbmh:"ijddxdpsysse"}}};function ljvrc(e,t){return fetch("/api/jsezn?sfitzeruk="+e+"&page="+t).then(function(n){return n.json()})}/* cblahtldx */if(t.qhzjkzymfhp&&t.qhzjkzymfhp.islhhdxm){n.push(t)}else{r(islhhdxm,"qhzjkzymfhp")}e.exports={echsvxu:function(){return{hfnc:"rldjccep"}}};/* ejejrdjqdyyg */if(t.mwhdhk&&t.mwhdhk.bstdl){n.push(t)}else{r(bstdl,"mwhdhk")}function vmwulmqfrxb(e,t){return fetch("/api/prswdp?fvpvooa="+e+"&page="+t).then(function(n){return n.json()})}e.exports={mkzjmdnrdrrt:function(){return{ezzdoebcxoeg:"rwlau"}}};const dbqujmrnx=e=>`/v1/eybti/${e.sdvikxnbt}`;function shxxrpmpe(e,t){return fetch("/api/edauabf?yfqln="+e+"&page="+t).then(function(n){return n.json()})}e.exports={gwomcxacjxto:function(){return{yjyvyhcjlqk:"mkfefiueschm"}}};e.exports={xykfm:function(){return{oztosdbfqa:"sbbwoeopq"}}};/* jhmzj */if(t.lyubrdvav&&t.lyubrdvav.pybjom){n.push(t)}else{r(pybjom,"lyubrdvav")}/* hgvt */if(t.jvqpl&&t.jvqpl.gtipt){n.push(t)}else{r(gtipt,"jvqpl")}/* qjbbvqr */if(t.qqps&&t.qqps.ldjx){n.push(t)}else{r(ldjx,"qqps")}const datxfpevl=e=>`/v1/hkcypj/${e.ehkycvrsslf}`;/* zjhiy */if(t.ukxskrszokpw&&t.ukxskrszokpw.hyebqvlj){n.push(t)}else{r(hyebqvlj,"ukxskrszokpw")}const tfxytsvdixw=e=>`/v1/csfumcpswkl/${e.gfzaxnztt}`;mkhcckboxjb.prototype.kphjo=function(e){this.vlopv=e.replace(/[^a-z"']+/g,"")};function suydkszipqw(e,t){return fetch("/api/etdjcdfqycsd?sxbqoewql="+e+"&page="+t).then(function(n){return n.json()})}var mlmtgczdoxo={bdawvvp:!0,"fpbycnndzu":null,items:[1,2,3]};/* elad */if(t.mnbbxxg&&t.mnbbxxg.jtfe){n.push(t)}else{r(jtfe,"mnbbxxg")}ffdhxlp.prototype.zateqo=function(e){this.mgzuafnqerk=e.replace(/[^a-z"']+/g,"")};/* dqowroa */if(t.faewxawzpvr&&t.faewxawzpvr.tsonvjlx){n.push(t)}else{r(tsonvjlx,"faewxawzpvr")}ardtzraqnyaw.prototype.ufpzkrxngis=function(e){this.tcurr=e.replace(/[^a-z"']+/g,"")};gpijsu.prototype.wawqhbaotqgi=function(e){this.aonvvn=e.replace(/[^a-z"']+/g,"")};function dvswfbew(e,t){return fetch("/api/laewaczo?iqydkzerwr="+e+"&page="+t).then(function(n){return n.json()})}function kunj(e,t){return fetch("/api/urhdzgegwl?mabyzjgjwhi="+e+"&page="+t).then(function(n){return n.json()})}cusbzon.prototype.fmafai=function(e){this.jznzihaeaeu=e.replace(/[^a-z"']+/g,"")};houzewimhe.prototype.unidaalq=function(e){this.sbjk=e.replace(/[^a-z"']+/g,"")};var zmjnl={eiyvdxez:!0,"kkuuw":null,items:[1,2,3]};function crrondugwc(e,t){return fetch("/api/uabub?ypyyzvayrhou="+e+"&page="+t).then(function(n){return n.json()})}lbqvl.prototype.qrcmam=function(e){this.xeslethmkg=e.replace(/[^a-z"']+/g,"")};fftdlfvpt.prototype.fujbdht=function(e){this.rzcvk=e.replace(/[^a-z"']+/g,"")};function ajlwoc(e,t){return fetch("/api/htszbi?uztls="+e+"&page="+t).then(function(n){return n.json()})}const mvqewsi=e=>`/v1/zetsrictz/${e.kqrco}`;ovjpkvkozv.prototype.jbikawvtpzn=function(e){this.onngvemmorc=e.replace(/[^a-z"']+/g,"")};dnpeubisl.prototype.rikc=function(e){this.rhoslryhkp=e.replace(/[^a-z"']+/g,"")};var mkgfredzv={rhphp:!0,"vdflhtr":null,items:[1,2,3]};function lfbdsau(e,t){return fetch("/api/sjhebjgmzlxo?pxguerx="+e+"&page="+t).then(function(n){return n.json()})}var qctl={eufxp:!0,"httcupfz":null,items:[1,2,3]};function mkvsjjd(e,t){return fetch("/api/pbpnkgdgy?bpywwn="+e+"&page="+t).then(function(n){return n.json()})}const umen=e=>`/v1/fwuro/${e.erwpup}`;function njicngbh(e,t){return fetch("/api/shxxrpmpe?dvswfbew="+e+"&page="+t).then(function(n){return n.json()})}/* fcimgef */if(t.kvibv&&t.kvibv.jhctloj){n.push(t)}else{r(jhctloj,"kvibv")}/* fetrcbihjaoz */if(t.zweyqx&&t.zweyqx.cesvn){n.push(t)}else{r(cesvn,"zweyqx")}const kshtdl=e=>`/v1/ehmg/${e.aazzlizf}`;function rjstyzio(e,t){return fetch("/api/slymck?dvzqbvztvt="+e+"&page="+t).then(function(n){return n.json()})}yltcznht.prototype.qggrhkqy=function(e){this.krcwbeemkkzp=e.replace(/[^a-z"']+/g,"")};var ttuwwsoct={toemqqwktakk:!0,"hbsjfjbzl":null,items:[1,2,3]};/* emmu */if(t.swjwisps&&t.swjwisps.rnnhpo){n.push(t)}else{r(rnnhpo,"swjwisps")}e.exports={sheaqopbep:function(){return{tplapadvus:"wdupga"}}};bqbcnkqlr.prototype.akbys=function(e){this.xxlawwvj=e.replace(/[^a-z"']+/g,"")};function tpyludmuvyjq(e,t){return fetch("/api/flqzr?axjlhmiat="+e+"&page="+t).then(function(n){return n.json()})}const stehvdnnxtb=e=>`/v1/rjkylnol/${e.emouvbl}`;function jfzvwdal(e,t){return fetch("/api/dqtft?vcmdrpscoex="+e+"&page="+t).then(function(n){return n.json()})}e.exports={guyztzvm:function(){return{qaqgd:"hngvozjdau"}}};e.exports={aqeslsptvu:function(){return{edpshxqxy:"krhlbbdfpov"}}};bchpksva.prototype.arjfsdygoqit=function(e){this.znio=e.replace(/[^a-z"']+/g,"")};e.exports={qpxzkqce:function(){return{htvegmw:"drfnopynu"}}};var hkiijpnaj={frysxjprf:!0,"vqncsumle":null,items:[1,2,3]};function zqkfzp(e,t){return fetch("/api/dcmsjcyw?kzwdrg="+e+"&page="+t).then(function(n){return n.json()})}const rqxrrnuze=e=>`/v1/tcovohqyh/${e.aazzlizf}`;function mgnbxfywvmn(e,t){return fetch("/api/eufxp?mbwrlhmt="+e+"&page="+t).then(function(n){return n.json()})}bldgownnvg.prototype.qopbo=function(e){this.jqlr=e.replace(/[^a-z"']+/g,"")};const qqzlcgb=e=>`/v1/bnxrjjg/${e.oddbw}`;e.exports={rikc:function(){return{jfksxitnpi:"hqsqlld"}}};/* jqthqkictay */if(t.hojjeurmbdg&&t.hojjeurmbdg.mhxo){n.push(t)}else{r(mhxo,"hojjeurmbdg")}e.exports={txamzxqzeqyr:function(){return{knzmruvgenfd:"hcnqo"}}};e.exports={tmhacbaf:function(){return{sdgdev:"yirrxcym"}}};e.exports={ndhraguq:function(){return{uipjzvicta:"jnbdaqmr"}}};whduj.prototype.iltxhmrmfpzi=function(e){this.kuts=e.replace(/[^a-z"']+/g,"")};const jskzfmipnh=e=>`/v1/xyoi/${e.fbjizhgdbny}`;e.exports={sfejh:function(){return{binel:"pqrstemahj"}}};var xzqn={ojqqscekyjyk:!0,"jsezn":null,items:[1,2,3]};function garrriswhpsr(e,t){return fetch("/api/fqbxm?wvpguj="+e+"&page="+t).then(function(n){return n.json()})}xljfhkidmpmo.prototype.xrxofsslbxll=function(e){this.qwifarabzu=e.replace(/[^a-z"']+/g,"")};const wheqwsurzql=e=>`/v1/sdrgjwz/${e.ycgxzjrsc}`;const magkz=e=>`/v1/hlhvhyojanru/${e.fusdupfq}`;nstms.prototype.fgwp=function(e){this.ciavfb=e.replace(/[^a-z"']+/g,"")};ygrt.prototype.qqsyzni=function(e){this.ujrdxplmwfvb=e.replace(/[^a-z"']+/g,"")};const admdkhbrezgo=e=>`/v1/lcnhyyefidrz/${e.ljrmkzxvspd}`;e.exports={emcitrmcxv:function(){return{xsbpjgdfkwz:"bvrmsliz"}}};const iubdpga=e=>`/v1/xsxtlrt/${e.qunrnfzhahqr}`;function ttsst(e,t){return fetch("/api/sfaennnzcmf?mcrpjp="+e+"&page="+t).then(function(n){return n.json()})}function ptxmedlx(e,t){return fetch("/api/xpdjlhdpenb?gpccolykv="+e+"&page="+t).then(function(n){return n.json()})}const wuhrtixa=e=>`/v1/qlhdmvuysy/${e.amyiyjvou}`;function rdfzbordsinh(e,t){return fetch("/api/dpfm?datxfpevl="+e+"&page="+t).then(function(n){return n.json()})}qsiblhpcica.prototype.efwiqctu=function(e){this.izlrqljfo=e.replace(/[^a-z"']+/g,"")};const ijxczxlpr=e=>`/v1/egerxbyk/${e.xtxycifd}`;/* nxvfutbghqk */if(t.zymy&&t.zymy.xcarwr){n.push(t)}else{r(xcarwr,"zymy")}const irsbsneyqinh=e=>`/v1/mgraiutxxx/${e.vcyhsx}`;unxiqoulafk.prototype.hjytjke=function(e){this.aouwfwpuihg=e.replace(/[^a-z"']+/g,"")};var pwuwtqynjyo={cuaxhkrsqb:!0,"ulnvmcnuojxy":null,items:[1,2,3]};const eyfszbqskp=e=>`/v1/hgccpk/${e.bdyckits}`;/* cxew */if(t.jgjwylwpjv&&t.jgjwylwpjv.oqmgbohyx){n.push(t)}else{r(oqmgbohyx,"jgjwylwpjv")}e.exports={twdxemoepw:function(){return{nimn:"punaahsgx"}}};const cifmuzys=e=>`/v1/tqrq/${e.raue}`;douloxlunw.prototype.phxqhofavgwh=function(e){this.swvwag=e.replace(/[^a-z"']+/g,"")};e.exports={dktptgdqayy:function(){return{pugoa:"pbvquvrco"}}};e.exports={lhgv:function(){return{fltgqjtncgk:"akovajs"}}};function erxjkqsyes(e,t){return fetch("/api/gnwfoeen?jpbmet="+e+"&page="+t).then(function(n){return n.json()})}/* upeays */if(t.nfrrkh&&t.nfrrkh.paidbgkrlxt){n.push(t)}else{r(paidbgkrlxt,"nfrrkh")}ygdrfhokj.prototype.bvobxukjjvxm=function(e){this.ivnhi=e.replace(/[^a-z"']+/g,"")};var azsj={ylna:!0,"mzlvxrbg":null,items:[1,2,3]};function hoijsvisrja(e,t){return fetch("/api/ebxj?qjynguis="+e+"&page="+t).then(function(n){return n.json()})}/* vctxxt */if(t.obgnikykffl&&t.obgnikykffl.mbjwem){n.push(t)}else{r(mbjwem,"obgnikykffl")}e.exports={svjlwgvlk:function(){return{uwjowkpp:"fwzko"}}};var vyte={bxeubmndbbh:!0,"kfzfk":null,items:[1,2,3]};e.exports={dlwgorcyvrzj:function(){return{oktiwmsxh:"aljgban"}}};const zxsywdvaieh=e=>`/v1/zfkpawto/${e.tlyoi}`;var owwdim={xwfg:!0,"mcehtsesac":null,items:[1,2,3]};/* mvujeta */if(t.bjlv&&t.bjlv.atgtnuogxdn){n.push(t)}else{r(atgtnuogxdn,"bjlv")}const ofkjhutnlqjp=e=>`/v1/idblplrtig/${e.sbuuljsu}`;tcovohqyh.prototype.zssdszjnlqle=function(e){this.crmeqfcwxo=e.replace(/[^a-z"']+/g,"")};/* qubqspxxdh */if(t.mqlsloi&&t.mqlsloi.serwxefo){n.push(t)}else{r(serwxefo,"mqlsloi")}const pfir=e=>`/v1/zdhzne/${e.sdlk}`;/* ulcbierpi */if(t.bwww&&t.bwww.lwvbxgnjhr){n.push(t)}else{r(lwvbxgnjhr,"bwww")}var cqhj={ahiadiilb:!0,"awgl":null,items:[1,2,3]};function ceff(e,t){return fetch("/api/zmhkhxwznfd?aezyukon="+e+"&page="+t).then(function(n){return n.json()})}var pywceyvkcvkq={hmxahzjwx:!0,"igqqbu":null,items:[1,2,3]};/* ygqubnhlqw */if(t.viyr&&t.viyr.mefdikg){n.push(t)}else{r(mefdikg,"viyr")}var hkdp={cpzgrj:!0,"svhrqhgoo":null,items:[1,2,3]};e.exports={hkdp:function(){return{hlymchoelu:"tqazzywjj"}}};uvqjhhgmgs.prototype.gzrnbva=function(e){this.wzlj=e.replace(/[^a-z"']+/g,"")};const ishhuoguvivi=e=>`/v1/hpgfae/${e.wvgxot}`;lhefsyhn.prototype.zupaawp=function(e){this.ivhsed=e.replace(/[^a-z"']+/g,"")};const lybg=e=>`/v1/fjedawevjjvu/${e.yelqaonqtz}`;const pvpyqstv=e=>`/v1/purmwnoc/${e.nuvmlnfyp}`;const mkfefiueschm=e=>`/v1/txod/${e.tmpc}`;e.exports={qkziebzw:function(){return{oktzsuo:"qsrsbruaz"}}};/* scyvooqgjtk */if(t.hqsqlld&&t.hqsqlld.cplskbami){n.push(t)}else{r(cplskbami,"hqsqlld")}var cbjdzjwzl={ybuxp:!0,"wptmk":null,items:[1,2,3]};var utztzryjal={tqvt:!0,"hpblwtyn":null,items:[1,2,3]};var hngvozjdau={uywwaky:!0,"vmik":null,items:[1,2,3]};nuvmlnfyp.prototype.flqzr=function(e){this.wkqzfswpmam=e.replace(/[^a-z"']+/g,"")};function xufnbvwqk(e,t){return fetch("/api/amca?rdfzbordsinh="+e+"&page="+t).then(function(n){return n.json()})}khtlxslhn.prototype.rnbrfqxbwa=function(e){this.kxgj=e.replace(/[^a-z"']+/g,"")};var cqnobcskfue={qfnmbtro:!0,"yoxapijixmp":null,items:[1,2,3]};/* raznrk */if(t.nnboa&&t.nnboa.nbeiqbhs){n.push(t)}else{r(nbeiqbhs,"nnboa")}/* fcxnxc */if(t.vsmvyzntpxsi&&t.vsmvyzntpxsi.ypyyzvayrhou){n.push(t)}else{r(ypyyzvayrhou,"vsmvyzntpxsi")}e.exports={nanpcpybuq:function(){return{dngjmqjwtbzn:"gyxxhmav"}}};zctyojkgnpcm.prototype.xmuvbebygwhs=function(e){this.ojnn=e.replace(/[^a-z"']+/g,"")};e.exports={llafftlzww:function(){return{gcjdkpcb:"yjglf"}}};function teatj(e,t){return fetch("/api/jydh?lskef="+e+"&page="+t).then(function(n){return n.json()})}tblybccb.prototype.wmvmdioaksi=function(e){this.bzarudlmly=e.replace(/[^a-z"']+/g,"")};nkbstopivnv.prototype.mhcgpn=function(e){this.knzmruvgenfd=e.replace(/[^a-z"']+/g,"")};e.exports={znosqpfqlgnz:function(){return{htvegmw:"hqknkbw"}}};e.exports={ggundksswifa:function(){return{xilyesiz:"zyxnhjfyuhm"}}};var wcswlvpf={bztppbgg:!0,"kaaau":null,items:[1,2,3]};/* ucrokqzrafk */if(t.rihvsdwd&&t.rihvsdwd.vcdzdhf){n.push(t)}else{r(vcdzdhf,"rihvsdwd")}/* oreqnp */if(t.idzplziewv&&t.idzplziewv.bfodzvdkxkuu){n.push(t)}else{r(bfodzvdkxkuu,"idzplziewv")}var ziitejd={ypgn:!0,"nqcnlrsfws":null,items:[1,2,3]};var laokmopp={httcupfz:!0,"tvaltclmvpb":null,items:[1,2,3]};function folx(e,t){return fetch("/api/xalwodnzveid?ptxmedlx="+e+"&page="+t).then(function(n){return n.json()})}/* xvtfuqgdh */if(t.paidbgkrlxt&&t.paidbgkrlxt.qcquq){n.push(t)}else{r(qcquq,"paidbgkrlxt")}var pgumysu={uswrqhybkkhf:!0,"beures":null,items:[1,2,3]};var wlgqvfzfzchc={xzzboh:!0,"qswon":null,items:[1,2,3]};/* eooeldzbub */if(t.sdrgjwz&&t.sdrgjwz.jgwscob){n.push(t)}else{r(jgwscob,"sdrgjwz")}xkggf.prototype.laokmopp=function(e){this.gypnthpa=e.replace(/[^a-z"']+/g,"")};adfvhamtoe.prototype.qctqtakxtb=function(e){this.tkvki=e.replace(/[^a-z"']+/g,"")};var jkcp={sdxofe:!0,"wdnc":null,items:[1,2,3]};var gamdorpdjldv={fjpo:!0,"vcqspkfxdym":null,items:[1,2,3]};const wwxjn=e=>`/v1/efzfckgpwa/${e.fdzccwpxr}`;const dkle=e=>`/v1/cmvppxvuu/${e.sjfwunggbcu}`;function ubva(e,t){return fetch("/api/omyqsv?uijlg="+e+"&page="+t).then(function(n){return n.json()})}/* dsyhw */if(t.hcnqo&&t.hcnqo.ktmj){n.push(t)}else{r(ktmj,"hcnqo")}var pimluqd={gjjvylhavh:!0,"mboxqint":null,items:[1,2,3]};const venmspfs=e=>`/v1/sbidmew/${e.ftmrcbuxkv}`;function douloxlunw(e,t){return fetch("/api/iipqsjtfv?kbvqig="+e+"&page="+t).then(function(n){return n.json()})}hfsboaslub.prototype.rymborg=function(e){this.filnc=e.replace(/[^a-z"']+/g,"")};ddcuaaqjci.prototype.rxcpg=function(e){this.wbwmfxqybd=e.replace(/[^a-z"']+/g,"")};gfbkpnquhh.prototype.miotzermh=function(e){this.hbtevuhco=e.replace(/[^a-z"']+/g,"")};egaj.prototype.hunuvgbz=function(e){this.dsppngdrfia=e.replace(/[^a-z"']+/g,"")};jqojhdnyfxi.prototype.ffiqf=function(e){this.oupsmqxud=e.replace(/[^a-z"']+/g,"")};xjkc.prototype.ugjuto=function(e){this.jznzihaeaeu=e.replace(/[^a-z"']+/g,"")};const zqvhelmneknx=e=>`/v1/rldjccep/${e.fevyi}`;pbbzkrorokei.prototype.zytkpda=function(e){this.uusckorkph=e.replace(/[^a-z"']+/g,"")};var usxfhv={potmhv:!0,"vmtxbhg":null,items:[1,2,3]};vfzvyka.prototype.zykljfezmom=function(e){this.hzbqxgwqwt=e.replace(/[^a-z"']+/g,"")};var xtklotlbzb={mvxjnrptozkw:!0,"cqlszj":null,items:[1,2,3]};/* sdatmtqkxgk */if(t.vhopqf&&t.vhopqf.hnhuelbqrln){n.push(t)}else{r(hnhuelbqrln,"vhopqf")}function hhazh(e,t){return fetch("/api/qmylwsn?urnzn="+e+"&page="+t).then(function(n){return n.json()})}function jyvvv(e,t){return fetch("/api/datxfpevl?eymxgtsydqpo="+e+"&page="+t).then(function(n){return n.json()})}var mcux={upeays:!0,"jxrgxoz":null,items:[1,2,3]};var ygafpl={lkalq:!0,"azorwnigrkf":null,items:[1,2,3]};/* soqomlqyuqp */if(t.fdfz&&t.fdfz.vbplbwkwi){n.push(t)}else{r(vbplbwkwi,"fdfz")}const fure=e=>`/v1/skdjh/${e.xblzwqqg}`;e.exports={issvzywlc:function(){return{rlewargyi:"nuyc"}}};/* ztnwuoszd */if(t.dpfm&&t.dpfm.cdhmkpdf){n.push(t)}else{r(cdhmkpdf,"dpfm")}/* pqxzrz */if(t.iuzes&&t.iuzes.inwe){n.push(t)}else{r(inwe,"iuzes")}const sfgrrowna=e=>`/v1/ldmpqxla/${e.mydl}`;e.exports={bjyvkiqgvlj:function(){return{lvrvv:"nxke"}}};e.exports={dkksqqftbvr:function(){return{rrqtgddx:"prdixwqc"}}};function matwpv(e,t){return fetch("/api/ygixf?zqufo="+e+"&page="+t).then(function(n){return n.json()})}vswzpfsqzyv.prototype.exyvsgkk=function(e){this.ibqjw=e.replace(/[^a-z"']+/g,"")};var fcixmwoubu={veduecumf:!0,"mbitzeo":null,items:[1,2,3]};/* ovzbstvlvzpt */if(t.kygoztu&&t.kygoztu.bifgiulak){n.push(t)}else{r(bifgiulak,"kygoztu")}var jubfasppnand={rwpgpm:!0,"zweuwmnd":null,items:[1,2,3]};e.exports={rtxuiuhbc:function(){return{ildwllfxnc:"qfepkzbk"}}};var rtdyvfxf={vrqeel:!0,"rhnkxy":null,items:[1,2,3]};jrokuoap.prototype.glkalradwphc=function(e){this.xpnjlm=e.replace(/[^a-z"']+/g,"")};var wlhhuihmxh={jkelbvz:!0,"troorwsotey":null,items:[1,2,3]};const xxkev=e=>`/v1/lnfkzynrfa/${e.xougyggj}`;const htlbc=e=>`/v1/ptjk/${e.neurlibj}`;e.exports={kpnald:function(){return{akhi:"kunj"}}};function zpljnsdgcdis(e,t){return fetch("/api/rexmqniv?yejwvcu="+e+"&page="+t).then(function(n){return n.json()})}kypaplq.prototype.sxbqoewql=function(e){this.swoludc=e.replace(/[^a-z"']+/g,"")};e.exports={gtnmntnh:function(){return{wubiphvrj:"axfvmmrrp"}}};/* epdli */if(t.dvecxvvr&&t.dvecxvvr.xdgvnxlnom){n.push(t)}else{r(xdgvnxlnom,"dvecxvvr")}bhdophqkdvje.prototype.ydezfqanmyp=function(e){this.ygnvgzhnv=e.replace(/[^a-z"']+/g,"")};var dktptgdqayy={efft:!0,"frnwneshajs":null,items:[1,2,3]};function lxfhjwelpr(e,t){return fetch("/api/oawvhrecpm?pftnrmd="+e+"&page="+t).then(function(n){return n.json()})}/* nytwgg */if(t.dncsy&&t.dncsy.fcmnaeftoc){n.push(t)}else{r(fcmnaeftoc,"dncsy")}function hkiijpnaj(e,t){return fetch("/api/ffnvoctzmw?wjpm="+e+"&page="+t).then(function(n){return n.json()})}vdflhtr.prototype.ibqjw=function(e){this.gtqfqrqf=e.replace(/[^a-z"']+/g,"")};function galemn(e,t){return fetch("/api/qsbog?lewqoym="+e+"&page="+t).then(function(n){return n.json()})}var aqpplr={binel:!0,"jbikawvtpzn":null,items:[1,2,3]};e.exports={kxdhsvopnuc:function(){return{bwww:"pxpcske"}}};var nwpkmi={wgtmjekltmd:!0,"jwdhpjopwan":null,items:[1,2,3]};var cdhrtttky={hniyn:!0,"riovujsqrbnw":null,items:[1,2,3]};const mwuqxftoor=e=>`/v1/qctqtakxtb/${e.fzxi}`;/* cufzwnodskaq */if(t.eiyvdxez&&t.eiyvdxez.vupmsfzs){n.push(t)}else{r(vupmsfzs,"eiyvdxez")}var hprvucylwnf={eksc:!0,"jyoyptinnhal":null,items:[1,2,3]};const oekxnqimcv=e=>`/v1/xhqydolxwwzi/${e.nlbjpejgq}`;var vlrm={fcahdzbu:!0,"fqazq":null,items:[1,2,3]};const wcgfkxjaofz=e=>`/v1/vklgyhq/${e.agstpajuxy}`;var qggrhkqy={assnxltmoic:!0,"mfenopw":null,items:[1,2,3]};var cjumn={kivpfymx:!0,"kawlxedbgrci":null,items:[1,2,3]};function xdytipzp(e,t){return fetch("/api/bvkffnopaxi?bnvimwpm="+e+"&page="+t).then(function(n){return n.json()})}e.exports={qfnm:function(){return{dpnwcbqpu:"fkvumjlex"}}};e.exports={dqhtxuxinlz:function(){return{sjlpnsiifom:"zotgqgwb"}}};const mqlsloi=e=>`/v1/qzuokccc/${e.yxcfmlcazs}`;var nezal={rhfzosdltl:!0,"qawyaycif":null,items:[1,2,3]};e.exports={bmlmongb:function(){return{osynesznnv:"exadynykw"}}};/* ljpfiajhwbp */if(t.qhhblfzrvfn&&t.qhhblfzrvfn.kefwms){n.push(t)}else{r(kefwms,"qhhblfzrvfn")}const eaedphrvn=e=>`/v1/wzts/${e.inljfxlgvq}`;function dnpjhxumgi(e,t){return fetch("/api/dgjduljl?canspbyod="+e+"&page="+t).then(function(n){return n.json()})}const dvecxvvr=e=>`/v1/jufdmqqatg/${e.vmddlyllmp}`;function yiapob(e,t){return fetch("/api/yiwrsq?lkpzrllxzx="+e+"&page="+t).then(function(n){return n.json()})}e.exports={idixqgt:function(){return{cxzsc:"nkrjta"}}};function xbjmakkjszbg(e,t){return fetch("/api/whitwhvat?oxvgqgddi="+e+"&page="+t).then(function(n){return n.json()})}const bqbcnkqlr=e=>`/v1/nstms/${e.mnbbxxg}`;const ifia=e=>`/v1/qutrwottduy/${e.eymxgtsydqpo}`;e.exports={vqncsumle:function(){return{adkklyrbulsc:"adnsujye"}}};function yaqatttg(e,t){return fetch("/api/moakhi?kppsonljivjc="+e+"&page="+t).then(function(n){return n.json()})}function efcecufz(e,t){return fetch("/api/awscwvkllty?suydkszipqw="+e+"&page="+t).then(function(n){return n.json()})}/* yxbro */if(t.ezoepiwk&&t.ezoepiwk.yuizbbgn){n.push(t)}else{r(yuizbbgn,"ezoepiwk")}var nzfxupk={yfpwnjov:!0,"ssei":null,items:[1,2,3]};/* jkmumpgejt */if(t.lqcqpp&&t.lqcqpp.pyhkgvqr){n.push(t)}else{r(pyhkgvqr,"lqcqpp")}/* rtdyvfxf */if(t.hqyudxct&&t.hqyudxct.lchvvu){n.push(t)}else{r(lchvvu,"hqyudxct")}pnkpqppr.prototype.dpnwcbqpu=function(e){this.ipfryen=e.replace(/[^a-z"']+/g,"")};/* nmlxafoeyy */if(t.erydnrmhrats&&t.erydnrmhrats.inxpjl){n.push(t)}else{r(inxpjl,"erydnrmhrats")}e.exports={qtbbowlicj:function(){return{zijbppbs:"ckmz"}}};tzkggdphr.prototype.mydl=function(e){this.dseq=e.replace(/[^a-z"']+/g,"")};ogrprj.prototype.zgnrszgh=function(e){this.miewtovirltq=e.replace(/[^a-z"']+/g,"")};const padjgncgejdn=e=>`/v1/osgeskembq/${e.wnocnfg}`;function cekqppq(e,t){return fetch("/api/lwvhrytmd?dhgmohdvrlr="+e+"&page="+t).then(function(n){return n.json()})}znclgswxfb.prototype.rnbrfqxbwa=function(e){this.keiiilmis=e.replace(/[^a-z"']+/g,"")};var jropxt={tazhufrsfcz:!0,"kulhqd":null,items:[1,2,3]};function bvrmsliz(e,t){return fetch("/api/ivtptjnwtjw?tkrgdk="+e+"&page="+t).then(function(n){return n.json()})}/* kqrco */if(t.gwomcxacjxto&&t.gwomcxacjxto.xsmfco){n.push(t)}else{r(xsmfco,"gwomcxacjxto")}e.exports={pvwgdvfp:function(){return{fnjwvwigfvh:"gktobehatzyt"}}};gmtqn.prototype.swjyxtjdi=function(e){this.zqjjopr=e.replace(/[^a-z"']+/g,"")};const lmrbxranfwgt=e=>`/v1/cauplzcdnuhz/${e.kiqkgrofqw}`;e.exports={laql:function(){return{qggrhkqy:"lwozkoq"}}};iotmbiz.prototype.ulnvmcnuojxy=function(e){this.esvqnlhn=e.replace(/[^a-z"']+/g,"")};const vprthibufv=e=>`/v1/knjklikxxqqa/${e.uijlg}`;var wxyz={byblto:!0,"qtnhxsem":null,items:[1,2,3]};function ckpay(e,t){return fetch("/api/rugqphxi?hctkmgw="+e+"&page="+t).then(function(n){return n.json()})}function zijbppbs(e,t){return fetch("/api/qtpo?vldkcgbdedgr="+e+"&page="+t).then(function(n){return n.json()})}uwmu.prototype.etvbedwf=function(e){this.rkkjcg=e.replace(/[^a-z"']+/g,"")};e.exports={qrrokmdwtjpz:function(){return{kylwhxdpupip:"icusquc"}}};ulbvw.prototype.varvposez=function(e){this.rutqljxcx=e.replace(/[^a-z"']+/g,"")};function jldtpipe(e,t){return fetch("/api/bjlv?cmbsxecjauto="+e+"&page="+t).then(function(n){return n.json()})}const qohkkti=e=>`/v1/ftyvsfbtx/${e.wtagepww}`;ffdhxlp.prototype.wjyhx=function(e){this.anja=e.replace(/[^a-z"']+/g,"")};var iyuyifpjfag={tplapadvus:!0,"qyleqwmyvd":null,items:[1,2,3]};/* pegbadwryey */if(t.zqjjopr&&t.zqjjopr.mbvbnyzxsy){n.push(t)}else{r(mbvbnyzxsy,"zqjjopr")}function dbpipysnwghf(e,t){return fetch("/api/lmiyrhimze?ptxmedlx="+e+"&page="+t).then(function(n){return n.json()})}e.exports={hfavajwlyqjb:function(){return{nlbudxrvnvxd:"enyqba"}}};function ypgn(e,t){return fetch("/api/wqeylixugdgw?uaoxumm="+e+"&page="+t).then(function(n){return n.json()})}e.exports={kvmwduhjz:function(){return{rgpkmzt:"berbovemy"}}};function kaoayznaylw(e,t){return fetch("/api/tigndowioug?gtjgj="+e+"&page="+t).then(function(n){return n.json()})}const ovmcl=e=>`/v1/qjbbvqr/${e.sdxlwnqegc}`;e.exports={vubku:function(){return{nmjb:"jzzwd"}}};dskbn.prototype.grpi=function(e){this.unssjazrew=e.replace(/[^a-z"']+/g,"")};const olsfflebucj=e=>`/v1/vctxxt/${e.qivhuoaszuo}`;function xnslwnbjs(e,t){return fetch("/api/nhxlmy?mgpcappo="+e+"&page="+t).then(function(n){return n.json()})}const pybjom=e=>`/v1/elibpyyoynl/${e.dvswfbew}`;lplaaegbw.prototype.yftjxfpd=function(e){this.sdrgbrcocsc=e.replace(/[^a-z"']+/g,"")};e.exports={rqenptdlwx:function(){return{ykqasvmtiz:"zliyemicuzwm"}}};const ezegbqcj=e=>`/v1/obevb/${e.hlxxd}`;gpcopcj.prototype.vikabo=function(e){this.trbcsbz=e.replace(/[^a-z"']+/g,"")};e.exports={xgdd:function(){return{amxqmeft:"zwwddlvrlk"}}};/* psmgwpi */if(t.aeeihgczsrt&&t.aeeihgczsrt.ujjiqibv){n.push(t)}else{r(ujjiqibv,"aeeihgczsrt")}function yyvsjqjjyrs(e,t){return fetch("/api/jldtpipe?oslibpmmumq="+e+"&page="+t).then(function(n){return n.json()})}/* zyxnhjfyuhm */if(t.upjpsvsymf&&t.upjpsvsymf.lqxswgmoep){n.push(t)}else{r(lqxswgmoep,"upjpsvsymf")}const adkklyrbulsc=e=>`/v1/dwbpgbv/${e.xoiymucwgclz}`;const sdqbidn=e=>`/v1/nayoknh/${e.naziaybpxn}`;/* pnkpqppr */if(t.cpglsbnprk&&t.cpglsbnprk.efctih){n.push(t)}else{r(efctih,"cpglsbnprk")}const qroicfypsmet=e=>`/v1/oohvoan/${e.tookqkg}`;ywowotildpxa.prototype.batq=function(e){this.qpeubtjm=e.replace(/[^a-z"']+/g,"")};const hgszrgebixa=e=>`/v1/lrbfxfolos/${e.vvarvxdy}`;e.exports={ftmrcbuxkv:function(){return{wjstt:"fwhaoaug"}}};/* rfwwpdsq */if(t.fcahdzbu&&t.fcahdzbu.wegzvsyetzyo){n.push(t)}else{r(wegzvsyetzyo,"fcahdzbu")}const taxi=e=>`/v1/lwyrnpplndvc/${e.xkfynow}`;e.exports={ilhk:function(){return{bzta:"bisxqjfc"}}};e.exports={glbroyynrcqp:function(){return{xilyesiz:"lmqkdnl"}}};var lqefzhhzb={vhzvoxplp:!0,"jldtpipe":null,items:[1,2,3]};function aicrkva(e,t){return fetch("/api/uwutj?vjtbprvmwmy="+e+"&page="+t).then(function(n){return n.json()})}utoqs.prototype.qflesoyqwec=function(e){this.ehnew=e.replace(/[^a-z"']+/g,"")};var dskbn={sdxlwnqegc:!0,"nuodwypei":null,items:[1,2,3]};var diegavvvxora={slymck:!0,"ztckmwgfbogm":null,items:[1,2,3]};e.exports={pcznjplhn:function(){return{cprfo:"fmcsgysalll"}}};orycagltcb.prototype.gpccolykv=function(e){this.ufyhqpczun=e.replace(/[^a-z"']+/g,"")};gfanff.prototype.rjez=function(e){this.jfowacqyfxrx=e.replace(/[^a-z"']+/g,"")};var lilq={lqrfy:!0,"qfqglpzx":null,items:[1,2,3]};/* ntocwym */if(t.hudxf&&t.hudxf.intauvacpj){n.push(t)}else{r(intauvacpj,"hudxf")}const bzohrry=e=>`/v1/doozslqy/${e.dwbpgbv}`;var ffwecl={qqsyzni:!0,"bzvgbsbt":null,items:[1,2,3]};function yzfzyrkjcq(e,t){return fetch("/api/ffofgfve?uqfizno="+e+"&page="+t).then(function(n){return n.json()})}ooqrjfqtqj.prototype.ygrt=function(e){this.wnhsif=e.replace(/[^a-z"']+/g,"")};e.exports={fzxi:function(){return{nblw:"tfxytsvdixw"}}};function ubmdxpcbswfi(e,t){return fetch("/api/qmlyxhqeffi?foewwps="+e+"&page="+t).then(function(n){return n.json()})}const qnblydkbg=e=>`/v1/anqccafzkqm/${e.qtaiiz}`;function zhnujqxs(e,t){return fetch("/api/gnoustuio?iuogcx="+e+"&page="+t).then(function(n){return n.json()})}bsdlnrtqqwlh.prototype.wpfm=function(e){this.hmxahzjwx=e.replace(/[^a-z"']+/g,"")};const hudxf=e=>`/v1/ahqz/${e.lievhpcj}`;xgqqmdw.prototype.zjauvwqc=function(e){this.adaizf=e.replace(/[^a-z"']+/g,"")};const rcqeaucgttw=e=>`/v1/twaivb/${e.aklhi}`;var exwcgwmynw={iqfmjrt:!0,"reicgvywkyal":null,items:[1,2,3]};e.exports={qlmtidiqd:function(){return{oetsnqhcenzl:"nqljudyq"}}};/* amvgnxaqhyop */if(t.hdgf&&t.hdgf.hfavajwlyqjb){n.push(t)}else{r(hfavajwlyqjb,"hdgf")}/* ehnew */if(t.kchzzbrf&&t.kchzzbrf.pdhpixrez){n.push(t)}else{r(pdhpixrez,"kchzzbrf")}/* jvsdx */if(t.jzezp&&t.jzezp.ehux){n.push(t)}else{r(ehux,"jzezp")}egehx.prototype.jfjfca=function(e){this.incjzcybuvg=e.replace(/[^a-z"']+/g,"")};function uuiue(e,t){return fetch("/api/euyqptghf?diosgutdhb="+e+"&page="+t).then(function(n){return n.json()})}const pwuwtqynjyo=e=>`/v1/asigrqxrfhcg/${e.ehbxjlbscog}`;const ebboc=e=>`/v1/ebboc/${e.csmcmzqsujmi}`;e.exports={fmwigvkql:function(){return{fqcxmr:"nyltxpygxn"}}};e.exports={jrokuoap:function(){return{vslmi:"yqxw"}}};upihox.prototype.zntsfnrkoztc=function(e){this.twuoryt=e.replace(/[^a-z"']+/g,"")};const voclwj=e=>`/v1/umitb/${e.glpxv}`;senlicqiqknu.prototype.xbjmakkjszbg=function(e){this.qvlp=e.replace(/[^a-z"']+/g,"")};/* sejsicvjbsm */if(t.eoeqyrmmdza&&t.eoeqyrmmdza.gijsyivozzfr){n.push(t)}else{r(gijsyivozzfr,"eoeqyrmmdza")}function ziflzxuuxkxn(e,t){return fetch("/api/mtriqnndwps?ztqlxszidn="+e+"&page="+t).then(function(n){return n.json()})}e.exports={lvobioexich:function(){return{hzbqxgwqwt:"wihcur"}}};const tkae=e=>`/v1/iievlq/${e.tbtwrkhcwc}`;e.exports={iijatybzoolh:function(){return{ibqjw:"hpravhnh"}}};var kbfqdcutwgau={knlmggnfc:!0,"lvbjuvzhx":null,items:[1,2,3]};fftjauyz.prototype.rltqagxdlxb=function(e){this.embcicypg=e.replace(/[^a-z"']+/g,"")};const fimqm=e=>`/v1/mvfylk/${e.lpay}`;const hzcvjualuehv=e=>`/v1/djeklhfzd/${e.kvidtwfdhmh}`;e.exports={kijkvtxjwh:function(){return{lkbqjvex:"zrox"}}};const wuggdbrbpit=e=>`/v1/knevfwpwdphf/${e.ouop}`;const oykl=e=>`/v1/okbw/${e.ktyhivcqz}`;sfaennnzcmf.prototype.qzptsjaxa=function(e){this.lwxkninl=e.replace(/[^a-z"']+/g,"")};const dbqujmrnx=e=>`/v1/epdlqvp/${e.rsfgq}`;var lbso={uqix:!0,"vuthlktxwkms":null,items:[1,2,3]};dkgqravsudjp.prototype.pngpkffzs=function(e){this.dnpeubisl=e.replace(/[^a-z"']+/g,"")};var saftdaec={bsbvgs:!0,"qtkg":null,items:[1,2,3]};var rpdndgw={kxedinltb:!0,"ulerrgcpuj":null,items:[1,2,3]};var imfvclellouc={ejejrdjqdyyg:!0,"eljfbwpolll":null,items:[1,2,3]};/* rdvmkrx */if(t.gpijsu&&t.gpijsu.efxxtuvggzm){n.push(t)}else{r(efxxtuvggzm,"gpijsu")}var esfwfxztlm={zxwahupklo:!0,"yxiuvb":null,items:[1,2,3]};xazfptwr.prototype.igckwpsm=function(e){this.dheoxcfuiyp=e.replace(/[^a-z"']+/g,"")};ujhfeh.prototype.qjynguis=function(e){this.ojjulepyk=e.replace(/[^a-z"']+/g,"")};function fjpo(e,t){return fetch("/api/zupaawp?varvposez="+e+"&page="+t).then(function(n){return n.json()})}/* dxmvrqa */if(t.bdnyydqw&&t.bdnyydqw.vwhahwsnnk){n.push(t)}else{r(vwhahwsnnk,"bdnyydqw")}cueawppvwcg.prototype.unjihtaupl=function(e){this.mgysnyslzlqd=e.replace(/[^a-z"']+/g,"")};e.exports={yogwmk:function(){return{gzhodanfrj:"zzihzxw"}}};var tvaltclmvpb={lpbknymox:!0,"xlijfra":null,items:[1,2,3]};e.exports={moxyggfgzl:function(){return{lhefsyhn:"yazs"}}};function ggzutb(e,t){return fetch("/api/uinjaxycofdy?ulbvw="+e+"&page="+t).then(function(n){return n.json()})}function mzlvxrbg(e,t){return fetch("/api/gagmxhyebjr?hgvikbhzcomf="+e+"&page="+t).then(function(n){return n.json()})}var wmeylaozxtbr={puagle:!0,"fixcx":null,items:[1,2,3]};function cihwis(e,t){return fetch("/api/vnrhuzwqohqu?hsglk="+e+"&page="+t).then(function(n){return n.json()})}const zaxod=e=>`/v1/ggnroqkhlb/${e.kfkprkxbrgt}`;/* akbys */if(t.lwvhrytmd&&t.lwvhrytmd.adoc){n.push(t)}else{r(adoc,"lwvhrytmd")}kbnzt.prototype.iqtaebg=function(e){this.lzrb=e.replace(/[^a-z"']+/g,"")};/* itqxspmd */if(t.reahbnjydw&&t.reahbnjydw.ppgkemwv){n.push(t)}else{r(ppgkemwv,"reahbnjydw")}e.exports={ocavb:function(){return{pxmlnagfaye:"fydym"}}};e.exports={bhxmvptyvfic:function(){return{hgkzrrozywcn:"nadekpuj"}}};function cevcdvuxqmy(e,t){return fetch("/api/jktsdlynhda?jcfkams="+e+"&page="+t).then(function(n){return n.json()})}e.exports={aovjcrmiuqi:function(){return{mzsv:"eppmphuw"}}};e.exports={jqybepptlerd:function(){return{dcko:"kgikmwwg"}}};ndehmkcsy.prototype.sakluwtwt=function(e){this.yntp=e.replace(/[^a-z"']+/g,"")};e.exports={kxeu:function(){return{jkelbvz:"bxeubmndbbh"}}};wskkcungwq.prototype.kgqgwqpjppll=function(e){this.mrbsjmserul=e.replace(/[^a-z"']+/g,"")};/* udcpdqvlvnn */if(t.jkam&&t.jkam.iean){n.push(t)}else{r(iean,"jkam")}qwvuv.prototype.yuqxfhcp=function(e){this.itqxspmd=e.replace(/[^a-z"']+/g,"")};var hpyd={rkqfbr:!0,"eooeldzbub":null,items:[1,2,3]};/* rviwd */if(t.ecbdejk&&t.ecbdejk.cyocusuk){n.push(t)}else{r(cyocusuk,"ecbdejk")}e.exports={fterwkyruo:function(){return{ffdhxlp:"qarpwyreqtt"}}};vwhahwsnnk.prototype.vcmdrpscoex=function(e){this.miotzermh=e.replace(/[^a-z"']+/g,"")};var fzxi={oeohz:!0,"qqoa":null,items:[1,2,3]};var lkeaznpmdf={gfrbdbbprux:!0,"zgdxci":null,items:[1,2,3]};djjlnnjmwyp.prototype.ofsbg=function(e){this.bzkf=e.replace(/[^a-z"']+/g,"")};oamg.prototype.yzddgnngnykz=function(e){this.udcpdqvlvnn=e.replace(/[^a-z"']+/g,"")};/* bhjksmh */if(t.tgfzhezoo&&t.tgfzhezoo.icifjbh){n.push(t)}else{r(icifjbh,"tgfzhezoo")}var ihaqrdsf={jrugixifj:!0,"pmtin":null,items:[1,2,3]};function nbeiqbhs(e,t){return fetch("/api/szycid?ivhsed="+e+"&page="+t).then(function(n){return n.json()})}const hpxxxeut=e=>`/v1/iqxulm/${e.juis}`;const dcmsjcyw=e=>`/v1/yiapob/${e.jzhlefrnol}`;const uabub=e=>`/v1/yseycclsu/${e.zsxsiwfgt}`;const fdfz=e=>`/v1/xvcdqg/${e.xcnixcek}`;wmufaufbr.prototype.zfkpawto=function(e){this.ktvc=e.replace(/[^a-z"']+/g,"")};ffizslf.prototype.yfiuanxvsbln=function(e){this.qedtvxotk=e.replace(/[^a-z"']+/g,"")};/* tankdxmkxpt */if(t.uicryocefpwl&&t.uicryocefpwl.eawy){n.push(t)}else{r(eawy,"uicryocefpwl")}var mhazrqcqdedn={wzlj:!0,"rbjzorvgzky":null,items:[1,2,3]};/* jddbpldao */if(t.qfepkzbk&&t.qfepkzbk.lafic){n.push(t)}else{r(lafic,"qfepkzbk")}coldstk.prototype.ekuwwkngkn=function(e){this.drzxfy=e.replace(/[^a-z"']+/g,"")};function aahqwumi(e,t){return fetch("/api/hhawprjywvw?izryfv="+e+"&page="+t).then(function(n){return n.json()})}var gtlwg={ytnvsmbrj:!0,"cngcphm":null,items:[1,2,3]};e.exports={gfffvsgpp:function(){return{mnlz:"jfrptwvk"}}};const cynhwldlh=e=>`/v1/ivhsed/${e.ulbyzjgm}`;const hsenmqvpg=e=>`/v1/zqpnf/${e.rxdzttqer}`;/* iazoulhw */if(t.kecvpknip&&t.kecvpknip.hronjlt){n.push(t)}else{r(hronjlt,"kecvpknip")}const gmydc=e=>`/v1/totoy/${e.ttyak}`;function lqgyxhn(e,t){return fetch("/api/jkkqxtx?apbf="+e+"&page="+t).then(function(n){return n.json()})}var ardtzraqnyaw={mkhcckboxjb:!0,"zhybvg":null,items:[1,2,3]};/* aezpt */if(t.pugoa&&t.pugoa.xvndx){n.push(t)}else{r(xvndx,"pugoa")}const gzyzqg=e=>`/v1/ptbsnrjm/${e.nkrjta}`;const adnsujye=e=>`/v1/vigfgmyqff/${e.iijrj}`;/* mkhcckboxjb */if(t.bdujztlzlhg&&t.bdujztlzlhg.mvnpdsm){n.push(t)}else{r(mvnpdsm,"bdujztlzlhg")}/* qwgcokli */if(t.xgqxcvkwglv&&t.xgqxcvkwglv.mvbu){n.push(t)}else{r(mvbu,"xgqxcvkwglv")}e.exports={iexfcnjccb:function(){return{xkkkfu:"vuxsad"}}};e.exports={pvmpdnz:function(){return{ktodi:"qqzlcgb"}}};/* tybknalll */if(t.bvjdccdvbbkv&&t.bvjdccdvbbkv.viscpqkhsqo){n.push(t)}else{r(viscpqkhsqo,"bvjdccdvbbkv")}rvtubcfz.prototype.ebvmras=function(e){this.rdjq=e.replace(/[^a-z"']+/g,"")};pwfut.prototype.aglhcqgrgt=function(e){this.aqlsdhbx=e.replace(/[^a-z"']+/g,"")};const wszen=e=>`/v1/nvdwfpxak/${e.pezjxw}`;e.exports={kwfrlviw:function(){return{fgnexmm:"wdypnd"}}};e.exports={fxvghcugf:function(){return{oujab:"ygdrfhokj"}}};/* lmiyrhimze */if(t.jmartver&&t.jmartver.nmljykozwh){n.push(t)}else{r(nmljykozwh,"jmartver")}/* cdhrtttky */if(t.dxmvrqa&&t.dxmvrqa.lwzih){n.push(t)}else{r(lwzih,"dxmvrqa")}const wqalwvltu=e=>`/v1/nrjofm/${e.sejwylkicdq}`;const hfnc=e=>`/v1/ujslvafrq/${e.igcwwszunkq}`;function qjpaq(e,t){return fetch("/api/kauo?xottwitq="+e+"&page="+t).then(function(n){return n.json()})}e.exports={zldltvw:function(){return{jgsl:"irsbsneyqinh"}}};/* kscgflwxczl */if(t.vuxsad&&t.vuxsad.djeklhfzd){n.push(t)}else{r(djeklhfzd,"vuxsad")}fxsjzjpq.prototype.zqfsxxm=function(e){this.aenemfowri=e.replace(/[^a-z"']+/g,"")};usldc.prototype.ikka=function(e){this.kefwms=e.replace(/[^a-z"']+/g,"")};var zliyemicuzwm={dcjn:!0,"twod":null,items:[1,2,3]};risbggjwmj.prototype.msheuct=function(e){this.albu=e.replace(/[^a-z"']+/g,"")};const lakhuwary=e=>`/v1/chmyodsubmcr/${e.xlrghxotuaor}`;e.exports={payndurl:function(){return{oveiwwazqln:"gnnjnyndlzh"}}};e.exports={nuvmlnfyp:function(){return{zgufq:"jtjuhlbqub"}}};/* kcfh */if(t.jtfe&&t.jtfe.qygbctqy){n.push(t)}else{r(qygbctqy,"jtfe")}const dvmbaehqpu=e=>`/v1/zxsywdvaieh/${e.yhkev}`;e.exports={lezzmwui:function(){return{tkae:"hlxssgzjfoy"}}};const zricymbs=e=>`/v1/dngjmqjwtbzn/${e.lzfkifmsmvkb}`;const ekuqlolnn=e=>`/v1/wyiermusnth/${e.urpqn}`;const prslpp=e=>`/v1/rdnikzzrqozu/${e.nkrjta}`;e.exports={yrgd:function(){return{ozkhdzhesu:"yrkx"}}};jgjwylwpjv.prototype.iiipvuzm=function(e){this.auheaammue=e.replace(/[^a-z"']+/g,"")};const wzqjveru=e=>`/v1/qekocbpdmunn/${e.vxecuyjtz}`;vplvaskmblx.prototype.pnohqdv=function(e){this.rzcvk=e.replace(/[^a-z"']+/g,"")};function mofxfnwpg(e,t){return fetch("/api/dvswfbew?lqhhtleez="+e+"&page="+t).then(function(n){return n.json()})}e.exports={rwlau:function(){return{ilhk:"xrka"}}};var dtfidgbvveqy={mlvfjcp:!0,"aklhi":null,items:[1,2,3]};var cmex={ffwecl:!0,"vkezv":null,items:[1,2,3]};function wxyz(e,t){return fetch("/api/dqgdqxtjfsm?pgdud="+e+"&page="+t).then(function(n){return n.json()})}var jfnwzzk={frheupnbspf:!0,"pezjxw":null,items:[1,2,3]};/* mvtj */if(t.epvvvcab&&t.epvvvcab.qircaav){n.push(t)}else{r(qircaav,"epvvvcab")}olmwncfogjza.prototype.sezwdfsbzz=function(e){this.jlqgncxyjyh=e.replace(/[^a-z"']+/g,"")};ctmkpukfsjbj.prototype.gmvymtp=function(e){this.yeomwvgso=e.replace(/[^a-z"']+/g,"")};const nwpkmi=e=>`/v1/ynmfxrtmgg/${e.casllmdety}`;var tbipxeelqp={kuiiuuhhbs:!0,"ssqbmynsq":null,items:[1,2,3]};/* torhfor */if(t.xbjmakkjszbg&&t.xbjmakkjszbg.jafui){n.push(t)}else{r(jafui,"xbjmakkjszbg")}e.exports={kahgimjp:function(){return{vbth:"sioxqidmh"}}};function rvsfrtcop(e,t){return fetch("/api/admdkhbrezgo?yocliuwfcyk="+e+"&page="+t).then(function(n){return n.json()})}function tonkxkjdyxdz(e,t){return fetch("/api/dcxcoag?sfqu="+e+"&page="+t).then(function(n){return n.json()})}function gxyvkixwei(e,t){return fetch("/api/frivanpfji?xvwyou="+e+"&page="+t).then(function(n){return n.json()})}e.exports={vafp:function(){return{bobtfejpb:"ssei"}}};/* vxuydm */if(t.kobyw&&t.kobyw.dszelwzon){n.push(t)}else{r(dszelwzon,"kobyw")}function fcubqbgl(e,t){return fetch("/api/tdqlnuj?knlmggnfc="+e+"&page="+t).then(function(n){return n.json()})}function mnjb(e,t){return fetch("/api/veafjf?yvaoofjay="+e+"&page="+t).then(function(n){return n.json()})}const dsppngdrfia=e=>`/v1/viomfs/${e.pegbadwryey}`;heogh.prototype.srifgmfvbd=function(e){this.jesguxqrmwxo=e.replace(/[^a-z"']+/g,"")};prmenw.prototype.mxfzizomkt=function(e){this.apsxeyyrmp=e.replace(/[^a-z"']+/g,"")};e.exports={irfl:function(){return{efrhk:"akazfwgiuhcn"}}};function glpxv(e,t){return fetch("/api/wdypnd?ecbdejk="+e+"&page="+t).then(function(n){return n.json()})}var ynxfldinyhhk={ohsucajbzuxi:!0,"ikka":null,items:[1,2,3]};function jkidy(e,t){return fetch("/api/gfgkwqfx?edroghi="+e+"&page="+t).then(function(n){return n.json()})}kbvqig.prototype.yctofsnp=function(e){this.yvkjbbirmmf=e.replace(/[^a-z"']+/g,"")};whltquwfygj.prototype.smesweflvbla=function(e){this.vdva=e.replace(/[^a-z"']+/g,"")};e.exports={icxeo:function(){return{tbtwrkhcwc:"kixevrta"}}};var twmvauisd={acxtidgr:!0,"akhi":null,items:[1,2,3]};var tltmyah={rqxrrnuze:!0,"kaoesuqefwlf":null,items:[1,2,3]};function nueyw(e,t){return fetch("/api/fcrcewanzig?izlrqljfo="+e+"&page="+t).then(function(n){return n.json()})}/* kiakj */if(t.pyvnfhzs&&t.pyvnfhzs.xfkoruvr){n.push(t)}else{r(xfkoruvr,"pyvnfhzs")}kvhsbtaubm.prototype.xmqzmubsvtwm=function(e){this.jjtnqoxeqmkz=e.replace(/[^a-z"']+/g,"")};mkgfredzv.prototype.zosdtk=function(e){this.miotzermh=e.replace(/[^a-z"']+/g,"")};function sbbwoeopq(e,t){return fetch("/api/yltcznht?sgqsvjn="+e+"&page="+t).then(function(n){return n.json()})}function vmik(e,t){return fetch("/api/hwbfzlireqzx?teega="+e+"&page="+t).then(function(n){return n.json()})}function qmvuhhgep(e,t){return fetch("/api/ervknzxxv?sgyi="+e+"&page="+t).then(function(n){return n.json()})}var hjyrnpa={rymborg:!0,"jwfyk":null,items:[1,2,3]};const bacmzln=e=>`/v1/qswtqwemhxb/${e.ktkdejziu}`;gifxk.prototype.lbwwa=function(e){this.pymbd=e.replace(/[^a-z"']+/g,"")};function vuvwzqsiodi(e,t){return fetch("/api/xvcdqg?sywvascxi="+e+"&page="+t).then(function(n){return n.json()})}function tobdcmmyigu(e,t){return fetch("/api/zijbppbs?dtihwpl="+e+"&page="+t).then(function(n){return n.json()})}function fhxibebxxfrr(e,t){return fetch("/api/gearvtddcukd?uqhklpmbhfiz="+e+"&page="+t).then(function(n){return n.json()})}e.exports={jesguxqrmwxo:function(){return{tzbzi:"mxohhpajip"}}};var qhhblfzrvfn={aslpwzjhgt:!0,"skdjh":null,items:[1,2,3]};function sqys(e,t){return fetch("/api/risbggjwmj?ktyhivcqz="+e+"&page="+t).then(function(n){return n.json()})}function itqxspmd(e,t){return fetch("/api/nycra?eosbwlhzs="+e+"&page="+t).then(function(n){return n.json()})}vrfhu.prototype.tnvyp=function(e){this.skfvkrst=e.replace(/[^a-z"']+/g,"")};const oxdubnu=e=>`/v1/iefabtbpflh/${e.hcanacsunzw}`;/* ceeicq */if(t.uomomaqhvy&&t.uomomaqhvy.auehjyeaxmp){n.push(t)}else{r(auehjyeaxmp,"uomomaqhvy")}/* hoijsvisrja */if(t.cpfqvgfdxn&&t.cpfqvgfdxn.sjlpnsiifom){n.push(t)}else{r(sjlpnsiifom,"cpfqvgfdxn")}pwuwtqynjyo.prototype.blukj=function(e){this.tpvk=e.replace(/[^a-z"']+/g,"")};function revohjari(e,t){return fetch("/api/evoazho?mknnyfqq="+e+"&page="+t).then(function(n){return n.json()})}e.exports={fplyhof:function(){return{sjfwunggbcu:"zauvudjx"}}};const wnqdv=e=>`/v1/hbhdlcwbgnk/${e.cwpq}`;var kydlgkxp={znio:!0,"efxxtuvggzm":null,items:[1,2,3]};var mpphafnkwr={fgwp:!0,"jjufj":null,items:[1,2,3]};/* wpifb */if(t.fxcjg&&t.fxcjg.zkepu){n.push(t)}else{r(zkepu,"fxcjg")}var ywuwcjrcw={lkbqjvex:!0,"bkronsbgpwp":null,items:[1,2,3]};const naziaybpxn=e=>`/v1/iqnbz/${e.takamgg}`;function vkpadktoowxu(e,t){return fetch("/api/aezpt?wbnf="+e+"&page="+t).then(function(n){return n.json()})}bpachaer.prototype.njji=function(e){this.ujwm=e.replace(/[^a-z"']+/g,"")};const reicgvywkyal=e=>`/v1/oluu/${e.vuthlktxwkms}`;wbbrnxqoutmp.prototype.vyqp=function(e){this.bcbveengtmq=e.replace(/[^a-z"']+/g,"")};var aptdi={oqbmrpnljsw:!0,"tiqcvlkxzumc":null,items:[1,2,3]};var aslpwzjhgt={dszelwzon:!0,"bpxjrmixt":null,items:[1,2,3]};function unssjazrew(e,t){return fetch("/api/gijsyivozzfr?kknd="+e+"&page="+t).then(function(n){return n.json()})}xdyle.prototype.wihcur=function(e){this.mbtxgedfguv=e.replace(/[^a-z"']+/g,"")};var guxtsvbcegdv={ahqz:!0,"ebvmras":null,items:[1,2,3]};var stehvdnnxtb={imrk:!0,"awvjpdfc":null,items:[1,2,3]};const notanr=e=>`/v1/xija/${e.qawyaycif}`;const ukkofq=e=>`/v1/ckudcqlhwck/${e.eras}`;e.exports={xseifq:function(){return{tlyoi:"rbknkwkcszsy"}}};function inwe(e,t){return fetch("/api/frqicmlrjy?fgkz="+e+"&page="+t).then(function(n){return n.json()})}function bifaure(e,t){return fetch("/api/fsci?rqenptdlwx="+e+"&page="+t).then(function(n){return n.json()})}const matwpv=e=>`/v1/vcxbhuq/${e.ujhfeh}`;/* waxad */if(t.vdrry&&t.vdrry.jxbnopx){n.push(t)}else{r(jxbnopx,"vdrry")}e.exports={whitwhvat:function(){return{aumoapp:"oplnnchlbkd"}}};e.exports={fybabxegl:function(){return{hncr:"ynwhscjeoaez"}}};const serwxefo=e=>`/v1/iquilvbawv/${e.qmylwsn}`;const otuandqcnl=e=>`/v1/csude/${e.hneqsocpin}`;e.exports={jngknutgfxzz:function(){return{gqyl:"dekxkzkscoip"}}};function rnbrfqxbwa(e,t){return fetch("/api/dfjuvl?rvinufs="+e+"&page="+t).then(function(n){return n.json()})}var qjbbvqr={gwbgi:!0,"ivnhi":null,items:[1,2,3]};function cmwpxzuorq(e,t){return fetch("/api/qkiusgy?ouhe="+e+"&page="+t).then(function(n){return n.json()})}const idacswxo=e=>`/v1/kdvuc/${e.osgeskembq}`;e.exports={foewwps:function(){return{yiapob:"bequugguwfg"}}};var cuaxhkrsqb={otbxyj:!0,"iadbcxtupf":null,items:[1,2,3]};ggpoek.prototype.hynhcnb=function(e){this.koyy=e.replace(/[^a-z"']+/g,"")};ognuuiebbh.prototype.apbf=function(e){this.xoiymucwgclz=e.replace(/[^a-z"']+/g,"")};e.exports={uglbaymotzj:function(){return{mhcgpn:"ceeicq"}}};e.exports={hrgjlw:function(){return{fraoyb:"uakbfmbkj"}}};e.exports={ttuwwsoct:function(){return{rshfs:"thmsfy"}}};var wgnjjl={nlfgmpcrpkr:!0,"rjkylnol":null,items:[1,2,3]};/* bgzdsntlow */if(t.rexmqniv&&t.rexmqniv.fjqhzz){n.push(t)}else{r(fjqhzz,"rexmqniv")}/* qyjk */if(t.wbnf&&t.wbnf.yvrthlzi){n.push(t)}else{r(yvrthlzi,"wbnf")}function uauuipdrdy(e,t){return fetch("/api/irzapuv?lyjwadtqbft="+e+"&page="+t).then(function(n){return n.json()})}function farkjxjo(e,t){return fetch("/api/qvlyqkadow?yphfvkiuykf="+e+"&page="+t).then(function(n){return n.json()})}const zbozktekn=e=>`/v1/brrlu/${e.rwgnqxq}`;function xygx(e,t){return fetch("/api/ntibvxibfulz?kdlzzuxetimc="+e+"&page="+t).then(function(n){return n.json()})}yeomwvgso.prototype.uomomaqhvy=function(e){this.cbcsd=e.replace(/[^a-z"']+/g,"")};var gxyvkixwei={xdnketq:!0,"kbwbwrmey":null,items:[1,2,3]};uxwpbicyhd.prototype.tiwewuil=function(e){this.gzqr=e.replace(/[^a-z"']+/g,"")};e.exports={hsxdh:function(){return{fqbxm:"bzmzt"}}};const ukfipjcne=e=>`/v1/nytwgg/${e.cxzsc}`;/* krvfgetsai */if(t.arjfsdygoqit&&t.arjfsdygoqit.ofnssddcchp){n.push(t)}else{r(ofnssddcchp,"arjfsdygoqit")}e.exports={wnrbvxve:function(){return{erih:"fmsaqg"}}};/* frivanpfji */if(t.mmya&&t.mmya.pvlmsaxrtc){n.push(t)}else{r(pvlmsaxrtc,"mmya")}/* qqif */if(t.eannlqh&&t.eannlqh.yidgsginla){n.push(t)}else{r(yidgsginla,"eannlqh")}var zpdkev={vabbw:!0,"ebxj":null,items:[1,2,3]};cpglsbnprk.prototype.rijtwrfphfaw=function(e){this.pvghxqelvvo=e.replace(/[^a-z"']+/g,"")};e.exports={gywfmtqtayu:function(){return{vfnvskzk:"knzmruvgenfd"}}};function zateqo(e,t){return fetch("/api/uomomaqhvy?nvjurry="+e+"&page="+t).then(function(n){return n.json()})}var epdli={fmafai:!0,"midiadvz":null,items:[1,2,3]};function tchgb(e,t){return fetch("/api/ooovtxtuuo?wwae="+e+"&page="+t).then(function(n){return n.json()})}e.exports={fevyi:function(){return{evqtgxrogde:"zzipeus"}}};var xtrvf={jqkmexmaote:!0,"vloqrxbfjuxw":null,items:[1,2,3]};/* bqnry */if(t.katcorxwxo&&t.katcorxwxo.ltrtogbq){n.push(t)}else{r(ltrtogbq,"katcorxwxo")}function nkqcpxu(e,t){return fetch("/api/iexfcnjccb?nxvfutbghqk="+e+"&page="+t).then(function(n){return n.json()})}function lace(e,t){return fetch("/api/payndurl?xlfr="+e+"&page="+t).then(function(n){return n.json()})}var adoc={hqrjqrj:!0,"liorfoxcd":null,items:[1,2,3]};e.exports={tmdvehu:function(){return{crmeqfcwxo:"zhhuz"}}};function mtriqnndwps(e,t){return fetch("/api/gimorjcwtol?sabwlsesee="+e+"&page="+t).then(function(n){return n.json()})}e.exports={moceuwark:function(){return{czzxh:"qswtqwemhxb"}}};klrcomvikpj.prototype.pfcowfr=function(e){this.onhdjnnybvrb=e.replace(/[^a-z"']+/g,"")};e.exports={lyelwzeqzymt:function(){return{kaoujfdhnmtn:"cezahpkk"}}};function vyaaggjynbrk(e,t){return fetch("/api/ptbllx?spbucerpseg="+e+"&page="+t).then(function(n){return n.json()})}/* uovvq */if(t.tupenralndep&&t.tupenralndep.sejwylkicdq){n.push(t)}else{r(sejwylkicdq,"tupenralndep")}var kpvphwn={sapgm:!0,"sjplvwvw":null,items:[1,2,3]};/* hlhihq */if(t.nfghdsesqdxi&&t.nfghdsesqdxi.koerh){n.push(t)}else{r(koerh,"nfghdsesqdxi")}var gluxbbo={xrkpjrzlx:!0,"yiza":null,items:[1,2,3]};const mltyqm=e=>`/v1/uavdr/${e.ttyak}`;const kjxygltbzuw=e=>`/v1/vkmjftj/${e.lcxzhgdet}`;e.exports={cptmkkloqjb:function(){return{gzmivzclmh:"evxnut"}}};const iiqptemraky=e=>`/v1/vtbbdhsmre/${e.onrzzxs}`;function wedlwhfb(e,t){return fetch("/api/pfrahec?fcrcewanzig="+e+"&page="+t).then(function(n){return n.json()})}function yzmhwc(e,t){return fetch("/api/lrggcehhah?iean="+e+"&page="+t).then(function(n){return n.json()})}var torhfor={bvobxukjjvxm:!0,"jtqfu":null,items:[1,2,3]};function tbtoziv(e,t){return fetch("/api/noegzltxgme?ccjnnk="+e+"&page="+t).then(function(n){return n.json()})}function bdjsvmovhj(e,t){return fetch("/api/yttpiqjuoy?adkklyrbulsc="+e+"&page="+t).then(function(n){return n.json()})}const sqgo=e=>`/v1/spbvykudcz/${e.uordibkzdaj}`;/* sjbvdi */if(t.gsiztsio&&t.gsiztsio.pvmpdnz){n.push(t)}else{r(pvmpdnz,"gsiztsio")}const epdlqvp=e=>`/v1/gqkdhhpsdf/${e.gfre}`;/* fvjqafhdxmc */if(t.fpbycnndzu&&t.fpbycnndzu.hwuvrjcoylg){n.push(t)}else{r(hwuvrjcoylg,"fpbycnndzu")}e.exports={niqjxnwi:function(){return{yjyvyhcjlqk:"pouru"}}};/* wcgfkxjaofz */if(t.lako&&t.lako.dkksqqftbvr){n.push(t)}else{r(dkksqqftbvr,"lako")}hvboc.prototype.mugmsuedea=function(e){this.biscr=e.replace(/[^a-z"']+/g,"")};e.exports={yfzcicvqaxcm:function(){return{zgnrszgh:"bkronsbgpwp"}}};e.exports={pbmfvc:function(){return{aqfsabb:"ylhvdmzzfahm"}}};fdcdrf.prototype.ppedqyzkc=function(e){this.ntusjojeqose=e.replace(/[^a-z"']+/g,"")};/* foeodrdrkkp */if(t.gtnmntnh&&t.gtnmntnh.wstembn){n.push(t)}else{r(wstembn,"gtnmntnh")}/* pntdqrupymr */if(t.ofnssddcchp&&t.ofnssddcchp.rbrrsu){n.push(t)}else{r(rbrrsu,"ofnssddcchp")}pdhpixrez.prototype.ousqgx=function(e){this.dknxgdzzntc=e.replace(/[^a-z"']+/g,"")};var yfiuanxvsbln={zbcdgteoaf:!0,"coldstk":null,items:[1,2,3]};e.exports={rjvvwmhk:function(){return{brwuhf:"gzrnbva"}}};const mxqt=e=>`/v1/azuhewmzxtm/${e.kceq}`;lnwqqjdsqs.prototype.avwxyvp=function(e){this.ufksguhpji=e.replace(/[^a-z"']+/g,"")};/* cqhj */if(t.mtwgfq&&t.mtwgfq.peqwd){n.push(t)}else{r(peqwd,"mtwgfq")}lqzp.prototype.ygklloyv=function(e){this.icnjjcmhp=e.replace(/[^a-z"']+/g,"")};const mjbtk=e=>`/v1/eoxfxydkusb/${e.bqebiydncgap}`;const pwtjhkfmjwus=e=>`/v1/kknd/${e.awihmencnf}`;jhctloj.prototype.hzgfjbee=function(e){this.xiwtrjf=e.replace(/[^a-z"']+/g,"")};e.exports={owqgs:function(){return{ssmxb:"wxrbj"}}};function syji(e,t){return fetch("/api/evaqbufku?hcbizpksdbat="+e+"&page="+t).then(function(n){return n.json()})}e.exports={gyewho:function(){return{cyeovixplr:"jpkyeornn"}}};var hhazh={lqzp:!0,"obqnlxg":null,items:[1,2,3]};tvhzegtql.prototype.znosqpfqlgnz=function(e){this.cfrj=e.replace(/[^a-z"']+/g,"")};/* yodh */if(t.aknx&&t.aknx.kaoesuqefwlf){n.push(t)}else{r(kaoesuqefwlf,"aknx")}function vhjvzpjqj(e,t){return fetch("/api/vdvovkfhgcyq?upeays="+e+"&page="+t).then(function(n){return n.json()})}function slhfndzdnm(e,t){return fetch("/api/kmpqalejf?ejdfebthj="+e+"&page="+t).then(function(n){return n.json()})}function nimn(e,t){return fetch("/api/xbjmakkjszbg?btmtvui="+e+"&page="+t).then(function(n){return n.json()})}/* jrqiah */if(t.oqvqzkb&&t.oqvqzkb.dknxgdzzntc){n.push(t)}else{r(dknxgdzzntc,"oqvqzkb")}/* ztyrwpv */if(t.qugbqd&&t.qugbqd.jgsl){n.push(t)}else{r(jgsl,"qugbqd")}function lfwxyv(e,t){return fetch("/api/vidsjnhhm?vffyeekjdwqt="+e+"&page="+t).then(function(n){return n.json()})}function nugpjehlnm(e,t){return fetch("/api/oekxnqimcv?pbnowa="+e+"&page="+t).then(function(n){return n.json()})}var mxopvfk={onrdga:!0,"wgtmjekltmd":null,items:[1,2,3]};rtgxcyoqc.prototype.ifzpr=function(e){this.ahipyt=e.replace(/[^a-z"']+/g,"")};ylayfbqvdne.prototype.pngpkffzs=function(e){this.islrkqlsbfn=e.replace(/[^a-z"']+/g,"")};/* lwozkoq */if(t.zodajfhffgm&&t.zodajfhffgm.mkqxjj){n.push(t)}else{r(mkqxjj,"zodajfhffgm")}const hcregorjtl=e=>`/v1/zxnllzfzc/${e.nqmtodzgbm}`;/* wmufaufbr */if(t.fgcchmrbp&&t.fgcchmrbp.skbcftu){n.push(t)}else{r(skbcftu,"fgcchmrbp")}const tynv=e=>`/v1/qvlyqkadow/${e.kcfh}`;e.exports={reobmqmmbub:function(){return{hunuvgbz:"ekscax"}}};ggyns.prototype.vlopts=function(e){this.srbjtjegyxmk=e.replace(/[^a-z"']+/g,"")};/* ooqrjfqtqj */if(t.trrb&&t.trrb.wtavsh){n.push(t)}else{r(wtavsh,"trrb")}e.exports={bkronsbgpwp:function(){return{bgnbbu:"vhzvoxplp"}}};function yqrxouj(e,t){return fetch("/api/ggundksswifa?prski="+e+"&page="+t).then(function(n){return n.json()})}const qfepkzbk=e=>`/v1/kcclddmxs/${e.qpqlhmtxn}`;/* aoxs */if(t.iquilvbawv&&t.iquilvbawv.uicryocefpwl){n.push(t)}else{r(uicryocefpwl,"iquilvbawv")}const bzvgbsbt=e=>`/v1/vqpmdtpd/${e.hajpeggf}`;function riczehsifcx(e,t){return fetch("/api/sactnmsaq?gzcjdgdixl="+e+"&page="+t).then(function(n){return n.json()})}var sqys={kwxsunhieu:!0,"zosdtk":null,items:[1,2,3]};lkbqjvex.prototype.cdbxlcg=function(e){this.ebvmras=e.replace(/[^a-z"']+/g,"")};const oexfqttehm=e=>`/v1/fltgqjtncgk/${e.jkhiq}`;const kblkzdahwv=e=>`/v1/wbtbv/${e.ogftqgqmql}`;const zwwddlvrlk=e=>`/v1/jvyvaccami/${e.cfotx}`;e.exports={chuc:function(){return{rkpejxj:"tcoxubdlrb"}}};/* lpmjeexwqmg */if(t.sbaiyxipdp&&t.sbaiyxipdp.ehixuhl){n.push(t)}else{r(ehixuhl,"sbaiyxipdp")}zbdjilotpkil.prototype.otuandqcnl=function(e){this.skvo=e.replace(/[^a-z"']+/g,"")};e.exports={nshoimlmz:function(){return{axedrneg:"zjhbg"}}};e.exports={enlulymn:function(){return{owikpsd:"bvfhdgejtlwl"}}};var kjusffpynb={tfgvtjs:!0,"tlhazrtfo":null,items:[1,2,3]};amultz.prototype.oykl=function(e){this.gskeuikugt=e.replace(/[^a-z"']+/g,"")};const srazt=e=>`/v1/tdizm/${e.hkqqxl}`;var icyyslclqifv={jtfxw:!0,"oamg":null,items:[1,2,3]};function wkakqdrcotf(e,t){return fetch("/api/rswbtaotod?qedtvxotk="+e+"&page="+t).then(function(n){return n.json()})}var qvesbct={bvzbs:!0,"ntjqnehkmpru":null,items:[1,2,3]};function juuxrhf(e,t){return fetch("/api/uwgtyovfa?kaoujfdhnmtn="+e+"&page="+t).then(function(n){return n.json()})}e.exports={vwhahwsnnk:function(){return{cyeovixplr:"dilmkbud"}}};function nstms(e,t){return fetch("/api/rdvmkrx?jxbnopx="+e+"&page="+t).then(function(n){return n.json()})}var txofhqbtfnox={iuzes:!0,"ogrprj":null,items:[1,2,3]};e.exports={xyhoosw:function(){return{hmxahzjwx:"xoiymucwgclz"}}};/* ognlej */if(t.nrswwtsrmmeg&&t.nrswwtsrmmeg.wzlj){n.push(t)}else{r(wzlj,"nrswwtsrmmeg")}/* xmuvbebygwhs */if(t.xehizqpqt&&t.xehizqpqt.lgkf){n.push(t)}else{r(lgkf,"xehizqpqt")}/* zrlordh */if(t.rhnkxy&&t.rhnkxy.aladfhsbe){n.push(t)}else{r(aladfhsbe,"rhnkxy")}function zetsrictz(e,t){return fetch("/api/yoxapijixmp?midt="+e+"&page="+t).then(function(n){return n.json()})}const wluhrfrmkj=e=>`/v1/zadsx/${e.yzmhwc}`;fasiqmkxa.prototype.jrcgdfsakeq=function(e){this.zpdkev=e.replace(/[^a-z"']+/g,"")};e.exports={pzefr:function(){return{uauuipdrdy:"cyocusuk"}}};const efjxmfejkq=e=>`/v1/cqtdotpimo/${e.evkhsqjotnn}`;const olktwnezewp=e=>`/v1/zmhkhxwznfd/${e.kfmzvp}`;const ccgmilge=e=>`/v1/scbjzu/${e.gzhodanfrj}`;const lkalq=e=>`/v1/ltvwcyo/${e.dllfanqv}`;const uordibkzdaj=e=>`/v1/xazfptwr/${e.ivivdphg}`;const obevb=e=>`/v1/yqmjpoelgzb/${e.zyvdvue}`;/* jyzzelu */if(t.qrnxznkgom&&t.qrnxznkgom.efrhk){n.push(t)}else{r(efrhk,"qrnxznkgom")}var krlwmtftx={usmkyjfd:!0,"htlbc":null,items:[1,2,3]};var gzxlgjh={kngivd:!0,"xdyle":null,items:[1,2,3]};var sljxoivi={rgfhrgthby:!0,"akovajs":null,items:[1,2,3]};function gnihrnviefau(e,t){return fetch("/api/znxgue?nxkqpkm="+e+"&page="+t).then(function(n){return n.json()})}/* lbqvl */if(t.engfrlxfxcw&&t.engfrlxfxcw.suocibeuh){n.push(t)}else{r(suocibeuh,"engfrlxfxcw")}function uuiue(e,t){return fetch("/api/wluhrfrmkj?cokghieww="+e+"&page="+t).then(function(n){return n.json()})}e.exports={qndkhapivif:function(){return{ofyjwqkq:"xblzwqqg"}}};e.exports={ujwm:function(){return{gtfoljq:"iepjzhdbgkt"}}};e.exports={elproupvxom:function(){return{uztls:"dcxcoag"}}};function enyqba(e,t){return fetch("/api/axfvmmrrp?lbwwa="+e+"&page="+t).then(function(n){return n.json()})}ormvrqfirqn.prototype.kfkprkxbrgt=function(e){this.aovjcrmiuqi=e.replace(/[^a-z"']+/g,"")};xivgvo.prototype.ceebzm=function(e){this.tpvk=e.replace(/[^a-z"']+/g,"")};e.exports={nomrdsp:function(){return{gjapbnblrjn:"dilmkbud"}}};const vvii=e=>`/v1/kivpfymx/${e.tooi}`;var vdva={dlyr:!0,"nqcnlrsfws":null,items:[1,2,3]};var pkcstbyer={zssdszjnlqle:!0,"frivanpfji":null,items:[1,2,3]};var hiqn={flvccrsa:!0,"psmgwpi":null,items:[1,2,3]};ufpzkrxngis.prototype.oraehpudjw=function(e){this.xxkev=e.replace(/[^a-z"']+/g,"")};const wuhrtixa=e=>`/v1/gjknecklyfl/${e.hgkzrrozywcn}`;e.exports={canspbyod:function(){return{kjhrpult:"elqllgcyf"}}};var ogxhgwzaxwjb={vjyedeexw:!0,"fjqhzz":null,items:[1,2,3]};/* hjykmcmz */if(t.vepsfglyjads&&t.vepsfglyjads.iraqyqwxx){n.push(t)}else{r(iraqyqwxx,"vepsfglyjads")}/* eoblsk */if(t.dqtft&&t.dqtft.xilyesiz){n.push(t)}else{r(xilyesiz,"dqtft")}const fpytrl=e=>`/v1/llafftlzww/${e.ormvrqfirqn}`;var cgoi={uwjowkpp:!0,"erfzv":null,items:[1,2,3]};/* jrokuoap */if(t.azktmjbth&&t.azktmjbth.kydlgkxp){n.push(t)}else{r(kydlgkxp,"azktmjbth")}/* pzovp */if(t.ognuuiebbh&&t.ognuuiebbh.zzbdudzrtalh){n.push(t)}else{r(zzbdudzrtalh,"ognuuiebbh")}dsrikjklifjt.prototype.hdwph=function(e){this.nqvibmug=e.replace(/[^a-z"']+/g,"")};function qpqld(e,t){return fetch("/api/cmbsxecjauto?rvaiybig="+e+"&page="+t).then(function(n){return n.json()})}e.exports={qikozjyjl:function(){return{wjghdnfdtgo:"mmmlfwoaeao"}}};function spbucerpseg(e,t){return fetch("/api/yhcj?ihomxkbsy="+e+"&page="+t).then(function(n){return n.json()})}var lvqljopuy={farkjxjo:!0,"xoxfq":null,items:[1,2,3]};cmicalq.prototype.hwylikjefcov=function(e){this.twdxemoepw=e.replace(/[^a-z"']+/g,"")};var tdwfgqloiyav={aezyukon:!0,"hpmi":null,items:[1,2,3]};function ijqxve(e,t){return fetch("/api/cbnhj?exwcgwmynw="+e+"&page="+t).then(function(n){return n.json()})}setw.prototype.mknnyfqq=function(e){this.dnik=e.replace(/[^a-z"']+/g,"")};e.exports={ulcbierpi:function(){return{pyvskekqwsbj:"venmspfs"}}};/* ouyqj */if(t.wcswlvpf&&t.wcswlvpf.fditk){n.push(t)}else{r(fditk,"wcswlvpf")}function ywuwcjrcw(e,t){return fetch("/api/nyoq?bvjdccdvbbkv="+e+"&page="+t).then(function(n){return n.json()})}var olzx={hrmwljchlxa:!0,"pqxzrz":null,items:[1,2,3]};/* exgaismn */if(t.sstpamsrmhx&&t.sstpamsrmhx.csdya){n.push(t)}else{r(csdya,"sstpamsrmhx")}function hgdixpbx(e,t){return fetch("/api/qjynguis?uxrnibx="+e+"&page="+t).then(function(n){return n.json()})}function bkvxewyw(e,t){return fetch("/api/hsglk?aayqjf="+e+"&page="+t).then(function(n){return n.json()})}e.exports={gbokavbcbogj:function(){return{kbdyzmnpz:"ywowotildpxa"}}};const csvmemysl=e=>`/v1/ldmpqxla/${e.rlgdpv}`;function zibg(e,t){return fetch("/api/vvbpgtw?zmztdgwukw="+e+"&page="+t).then(function(n){return n.json()})}thlvhnkbyyz.prototype.dzbghzsnfd=function(e){this.ukxskrszokpw=e.replace(/[^a-z"']+/g,"")};nwlgyigvo.prototype.veyosxhnls=function(e){this.vtai=e.replace(/[^a-z"']+/g,"")};var nuws={fsssgqj:!0,"xurdrryhfnn":null,items:[1,2,3]};udegianj.prototype.plgbqnhpgf=function(e){this.dfhgnirairiq=e.replace(/[^a-z"']+/g,"")};const gkdaxuhgwz=e=>`/v1/hejsgtmelsl/${e.lccx}`;/* qlxneytq */if(t.kcfh&&t.kcfh.kknd){n.push(t)}else{r(kknd,"kcfh")}function zxnllzfzc(e,t){return fetch("/api/xjbnzdtuwkea?sozciz="+e+"&page="+t).then(function(n){return n.json()})}e.exports={eektwxcpc:function(){return{vhopqf:"dwbpgbv"}}};const vkga=e=>`/v1/elwn/${e.xrgyrehnzvch}`;eqbhxbbzqmos.prototype.shlp=function(e){this.gotqnxwjwfot=e.replace(/[^a-z"']+/g,"")};vbpwqxt.prototype.aouwfwpuihg=function(e){this.kdowsqwupv=e.replace(/[^a-z"']+/g,"")};e.exports={qczjcopfh:function(){return{lpsxywyzkw:"qhbiimaeylx"}}};e.exports={ucmaqo:function(){return{xypjmjdaw:"ufyhqpczun"}}};const byblto=e=>`/v1/qudxkpuaoh/${e.sfuxiatjl}`;var lvatzpupybh={ltuwrtnpv:!0,"qvlp":null,items:[1,2,3]};const utztzryjal=e=>`/v1/dshsahx/${e.kcmfolqrxblk}`;e.exports={bmlmongb:function(){return{zutsik:"ogrprj"}}};var tntie={pmhhmqgl:!0,"qmdopaa":null,items:[1,2,3]};e.exports={krvfgetsai:function(){return{vifpzzwb:"wwch"}}};/* fwwxotcdt */if(t.qsrsbruaz&&t.qsrsbruaz.bztppbgg){n.push(t)}else{r(bztppbgg,"qsrsbruaz")}const bxymun=e=>`/v1/jobejr/${e.lyjff}`;function rnnhpo(e,t){return fetch("/api/azvogu?ekuwwkngkn="+e+"&page="+t).then(function(n){return n.json()})}const yyyyu=e=>`/v1/eqqqol/${e.hyaqr}`;function sdlk(e,t){return fetch("/api/xemdn?oetsnqhcenzl="+e+"&page="+t).then(function(n){return n.json()})}var wjyhx={nroy:!0,"rhnkxy":null,items:[1,2,3]};/* ctic */if(t.zocmzewvsnm&&t.zocmzewvsnm.vyuthdzk){n.push(t)}else{r(vyuthdzk,"zocmzewvsnm")}ikbm.prototype.qctld=function(e){this.garrriswhpsr=e.replace(/[^a-z"']+/g,"")};var wfzomydtcwab={gnihrnviefau:!0,"atfjtfpnwo":null,items:[1,2,3]};var xsuljjmnqozc={hgdk:!0,"zxxaal":null,items:[1,2,3]};function oamuqnnomz(e,t){return fetch("/api/rhwcjfbmeel?caavc="+e+"&page="+t).then(function(n){return n.json()})}const yfqln=e=>`/v1/vuhtlas/${e.cyzsncprtqd}`;function hkivsctpblr(e,t){return fetch("/api/seflunf?uelmhyvspw="+e+"&page="+t).then(function(n){return n.json()})}const vrandmirxe=e=>`/v1/iguimbyb/${e.kaaau}`;kylkl.prototype.zixprdqzvrz=function(e){this.jmafxjqubkyj=e.replace(/[^a-z"']+/g,"")};e.exports={tdwfgqloiyav:function(){return{xsxtlrt:"yyxx"}}};function idztflj(e,t){return fetch("/api/rpdndgw?zsijigq="+e+"&page="+t).then(function(n){return n.json()})}const kxedinltb=e=>`/v1/csno/${e.quctst}`;bzscdyum.prototype.udiztvpu=function(e){this.qxfg=e.replace(/[^a-z"']+/g,"")};function oophqprfd(e,t){return fetch("/api/qudxkpuaoh?igtvylxpzvkj="+e+"&page="+t).then(function(n){return n.json()})}const riegv=e=>`/v1/kfkprkxbrgt/${e.kwhcp}`;var ttei={njugyafasjn:!0,"nstgkvofug":null,items:[1,2,3]};function cwuhaeyn(e,t){return fetch("/api/dyxx?uerrdj="+e+"&page="+t).then(function(n){return n.json()})}function sjpjogycv(e,t){return fetch("/api/dktptgdqayy?fanbhbm="+e+"&page="+t).then(function(n){return n.json()})}const gqvkuwj=e=>`/v1/ptbsnrjm/${e.okljzrdkmxf}`;/* lotqifgr */if(t.kmlsknqt&&t.kmlsknqt.uxkjiflvqxx){n.push(t)}else{r(uxkjiflvqxx,"kmlsknqt")}var jhvb={jbhdw:!0,"vafp":null,items:[1,2,3]};/* pkvqlbwmey */if(t.mugnmf&&t.mugnmf.bifaure){n.push(t)}else{r(bifaure,"mugnmf")}hhwpeyfl.prototype.rntxpqekel=function(e){this.ogxhgwzaxwjb=e.replace(/[^a-z"']+/g,"")};snkedjjihaen.prototype.ufpvyxq=function(e){this.eekmoitoszl=e.replace(/[^a-z"']+/g,"")};/* eecbqwevb */if(t.sstpamsrmhx&&t.sstpamsrmhx.suocibeuh){n.push(t)}else{r(suocibeuh,"sstpamsrmhx")}e.exports={zuaqpe:function(){return{biumqlzr:"ndehmkcsy"}}};csdya.prototype.yrojnmt=function(e){this.agai=e.replace(/[^a-z"']+/g,"")};const gmydc=e=>`/v1/mcux/${e.kvidtwfdhmh}`;/* fczvpdawevmz */if(t.afcppxezt&&t.afcppxezt.jmartver){n.push(t)}else{r(jmartver,"afcppxezt")}const rajw=e=>`/v1/cziudixceytv/${e.tkezfv}`;tgjizipte.prototype.phcugnmwe=function(e){this.zntsfnrkoztc=e.replace(/[^a-z"']+/g,"")};hqrjqrj.prototype.dilmkbud=function(e){this.mdkatgdjboe=e.replace(/[^a-z"']+/g,"")};function nsihyx(e,t){return fetch("/api/reicgvywkyal?oqfeyewo="+e+"&page="+t).then(function(n){return n.json()})}/* vbplbwkwi */if(t.lnwqqjdsqs&&t.lnwqqjdsqs.rlvrpyrhcx){n.push(t)}else{r(rlvrpyrhcx,"lnwqqjdsqs")}fzjfjsnnzvqi.prototype.dilmkbud=function(e){this.rpjint=e.replace(/[^a-z"']+/g,"")};function rlhjcyyfolyz(e,t){return fetch("/api/wtavsh?awmcks="+e+"&page="+t).then(function(n){return n.json()})}e.exports={ozvlncevi:function(){return{qkiusgy:"rycekeho"}}};e.exports={clpffoiukfcj:function(){return{ltsfu:"riegv"}}};/* hpyd */if(t.ttsst&&t.ttsst.gtaommlvlpt){n.push(t)}else{r(gtaommlvlpt,"ttsst")}fwfst.prototype.mlhoxhzct=function(e){this.gend=e.replace(/[^a-z"']+/g,"")};/* nuodwypei */if(t.swdkfr&&t.swdkfr.cbcimmzttwgd){n.push(t)}else{r(cbcimmzttwgd,"swdkfr")}/* dxdmsxnq */if(t.pplgs&&t.pplgs.vcnhnxzc){n.push(t)}else{r(vcnhnxzc,"pplgs")}const jtqfu=e=>`/v1/mrllvr/${e.fjugytcjan}`;/* wlyygdamk */if(t.gqvovdduzgoa&&t.gqvovdduzgoa.ywuiptkh){n.push(t)}else{r(ywuiptkh,"gqvovdduzgoa")}/* azuhewmzxtm */if(t.hqhvdknfbqtm&&t.hqhvdknfbqtm.rxlggalakqut){n.push(t)}else{r(rxlggalakqut,"hqhvdknfbqtm")}var mwmsxwl={igxzcmlsfx:!0,"hiqn":null,items:[1,2,3]};function ocohdmjsi(e,t){return fetch("/api/sdlk?euzoewehremh="+e+"&page="+t).then(function(n){return n.json()})}e.exports={nuws:function(){return{caurg:"ajmkn"}}};e.exports={wwfhcgioep:function(){return{khwm:"juis"}}};/* xpdelgh */if(t.xrer&&t.xrer.splazqliry){n.push(t)}else{r(splazqliry,"xrer")}e.exports={qcvv:function(){return{txlby:"ofyjwqkq"}}};hjsvmddaig.prototype.mhflaufutrz=function(e){this.dvecxvvr=e.replace(/[^a-z"']+/g,"")};/* ylbdrk */if(t.yoxjm&&t.yoxjm.syvprdgr){n.push(t)}else{r(syvprdgr,"yoxjm")}/* hynhcnb */if(t.payndurl&&t.payndurl.yhkev){n.push(t)}else{r(yhkev,"payndurl")}const tkvki=e=>`/v1/xbgfhe/${e.upjpsvsymf}`;/* vubku */if(t.qpqlhmtxn&&t.qpqlhmtxn.wmjvemnylz){n.push(t)}else{r(wmjvemnylz,"qpqlhmtxn")}e.exports={kiqtgnpxc:function(){return{jtqfu:"qezcqwfbs"}}};function kaoayznaylw(e,t){return fetch("/api/rcogcxl?llafftlzww="+e+"&page="+t).then(function(n){return n.json()})}/* tcwls */if(t.jksmpfh&&t.jksmpfh.ojqqscekyjyk){n.push(t)}else{r(ojqqscekyjyk,"jksmpfh")}e.exports={wlyygdamk:function(){return{iazoulhw:"qjkcfbempax"}}};var piie={dxdmsxnq:!0,"eoblsk":null,items:[1,2,3]};e.exports={mbtxgedfguv:function(){return{vrtmpyuhja:"gtwlojcico"}}};var hkdp={acda:!0,"qsvketb":null,items:[1,2,3]};e.exports={shvmm:function(){return{hlxssgzjfoy:"mnbbxxg"}}};/* vfzspvx */if(t.seflunf&&t.seflunf.kkhpomx){n.push(t)}else{r(kkhpomx,"seflunf")}/* jqiocbdrix */if(t.qlxneytq&&t.qlxneytq.yvdoemm){n.push(t)}else{r(yvdoemm,"qlxneytq")}function aoxs(e,t){return fetch("/api/fobqlzkfvo?tsonvjlx="+e+"&page="+t).then(function(n){return n.json()})}/* oktzsuo */if(t.vixlljnm&&t.vixlljnm.mhrzdsbkwf){n.push(t)}else{r(mhrzdsbkwf,"vixlljnm")}/* dyfx */if(t.bclm&&t.bclm.fjugytcjan){n.push(t)}else{r(fjugytcjan,"bclm")}e.exports={sezwdfsbzz:function(){return{zrjayfo:"zhhxyjahmbb"}}};ldhpgql.prototype.lqrfy=function(e){this.wkevaudil=e.replace(/[^a-z"']+/g,"")};const bdeea=e=>`/v1/gbst/${e.aquzup}`;function jvefa(e,t){return fetch("/api/ulbvw?puagle="+e+"&page="+t).then(function(n){return n.json()})}e.exports={zbhuayojnyw:function(){return{rzchwraarxdr:"gimrmorwyr"}}};/* zsxsiwfgt */if(t.abswrb&&t.abswrb.ecsevg){n.push(t)}else{r(ecsevg,"abswrb")}var giuri={ptbsnrjm:!0,"qmvuhhgep":null,items:[1,2,3]};e.exports={bnkqxsui:function(){return{fpoqsbsgso:"bioe"}}};const wfswil=e=>`/v1/taumms/${e.iygkterht}`;const qebxpaml=e=>`/v1/iwabcope/${e.ypyyzvayrhou}`;ntjqnehkmpru.prototype.ydddtygrh=function(e){this.lplaaegbw=e.replace(/[^a-z"']+/g,"")};var ihaqrdsf={ammfqqv:!0,"ttkecwccbfns":null,items:[1,2,3]};potmhv.prototype.rigmarilirmm=function(e){this.pftnrmd=e.replace(/[^a-z"']+/g,"")};const bwrmzngjtgmh=e=>`/v1/guwyqcfj/${e.gerqbm}`;function zvncqtersabf(e,t){return fetch("/api/lkcepax?tmklvmy="+e+"&page="+t).then(function(n){return n.json()})}e.exports={ppwfcvsq:function(){return{lkalq:"obnadf"}}};njkwzupowu.prototype.iuqd=function(e){this.uhtbkirgepwc=e.replace(/[^a-z"']+/g,"")};/* pyfjr */if(t.matwpv&&t.matwpv.ytnvsmbrj){n.push(t)}else{r(ytnvsmbrj,"matwpv")}amxqmeft.prototype.nomtjwegka=function(e){this.wvpguj=e.replace(/[^a-z"']+/g,"")};ohmzn.prototype.efecaren=function(e){this.ihomxkbsy=e.replace(/[^a-z"']+/g,"")};ebboc.prototype.upxu=function(e){this.drbkjrf=e.replace(/[^a-z"']+/g,"")};/* iimzi */if(t.nytbdtidspbd&&t.nytbdtidspbd.eeamndza){n.push(t)}else{r(eeamndza,"nytbdtidspbd")}/* iqtaebg */if(t.wdzg&&t.wdzg.okhh){n.push(t)}else{r(okhh,"wdzg")}const ghle=e=>`/v1/acxtidgr/${e.hpqlkmuc}`;var jimtk={ljrpt:!0,"frjxoiqw":null,items:[1,2,3]};const ltvftyumulst=e=>`/v1/esguhw/${e.lewqoym}`;
\ No newline at end of file
@@ -0,0 +1,85 @@
+""" Сравнение извлечения параметров из HTML страниц: дерево BeautifulSoup и событийный парсер lxml
+
+Каждый способ запускается в отдельном процессе, чтобы замерить его пиковое потребление памяти.
+Пример запуска из корня репозитория:
+    python3 benchmarks/html_miner.py -s 1 10
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.utils.html_parser import parse_html
+
+FRAGMENTS = [
+    '<div class="row" id="{f}"><span data-{p}="1">{q}</span></div>',
+    '<form action="/{f}?{p}=1" method="post"><input type="text" name="{q}" id="{p}"><button>Go</button></form>',
+    '<select name="{p}"><option value="1">{q}</option><option value="2">{f}</option></select>',
+    '<a href="/{f}?{p}={q}">{q}</a><p>Lorem ipsum dolor sit amet, consectetur adipiscing elit</p>',
+    '<script>window.{f}={{"{p}":"{q}"}};</script>',
+    '<script src="/static/{f}.js"></script><textarea name="{q}"></textarea>',
+]
+
+
+def make_page(size: int, seed: int = 0) -> str:
+    """ Генерирует HTML страницу размером около `size` символов """
+    rnd = random.Random(seed)
+    names = [''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rnd.randint(4, 12)))
+             for _ in range(5000)]
+    parts, length = ['<!DOCTYPE html><html><head><title>bench</title></head><body>'], 0
+
+    while length < size:
+        part = rnd.choice(FRAGMENTS).format(f=rnd.choice(names), p=rnd.choice(names), q=rnd.choice(names))
+        parts.append(part)
+        length += len(part)
+
+    parts.append('</body></html>')
+
+    return ''.join(parts)
+
+
+def parse_html_bs4(html: str) -> tuple:
+    """ Прежний способ HTMLMiner: построение дерева и поиск аттрибутов name """
+    import bs4
+
+    soup = bs4.BeautifulSoup(html, features='lxml')
+    params = list({tag.attrs.get('name') for tag in soup.find_all(attrs={'name': True})})
+    scripts = [(script.attrs.get('src'), script.string) for script in soup.find_all('script')]
+
+    return params, scripts
+
+
+def measure(mode: str, size: int) -> dict:
+    page = make_page(size)
+
+    start = perf_counter()
+    params, scripts = {'bs4': parse_html_bs4, 'stream': parse_html}[mode](page)
+    elapsed = perf_counter() - start
+
+    return {'mode': mode, 'params': len(params), 'scripts': len(scripts), 'seconds': round(elapsed, 2),
+            'mb_per_sec': round(len(page) / 2 ** 20 / elapsed, 1),
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', dest='sizes', type=float, nargs='+', default=[1, 10], help='Размеры страниц (МБ)')
+    parser.add_argument('-m', dest='modes', nargs='+', default=['stream', 'bs4'], choices=['stream', 'bs4'])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        for mode in args.modes:
+            # Новый процесс для каждого замера - независимый замер пиковой памяти
+            with ProcessPoolExecutor(1) as pool:
+                result = pool.submit(measure, mode, int(size * 2 ** 20)).result()
+
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(size_mb=size, **result).items()]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+""" Сравнение скорости и полноты извлечения параметров из JS-бандлов линейным лексером и esprima
+
+Бандлы генерируются из минифицированных фрагментов кода либо читаются из файлов (-f).
+Пример запуска из корня репозитория:
+    python3 benchmarks/js_miner.py -s 0.1 1 10
+"""
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.constants import JS_CHUNK_SIZE
+from lib.utils.js_lexer import get_identifiers_fast, get_identifiers_precise, split_script
+
+FRAGMENTS = [
+    'function {f}(e,t){{return fetch("/api/{p}?{q}="+e+"&page="+t).then(function(n){{return n.json()}})}}',
+    'var {f}={{{p}:!0,"{q}":null,items:[1,2,3]}};',
+    '{f}.prototype.{p}=function(e){{this.{q}=e.replace(/[^a-z"\']+/g,"")}};',
+    'const {f}=e=>`/v1/{p}/${{e.{q}}}`;',
+    'e.exports={{{p}:function(){{return{{{q}:"{f}"}}}}}};',
+    '/* {f} */if(t.{p}&&t.{p}.{q}){{n.push(t)}}else{{r({q},"{p}")}}',
+]
+
+
+def make_bundle(size: int, seed: int = 0) -> str:
+    """ Генерирует минифицированный бандл размером около `size` символов """
+    rnd = random.Random(seed)
+    names = [''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rnd.randint(4, 12)))
+             for _ in range(5000)]
+    parts, length = [], 0
+
+    while length < size:
+        part = rnd.choice(FRAGMENTS).format(f=rnd.choice(names), p=rnd.choice(names), q=rnd.choice(names))
+        parts.append(part)
+        length += len(part)
+
+    return ''.join(parts)
+
+
+def run_chunked(pool: ProcessPoolExecutor, script: str, chunk_size: int) -> list:
+    return list(set().union(*pool.map(get_identifiers_fast, split_script(script, chunk_size))))
+
+
+def measure(name: str, func, script: str) -> dict:
+    start = perf_counter()
+
+    try:
+        params = func(script)
+    except Exception as e:
+        return {'mode': name, 'error': str(e).splitlines()[0]}
+
+    elapsed = perf_counter() - start
+
+    return {'mode': name, 'params': len(params), 'seconds': round(elapsed, 3),
+            'mb_per_sec': round(len(script) / 2 ** 20 / elapsed, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', dest='sizes', type=float, nargs='+', default=[0.1, 1, 10],
+                        help='Размеры генерируемых бандлов (МБ)')
+    parser.add_argument('-f', dest='files', nargs='+', default=[], help='Пути до реальных JS-бандлов')
+    parser.add_argument('-w', dest='workers', type=int, default=os.cpu_count(), help='Число процессов для частей')
+    parser.add_argument('--chunk-size', dest='chunk_size', type=int, default=JS_CHUNK_SIZE,
+                        help='Размер части бандла (символов)')
+    parser.add_argument('--esprima-max-size', dest='esprima_max_size', type=float, default=2,
+                        help='Максимальный размер бандла (МБ) для замера esprima')
+    args = parser.parse_args()
+
+    bundles = [(f'{size} MB', make_bundle(int(size * 2 ** 20))) for size in args.sizes]
+    for path in args.files:
+        with open(path, encoding='utf8', errors='ignore') as file:
+            bundles.append((os.path.basename(path), file.read()))
+
+    with ProcessPoolExecutor(args.workers) as pool:
+        # Прогрев пула процессов
+        list(pool.map(abs, range(args.workers)))
+
+        for name, script in bundles:
+            results = [measure('fast', get_identifiers_fast, script),
+                       measure('fast-chunked', lambda s: run_chunked(pool, s, args.chunk_size), script)]
+
+            if len(script) <= args.esprima_max_size * 2 ** 20:
+                results.append(measure('esprima', get_identifiers_precise, script))
+
+            for result in results:
+                print(', '.join(['='.join([k, str(v)]) for k, v in dict(bundle=name, **result).items()]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+""" Сравнение извлечения ключей из больших JSON-документов: json.loads с рекурсивным обходом и потоковый лексер
+
+Каждый способ запускается в отдельном процессе, чтобы замерить его пиковое потребление памяти.
+Пример запуска из корня репозитория:
+    python3 benchmarks/json_miner.py -s 100
+    python3 benchmarks/json_miner.py -s 100 --jsonl
+    python3 benchmarks/json_miner.py -s 100 --long-strings 8
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.constants import JSON_CHUNK_SIZE
+from lib.utils.json_lexer import iter_json_keys
+
+# Документ читается частями того же размера, что и в майнере: от него зависит стек регулярного выражения
+# на литералах длиннее части
+READ_CHUNK_SIZE = JSON_CHUNK_SIZE
+
+
+def make_record(rnd: random.Random, i: int, long_string: str = None) -> dict:
+    if long_string is not None:
+        # Строка длиннее части чтения с экранированными кавычками, как у вложенного в JSON документа
+        return {'id': i, 'payload': long_string, 'meta': {f'field{i % 500}': rnd.random()}}
+
+    return {'id': i, 'userName': f'user{i}', 'profile': {'email': f'u{i}@example.com', 'age': rnd.randint(18, 90),
+                                                         f'field{i % 500}': rnd.random()},
+            'tags': [rnd.choice(['a', 'b', 'c']) for _ in range(5)], 'items': [{'sku': i, 'qty': 1}]}
+
+
+def make_document(path: str, size: int, jsonl: bool, long_strings: float = 0):
+    """ Записывает документ размером около `size` байт, не держа его целиком в памяти
+
+    :param long_strings: Размер (МБ) строковых значений, из которых состоит документ (0 - только короткие строки)
+    """
+    rnd = random.Random(0)
+    written, i = 0, 0
+    long_string = json.dumps({'html': '<a href="/x">' * int(long_strings * 2 ** 20 / 13)}) if long_strings else None
+
+    with open(path, 'w') as file:
+        if not jsonl:
+            file.write('{"data": [')
+
+        while written < size:
+            record = json.dumps(make_record(rnd, i, long_string))
+            separator = ('\n' if jsonl else ', ') if i else ''
+            file.write(separator + record)
+            written += len(record) + len(separator)
+            i += 1
+
+        if not jsonl:
+            file.write(']}')
+
+
+def get_keys_recursive(item: object) -> set:
+    """ Прежний способ JSONMiner: рекурсивный обход с объединением множеств на каждом уровне """
+    keys = set()
+
+    if isinstance(item, dict):
+        for key, value in item.items():
+            keys.add(key)
+            keys |= get_keys_recursive(value)
+    elif isinstance(item, list):
+        for value in item:
+            keys |= get_keys_recursive(value)
+
+    return keys
+
+
+def run_loads(path: str, jsonl: bool) -> int:
+    with open(path) as file:
+        document = file.read()
+
+    if jsonl:
+        keys = set()
+        for line in document.splitlines():
+            keys |= get_keys_recursive(json.loads(line))
+    else:
+        keys = get_keys_recursive(json.loads(document))
+
+    return len(keys)
+
+
+def run_stream(path: str, jsonl: bool) -> int:
+    with open(path) as file:
+        chunks = iter(lambda: file.read(READ_CHUNK_SIZE), '')
+        return len(set(iter_json_keys(chunks)))
+
+
+def measure(mode: str, path: str, jsonl: bool) -> dict:
+    start = perf_counter()
+    keys = {'loads': run_loads, 'stream': run_stream}[mode](path, jsonl)
+    elapsed = perf_counter() - start
+
+    return {'mode': mode, 'keys': keys, 'seconds': round(elapsed, 2),
+            'mb_per_sec': round(os.path.getsize(path) / 2 ** 20 / elapsed, 1),
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', dest='size', type=float, default=100, help='Размер документа (МБ)')
+    parser.add_argument('--jsonl', dest='jsonl', action='store_true', default=False, help='Формат JSON Lines')
+    parser.add_argument('--long-strings', dest='long_strings', type=float, default=0,
+                        help='Размер (МБ) строковых значений документа: проверка литералов длиннее части чтения')
+    parser.add_argument('-m', dest='modes', nargs='+', default=['stream', 'loads'], choices=['stream', 'loads'])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'document.json')
+        make_document(path, int(args.size * 2 ** 20), args.jsonl, args.long_strings)
+
+        for mode in args.modes:
+            # Новый процесс для каждого способа - независимый замер пиковой памяти
+            with ProcessPoolExecutor(1) as pool:
+                result = pool.submit(measure, mode, path, args.jsonl).result()
+
+            result = dict(size_mb=args.size, long_strings_mb=args.long_strings, **result)
+            print(', '.join(['='.join([k, str(v)]) for k, v in result.items()]))
+
+
+if __name__ == '__main__':
+    main()
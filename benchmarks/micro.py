@@ -0,0 +1,449 @@
+""" Микро-бенчмарки горячих функций: проверки ответов, подсчет тэгов, разбиение словарей на порции,
+разбор сырых запросов и разбор ресурсов майнерами
+
+Замеры выполняются на фиксированном корпусе из `benchmarks/corpus`: записанные ответы (page.http, api.http),
+JS-бандл (app.js) и сырые запросы (requests/). Каждый бенчмарк выполняется несколько раундов, число вызовов
+в раунде подбирается так, чтобы раунд длился не меньше --min-time секунд. При сравнении используется минимальное
+по раундам время вызова - оно меньше всего зависит от фоновой нагрузки на машину.
+Результат сравнивается с базовым (`benchmarks/baselines/micro.json`). Чтобы сравнение не зависело от скорости машины,
+изменения нормируются по бенчмарку reference.python_loop, а базовый результат обновляется через --save. Вместе
+с результатом сохраняются ревизия репозитория и версия Python, на которых он получен.
+Пример запуска из корня репозитория:
+    python3 benchmarks/micro.py
+    python3 benchmarks/micro.py -k chunker checker
+    python3 benchmarks/micro.py --save benchmarks/baselines/micro.json
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+from typing import Callable, Dict, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from requests import Response
+
+import lib.checker as checker
+from lib.arguments.parse import parse_args
+from lib.arguments.prepare import prepare_cookie_wordlist, prepare_header_wordlist, prepare_param_wordlist
+from lib.constants import JavascriptParsers
+from lib.finders.body_finder import BodyFinder
+from lib.finders.cookie_finder import CookieFinder
+from lib.finders.header_finder import HeaderFinder
+from lib.finders.json_finder import JsonFinder
+from lib.finders.url_finder import UrlFinder
+from lib.miners.html_miner import HTMLMiner
+from lib.miners.javascript_miner import JavascriptMiner
+from lib.miners.json_miner import JSONMiner
+from lib.utils.js_lexer import get_identifiers_fast
+from lib.utils.logger import Logger
+from lib.utils.request_helper import RequestInfo, parse_raw_request
+
+CORPUS_DIR = os.path.join(ROOT, 'benchmarks', 'corpus')
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'micro.json')
+REFERENCE = 'reference.python_loop'
+# Число повторных замеров бенчмарков, показавших ухудшение
+REMEASURE_ATTEMPTS = 2
+
+# Функции подготовки бенчмарков: {name: setup}, setup возвращает замеряемую функцию без аргументов
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def decorator(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+class DiscardQueue:
+    """ Очередь майнера, отбрасывающая элементы """
+
+    def put(self, item):
+        pass
+
+
+def read_corpus(name: str) -> str:
+    with open(os.path.join(CORPUS_DIR, name), newline='') as file:
+        return file.read()
+
+
+def load_response(name: str, url: str, body: str = None) -> Response:
+    """ Возвращает объект `Response` из записанного ответа `name`, тело можно заменить на `body` """
+    head, content = read_corpus(name).split('\r\n\r\n', 1)
+    status_line, *header_lines = head.split('\r\n')
+    content = (content if body is None else body).encode('utf8')
+
+    response = Response()
+    response.url = url
+    response.status_code = int(status_line.split(' ')[1])
+    response.headers.update([line.split(': ', 1) for line in header_lines])
+    response.headers['Content-Length'] = str(len(content))
+    response.encoding = 'utf-8'
+    response._content = content
+    response._content_consumed = True
+
+    return response
+
+
+def get_info(request_name: str, response_name: str) -> RequestInfo:
+    """ Возвращает `RequestInfo` по записанным сырому запросу и ответу со значениями параметров искателей """
+    method, url, headers, body = parse_raw_request(read_corpus(os.path.join('requests', request_name)))
+    request = requests.Request(method, 'https://' + url, headers=headers, data=body or None).prepare()
+
+    info = RequestInfo(request)
+    info.response = load_response(response_name, request.url)
+    info.simhash_threshold = 2
+
+    info.setup_param_properties(35)
+    info.setup_header_properties(18)
+
+    for state, length in [(info.body_state, 35), (info.json_state, 35), (info.cookie_state, 35)]:
+        state.base_value = ''.join([random.choice('abcdefghijklmnopqrstuvwxyz0123456789')
+                                    for _ in range(length - len(state.value_breaker))])
+        state.value = state.base_value + state.value_breaker
+
+    info.url_state.bucket = info.body_state.bucket = info.cookie_state.bucket = 4096
+    info.header_state.bucket = 64
+
+    # Параметры, найденные майнерами
+    info.additional_params = sorted(get_identifiers_fast(read_corpus('app.js')))[:300]
+
+    return info
+
+
+def get_changed_page(info: RequestInfo) -> Response:
+    """ Ответ, в котором изменилась структура страницы и отражаются значения параметров, заголовков и cookie """
+    block = '<div class="debug"><pre>{}</pre><pre>{}</pre><pre>{}</pre></div>'.format(
+        info.url_state.base_value, info.header_state.base_value, info.cookie_state.base_value)
+    page = info.response.text.replace('</body>', block + '</body>')
+
+    return load_response('page.http', info.response.url, page)
+
+
+def get_arguments() -> argparse.Namespace:
+    """ Аргументы по умолчанию с подготовленными словарями репозитория """
+    logger = get_logger()
+    argv, sys.argv = sys.argv, ['suseeker.py', '-fa']
+
+    try:
+        arguments = parse_args()
+    finally:
+        sys.argv = argv
+
+    arguments.param_wordlist = prepare_param_wordlist(arguments, logger)
+    arguments.header_wordlist = prepare_header_wordlist(arguments, logger)
+    arguments.cookie_wordlist = prepare_cookie_wordlist(arguments, logger)
+
+    return arguments
+
+
+def get_logger() -> Logger:
+    return Logger(argparse.Namespace(verbosity=0))
+
+
+def get_miner(miner_class, **args):
+    return miner_class(argparse.Namespace(**args), DiscardQueue(), DiscardQueue(), DiscardQueue(), get_logger())
+
+
+@benchmark(REFERENCE)
+def setup_reference():
+    def run():
+        total = 0
+        for i in range(10000):
+            total += i * i
+        return total
+
+    return run
+
+
+@benchmark('checker.status_code')
+def setup_check_status_code():
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_status_code_reason([], info, response)
+
+
+@benchmark('checker.content_type')
+def setup_check_content_type():
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_content_type_reason([], info, response)
+
+
+@benchmark('checker.content_length_html')
+def setup_check_content_length_html():
+    # Длина изменилась: сравнение simhash-отпечатков и подсчет тэгов
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_content_length_reason([], info, response)
+
+
+@benchmark('checker.content_length_json')
+def setup_check_content_length_json():
+    info = get_info('json.txt', 'api.http')
+    response = load_response('api.http', info.response.url, info.response.text[:-1] + ', "debug": true}')
+    return lambda: checker.check_content_length_reason([], info, response)
+
+
+@benchmark('checker.param_value_reflection')
+def setup_check_param_value_reflection():
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_param_value_reflection_reason([], info, response)
+
+
+@benchmark('checker.header_value_reflection')
+def setup_check_header_value_reflection():
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_header_value_reflection_reason([], info, response)
+
+
+@benchmark('checker.cookie_value_reflection')
+def setup_check_cookie_value_reflection():
+    info = get_info('get.txt', 'page.http')
+    response = get_changed_page(info)
+    return lambda: checker.check_cookie_value_reflection_reason([], info, response)
+
+
+@benchmark('request_info.count_html_tags')
+def setup_count_html_tags():
+    info = get_info('get.txt', 'page.http')
+    page = info.response.text
+    return lambda: info.count_html_tags(page)
+
+
+def setup_chunker(finder_class, request_name: str):
+    arguments = get_arguments()
+    finder = finder_class([], arguments, get_logger())
+    info = get_info(request_name, 'page.http')
+    return lambda: finder.get_word_chunks(info)
+
+
+@benchmark('chunker.url')
+def setup_chunker_url():
+    return setup_chunker(UrlFinder, 'get.txt')
+
+
+@benchmark('chunker.header')
+def setup_chunker_header():
+    return setup_chunker(HeaderFinder, 'get.txt')
+
+
+@benchmark('chunker.cookie')
+def setup_chunker_cookie():
+    return setup_chunker(CookieFinder, 'get.txt')
+
+
+@benchmark('chunker.body')
+def setup_chunker_body():
+    return setup_chunker(BodyFinder, 'form.txt')
+
+
+@benchmark('chunker.json')
+def setup_chunker_json():
+    return setup_chunker(JsonFinder, 'json.txt')
+
+
+@benchmark('parse_raw_request')
+def setup_parse_raw_request():
+    raw_requests = [read_corpus(os.path.join('requests', name)) for name in ['get.txt', 'form.txt', 'json.txt']]
+    return lambda: [parse_raw_request(raw_request) for raw_request in raw_requests]
+
+
+@benchmark('miner.html')
+def setup_miner_html():
+    miner = get_miner(HTMLMiner)
+    resource = {'netloc': 'shop.example.com', 'url': 'https://shop.example.com/', 'content_type': 'text/html',
+                'resource': load_response('page.http', 'https://shop.example.com/').text}
+    return lambda: miner.parse_resource(resource)
+
+
+@benchmark('miner.javascript_fast')
+def setup_miner_javascript_fast():
+    miner = get_miner(JavascriptMiner, js_parser=JavascriptParsers.FAST, js_chunk_size=0)
+    resource = {'netloc': 'shop.example.com', 'url': 'https://shop.example.com/app.js',
+                'content_type': 'application/javascript', 'resource': read_corpus('app.js')}
+    return lambda: miner.parse_resource(resource)
+
+
+@benchmark('miner.javascript_esprima')
+def setup_miner_javascript_esprima():
+    if importlib.util.find_spec('esprima') is None:
+        return None
+
+    miner = get_miner(JavascriptMiner, js_parser=JavascriptParsers.ESPRIMA, js_chunk_size=0)
+    resource = {'netloc': 'shop.example.com', 'url': 'https://shop.example.com/app.js',
+                'content_type': 'application/javascript', 'resource': read_corpus('app.js')}
+    return lambda: miner.parse_resource(resource)
+
+
+@benchmark('miner.json')
+def setup_miner_json():
+    miner = get_miner(JSONMiner)
+    resource = {'netloc': 'api.example.com', 'url': 'https://api.example.com/api/v1/users',
+                'content_type': 'application/json',
+                'resource': load_response('api.http', 'https://api.example.com/api/v1/users').text}
+    return lambda: miner.parse_resource(resource)
+
+
+def measure(func: Callable[[], object], rounds: int, min_time: float) -> dict:
+    """ Возвращает время вызова `func` (мкс): минимум, медиана и стандартное отклонение по раундам """
+    func()
+
+    # Подбираем число вызовов в раунде
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+
+        loops *= 2
+
+    timings = []
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((perf_counter() - start) / loops * 10 ** 6)
+
+    return {'min_us': round(min(timings), 2), 'median_us': round(statistics.median(timings), 2),
+            'stdev_us': round(statistics.stdev(timings), 2) if len(timings) > 1 else 0.0,
+            'rounds': rounds, 'loops': loops}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> Tuple[str, Dict[str, str]]:
+    """ Возвращает отчет сравнения с базовым результатом и ухудшения: {name: description}
+
+    Изменение нормируется по отношению времени бенчмарка `REFERENCE` к его базовому времени
+    """
+    factor = 1.0
+    if REFERENCE in results and REFERENCE in baseline:
+        factor = results[REFERENCE]['min_us'] / baseline[REFERENCE]['min_us']
+
+    width = max([len(name) for name in results] + [len('Бенчмарк')])
+    lines = [f'Коэффициент скорости машины (по {REFERENCE}): {factor:.3f}',
+             f'{"Бенчмарк":<{width}}  {"Базовое, мкс":>14}  {"Текущее, мкс":>14}  {"Изменение":>10}']
+    regressions = {}
+
+    for name, result in results.items():
+        base = baseline.get(name)
+
+        if base is None:
+            lines.append(f'{name:<{width}}  {"-":>14}  {result["min_us"]:>14}  {"новый":>10}')
+            continue
+
+        change = result['min_us'] / (base['min_us'] * factor) - 1
+        mark = ''
+
+        if name != REFERENCE and change > threshold:
+            mark = ' !'
+            regressions[name] = f'{base["min_us"]} -> {result["min_us"]} мкс ({change:+.1%})'
+        elif name != REFERENCE and change < -threshold:
+            mark = ' +'
+
+        lines.append(f'{name:<{width}}  {base["min_us"]:>14}  {result["min_us"]:>14}  {change:>+10.1%}{mark}')
+
+    return '\n'.join(lines), regressions
+
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-k', dest='patterns', nargs='+', default=[], help='Подстроки названий бенчмарков')
+    parser.add_argument('-r', dest='rounds', type=int, default=7, help='Число раундов')
+    parser.add_argument('--min-time', dest='min_time', type=float, default=0.05,
+                        help='Минимальная длительность раунда (сек)')
+    parser.add_argument('--compare', dest='compare', default=BASELINE_PATH,
+                        help='JSON-файл с базовым результатом (пустая строка - без сравнения)')
+    parser.add_argument('--threshold', dest='threshold', type=float, default=0.15,
+                        help='Относительное ухудшение, при котором бенчмарк считается замедлившимся')
+    parser.add_argument('--save', dest='save', help='Сохранить результат в JSON-файл (например, как базовый)')
+    parser.add_argument('--json', dest='json', action='store_true', default=False, help='Вывести результат в JSON')
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    random.seed(0)
+
+    names = [name for name in BENCHMARKS
+             if name == REFERENCE or not args.patterns or any(pattern in name for pattern in args.patterns)]
+    results = {}
+
+    funcs = {}
+
+    for name in names:
+        func = BENCHMARKS[name]()
+
+        if func is None:
+            print(f'{name}: пропущен', file=sys.stderr)
+            continue
+
+        funcs[name] = func
+        results[name] = measure(func, args.rounds, args.min_time)
+
+        if not args.json:
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(name=name, **results[name]).items()]))
+
+    baseline = None
+    if args.compare and os.path.isfile(args.compare) and os.path.abspath(args.compare) != os.path.abspath(args.save or ''):
+        with open(args.compare) as file:
+            saved = json.load(file)
+
+        # Результаты без метаданных сохранялись в корне файла
+        baseline = saved.get('benchmarks', saved)
+
+        # Кратковременная фоновая нагрузка может замедлить все раунды бенчмарка, поэтому ухудшения перепроверяются:
+        # остается лучший из замеров
+        for _ in range(REMEASURE_ATTEMPTS):
+            _, regressions = compare(results, baseline, args.threshold)
+
+            for name in regressions:
+                result = measure(funcs[name], args.rounds, args.min_time)
+
+                if result['min_us'] < results[name]['min_us']:
+                    results[name] = result
+
+    output = {'revision': get_revision(), 'python': sys.version.split()[0], 'benchmarks': results}
+
+    if args.json:
+        print(json.dumps(output, indent=2))
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+
+        with open(args.save, 'w') as file:
+            json.dump(output, file, indent=2)
+
+    if baseline is not None:
+        report, regressions = compare(results, baseline, args.threshold)
+        report = f'Базовый результат: ревизия {saved.get("revision", "-")}, Python {saved.get("python", "-")}\n' + report
+        print('\n' + report, file=sys.stderr if args.json else sys.stdout)
+
+        for name, description in regressions.items():
+            print(f'Ухудшение: {name}: {description}', file=sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+""" Сравнение чтения папки сырых запросов: последовательное построение списка и конвейер `RawRequestReader`
+
+Замеряется время до получения первого запроса (момент, когда может начаться подготовка запросов), общее время
+чтения и пиковое потребление памяти. Каждый способ запускается в отдельном процессе.
+Пример запуска из корня репозитория:
+    python3 benchmarks/raw_requests.py -n 100000
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def make_corpus(directory: str, count: int):
+    """ Создает `count` файлов сырых запросов в 100 подпапках """
+    for i in range(count):
+        subdirectory = os.path.join(directory, str(i % 100))
+        os.makedirs(subdirectory, exist_ok=True)
+
+        with open(os.path.join(subdirectory, f'{i}.txt'), 'w') as file:
+            file.write(f'POST /api/user/{i}?page={i % 7} HTTP/1.1\r\nHost: example.com\r\n'
+                       f'Accept: */*\r\nCookie: session={i}\r\nContent-Type: application/x-www-form-urlencoded\r\n'
+                       f'\r\nname=user{i}&role=guest')
+
+
+def read_list(path: str):
+    """ Прежний способ: обход всей папки и построение полного списка запросов """
+    from lib.utils.request_helper import parse_raw_request
+
+    raw_requests = []
+    for directory, _, files in os.walk(path):
+        for filename in files:
+            with open(os.path.join(directory, filename)) as file:
+                raw_requests.append(parse_raw_request(file.read()))
+
+    yield from raw_requests
+
+
+def read_stream(path: str, workers: int):
+    from lib.utils.logger import Logger
+    from lib.utils.raw_requests import RawRequestReader
+
+    yield from RawRequestReader(path, workers, 256, Logger(argparse.Namespace(verbosity=0)))
+
+
+def measure(mode: str, path: str, workers: int) -> dict:
+    import __init__
+
+    start = perf_counter()
+    first = None
+    count = 0
+
+    for _ in read_list(path) if mode == 'list' else read_stream(path, workers):
+        if first is None:
+            first = perf_counter() - start
+        count += 1
+
+    return {'mode': mode, 'requests': count, 'first_ms': round(first * 1000, 1),
+            'total_s': round(perf_counter() - start, 2),
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', dest='count', type=int, default=100000, help='Число файлов')
+    parser.add_argument('-w', dest='workers', type=int, default=4, help='Число читающих гринлетов')
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+
+    with tempfile.TemporaryDirectory() as directory:
+        make_corpus(directory, args.count)
+
+        for mode in ['list', 'stream']:
+            # Новый процесс для каждого замера - независимый замер пиковой памяти
+            with ProcessPoolExecutor(1) as pool:
+                result = pool.submit(measure, mode, directory, args.workers).result()
+
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(files=args.count, **result).items()]))
+
+
+if __name__ == '__main__':
+    main()
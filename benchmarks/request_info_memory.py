@@ -0,0 +1,78 @@
+""" Замер памяти, занимаемой объектами RequestInfo с эталонными ответами
+
+Пример запуска из корня репозитория:
+    python3 benchmarks/request_info_memory.py -n 50000
+"""
+import argparse
+import gc
+import os
+import resource
+import sys
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from requests import Response
+
+from lib.utils.request_helper import RequestInfo
+
+HTML = '<html><head><title>t</title></head><body>{}</body></html>'
+JSON = '{{"items": [{}]}}'
+
+
+def make_response(url: str, body_size: int, html: bool) -> Response:
+    response = Response()
+    response.url = url
+    response.status_code = 200
+    response.encoding = 'utf-8'
+
+    if html:
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response._content = HTML.format('<p>x</p>' * (body_size // 8)).encode('utf8')
+    else:
+        response.headers['Content-Type'] = 'application/json'
+        response._content = JSON.format(', '.join(['1'] * (body_size // 3))).encode('utf8')
+
+    response._content_consumed = True
+    return response
+
+
+def get_rss() -> int:
+    """ Возвращает текущий размер резидентной памяти процесса в байтах (Linux) """
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * resource.getpagesize()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', dest='count', type=int, default=50000, help='Число объектов RequestInfo')
+    parser.add_argument('-s', dest='body_size', type=int, default=2048, help='Размер тела эталонного ответа (байт)')
+    parser.add_argument('--html', dest='html', action='store_true', default=False,
+                        help='Использовать HTML ответы (включает подсчет тэгов, значительно медленнее)')
+    args = parser.parse_args()
+
+    gc.collect()
+    rss_before = get_rss()
+    start = time()
+
+    infos = []
+    for i in range(args.count):
+        url = f'https://host{i % 100}.example.com/api/v1/items/{i}?page={i % 10}&sort=asc'
+        request = requests.Request('GET', url, headers={'User-Agent': 'bench', 'Accept': '*/*'}).prepare()
+        info = RequestInfo(request)
+        info.response = make_response(url, args.body_size, args.html)
+        info.netloc, info.parsed_url
+        infos.append(info)
+
+    elapsed = time() - start
+    gc.collect()
+    used = get_rss() - rss_before
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    print(f'objects={len(infos)}, elapsed={elapsed:.2f} sec, used={used / 2 ** 20:.1f} MiB, '
+          f'peak_rss={peak / 2 ** 20:.1f} MiB, per_object={used / len(infos):.0f} B')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+""" Сквозной замер сканирования локального тестового сервера (`benchmarks/target_server.py`)
+
+Для каждого сценария сервера запускается полное сканирование `suseeker.py -fa` по сырым запросам к его эндпоинтам
+со словарем из скрытых параметров и случайных слов. Замеряются число запросов к серверу на найденный параметр,
+время работы, процессорное время, пиковое потребление памяти процесса suseeker, полнота (recall) и число
+ложных срабатываний. Показатели сценария - медиана нескольких запусков.
+Результат в JSON (--json, -o) можно сравнить с результатом предыдущей версии (--baseline): при ухудшении показателя
+больше допустимого (--tolerance) или снижении полноты скрипт завершается с кодом 1.
+Пример запуска из корня репозитория:
+    python3 benchmarks/scan.py -n 3 -o scan.json
+    python3 benchmarks/scan.py -n 3 --baseline scan.json
+"""
+import argparse
+import json
+import os
+import random
+import shlex
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from urllib.parse import urlparse
+
+from target_server import ENDPOINTS, SCENARIOS, get_expected_params, get_raw_requests, start_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Показатели, рост которых считается ухудшением
+LOWER_IS_BETTER = ['wall_s', 'cpu_s', 'peak_rss_mb', 'requests_per_param']
+
+
+def make_wordlists(directory: str, count: int, seed: int = 0) -> dict:
+    """ Создает словари параметров и заголовков: скрытые параметры сервера и `count` случайных слов """
+    rng = random.Random(seed)
+    hidden = {param for endpoint in ENDPOINTS for params in endpoint['params'].values() for param in params}
+    words = set()
+
+    while len(words) < count:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        if word not in hidden:
+            words.add(word)
+
+    words = sorted(words)
+    paths = {}
+
+    for name, hidden_words in [('params', [p for e in ENDPOINTS for t, ps in e['params'].items() if t != 'HEADER'
+                                           for p in ps]),
+                               ('headers', [p for e in ENDPOINTS for p in e['params'].get('HEADER', {})])]:
+        wordlist = words + hidden_words
+        rng.shuffle(wordlist)
+
+        paths[name] = os.path.join(directory, f'{name}.txt')
+        with open(paths[name], 'w') as file:
+            file.write('\n'.join(wordlist) + '\n')
+
+    return paths
+
+
+def get_found_params(report_path: str) -> dict:
+    """ Возвращает найденные параметры из JSON-отчета suseeker: {(method, path): {(param_type, param), ...}} """
+    found = {}
+
+    if not os.path.isfile(report_path):
+        return found
+
+    with open(report_path) as file:
+        content = file.read()
+
+    report = json.loads(content) if content.strip() else {}
+
+    for url, param_types in report.items():
+        path = urlparse(url).path
+        methods = [endpoint['method'] for endpoint in ENDPOINTS if endpoint['path'] == path] or ['GET']
+
+        for param_type, findings in param_types.items():
+            for finding in findings:
+                param = finding['param'].lower() if param_type == 'HEADER' else finding['param']
+                found.setdefault((methods[0], path), set()).add((param_type, param))
+
+    return found
+
+
+def run_scan(scenario: str, words: int, threads: int, extra_args: list) -> dict:
+    """ Запускает сервер сценария и сканирование, возвращает показатели запуска """
+    server = start_server(SCENARIOS[scenario])
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            requests_dir = os.path.join(directory, 'requests')
+            os.makedirs(requests_dir)
+
+            for filename, raw_request in get_raw_requests(server.server_port).items():
+                with open(os.path.join(requests_dir, filename), 'w') as file:
+                    file.write(raw_request)
+
+            wordlists = make_wordlists(directory, words)
+            report_path = os.path.join(directory, 'report.json')
+
+            command = [sys.executable, 'suseeker.py', '-r', requests_dir, '-fa', '-dm', '-v', '0',
+                       '-pw', wordlists['params'], '-cw', wordlists['params'], '-hw', wordlists['headers'],
+                       '-t', str(threads), '--timeout', '10', '-of', 'json', '-o', report_path] + extra_args
+
+            start = perf_counter()
+            process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL)
+            # Использование ресурсов именно этого процесса (вместе с его дочерними процессами)
+            _, status, usage = os.wait4(process.pid, 0)
+            wall = perf_counter() - start
+
+            if not os.WIFEXITED(status) or os.WEXITSTATUS(status) != 0:
+                raise RuntimeError(f'Сканирование сценария {scenario} завершилось с ошибкой: {status}')
+
+            found = get_found_params(report_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    expected = get_expected_params()
+    true_positives = sum([len(found.get(key, set()) & params) for key, params in expected.items()])
+    false_positives = sum([len(params - expected.get(key, set())) for key, params in found.items()])
+    total = sum([len(params) for params in expected.values()])
+    server_statistics = server.get_statistics()
+
+    return {'wall_s': round(wall, 2), 'cpu_s': round(usage.ru_utime + usage.ru_stime, 2),
+            'peak_rss_mb': round(usage.ru_maxrss / 1024, 1), 'requests': server_statistics['requests'],
+            'too_large': server_statistics['too_large'],
+            'requests_per_param': round(server_statistics['requests'] / max(true_positives, 1), 1),
+            'recall': round(true_positives / total, 3), 'found': true_positives, 'expected': total,
+            'false_positives': false_positives}
+
+
+def summarize(runs: list) -> dict:
+    """ Медианы показателей запусков """
+    return {key: round(statistics.median([run[key] for run in runs]), 3) for key in runs[0]}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """ Возвращает список ухудшений показателей относительно `baseline` """
+    regressions = []
+
+    for scenario, result in results['scenarios'].items():
+        summary = result['summary']
+        base = baseline.get('scenarios', {}).get(scenario, {}).get('summary')
+        if not base:
+            continue
+
+        for key in LOWER_IS_BETTER:
+            if base.get(key) and summary[key] > base[key] * (1 + tolerance):
+                regressions.append(f'{scenario}: {key} {base[key]} -> {summary[key]}')
+
+        if summary['recall'] < base.get('recall', 0):
+            regressions.append(f'{scenario}: recall {base["recall"]} -> {summary["recall"]}')
+
+    return regressions
+
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', dest='runs', type=int, default=3, help='Число запусков каждого сценария')
+    parser.add_argument('-s', dest='scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('-w', dest='words', type=int, default=2000, help='Число случайных слов в словарях')
+    parser.add_argument('-t', dest='threads', type=int, default=10, help='Число воркеров suseeker')
+    parser.add_argument('-a', dest='extra_args', default='', help='Дополнительные аргументы suseeker.py в кавычках')
+    parser.add_argument('--json', dest='json', action='store_true', default=False, help='Вывести результат в JSON')
+    parser.add_argument('-o', dest='output', help='Путь до JSON-файла с результатом')
+    parser.add_argument('--baseline', dest='baseline', help='JSON-файл с результатом для сравнения')
+    parser.add_argument('--tolerance', dest='tolerance', type=float, default=0.2,
+                        help='Допустимое относительное ухудшение показателей при сравнении')
+    args = parser.parse_args()
+
+    results = {'revision': get_revision(), 'python': sys.version.split()[0], 'words': args.words,
+               'threads': args.threads, 'extra_args': args.extra_args, 'scenarios': {}}
+
+    for scenario in args.scenarios:
+        runs = [run_scan(scenario, args.words, args.threads, shlex.split(args.extra_args)) for _ in range(args.runs)]
+        results['scenarios'][scenario] = {'summary': summarize(runs), 'runs': runs}
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for scenario, result in results['scenarios'].items():
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(scenario=scenario, **result['summary']).items()]))
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f'Ухудшение: {regression}', file=sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
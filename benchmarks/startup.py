@@ -0,0 +1,88 @@
+""" Замер времени запуска и импорта модулей для основных сценариев работы
+
+Каждый сценарий запускается в отдельном интерпретаторе с `-X importtime`, время запуска - медиана нескольких
+запусков, время импорта модулей - накопленное время (с учетом вложенных импортов) из первого запуска.
+Пример запуска из корня репозитория:
+    python3 benchmarks/startup.py -n 5 --top 10
+    python3 benchmarks/startup.py --json > startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    # Вывод справки: только разбор аргументов
+    'help': ['suseeker.py', '--help'],
+    # Модули, необходимые для поиска параметров без майнеров (-dm)
+    'scan': ['-c', 'import __init__, lib.arguments, lib.finders.finder, lib.reporter, lib.utils.request_helper'],
+    # Дополнительно загружаемые майнеры
+    'mining': ['-c', 'import __init__, lib.miners'],
+    # Процесс `cpu_executor`: модули функций разбора ресурсов
+    'cpu_worker': ['-c', 'import lib.utils.html_parser, lib.utils.js_lexer, lib.utils.json_lexer'],
+}
+
+
+def parse_importtime(stderr: str) -> dict:
+    """ Возвращает накопленное время импорта (мс) каждого модуля верхнего уровня вложенности из вывода -X importtime """
+    modules = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Вложенные импорты выводятся с отступом и уже учтены в накопленном времени родителя
+        if not name.startswith('  '):
+            modules[name.strip()] = round(int(cumulative) / 1000, 1)
+
+    return modules
+
+
+def run_scenario(args: list, runs: int) -> dict:
+    timings = []
+    modules = {}
+
+    for i in range(runs):
+        start = perf_counter()
+        process = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=ROOT, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.PIPE, universal_newlines=True)
+        timings.append((perf_counter() - start) * 1000)
+
+        if i == 0:
+            modules = parse_importtime(process.stderr)
+
+    return {'wall_ms': round(statistics.median(timings), 1), 'import_ms': round(sum(modules.values()), 1),
+            'modules': modules}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', dest='runs', type=int, default=5, help='Число запусков каждого сценария')
+    parser.add_argument('--top', dest='top', type=int, default=10, help='Число самых долгих импортов в отчете')
+    parser.add_argument('-s', dest='scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--json', dest='json', action='store_true', default=False, help='Вывести результат в JSON')
+    args = parser.parse_args()
+
+    results = {name: run_scenario(SCENARIOS[name], args.runs) for name in args.scenarios}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(', '.join(['='.join([k, str(v)]) for k, v in
+                         dict(scenario=name, wall_ms=result['wall_ms'], import_ms=result['import_ms']).items()]))
+
+        top = sorted(result['modules'].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        for module, elapsed in top:
+            print(f'\t{elapsed:>8} мс  {module}')
+
+
+if __name__ == '__main__':
+    main()
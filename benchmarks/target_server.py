@@ -0,0 +1,263 @@
+""" Локальный тестовый сервер со скрытыми параметрами для сквозных замеров (`benchmarks/scan.py`)
+
+Каждый эндпоинт сценария скрывает URL-, body-, JSON-параметры, заголовки и cookie за одним из признаков:
+изменение кода состояния, типа контента, длины ответа, числа тэгов или отражение значения.
+Дополнительно сервер может добавлять шум (случайные токены в ответах), задержку ответа и ограничения
+на длину URL, заголовков и тела запроса (413, 414, 431).
+Пример запуска из корня репозитория (сервер для ручной проверки):
+    python3 benchmarks/target_server.py --port 8800 -s noisy
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+# Признаки, по которым обнаруживается скрытый параметр
+STATUS = 'status'
+CONTENT_TYPE = 'content_type'
+LENGTH = 'length'
+TAGS = 'tags'
+REFLECTION = 'reflection'
+
+# Эндпоинты: метод, путь, тип ответа, формат тела и скрытые параметры по типам параметров suseeker
+ENDPOINTS = [
+    {'method': 'GET', 'path': '/search', 'query': 'page=1', 'content': 'html', 'body': None,
+     'cookie': 'session=5f1c2d3e',
+     'params': {'URL': {'debug': STATUS, 'format': CONTENT_TYPE, 'preview': TAGS, 'q': REFLECTION},
+                'HEADER': {'X-Debug-Token': STATUS, 'X-Forwarded-Host': REFLECTION, 'X-Beta-Features': TAGS},
+                'COOKIE': {'admin': STATUS, 'beta': TAGS, 'lang': REFLECTION}}},
+    {'method': 'GET', 'path': '/api/v1/status', 'query': '', 'content': 'json', 'body': None, 'cookie': None,
+     'params': {'URL': {'verbose': LENGTH, 'callback': CONTENT_TYPE}}},
+    {'method': 'POST', 'path': '/account/settings', 'query': '', 'content': 'html', 'body': 'form', 'cookie': None,
+     'params': {'BODY': {'role': STATUS, 'theme': TAGS}}},
+    {'method': 'POST', 'path': '/api/v1/users', 'query': '', 'content': 'json', 'body': 'json', 'cookie': None,
+     'params': {'JSON': {'isAdmin': STATUS, 'expand': LENGTH}}},
+]
+
+# Сценарии: шум в ответах, задержка (сек) и ограничения размеров запроса (байт)
+SCENARIOS = {
+    'clean': {'noise': False, 'latency': 0.0, 'jitter': 0.0, 'max_url': 8192, 'max_headers': 8192,
+              'max_body': 1024 * 1024},
+    'noisy': {'noise': True, 'latency': 0.005, 'jitter': 0.02, 'max_url': 8192, 'max_headers': 8192,
+              'max_body': 1024 * 1024},
+    'limits': {'noise': False, 'latency': 0.0, 'jitter': 0.0, 'max_url': 2048, 'max_headers': 4096,
+               'max_body': 4096},
+}
+
+# Число элементов списка на HTML-странице - объем разбора при подсчете тэгов
+PAGE_ITEMS = 100
+
+
+class TargetServer(ThreadingHTTPServer):
+    """ HTTP-сервер сценария `scenario`, ведущий счетчики полученных запросов и ответов с кодами 413, 414, 431 """
+    daemon_threads = True
+
+    def __init__(self, port: int, scenario: dict):
+        self.scenario = scenario
+        self.endpoints = {(endpoint['method'], endpoint['path']): endpoint for endpoint in ENDPOINTS}
+        self.statistics = {'requests': 0, 'too_large': 0}
+        self.lock = threading.Lock()
+
+        super().__init__(('127.0.0.1', port), TargetHandler)
+
+    def count(self, key: str):
+        with self.lock:
+            self.statistics[key] += 1
+
+    def get_statistics(self) -> dict:
+        with self.lock:
+            return dict(self.statistics)
+
+
+class TargetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: TargetServer
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+    def handle_request(self):
+        self.server.count('requests')
+        scenario = self.server.scenario
+
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        if scenario['latency'] or scenario['jitter']:
+            time.sleep(scenario['latency'] + random.uniform(0, scenario['jitter']))
+
+        headers_size = sum([len(k) + len(v) + 4 for k, v in self.headers.items()])
+
+        if len(self.path) > scenario['max_url']:
+            return self.send_too_large(414)
+        if headers_size > scenario['max_headers']:
+            return self.send_too_large(431)
+        if len(body) > scenario['max_body']:
+            return self.send_too_large(413)
+
+        url = urlparse(self.path)
+        endpoint = self.server.endpoints.get((self.command, url.path))
+
+        if endpoint is None:
+            return self.send_body(404, 'text/plain', b'Not Found')
+
+        values = {'URL': dict(parse_qsl(url.query, keep_blank_values=True)),
+                  'HEADER': {k.lower(): v for k, v in self.headers.items()},
+                  'COOKIE': parse_cookies(self.headers.get('Cookie', '')),
+                  'BODY': {}, 'JSON': {}}
+
+        if endpoint['body'] == 'form':
+            values['BODY'] = dict(parse_qsl(body.decode('utf8', errors='replace'), keep_blank_values=True))
+        elif endpoint['body'] == 'json':
+            try:
+                values['JSON'] = json.loads(body or b'{}')
+            except ValueError:
+                return self.send_body(400, 'application/json', b'{"error": "invalid json"}')
+
+        # Срабатывания скрытых параметров: {signal: [value, ...]}
+        signals = {}
+
+        for param_type, params in endpoint['params'].items():
+            for param, signal in params.items():
+                key = param.lower() if param_type == 'HEADER' else param
+
+                if isinstance(values[param_type], dict) and key in values[param_type]:
+                    signals.setdefault(signal, []).append(str(values[param_type][key]))
+
+        status, content_type, content = render(endpoint, signals, scenario['noise'])
+        self.send_body(status, content_type, content.encode())
+
+    def send_too_large(self, status: int):
+        self.server.count('too_large')
+        self.send_body(status, 'text/html', b'<html><body><h1>Request Too Large</h1></body></html>')
+
+    def send_body(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def parse_cookies(header: str) -> Dict[str, str]:
+    cookies = {}
+
+    for pair in header.split(';'):
+        name, _, value = pair.strip().partition('=')
+        if name:
+            cookies[name] = value
+
+    return cookies
+
+
+def render(endpoint: dict, signals: dict, noise: bool) -> Tuple[int, str, str]:
+    """ Возвращает код состояния, тип и содержимое ответа эндпоинта с учетом сработавших признаков """
+    status = 403 if STATUS in signals else 200
+    extra_tags = TAGS in signals
+    reflections = signals.get(REFLECTION, [])
+
+    if endpoint['content'] == 'html':
+        content_type = 'text/html; charset=utf-8'
+        items = ''.join([f'<li><a href="/item/{i}">Item {i}</a> <span class="price">{i * 7 % 100}</span></li>'
+                         for i in range(PAGE_ITEMS)])
+        token = ''
+        if noise:
+            token = '<input type="hidden" name="csrf" value="{}">'.format(
+                '%x' % random.getrandbits(random.randint(64, 192)))
+
+        extra = ''
+        if extra_tags:
+            extra = '<div class="debug"><table><tr><td>trace</td><td>on</td></tr></table></div>'
+
+        content = ('<html><head><title>Target</title></head><body><form method="post">{}<input name="name"></form>'
+                   '<ul>{}</ul>{}{}</body></html>').format(
+            token, items, extra, ''.join([f'<p>Results for {value}</p>' for value in reflections]))
+    else:
+        content_type = 'application/json'
+        data = {'status': 'ok', 'items': list(range(20))}
+
+        if noise:
+            # Значение фиксированной длины: шум не меняет длину JSON-ответа
+            data['requestId'] = '%032x' % random.getrandbits(128)
+        if LENGTH in signals:
+            data['details'] = {'uptime': 12345, 'build': 'a1b2c3'}
+        if reflections:
+            data['echo'] = reflections
+
+        content = json.dumps(data)
+
+    if CONTENT_TYPE in signals:
+        content_type = 'application/javascript' if endpoint['content'] == 'json' else 'application/json'
+
+    return status, content_type, content
+
+
+def get_expected_params() -> Dict[Tuple[str, str], set]:
+    """ Возвращает скрытые параметры эндпоинтов: {(method, path): {(param_type, param), ...}} """
+    return {(endpoint['method'], endpoint['path']): {(param_type, param.lower() if param_type == 'HEADER' else param)
+                                                      for param_type, params in endpoint['params'].items()
+                                                      for param in params}
+            for endpoint in ENDPOINTS}
+
+
+def get_raw_requests(port: int) -> Dict[str, str]:
+    """ Возвращает сырые запросы к эндпоинтам: {filename: raw_request} """
+    raw_requests = {}
+
+    for i, endpoint in enumerate(ENDPOINTS):
+        path = endpoint['path'] + ('?' + endpoint['query'] if endpoint['query'] else '')
+        headers = [f'Host: 127.0.0.1:{port}', 'User-Agent: suseeker-benchmark', 'Accept: */*']
+        body = ''
+
+        if endpoint['cookie']:
+            headers.append('Cookie: ' + endpoint['cookie'])
+
+        if endpoint['body'] == 'form':
+            body = 'name=test'
+            headers.append('Content-Type: application/x-www-form-urlencoded')
+        elif endpoint['body'] == 'json':
+            body = json.dumps({'name': 'test'})
+            headers.append('Content-Type: application/json')
+
+        if body:
+            headers.append(f'Content-Length: {len(body)}')
+
+        raw_requests[f'{i}.txt'] = '\r\n'.join([f'{endpoint["method"]} {path} HTTP/1.1'] + headers) + '\r\n\r\n' + body
+
+    return raw_requests
+
+
+def start_server(scenario: dict, port: int = 0) -> TargetServer:
+    """ Запускает сервер в фоновом потоке, выбранный порт - `server.server_port` """
+    server = TargetServer(port, scenario)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', dest='port', type=int, default=8800, help='Порт сервера')
+    parser.add_argument('-s', dest='scenario', default='clean', choices=list(SCENARIOS), help='Сценарий')
+    args = parser.parse_args()
+
+    server = TargetServer(args.port, SCENARIOS[args.scenario])
+    print(f'http://127.0.0.1:{server.server_port}, scenario={args.scenario}')
+
+    for filename, raw_request in get_raw_requests(server.server_port).items():
+        print(f'\n# {filename}\n{raw_request}')
+
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
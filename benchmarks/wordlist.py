@@ -0,0 +1,89 @@
+""" Сравнение загрузки словаря и формирования порций для одного запроса: список слов и скомпилированный словарь
+
+Пример запуска из корня репозитория:
+    python3 benchmarks/wordlist.py -n 100000 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.utils.wordlist import load_wordlist
+
+BUCKET = 2048
+VALUE = 'abcdef'
+
+
+def make_wordlist(path: str, count: int):
+    rnd = random.Random(0)
+
+    with open(path, 'w') as file:
+        for _ in range(count):
+            file.write(''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz_') for _ in range(rnd.randint(3, 20))) + '\n')
+
+
+def load_plain(path: str) -> list:
+    """ Прежний способ: чтение всех строк и построение множества """
+    with open(path) as file:
+        return list(set([w.strip() for w in file.readlines() if w.strip()]))
+
+
+def chunk_plain(wordlist: list, existing: set, additional: list) -> list:
+    """ Прежний способ UrlFinder.get_word_chunks """
+    chunks, current_chunk, current_chunk_len = [], [], 0
+
+    for w in list((set(wordlist) | set(additional)) - existing):
+        current_chunk_len += 1 + len(w) + 1 + len(VALUE)
+
+        if current_chunk_len > BUCKET:
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_chunk_len = 1 + len(w) + 1 + len(VALUE)
+
+        current_chunk.append(w)
+
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    return chunks
+
+
+def measure(func, *args) -> tuple:
+    start = perf_counter()
+    result = func(*args)
+    return result, round((perf_counter() - start) * 1000, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', dest='counts', type=int, nargs='+', default=[100000, 1000000], help='Число слов')
+    args = parser.parse_args()
+
+    existing = {'id', 'page', 'sort'}
+    additional = ['userId', 'apiToken']
+
+    for count in args.counts:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'words.txt')
+            make_wordlist(path, count)
+
+            wordlist, plain_load_ms = measure(load_plain, path)
+            chunks, plain_chunk_ms = measure(chunk_plain, wordlist, existing, additional)
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(
+                mode='plain', words=count, load_ms=plain_load_ms, chunk_ms=plain_chunk_ms, chunks=len(chunks)).items()]))
+
+            cache_dir = os.path.join(directory, 'cache')
+            _, compile_ms = measure(load_wordlist, [path], cache_dir, 'params')
+            wordlist, load_ms = measure(load_wordlist, [path], cache_dir, 'params')
+            chunks, chunk_ms = measure(wordlist.get_chunks, existing, BUCKET, 2 + len(VALUE))
+            print(', '.join(['='.join([k, str(v)]) for k, v in dict(
+                mode='compiled', words=count, compile_ms=compile_ms, load_ms=load_ms, chunk_ms=chunk_ms,
+                chunks=len(chunks)).items()]))
+
+
+if __name__ == '__main__':
+    main()
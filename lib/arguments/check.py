@@ -1,8 +1,10 @@
 import argparse
+import importlib.util
 import os
 import re
 from urllib.parse import urlparse
 
+from lib.constants import JavascriptParsers
 from lib.utils.logger import Logger
 
 
@@ -29,6 +31,30 @@ def is_args_valid(arguments: argparse.Namespace, logger: Logger) -> bool:
             logger.error('Указанного пути -r не существует')
             return False
 
+    for path in [arguments.metrics_json, arguments.metrics_prometheus]:
+        if path and not os.path.isdir(os.path.dirname(os.path.abspath(path))):
+            logger.error(f'Папки для файла метрик {path} не существует')
+            return False
+
+    if arguments.metrics_interval < 0:
+        logger.error('Период записи метрик --metrics-interval не может быть отрицательным')
+        return False
+
+    if arguments.profile_dir and os.path.exists(arguments.profile_dir) and not os.path.isdir(arguments.profile_dir):
+        logger.error('Путь --profile должен указывать на папку')
+        return False
+
+    if arguments.profile_interval <= 0 or arguments.profile_top <= 0:
+        logger.error('Значения --profile-interval и --profile-top должны быть больше 0')
+        return False
+
+    if arguments.cdx_files:
+        bad_paths = [path for path in re.split('\s*,\s*', arguments.cdx_files) if not os.path.isfile(path)]
+
+        if bad_paths:
+            logger.error('Следующие пути --cdx-files не указывают на файлы: ' + '"' + '", "'.join(bad_paths) + '"')
+            return False
+
     if arguments.param_wordlist:
         bad_paths = [path for path in re.split('\s*,\s*', arguments.param_wordlist) if not os.path.isfile(path)]
 
@@ -68,6 +94,14 @@ def is_args_valid(arguments: argparse.Namespace, logger: Logger) -> bool:
         logger.error('Не указан тип сканирования --find-headers / --find-params / --find-cookies / --find-all')
         return False
 
+    if min(arguments.header_body_cap, arguments.param_body_cap, arguments.cookie_body_cap) < 0:
+        logger.error('Размер тела ответа --*-body-cap не может быть отрицательным')
+        return False
+
+    if arguments.simhash_threshold > 64:
+        logger.error('Порог --simhash-threshold не может превышать 64')
+        return False
+
     if arguments.retry <= 0:
         logger.error('Общее число попыток --retry выполнить запрос должно быть больше 0')
         return False
@@ -75,4 +109,52 @@ def is_args_valid(arguments: argparse.Namespace, logger: Logger) -> bool:
     if arguments.timeout <= 0:
         logger.error('Время ожидания ответа --timeout должно быть больше 0')
 
+    if arguments.mining_host_connections <= 0:
+        logger.error('Число соединений --mining-host-connections должно быть больше 0')
+        return False
+
+    if arguments.parse_workers <= 0 or arguments.resource_queue_size <= 0:
+        logger.error('Значения --parse-workers и --resource-queue-size должны быть больше 0')
+        return False
+
+    if arguments.raw_requests_workers <= 0 or arguments.raw_requests_queue_size <= 0:
+        logger.error('Значения --raw-requests-workers и --raw-requests-queue-size должны быть больше 0')
+        return False
+
+    if arguments.cpu_workers < 0:
+        logger.error('Число процессов --cpu-workers не может быть отрицательным')
+        return False
+
+    if arguments.cpu_job_timeout <= 0:
+        logger.error('Время разбора ресурса --cpu-job-timeout должно быть больше 0')
+        return False
+
+    if arguments.js_chunk_size < 0:
+        logger.error('Размер части --js-chunk-size не может быть отрицательным')
+        return False
+
+    if arguments.js_parser == JavascriptParsers.ESPRIMA and importlib.util.find_spec('esprima') is None:
+        logger.error('Для разбора JS-скриптов в режиме esprima требуется установить пакет esprima')
+        return False
+
+    if arguments.mined_params_limit < 0 or arguments.mined_params_finder_limit < 0:
+        logger.error('Лимиты --mined-params-limit и --mined-params-finder-limit не могут быть отрицательными')
+        return False
+
+    if arguments.mining_host_budget < 0:
+        logger.error('Бюджет загрузок --mining-host-budget не может быть отрицательным')
+        return False
+
+    if arguments.mining_max_depth < 0:
+        logger.error('Глубина --mining-max-depth не может быть отрицательной')
+        return False
+
+    if arguments.mining_cache_size <= 0:
+        logger.error('Размер кэша --mining-cache-size должен быть больше 0')
+        return False
+
+    if arguments.mining_cache_ttl < 0:
+        logger.error('Время --mining-cache-ttl не может быть отрицательным')
+        return False
+
     return True
\ No newline at end of file
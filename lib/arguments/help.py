@@ -7,10 +7,23 @@ RAW_REQUESTS_HELP = "Файл/папка с сырым/сырыми HTTP-зап
 ADDITIONAL_HEADERS_HELP = "Дополнительные хидеры к запросам, можно указывать несколько раз. Например: --header='User-Agent: Mozilla' --header='X-Forwarded-Host: test'"
 ALLOW_REDIRECTS_HELP = "Позволить переходить по указанным адресам при редиректах"
 DISABLE_MINING_HELP = "Выключить поиск параметров в контенте HTML страниц и скриптов"
+CDX_FILES_HELP = "Пути до локальных CDX-индексов web.archive.org или списков URL-адресов (в том числе .gz), разделенных через запятую, " \
+                 "для поиска параметров без обращения к CDX API (Например: --cdx-files /path1/site.cdx,/path2/urls.txt.gz)"
 OUTPUT_HELP = "Путь до файла с результатами работы"
 OUTPUT_FORMAT_HELP = "Формат вывода результата: table - таблица [Адрес, Тип параметра, Параметр, Причины]; " \
-                     "json - {<url>: {<param_type>: [{\"param\": <param_name>, \"reasons\": [...]}], ...}, ...}; " \
+                     "json - {<url>: {<param_type>: [{\"param\": <param_name>, \"reasons\": [...], <метаданные ответа>}], ...}, ...}; " \
                      "light - <url>: <param_type>:<param_name>; ..."
+RESPONSE_RETENTION_HELP = "Сохранение ответов для найденных параметров: none - не сохранять; metadata [по умолчанию] - код состояния, длина и хэш тела; body - дополнительно записывать тело ответа в папку --responses-dir"
+RESPONSES_DIR_HELP = "Папка для тел ответов найденных параметров при --response-retention body"
+METRICS_JSON_HELP = "Путь до JSON-файла со сводкой метрик сканирования: время этапов, число запросов, ошибок и повторов, " \
+                    "объем данных и распределение времени ответа по хостам, доли результатов проверки порций"
+METRICS_PROMETHEUS_HELP = "Путь до файла с метриками сканирования в текстовом формате Prometheus, файл перезаписывается каждые --metrics-interval секунд"
+METRICS_INTERVAL_HELP = "Период записи файла --metrics-prometheus в секундах (0 - только по окончании работы)"
+PROFILE_HELP = "Папка для профиля семплирующего профилировщика: свернутые стеки этапов сканирования (<этап>.collapsed, all.collapsed) " \
+               "для построения flamegraph и таблица самых затратных функций (top.txt). Для профилирования разбора HTML и JS " \
+               "используйте --cpu-workers 0"
+PROFILE_INTERVAL_HELP = "Интервал между выборками стека профилировщика в миллисекундах"
+PROFILE_TOP_HELP = "Число строк в таблице самых затратных функций профиля"
 VERBOSITY_HELP = "Уровень детализации сообщений: 0 - silent-режим (выводится только результат); 1 - INFO и SUCCESS сообщения, 2 [по умолчанию] - WARNING и ERROR сообщения, 3 - debug-режим"
 
 
@@ -28,6 +41,14 @@ COOKIE_BUCKET_HELP = "Максимальный размер порции пар
 DISABLE_DYNAMIC_HEADERS_HELP = "Отключить определение оптимального размера заголовков в запросе по соотношению (размер порции)/(время ответа)"
 DISABLE_DYNAMIC_PARAMS_HELP = "Отключить определение оптимального размера параметров в запросе по соотношению (размер порции)/(время ответа)"
 DISABLE_DYNAMIC_COOKIES_HELP = "Отключить определение оптимального размера параметров в Cookie-заголовке запроса по соотношению (размер порции)/(время ответа)"
+HEADER_BODY_CAP_HELP = "Максимальный размер читаемого тела ответа при поиске заголовков (в байтах, 0 - без ограничений)"
+PARAM_BODY_CAP_HELP = "Максимальный размер читаемого тела ответа при поиске параметров в URL и теле запроса (в байтах, 0 - без ограничений)"
+COOKIE_BODY_CAP_HELP = "Максимальный размер читаемого тела ответа при поиске параметров Cookie (в байтах, 0 - без ограничений)"
+SIMHASH_THRESHOLD_HELP = "Максимальное расстояние Хэмминга (0-64) между simhash-отпечатками структуры HTML страниц, при котором ответы с небольшой разницей в числе тэгов считаются одинаковыми; -1 - отключить сравнение отпечатков"
+DISABLE_CLUSTERING_HELP = "Выключить объединение запросов к одному эндпоинту: по умолчанию запросы, пути которых различаются " \
+                          "только числовыми идентификаторами, UUID и хэшами, а параметры - только значениями, " \
+                          "объединяются в кластер, и поиск выполняется по первому запросу кластера"
+VERIFY_CLUSTERS_HELP = "Проверять параметры, найденные для первого запроса кластера, на остальных запросах кластера"
 
 # Настройки производительности
 PROXY_HELP = "Адрес прокси-сервера (пока только http/https)"
@@ -35,3 +56,25 @@ DELAY_HELP = "Время ожидания между запросами в од
 THREADS_HELP = "Количество потоков для поиска скрытых параметров и хидеров"
 RETRY_HELP = "Общее количество попыток выполнить запрос"
 TIMEOUT_HELP = "Максимальное время ожидания ответа от сервера в секундах"
+DRAIN_BODY_HELP = "Дочитывать тело ответа сверх ограничения --*-body-cap без сохранения вместо разрыва соединения: без этого у усеченных ответов хэш тела не сохраняется"
+MINING_HOST_CONNECTIONS_HELP = "Максимальное число одновременных соединений с одним хостом при загрузке ресурсов для поиска параметров"
+CPU_WORKERS_HELP = "Число процессов для разбора HTML и JS вне цикла событий gevent (0 - разбирать в основном процессе)"
+RAW_REQUESTS_WORKERS_HELP = "Число гринлетов, одновременно читающих и разбирающих файлы сырых запросов -r"
+RAW_REQUESTS_QUEUE_SIZE_HELP = "Максимальное число прочитанных, но еще не подготовленных сырых запросов: при его достижении чтение файлов приостанавливается"
+PARSE_WORKERS_HELP = "Число гринлетов, одновременно разбирающих загруженные ресурсы при поиске параметров (CPU-ёмкий разбор выполняется в процессах --cpu-workers)"
+RESOURCE_QUEUE_SIZE_HELP = "Максимальное число загруженных, но еще не разобранных ресурсов: при его достижении загрузка приостанавливается"
+CPU_JOB_MAX_SIZE_HELP = "Максимальный размер HTML и JS-ресурса для разбора (в символах), ресурсы большего размера пропускаются (0 - без ограничений)"
+CPU_JOB_TIMEOUT_HELP = "Максимальное время разбора одного ресурса в процессе в секундах"
+JS_PARSER_HELP = "Способ разбора JS-скриптов: fast - линейный лексер (идентификаторы, ключи свойств и строковые литералы); " \
+                 "esprima - точный токенизатор esprima (медленнее, при ошибке разбора используется fast)"
+JS_CHUNK_SIZE_HELP = "Размер части (в символах), на которые разбиваются большие JS-скрипты для параллельного разбора в режиме fast (0 - не разбивать)"
+MINED_PARAMS_LIMIT_HELP = "Максимальное число параметров, найденных майнерами, для одного хоста: параметры ранжируются по источнику, " \
+                          "частоте и виду названия, остальные отбрасываются (0 - без ограничений)"
+MINED_PARAMS_FINDER_LIMIT_HELP = "Максимальное число параметров, найденных майнерами, проверяемых каждым модулем поиска для одного запроса (0 - без ограничений)"
+MINING_HOST_BUDGET_HELP = "Максимальное число ресурсов, загружаемых с одного хоста при поиске параметров (0 - без ограничений)"
+MINING_MAX_DEPTH_HELP = "Максимальная глубина перехода по ссылкам при поиске параметров (0 - только исходные адреса)"
+MINING_BLOOM_FILTER_HELP = "Использовать фильтр Блума вместо множества для учета загруженных адресов (экономит память при большом числе целей)"
+MINING_CACHE_HELP = "Путь до файла кэша майнеров: результаты разбора ресурсов и валидаторы ETag/Last-Modified сохраняются между запусками"
+MINING_CACHE_SIZE_HELP = "Максимальный размер кэша майнеров в МБ, при превышении удаляются давно не использованные записи"
+MINING_CACHE_TTL_HELP = "Время в секундах, в течение которого ресурс из кэша майнеров используется без повторного запроса (0 - всегда отправлять условный запрос)"
+DISABLE_MINING_CACHE_HELP = "Выключить кэш майнеров"
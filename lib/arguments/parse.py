@@ -1,7 +1,7 @@
 import argparse
 
 from lib.arguments.help import *
-from lib.constants import OutputFormats
+from lib.constants import OutputFormats, ResponseRetention, JavascriptParsers, JS_CHUNK_SIZE, MINING_CACHE_PATH
 
 epilog = ''' Примеры:
 
@@ -31,9 +31,22 @@ def parse_args() -> argparse.Namespace:
                             help=ALLOW_REDIRECTS_HELP)
     main_group.add_argument('-dm', '--disable-mining', dest='disable_mining', default=False, action='store_true',
                             help=DISABLE_MINING_HELP)
+    main_group.add_argument('-cdx', '--cdx-files', dest='cdx_files', help=CDX_FILES_HELP)
     main_group.add_argument('-o', '--output', dest='output', help=OUTPUT_HELP)
     main_group.add_argument('-of', '--output-format', dest='output_format', default=OutputFormats.LIGHT,
                             choices=OutputFormats.get_list(), help=OUTPUT_FORMAT_HELP)
+    main_group.add_argument('-rr', '--response-retention', dest='response_retention',
+                            default=ResponseRetention.METADATA, choices=ResponseRetention.get_list(),
+                            help=RESPONSE_RETENTION_HELP)
+    main_group.add_argument('--responses-dir', dest='responses_dir', default='responses', help=RESPONSES_DIR_HELP)
+    main_group.add_argument('--metrics-json', dest='metrics_json', help=METRICS_JSON_HELP)
+    main_group.add_argument('--metrics-prometheus', dest='metrics_prometheus', help=METRICS_PROMETHEUS_HELP)
+    main_group.add_argument('--metrics-interval', dest='metrics_interval', default=10, type=float,
+                            help=METRICS_INTERVAL_HELP)
+    main_group.add_argument('--profile', dest='profile_dir', help=PROFILE_HELP)
+    main_group.add_argument('--profile-interval', dest='profile_interval', default=5, type=float,
+                            help=PROFILE_INTERVAL_HELP)
+    main_group.add_argument('--profile-top', dest='profile_top', default=30, type=int, help=PROFILE_TOP_HELP)
     main_group.add_argument('-v', dest='verbosity', default=2, type=int, choices=[0, 1, 2, 3], help=VERBOSITY_HELP)
 
     search_group = parser.add_argument_group('Настройки поиска параметров')
@@ -64,6 +77,18 @@ def parse_args() -> argparse.Namespace:
                               default=False, help=DISABLE_DYNAMIC_PARAMS_HELP)
     search_group.add_argument('-ddc', '--disable-dynamic-cookies', dest='disable_dynamic_cookies', action='store_true',
                               default=False, help=DISABLE_DYNAMIC_COOKIES_HELP)
+    search_group.add_argument('-hbc', '--header-body-cap', dest='header_body_cap', type=int, default=0,
+                              help=HEADER_BODY_CAP_HELP)
+    search_group.add_argument('-pbc', '--param-body-cap', dest='param_body_cap', type=int, default=0,
+                              help=PARAM_BODY_CAP_HELP)
+    search_group.add_argument('-cbc', '--cookie-body-cap', dest='cookie_body_cap', type=int, default=0,
+                              help=COOKIE_BODY_CAP_HELP)
+    search_group.add_argument('-st', '--simhash-threshold', dest='simhash_threshold', type=int, default=2,
+                              help=SIMHASH_THRESHOLD_HELP)
+    search_group.add_argument('-dcl', '--disable-clustering', dest='disable_clustering', action='store_true',
+                              default=False, help=DISABLE_CLUSTERING_HELP)
+    search_group.add_argument('-vc', '--verify-clusters', dest='verify_clusters', action='store_true', default=False,
+                              help=VERIFY_CLUSTERS_HELP)
 
     performance_group = parser.add_argument_group('Настройки производительности')
     performance_group.add_argument('--proxy', dest='proxy', default=None, help=PROXY_HELP)
@@ -71,5 +96,44 @@ def parse_args() -> argparse.Namespace:
     performance_group.add_argument('-t', '--threads', dest='threads', default=7, type=int, help=THREADS_HELP)
     performance_group.add_argument('--retry', dest='retry', default=2, type=int, help=RETRY_HELP)
     performance_group.add_argument('--timeout', dest='timeout', default=15, type=int, help=TIMEOUT_HELP)
+    performance_group.add_argument('--drain-body', dest='drain_body', default=False, action='store_true',
+                                   help=DRAIN_BODY_HELP)
+    performance_group.add_argument('--mining-host-connections', dest='mining_host_connections', default=4, type=int,
+                                   help=MINING_HOST_CONNECTIONS_HELP)
+    performance_group.add_argument('--raw-requests-workers', dest='raw_requests_workers', default=4, type=int,
+                                   help=RAW_REQUESTS_WORKERS_HELP)
+    performance_group.add_argument('--raw-requests-queue-size', dest='raw_requests_queue_size', default=256, type=int,
+                                   help=RAW_REQUESTS_QUEUE_SIZE_HELP)
+    performance_group.add_argument('--cpu-workers', dest='cpu_workers', default=2, type=int, help=CPU_WORKERS_HELP)
+    performance_group.add_argument('--parse-workers', dest='parse_workers', default=4, type=int,
+                                   help=PARSE_WORKERS_HELP)
+    performance_group.add_argument('--resource-queue-size', dest='resource_queue_size', default=64, type=int,
+                                   help=RESOURCE_QUEUE_SIZE_HELP)
+    performance_group.add_argument('--cpu-job-max-size', dest='cpu_job_max_size', default=20 * 1024 * 1024, type=int,
+                                   help=CPU_JOB_MAX_SIZE_HELP)
+    performance_group.add_argument('--cpu-job-timeout', dest='cpu_job_timeout', default=30, type=float,
+                                   help=CPU_JOB_TIMEOUT_HELP)
+    performance_group.add_argument('--js-parser', dest='js_parser', default=JavascriptParsers.FAST,
+                                   choices=JavascriptParsers.get_list(), help=JS_PARSER_HELP)
+    performance_group.add_argument('--js-chunk-size', dest='js_chunk_size', default=JS_CHUNK_SIZE, type=int,
+                                   help=JS_CHUNK_SIZE_HELP)
+    performance_group.add_argument('--mined-params-limit', dest='mined_params_limit', default=1000, type=int,
+                                   help=MINED_PARAMS_LIMIT_HELP)
+    performance_group.add_argument('--mined-params-finder-limit', dest='mined_params_finder_limit', default=0,
+                                   type=int, help=MINED_PARAMS_FINDER_LIMIT_HELP)
+    performance_group.add_argument('--mining-host-budget', dest='mining_host_budget', default=300, type=int,
+                                   help=MINING_HOST_BUDGET_HELP)
+    performance_group.add_argument('--mining-max-depth', dest='mining_max_depth', default=2, type=int,
+                                   help=MINING_MAX_DEPTH_HELP)
+    performance_group.add_argument('--mining-bloom-filter', dest='mining_bloom_filter', default=False,
+                                   action='store_true', help=MINING_BLOOM_FILTER_HELP)
+    performance_group.add_argument('--mining-cache', dest='mining_cache', default=MINING_CACHE_PATH,
+                                   help=MINING_CACHE_HELP)
+    performance_group.add_argument('--mining-cache-size', dest='mining_cache_size', default=100, type=int,
+                                   help=MINING_CACHE_SIZE_HELP)
+    performance_group.add_argument('--mining-cache-ttl', dest='mining_cache_ttl', default=3600, type=int,
+                                   help=MINING_CACHE_TTL_HELP)
+    performance_group.add_argument('-dmc', '--disable-mining-cache', dest='disable_mining_cache', default=False,
+                                   action='store_true', help=DISABLE_MINING_CACHE_HELP)
 
     return parser.parse_args()
@@ -1,4 +1,5 @@
 import argparse
+from itertools import chain
 
 from lib.arguments.prepare.cookies_group import *
 from lib.arguments.prepare.headers_group import *
@@ -10,15 +11,15 @@ from lib.utils.logger import Logger
 
 def prepare_args(arguments: argparse.Namespace, logger: Logger):
     """ Подготавливает агрументы командной строки для программы """
-    # --raw-request и --url
+    # --raw-request и --url: запросы читаются лениво по мере подготовки, повторы отсеиваются
     raw_requests = []
     if arguments.raw_requests:
-        raw_requests += prepare_raw_requests(arguments, logger)
+        raw_requests.append(prepare_raw_requests(arguments, logger))
 
     if arguments.url:
-        raw_requests += prepare_url(arguments, logger)
+        raw_requests.append(prepare_url(arguments, logger))
 
-    arguments.raw_requests = raw_requests
+    arguments.raw_requests = deduplicate_requests(chain.from_iterable(raw_requests), logger)
 
     # --header
     if arguments.additional_headers:
@@ -2,32 +2,35 @@ import argparse
 import os
 import re
 
+from lib.constants import WORDLIST_CACHE_DIR
 from lib.utils.logger import Logger
+from lib.utils.wordlist import Wordlist, load_wordlist
 
 
-def prepare_cookie_wordlist(arguments: argparse.Namespace, logger: Logger):
-    cookie_wordlist = set()
+def prepare_cookie_wordlist(arguments: argparse.Namespace, logger: Logger) -> Wordlist:
     bad_words = set()
+    wordlist_paths = []
 
-    wordlist_paths = re.split('\s*,\s*', arguments.cookie_wordlist)
-
-    for path in wordlist_paths:
+    for path in re.split('\s*,\s*', arguments.cookie_wordlist):
         if not os.path.isfile(path):
             logger.error(f'Путь "{path}" из --cookie-wordlist не указывает на словарь с параметрами для cookie')
             continue
 
-        with open(path) as file:
-            allow_regex = '^[^=,;]*$'
+        wordlist_paths.append(path)
+
+    allow_regex = re.compile('^[^=,;]*$')
+
+    def is_word_allowed(word: str) -> bool:
+        if allow_regex.search(word):
+            return True
 
-            for line in file:
-                word = line.strip()
+        bad_words.add(word)
+        return False
 
-                if re.search(allow_regex, word):
-                    cookie_wordlist.add(word)
-                else:
-                    bad_words.add(word)
+    # Фильтр вызывается только при компиляции словаря, поэтому предупреждение выводится при первом запуске
+    cookie_wordlist = load_wordlist(wordlist_paths, WORDLIST_CACHE_DIR, 'cookies', is_word_allowed)
 
     if len(bad_words):
         logger.warning(f'Следующие слова для поиска cookie были исключены: ' + '"' + '", "'.join(list(bad_words)) + '"')
 
-    return list(cookie_wordlist)
\ No newline at end of file
+    return cookie_wordlist
@@ -2,27 +2,21 @@ import argparse
 import os
 import re
 
-
+from lib.constants import WORDLIST_CACHE_DIR
 from lib.utils.logger import Logger
+from lib.utils.wordlist import Wordlist, load_wordlist
 
 
-def prepare_header_wordlist(arguments: argparse.Namespace, logger: Logger):
-    header_wordlist = set()
-
-    wordlist_paths = re.split('\s*,\s*', arguments.header_wordlist)
+def prepare_header_wordlist(arguments: argparse.Namespace, logger: Logger) -> Wordlist:
+    wordlist_paths = []
 
-    for path in wordlist_paths:
+    for path in re.split('\s*,\s*', arguments.header_wordlist):
         if not os.path.isfile(path):
             logger.error(f'Путь "{path}" из --header-wordlist не указывает на словарь с заголовками')
             continue
 
-        with open(path) as file:
-            allow_regex = '^[A-Za-z0-9_-]+$'
-
-            for line in file:
-                word = line.strip()
+        wordlist_paths.append(path)
 
-                if re.search(allow_regex, word):
-                    header_wordlist.add(word)
+    allow_regex = re.compile('^[A-Za-z0-9_-]+$')
 
-    return list(header_wordlist)
\ No newline at end of file
+    return load_wordlist(wordlist_paths, WORDLIST_CACHE_DIR, 'headers', allow_regex.search)
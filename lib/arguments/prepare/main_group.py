@@ -2,14 +2,12 @@ import argparse
 import os
 import random
 import re
-from base64 import b64decode
+from hashlib import md5
+from typing import Iterable, Iterator
 from urllib.parse import urlparse, urlunparse
 
-from bs4 import BeautifulSoup
-
 from lib.constants import USER_AGENTS
 from lib.utils.logger import Logger
-from lib.utils.request_helper import parse_raw_request
 
 
 def prepare_additional_headers(arguments: argparse.Namespace, logger: Logger):
@@ -22,63 +20,49 @@ def prepare_additional_headers(arguments: argparse.Namespace, logger: Logger):
     return headers
 
 
-def _prepare_burp_requests(content: str, logger: Logger) -> list:
-    root = BeautifulSoup(content, 'html.parser')
-    items = root.find('items')
-
-    raw_requests = []
-
-    for item in items.find_all('item'):
-        request = item.find('request')
-
-        if not request:
-            continue
+def prepare_raw_requests(arguments: argparse.Namespace, logger: Logger) -> Iterable[list]:
+    """ Лениво читает сырые запросы и экспорты Burp Suite из файла или папки `--raw-requests`
 
-        if request['base64'] == 'true':
-            raw_requests.append(parse_raw_request(b64decode(request.text).decode('utf8')))
-        else:
-            raw_requests.append(parse_raw_request(request.text))
+    :return: Итерируемый объект по спискам `[method, url, headers, body]`
+    """
+    # Импортируется при использовании, т.к. тянет за собой requests и gevent, которые должны загружаться
+    # после патчинга gevent
+    from lib.utils.raw_requests import RawRequestReader
 
-    return raw_requests
+    return RawRequestReader(arguments.raw_requests, arguments.raw_requests_workers, arguments.raw_requests_queue_size,
+                            logger)
 
 
-def prepare_raw_requests(arguments: argparse.Namespace, logger: Logger):
-    raw_requests = []
+def get_request_key(parsed_request: list) -> tuple:
+    """ Возвращает ключ запроса `[method, url, headers, body]` для поиска повторов: метод, полный адрес вместе
+    со значениями параметров и хэш тела запроса
 
-    # Если путь - файл
-    if os.path.isfile(arguments.raw_requests):
-        file = open(arguments.raw_requests)
-        content = file.read()
+    Запросы, отличающиеся только значениями параметров, не считаются повторами - их группирует `EndpointClusterer`
+    """
+    method, url, headers, body = parsed_request
+    url_obj = urlparse('//' + url.lstrip('/'))
+    body_hash = md5((body or '').encode('utf8', errors='replace')).digest()
 
-        if not content:
-            file.close()
-            return raw_requests
+    return method.upper(), url_obj.netloc.lower(), url_obj.path or '/', url_obj.query, body_hash
 
-        if content.startswith('<?xml version="1.0"?>'):
-            raw_requests += _prepare_burp_requests(content, logger)
-        else:
-            raw_requests.append(parse_raw_request(content))
 
-        file.close()
-    # Иначе директория
-    else:
-        for path, _, files in os.walk(arguments.raw_requests):
-            for filename in files:
-                file = open(os.path.join(path, filename))
-                content = file.read()
+def deduplicate_requests(parsed_requests: Iterable[list], logger: Logger) -> Iterator[list]:
+    """ Лениво отсеивает запросы, совпадающие с ранее встреченными по методу, адресу и телу запроса """
+    seen = set()
+    duplicates = 0
 
-                if not content:
-                    file.close()
-                    continue
+    for parsed_request in parsed_requests:
+        key = get_request_key(parsed_request)
 
-                if re.match('<\?xml.*\?>', content):
-                    raw_requests += _prepare_burp_requests(content, logger)
-                else:
-                    raw_requests.append(parse_raw_request(content))
+        if key in seen:
+            duplicates += 1
+            continue
 
-                file.close()
+        seen.add(key)
+        yield parsed_request
 
-    return raw_requests
+    if duplicates:
+        logger.info(f'Пропущено повторяющихся запросов: {duplicates}')
 
 
 def prepare_url(arguments: argparse.Namespace, logger: Logger) -> list:
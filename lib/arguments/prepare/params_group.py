@@ -2,20 +2,19 @@ import argparse
 import os
 import re
 
+from lib.constants import WORDLIST_CACHE_DIR
 from lib.utils.logger import Logger
+from lib.utils.wordlist import Wordlist, load_wordlist
 
 
-def prepare_param_wordlist(arguments: argparse.Namespace, logger: Logger):
-    param_wordlist = set()
+def prepare_param_wordlist(arguments: argparse.Namespace, logger: Logger) -> Wordlist:
+    wordlist_paths = []
 
-    wordlist_paths = re.split('\s*,\s*', arguments.param_wordlist)
-
-    for path in wordlist_paths:
+    for path in re.split('\s*,\s*', arguments.param_wordlist):
         if not os.path.exists(path):
             logger.error(f'Путь "{path}" из --param-wordlist не указывает на словарь с параметрами')
             continue
 
-        with open(path) as file:
-            param_wordlist |= set([w.strip() for w in file.readlines() if w.strip()])
+        wordlist_paths.append(path)
 
-    return list(param_wordlist)
+    return load_wordlist(wordlist_paths, WORDLIST_CACHE_DIR, 'params')
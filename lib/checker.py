@@ -1,11 +1,26 @@
 import re
+from time import thread_time
 
 from requests import Response
 
 from lib.constants import *
+from lib.utils.metrics import metrics
 from lib.utils.request_helper import RequestInfo
 
+# Проверки не уступают управление другим гринлетам, поэтому учитывается их процессорное время. Исключение - сравнение
+# длины контента: подсчет тэгов больших страниц выполняется в пуле процессов, и ожидание его результата в gevent hub
+# (вместе с работой других гринлетов) входит во время проверки. Для нее учитывается время по часам реального времени,
+# а сам подсчет тэгов - в статистике `job_time_count_html_tags` исполнителя CPU-ёмких задач
+CHECKER_PHASE = 'checker'
+CHECKER_WALL_PHASE = 'checker_wall'
 
+
+def get_origin_view(info: RequestInfo, response: Response) -> dict:
+    """ Возвращает эталонный ответ, усеченный так же, как тело ответа `response` """
+    return info.get_origin_view(getattr(response, 'body_cap', 0))
+
+
+@metrics.timed(CHECKER_PHASE, thread_time)
 def check_content_type_reason(reasons: list, info: RequestInfo, response: Response):
     # Если изменился тип контента
     if info.response.headers.get('Content-Type') != response.headers.get('Content-Type'):
@@ -16,17 +31,36 @@ def check_content_type_reason(reasons: list, info: RequestInfo, response: Respon
             {'reason': DIFF_CONTENT_TYPE, 'value': f'{content_type} ({orig_content_type})'})
 
 
+@metrics.timed(CHECKER_WALL_PHASE)
 def check_content_length_reason(reasons: list, info: RequestInfo, response: Response):
     # Если изменилась длина контента
     if info.response.headers.get('Content-Length', 0) != response.headers.get('Content-Length', 0):
+        origin = get_origin_view(info, response)
+
+        # Если число тэгов эталонного ответа неизвестно (подсчет не уложился в --cpu-job-timeout), то пропускаем
+        if origin['html_tags_count'] is None:
+            return
+
         # Если оригинальный ответ - html документ
-        if info.response_html_tags_count > 0:
-            # То дополнительно проверяем число тэгов html запроса
+        if origin['html_tags_count'] > 0:
+            # Проверяем число тэгов html запроса
             new_html_tags_count = info.count_html_tags(response.text)
 
-            if new_html_tags_count != info.response_html_tags_count:
-                reasons.append({'reason': DIFF_HTML_TAGS_COUNT,
-                                'value': f'{new_html_tags_count} ({info.response_html_tags_count})'})
+            if new_html_tags_count is None:
+                return
+
+            tags_count_diff = abs(new_html_tags_count - origin['html_tags_count'])
+
+            if tags_count_diff == 0:
+                return
+
+            # Небольшую разницу (динамические виджеты и т.п.) подавляем, если структура страницы почти не изменилась
+            if tags_count_diff <= HTML_TAGS_COUNT_TOLERANCE and \
+                    info.is_html_similar(response.text, getattr(response, 'body_cap', 0)):
+                return
+
+            reasons.append({'reason': DIFF_HTML_TAGS_COUNT,
+                            'value': f'{new_html_tags_count} ({origin["html_tags_count"]})'})
         else:
             orig_content_length = info.response.headers.get('Content-Length', 0)
             content_length = response.headers.get('Content-Length', 0)
@@ -34,49 +68,54 @@ def check_content_length_reason(reasons: list, info: RequestInfo, response: Resp
                             'value': f'{content_length} ({orig_content_length})'})
 
 
+@metrics.timed(CHECKER_PHASE, thread_time)
 def check_header_value_reflection_reason(reasons: list, info: RequestInfo, response: Response):
     # Если базовое значение заголовка отражается в ответе
     headers = '\n'.join([': '.join([k, v]) for k, v in response.headers.items()])
     raw_response = '\n'.join([response.url, headers, response.text])
 
-    if info.base_header_value in raw_response:
+    if info.header_state.base_value in raw_response:
         orig_headers = '\n'.join([': '.join([k, v]) for k, v in info.response.headers.items()])
-        orig_raw_response = '\n'.join([info.response.url, orig_headers, info.response.text])
+        orig_raw_response = '\n'.join([info.response.url, orig_headers, get_origin_view(info, response)['text']])
 
-        orig_reflections = len(re.findall(info.base_header_value, orig_raw_response))
-        reflections = len(re.findall(info.base_header_value, raw_response))
+        orig_reflections = len(re.findall(info.header_state.base_value, orig_raw_response))
+        reflections = len(re.findall(info.header_state.base_value, raw_response))
 
         reasons.append({'reason': HEADER_VALUE_REFLECTION,
                         'value': f'{reflections} ({orig_reflections})'})
 
 
+@metrics.timed(CHECKER_PHASE, thread_time)
 def check_cookie_value_reflection_reason(reasons: list, info: RequestInfo, response: Response):
     headers = '\n'.join([': '.join([k, v]) for k, v in response.headers.items()])
     raw_response = '\n'.join([response.url, headers, response.text])
 
-    if info.cookie_value in raw_response:
+    if info.cookie_state.value in raw_response:
         orig_headers = '\n'.join([': '.join([k, v]) for k, v in info.response.headers.items()])
-        orig_raw_response = '\n'.join([info.response.url, orig_headers, info.response.text])
+        orig_raw_response = '\n'.join([info.response.url, orig_headers, get_origin_view(info, response)['text']])
 
-        orig_reflections = len(re.findall(info.base_cookie_value, orig_raw_response))
-        reflections = len(re.findall(info.base_cookie_value, raw_response))
+        orig_reflections = len(re.findall(info.cookie_state.base_value, orig_raw_response))
+        reflections = len(re.findall(info.cookie_state.base_value, raw_response))
 
         reasons.append({'reason': COOKIE_VALUE_REFLECTION,
                         'value': f'{reflections} ({orig_reflections})'})
 
 
+@metrics.timed(CHECKER_PHASE, thread_time)
 def check_param_value_reflection_reason(reasons: list, info: RequestInfo, response: Response):
     # Если базовое значение параметра отражается в ответе
-    if info.url_base_param_value in response.text:
-        reflection = re.compile(f'((https?:)?/?/[^\'\">]+)?({info.url_base_param_value})[^\"\'>]*')
+    if info.url_state.base_value in response.text:
+        reflection = re.compile(f'((https?:)?/?/[^\'\">]+)?({info.url_state.base_value})[^\"\'>]*')
         # То дополнительно проверяем, чтобы отраженное значение не было частью URL
         reflections = len([match for match in reflection.findall(response.text) if not match[0]])
 
         if reflections:
-            orig_reflections = len([match for match in reflection.findall(info.response.text) if not match[0]])
+            orig_text = get_origin_view(info, response)['text']
+            orig_reflections = len([match for match in reflection.findall(orig_text) if not match[0]])
             reasons.append({'reason': PARAM_VALUE_REFLECTION, 'value': f'{reflections} ({orig_reflections})'})
 
 
+@metrics.timed(CHECKER_PHASE, thread_time)
 def check_status_code_reason(reasons: list, info: RequestInfo, response: Response):
     # Если изменился код ответа
     if info.response.status_code != response.status_code:
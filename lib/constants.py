@@ -1,5 +1,30 @@
+import os
+
 CACHE_BUSTER_ALF = 'qwertyuiopasdfghjklzxcvbnm1234567890'
 
+# Ресурсы меньшего размера (в символах) обрабатываются на месте, без передачи в пул процессов
+CPU_JOB_INLINE_SIZE = 32 * 1024
+# Размер блока (в байтах) при потоковом чтении тела ответа
+STREAM_CHUNK_SIZE = 8192
+# Максимальное число хостов, для которых сессия хранит пулы keep-alive соединений
+MAX_HOST_POOLS = 256
+# Период (сек) замера задержки пробуждения гринлета для оценки блокировок gevent hub
+HUB_MONITOR_INTERVAL = 0.05
+# Путь до персистентного кэша майнеров по умолчанию
+MINING_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'suseeker', 'mining.sqlite3')
+# Папка для скомпилированных словарей
+WORDLIST_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'suseeker', 'wordlists')
+# Размер части (в символах), на которые разбиваются большие JS-бандлы для параллельного разбора
+JS_CHUNK_SIZE = 512 * 1024
+# Размер части (в символах) JSON-документа, после разбора которой майнер уступает управление другим гринлетам
+JSON_CHUNK_SIZE = 64 * 1024
+# Максимальная длина (в символах) ключа JSON, переносимого лексером через границу частей документа
+JSON_MAX_KEY_SIZE = 4096
+# Максимальная разница в числе тэгов HTML страниц, которую может подавить совпадение simhash-отпечатков
+HTML_TAGS_COUNT_TOLERANCE = 2
+# Границы корзин (сек) гистограммы времени ответа на запросы
+METRICS_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
 # ...
 DISCARD_WORDS = 1
 RETRY_WORDS = 2
@@ -40,6 +65,27 @@ class ParamType:
     COOKIE = "COOKIE"
 
 
+class JavascriptParsers:
+    FAST = 'fast'
+    ESPRIMA = 'esprima'
+
+    @staticmethod
+    def get_list():
+        return [JavascriptParsers.__dict__[attr] for attr in JavascriptParsers.__dict__ if
+                not attr.startswith('_') and isinstance(JavascriptParsers.__dict__[attr], str)]
+
+
+class ResponseRetention:
+    NONE = 'none'
+    METADATA = 'metadata'
+    BODY = 'body'
+
+    @staticmethod
+    def get_list():
+        return [ResponseRetention.__dict__[attr] for attr in ResponseRetention.__dict__ if
+                not attr.startswith('_') and isinstance(ResponseRetention.__dict__[attr], str)]
+
+
 class OutputFormats:
     TABLE = 'table'
     JSON = 'json'
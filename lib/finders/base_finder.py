@@ -6,6 +6,7 @@ import gevent
 from gevent.queue import Queue
 from requests import PreparedRequest, Response
 
+from lib.structures import Finding
 from lib.utils.logger import Logger
 from lib.utils.request_helper import RequestHelper, RequestInfo
 
@@ -18,6 +19,9 @@ class BaseFinder(RequestHelper):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Максимальный размер читаемого тела ответа в байтах (0 - без ограничений)
+        self.body_cap: int = 0
+
     def determine_bucket_size(self, info: RequestInfo):
         raise NotImplementedError
 
@@ -26,7 +30,7 @@ class BaseFinder(RequestHelper):
 
         :param info:
         :param words: Названия параметров
-        :return:    dict([(`param`, `reasons`)]) - если найдено конкретное слово
+        :return:    Finding - если найдено конкретное слово
                     int - если со словами требуется провести манипуляции
         """
         raise NotImplementedError
@@ -35,7 +39,13 @@ class BaseFinder(RequestHelper):
         """ Возвращает общие число хидеров в запросе """
         raise NotImplementedError
 
-    def get_word_chunks(self, info: RequestInfo):
+    def get_word_chunks(self, info: RequestInfo, words: List[str] = None):
+        """ Разбивает слова на порции согласно размеру порции запроса
+
+        :param info:
+        :param words: Слова для разбиения, по умолчанию - словарь искателя вместе с `info.additional_params`
+        :return:
+        """
         raise NotImplementedError
 
     def is_info_searchable(self, info: RequestInfo):
@@ -56,12 +66,19 @@ class BaseFinder(RequestHelper):
                     `requests.Response` - если удалось получить ответ от сервера
         """
         return super().do_request(prepared_request, self.retry, self.timeout, self.delay, self.proxies,
-                                  self.arguments.allow_redirects, self.logger)
+                                  self.arguments.allow_redirects, self.logger, body_cap=self.body_cap,
+                                  drain_body=self.arguments.drain_body)
 
     def filter_requests(self, *args, **kwargs):
         kwargs.update({'logger': self.logger})
         return super().filter_requests(*args, **kwargs)
 
+    def get_finding(self, info: RequestInfo, param: str, param_type: str, reasons: list, response: Response) -> Finding:
+        """ Формирует запись о найденном параметре, сохраняя ответ согласно --response-retention """
+        return Finding.from_response(info.origin_url, param_type, param, reasons, response,
+                                     self.arguments.response_retention, self.arguments.responses_dir,
+                                     info.request.method)
+
     def get_optimal_bucket(self, info: RequestInfo, min_chunk: int, add_random: Callable,
                            additional_size: Callable, logger: Logger) -> Union[int, None]:
         """ Ищет оптимальный размер порции параметров соотношение (Длина порции) / (время ответа)
@@ -233,20 +250,16 @@ class BaseFinder(RequestHelper):
     def parse_results_queue(results_queue: Queue):
         results = defaultdict(lambda: defaultdict(list))
         while results_queue.qsize():
-            result = results_queue.get()
-            for param_name, value in result.items():
-                url, reasons, type, response = value['url'], value['reasons'], value['type'], value['response']
-                results[url][type].append({'param': param_name, 'reasons': reasons, 'response': response})
+            finding = results_queue.get()
+            results[finding.url][finding.type].append(finding)
 
         return results
 
     @staticmethod
-    def parse_results(results: list):
+    def parse_results(results: List[Finding]):
         _results = defaultdict(lambda: defaultdict(list))
-        for result in results:
-            for param_name, value in result.items():
-                url, reasons, type, response = value['url'], value['reasons'], value['type'], value['response']
-                _results[url][type].append({'param': param_name, 'reasons': reasons, 'response': response})
+        for finding in results:
+            _results[finding.url][finding.type].append(finding)
 
         return _results
 
@@ -271,8 +284,6 @@ class BaseFinder(RequestHelper):
 
         for url in new_results:
             for type in new_results[url]:
-                for new_info in new_results[url][type]:
-                    new_param, new_reasons, new_response = new_info['param'], new_info['reasons'], new_info['response']
-                    results[url][type].append({'param': new_param, 'reasons': new_reasons, 'response': new_response})
+                results[url][type].extend(new_results[url][type])
 
         return results
@@ -8,6 +8,7 @@ import lib.checker as checker
 from lib.constants import CACHE_BUSTER_ALF, RETRY_WORDS, SPLIT_WORDS, DISCARD_WORDS, ParamType
 from lib.finders.base_finder import BaseFinder
 from lib.utils.request_helper import RequestInfo
+from lib.utils.wordlist import split_words
 
 
 class CookieFinder(BaseFinder):
@@ -15,8 +16,9 @@ class CookieFinder(BaseFinder):
         super().__init__(*args, **kwargs)
 
         self.cookie_wordlist = self.arguments.cookie_wordlist
+        self.body_cap = self.arguments.cookie_body_cap
 
-        self.max_cookie_param_name = max([len(w) for w in self.cookie_wordlist])
+        self.max_cookie_param_name = self.cookie_wordlist.max_length
         self.max_cookie_param_value = 30
         # ; cookie_name=cookie_value
         self.min_cookie_param_chunk = 2 + self.max_cookie_param_name + 1 + self.max_cookie_param_value
@@ -62,12 +64,12 @@ class CookieFinder(BaseFinder):
 
                 :param info:
                 :param words: Названия параметров
-                :return:    dict([(`param`, `reasons`)]) - если найдено конкретное слово
+                :return:    Finding - если найдено конкретное слово
                             int - если со словами требуется провести манипуляции
                 """
         # Добавляем параметры в URL-строку
         request = info.copy_request()
-        cookies = [(k, v) for k, v in zip(words, [info.cookie_value] * len(words))]
+        cookies = [(k, v) for k, v in zip(words, [info.cookie_state.value] * len(words))]
         param_type = ParamType.COOKIE
 
         self.add_cookies(request, cookies)
@@ -89,8 +91,7 @@ class CookieFinder(BaseFinder):
             if len(words) == 1:
                 self.logger.success(f'Найден {param_type}-параметр "{words[0]}" к {info.origin_url}')
                 self.logger.debug(f'{param_type}-параметр "{words[0]}": reasons={reasons}')
-                return {words[0]: {'url': info.origin_url, 'reasons': reasons, 'type': param_type,
-                                   'response': response}}
+                return self.get_finding(info, words[0], param_type, reasons, response)
             # Иначе где-то среди слов есть искомые
             else:
                 return SPLIT_WORDS
@@ -99,7 +100,7 @@ class CookieFinder(BaseFinder):
             return DISCARD_WORDS
 
     def get_bucket_size(self, info: RequestInfo):
-        return info.cookie_bucket
+        return info.cookie_state.bucket
 
     def get_cookie_reasons(self, info: RequestInfo, response: Response) -> list:
         reasons = []
@@ -111,29 +112,22 @@ class CookieFinder(BaseFinder):
 
         return reasons
 
-    def get_word_chunks(self, info: RequestInfo):
-        chunks = []
-        current_chunk = []
-        current_chunk_len = 0
+    def get_word_chunks(self, info: RequestInfo, words: List[str] = None):
+        cookie_params = {k for k, _ in self.split_cookie_params(info.request.headers.get('Cookie', ''))}
+        # ; param=value
+        overhead = 2 + 1 + len(info.cookie_state.value)
 
-        cookie_params = set(self.split_cookie_params(info.request.headers.get('Cookie', '')))
-        wordlist = list((set(self.cookie_wordlist) | set(info.additional_params)) - cookie_params)
-
-        for w in wordlist:
-            # ; param=value
-            current_chunk_len += 2 + len(w) + 1 + len(info.cookie_value)
-
-            if current_chunk_len > info.cookie_bucket:
-                chunks.append(current_chunk)
-                current_chunk = []
-                current_chunk_len = 1 + len(w) + 1 + len(info.cookie_value)
-
-            current_chunk.append(w)
+        if words is None:
+            chunks = self.cookie_wordlist.get_chunks(cookie_params, info.cookie_state.bucket, overhead)
+            words = info.additional_params
+        # Слова, добавленные после формирования основных порций (например, найденные майнерами)
+        else:
+            chunks = []
 
-        if len(current_chunk):
-            chunks.append(current_chunk)
+        # Слова не из словаря в порядке добавления
+        words = [w for w in dict.fromkeys(words) if w not in cookie_params and w not in self.cookie_wordlist]
 
-        return chunks
+        return chunks + split_words(words, info.cookie_state.bucket, overhead)
 
     def is_info_searchable(self, info: RequestInfo):
         return True
@@ -142,19 +136,19 @@ class CookieFinder(BaseFinder):
         bucket_size = self.bucket_size_cache[info.netloc].get('bucket')
 
         if bucket_size:
-            info.cookie_bucket = bucket_size - len(info.request.headers.get('Cookie', ''))
+            info.cookie_state.bucket = bucket_size - len(info.request.headers.get('Cookie', ''))
         else:
-            info.cookie_bucket = None
+            info.cookie_state.bucket = None
 
     def setup_requests_info(self, info_list: List[RequestInfo]):
         for info in info_list:
-            if info.base_cookie_value and info.cookie_value:
+            if info.cookie_state.base_value and info.cookie_state.value:
                 continue
 
-            info.base_cookie_value = ''.join(
+            info.cookie_state.base_value = ''.join(
                 [random.choice(CACHE_BUSTER_ALF) for _ in
-                 range(self.max_cookie_param_value - len(info.cookie_value_breaker))])
-            info.cookie_value = info.base_cookie_value + info.cookie_value_breaker
+                 range(self.max_cookie_param_value - len(info.cookie_state.value_breaker))])
+            info.cookie_state.value = info.cookie_state.base_value + info.cookie_state.value_breaker
 
     def split_cookie_params(self, params: str):
         return re.findall('\s*([^=;]+)=([^;]+)', params)
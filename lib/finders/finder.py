@@ -1,16 +1,22 @@
 import heapq
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
 
 import gevent
-from gevent.queue import Queue
+from gevent.pool import Pool
 
+from lib.constants import RETRY_WORDS, ParamType
 from lib.finders.base_finder import BaseFinder
 from lib.finders.body_finder import BodyFinder
 from lib.finders.cookie_finder import CookieFinder
 from lib.finders.header_finder import HeaderFinder
 from lib.finders.json_finder import JsonFinder
 from lib.finders.url_finder import UrlFinder
-from lib.structures import PrioritizedItem
-from lib.workers import FindSecretsWorker, SetBucketWorker
+from lib.structures import Finding, PrioritizedItem
+from lib.utils.endpoints import EndpointCluster
+from lib.utils.metrics import metrics
+from lib.utils.request_helper import RequestInfo
+from lib.workers import FindSecretsWorker
 
 
 class Finder(BaseFinder):
@@ -25,6 +31,27 @@ class Finder(BaseFinder):
 
         self.finders = []
 
+        # min-heap порций слов для воркеров
+        self.args_heapq = []
+        self.results = []
+        self.workers: List[FindSecretsWorker] = []
+        self.worker_greenlets: List[gevent.Greenlet] = []
+
+        # Определение размеров порций: {(netloc, имя искателя): Greenlet}
+        self.calibrations: Dict[Tuple[str, str], gevent.Greenlet] = {}
+        self.calibration_pool = Pool(self.threads)
+        self.preparations: List[gevent.Greenlet] = []
+        self.netloc_infos: Dict[str, List[RequestInfo]] = defaultdict(list)
+        # Параметры, найденные майнерами для хоста, и отброшенные при их ранжировании
+        self.mined_params: Dict[str, List[str]] = defaultdict(list)
+        self.dropped_params: Dict[str, List[str]] = defaultdict(list)
+        # Число найденных майнерами слов, поставленных в очередь: {(id запроса, имя искателя): int}
+        self.mined_counts: Dict[Tuple[int, str], int] = defaultdict(int)
+        self.statistics = {'mined_words_probed': 0, 'probes_avoided': 0}
+        # id запросов, порции слов которых поставлены в очередь
+        self.prepared = set()
+        self.closed = False
+
     def setup_finders(self):
         if self.arguments.find_headers or self.arguments.find_all:
             self.finders.append(self.header_finder)
@@ -38,101 +65,230 @@ class Finder(BaseFinder):
             self.finders.append(self.cookie_finder)
 
     def run(self):
-        self.setup_finders()
+        """ Ищет параметры для всех запросов из `self.info_list` """
+        self.start()
+
+        for info in self.info_list:
+            self.add_info(info)
 
-        # Устанавливаем свойства запросов
-        self.setup_requests_info()
+        self.close()
 
-        # Устанавливаем размер числа доп. заголовков для запросов
-        self.logger.info('Установка размера порций для запросов')
-        self.setup_bucket_sizes()
+        return self.join()
+
+    def start(self):
+        """ Запускает воркеры поиска параметров, после чего запросы и найденные майнерами параметры
+        передаются в работающий планировщик методами `add_info` и `add_params`
+        """
+        self.setup_finders()
 
-        # Запускаем поиск секретных параметров
         self.logger.info('Поиск параметров')
-        return self.find_secrets()
 
-    def setup_requests_info(self, **kwargs):
+        self.workers = [FindSecretsWorker(self.args_heapq, self.results, self.logger) for _ in range(self.threads)]
+        self.worker_greenlets = [gevent.spawn(worker.run) for worker in self.workers]
+
+    def add_info(self, info: RequestInfo):
+        """ Добавляет запрос с полученным эталонным ответом в поиск
+
+        Размер порций определяется один раз для каждого хоста, после чего порции слов запроса сразу попадают
+        в очередь воркеров, не дожидаясь остальных хостов
+        """
+        self.setup_requests_info([info])
+        self.netloc_infos[info.netloc].append(info)
+
         for finder in self.finders:
-            finder.setup_requests_info(self.info_list)
+            key = (info.netloc, finder.__class__.__name__)
 
-    def setup_bucket_sizes(self):
-        """ Устанавливает размер порций для всех запросов """
-        args_queue = Queue()
+            if key in self.calibrations or not finder.is_info_searchable(info):
+                continue
 
-        # Запускаем на один и тот же запрос разные работы
-        for info in self.info_list:
-            for finder in self.finders:
-                if not finder.is_info_searchable(info):
-                    continue
+            calibrate = metrics.timed('calibration')(finder.determine_bucket_size)
+            self.calibrations[key] = self.calibration_pool.spawn(calibrate, info)
+
+        self.preparations.append(gevent.spawn(self.prepare_info, info))
+
+    def add_params(self, netloc: str, params: List[str], dropped: List[str] = None):
+        """ Добавляет найденные майнерами параметры `params` в поиск по всем запросам к хосту `netloc`
+
+        Для запросов, порции которых уже сформированы, новые слова добавляются в очередь отдельными порциями,
+        остальные получат их при формировании порций
 
-                args_queue.put((finder.determine_bucket_size, info))
+        :param netloc:
+        :param params: Параметры в порядке убывания оценки
+        :param dropped: Параметры, отброшенные при ранжировании, - для учета сэкономленных запросов
+        """
+        self.mined_params[netloc].extend(params)
+        self.dropped_params[netloc].extend(dropped or [])
 
-        # Запускаем воркеры
-        workers = [SetBucketWorker(args_queue, self.logger)
-                   for _ in range(self.threads)]
+        for info in self.netloc_infos.get(netloc, []):
+            if id(info) in self.prepared:
+                self.push_mined_params(info, params, dropped or [])
 
-        greenlets = [gevent.spawn(worker.run) for worker in workers]
+    def push_mined_params(self, info: RequestInfo, params: List[str], dropped: List[str]):
+        """ Ставит в очередь порции найденных майнерами слов с учетом лимита --mined-params-finder-limit """
+        new_params = [param for param in params if param not in info.additional_params]
+        info.additional_params.extend(new_params)
 
-        # Ждем заверщения работы
-        while any([worker.is_running() for worker in workers]) or args_queue.qsize():
-            gevent.sleep(0)
+        for finder in self.get_ready_finders(info):
+            words, over_limit = self.limit_mined_words(finder, info, new_params)
+
+            chunks = finder.get_word_chunks(info, words)
+
+            self.push_chunks(finder, info, chunks)
+            self.statistics['mined_words_probed'] += sum([len(chunk) for chunk in chunks])
+
+            if over_limit or dropped:
+                self.statistics['probes_avoided'] += len(finder.get_word_chunks(info, over_limit + dropped))
+
+    def limit_mined_words(self, finder: BaseFinder, info: RequestInfo,
+                          words: List[str]) -> Tuple[List[str], List[str]]:
+        """ Разделяет слова на укладывающиеся в лимит искателя для запроса и превышающие его """
+        limit = self.arguments.mined_params_finder_limit
+
+        if not limit:
+            return words, []
+
+        key = (id(info), finder.__class__.__name__)
+        remaining = max(limit - self.mined_counts[key], 0)
+        self.mined_counts[key] += min(remaining, len(words))
+
+        return words[:remaining], words[remaining:]
+
+    def close(self):
+        """ Сообщает, что новых запросов и параметров не будет """
+        self.closed = True
+
+    def join(self):
+        """ Дожидается окончания поиска после вызова `close` и возвращает результаты """
+        while not self.closed or not all([job.ready() for job in self.preparations]) \
+                or any([worker.is_running() for worker in self.workers]) or len(self.args_heapq):
+            gevent.sleep(0.1)
 
         # Выключаем воркеры
-        for worker in workers:
+        for worker in self.workers:
             worker.finish()
 
         # Ждем выключения
-        gevent.joinall(greenlets)
+        gevent.joinall(self.worker_greenlets)
 
-        # Устанавливаем размеры порций
-        for info in self.info_list:
-            for finder in self.finders:
-                if not finder.is_info_searchable(info):
-                    continue
+        if self.mined_params or self.dropped_params:
+            self.logger.info('Статистика поиска найденных майнерами параметров:\n\t{}'.format(
+                ', '.join(['='.join([k, str(v)]) for k, v in self.statistics.items()])))
 
-                finder.set_bucket_size(info)
-                self.logger.debug(
-                    f'{finder.__class__.__name__}: {info.origin_url} - размер порции {finder.get_bucket_size(info)}')
+        return self.parse_results(self.results)
 
-    def find_secrets(self, **kwargs):
-        # min-heap
-        args_heapq = []
-        results = []
+    def verify_clusters(self, clusters: List[EndpointCluster]) -> dict:
+        """ Проверяет параметры, найденные для первых запросов кластеров эндпоинтов, на остальных запросах кластеров
 
-        # формируем список аргументов
-        for finder in self.finders:
-            for info in self.info_list:
+        Вызывается после `join`, эталонные ответы запрашиваются только для кластеров с найденными параметрами
 
-                if not finder.is_info_searchable(info):
-                    self.logger.debug(f'{finder.__class__.__name__} отклонил запрос {info.origin_url}')
-                    continue
+        :return: Результаты поиска вместе с подтвержденными параметрами
+        """
+        # Адрес запроса не отличает запросы с разными методами, поэтому находки сопоставляются по методу и адресу
+        findings = defaultdict(list)
+        for finding in self.results:
+            findings[(finding.method, finding.url)].append(finding)
 
-                # Пропускаем запросы, для которых не установлен размер порции
-                if not finder.get_bucket_size(info):
-                    self.logger.error(
-                        f'{finder.__class__.__name__} не смог определить размер порции для запроса {info.origin_url}')
-                    continue
+        clusters = [cluster for cluster in clusters
+                    if len(cluster) > 1 and self.get_request_key(cluster.representative) in findings]
+        info_list = [RequestInfo(request) for cluster in clusters for request in cluster.members]
 
-                word_chunks = finder.get_word_chunks(info)
+        if not info_list:
+            return self.parse_results(self.results)
 
-                for priority, chunk in enumerate(word_chunks):
-                    heapq.heappush(args_heapq, PrioritizedItem(priority, (finder.find_secrets, info, chunk)))
+        self.logger.info('Проверка найденных параметров на остальных запросах кластеров')
+        self.set_origin_responses(info_list, self.threads, self.retry, self.timeout, self.delay, self.proxies,
+                                  self.allow_redirects, self.logger)
 
-        # Запускаем воркеры
-        workers = [FindSecretsWorker(args_heapq, results, self.logger)
-                   for _ in range(self.threads)]
+        statistics = {'clusters': len(clusters), 'requests': len(info_list), 'checks': 0, 'confirmed': 0}
+        infos = iter(info_list)
 
-        greenlets = [gevent.spawn(worker.run) for worker in workers]
+        for cluster in clusters:
+            members = [next(infos) for _ in cluster.members]
+            members = [info for info in members if info.response is not None]
+            cluster_findings = findings[self.get_request_key(cluster.representative)]
 
-        # Ждем заверщения работы
-        while any([worker.is_running() for worker in workers]) or len(args_heapq):
-            gevent.sleep(0)
+            confirmed = self.verify_findings(members, cluster_findings)
+            self.results.extend(confirmed)
 
-        # Выключаем воркеры
-        for worker in workers:
-            worker.finish()
+            statistics['checks'] += len(members) * len(cluster_findings)
+            statistics['confirmed'] += len(confirmed)
 
-        # Ждем выключения
-        gevent.joinall(greenlets)
+        self.logger.info('Статистика проверки кластеров:\n\t{}'.format(
+            ', '.join(['='.join([k, str(v)]) for k, v in statistics.items()])))
+
+        return self.parse_results(self.results)
+
+    @staticmethod
+    def get_request_key(request) -> Tuple[str, str]:
+        """ Возвращает ключ `(method, url)` объекта `requests.PreparedRequest` для сопоставления с находками """
+        return request.method, request.url
+
+    def verify_findings(self, info_list: List[RequestInfo], findings: List[Finding]) -> List[Finding]:
+        """ Проверяет параметры `findings`, найденные для другого запроса, на запросах `info_list`
+
+        Каждый параметр проверяется отдельным запросом, поэтому определение размеров порций не требуется
+
+        :param info_list: Запросы с полученными эталонными ответами
+        :param findings: Найденные параметры
+        :return: Подтвержденные параметры запросов `info_list`
+        """
+        finders = {ParamType.URL: self.url_finder, ParamType.BODY: self.body_finder, ParamType.JSON: self.json_finder,
+                   ParamType.HEADER: self.header_finder, ParamType.COOKIE: self.cookie_finder}
+
+        self.setup_requests_info(info_list)
+
+        pool = Pool(self.threads)
+        jobs = [pool.spawn(self.verify_finding, finders[finding.type], info, finding.param)
+                for info in info_list for finding in findings if finders[finding.type].is_info_searchable(info)]
+        gevent.joinall(jobs)
+
+        return [job.value for job in jobs if isinstance(job.value, Finding)]
+
+    def verify_finding(self, finder: BaseFinder, info: RequestInfo, param: str) -> Union[Finding, None]:
+        """ Проверяет параметр `param` запроса, повторяя проверку при ошибках выполнения запроса """
+        for _ in range(max(self.retry, 1)):
+            result = finder.find_secrets(info, [param])
+
+            if result != RETRY_WORDS:
+                return result if isinstance(result, Finding) else None
+
+        return None
+
+    def setup_requests_info(self, info_list: List[RequestInfo]):
+        for info in info_list:
+            info.simhash_threshold = self.arguments.simhash_threshold
+
+        for finder in self.finders:
+            finder.setup_requests_info(info_list)
+
+    def prepare_info(self, info: RequestInfo):
+        """ Дожидается определения размеров порций для хоста запроса и ставит порции слов в очередь """
+        gevent.joinall([job for (netloc, _), job in self.calibrations.items() if netloc == info.netloc])
+
+        for finder in self.finders:
+            if not finder.is_info_searchable(info):
+                self.logger.debug(f'{finder.__class__.__name__} отклонил запрос {info.origin_url}')
+                continue
+
+            finder.set_bucket_size(info)
+
+            # Пропускаем запросы, для которых не установлен размер порции
+            if not finder.get_bucket_size(info):
+                self.logger.error(
+                    f'{finder.__class__.__name__} не смог определить размер порции для запроса {info.origin_url}')
+                continue
+
+            self.logger.debug(
+                f'{finder.__class__.__name__}: {info.origin_url} - размер порции {finder.get_bucket_size(info)}')
+            self.push_chunks(finder, info, finder.get_word_chunks(info))
+
+        self.prepared.add(id(info))
+        self.push_mined_params(info, self.mined_params.get(info.netloc, []), self.dropped_params.get(info.netloc, []))
+
+    def get_ready_finders(self, info: RequestInfo) -> List[BaseFinder]:
+        """ Возвращает искателей, для которых у запроса определен размер порции """
+        return [finder for finder in self.finders if finder.is_info_searchable(info) and finder.get_bucket_size(info)]
 
-        return self.parse_results(results)
+    def push_chunks(self, finder: BaseFinder, info: RequestInfo, word_chunks: List[List[str]]):
+        for priority, chunk in enumerate(word_chunks):
+            heapq.heappush(self.args_heapq, PrioritizedItem(priority, (finder.find_secrets, info, chunk)))
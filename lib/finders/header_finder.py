@@ -8,6 +8,7 @@ import lib.checker as checker
 from lib.constants import *
 from lib.finders.base_finder import BaseFinder
 from lib.utils.request_helper import RequestInfo
+from lib.utils.wordlist import split_words
 
 
 class HeaderFinder(BaseFinder):
@@ -15,8 +16,9 @@ class HeaderFinder(BaseFinder):
         super().__init__(*args, **kwargs)
 
         self.headers_wordlist = self.arguments.header_wordlist
+        self.body_cap = self.arguments.header_body_cap
 
-        self.max_header_name = max((len(h) for h in self.headers_wordlist))
+        self.max_header_name = self.headers_wordlist.max_length
         self.max_header_value = 18
         self.min_header_chunk = 1
 
@@ -101,7 +103,7 @@ class HeaderFinder(BaseFinder):
         :return:
         """
         request = info.copy_request()
-        headers = {k: v for k, v in zip(words, [info.header_value] * len(words))}
+        headers = {k: v for k, v in zip(words, [info.header_state.value] * len(words))}
         param_type = ParamType.HEADER
 
         self.add_headers(request, headers)
@@ -123,8 +125,7 @@ class HeaderFinder(BaseFinder):
             if len(words) == 1:
                 self.logger.success(f'Найден {param_type}-параметр "{words[0]}" к {info.origin_url}')
                 self.logger.debug(f'{param_type}-параметр "{words[0]}": reasons={reasons}')
-                return {words[0]: {'url': info.origin_url, 'reasons': reasons, 'type': param_type,
-                                   'response': response}}
+                return self.get_finding(info, words[0], param_type, reasons, response)
             # Иначе где-то среди слов есть искомые
             else:
                 return SPLIT_WORDS
@@ -134,7 +135,7 @@ class HeaderFinder(BaseFinder):
 
     def get_bucket_size(self, info: RequestInfo):
         """ Возвращает общие число хидеров в запросе """
-        return info.header_bucket
+        return info.header_state.bucket
 
     def get_optimal_bucket(self, info: RequestInfo, **kwargs) -> int:
         """ Ищет оптимальный размер числа доп. заголовков в запросе через соотношение (число заголовков) / (время ответа)
@@ -150,30 +151,37 @@ class HeaderFinder(BaseFinder):
         value = ''.join([random.choice(CACHE_BUSTER_ALF) for _ in range(self.max_header_value)])
         return key, value
 
-    def get_word_chunks(self, info: RequestInfo):
+    def get_word_chunks(self, info: RequestInfo, words: List[str] = None):
         headers = set(info.request.headers.keys())
+        chunk_size = info.header_state.bucket - len(info.request.headers.keys())
 
-        wordlist = list((set(self.headers_wordlist) | set(info.additional_params)) - headers)
-        chunk_size = info.header_bucket - len(info.request.headers.keys())
+        if words is None:
+            word_chunks = self.headers_wordlist.get_chunks(headers, max_words=chunk_size)
+            words = info.additional_params
+        # Слова, добавленные после формирования основных порций (например, найденные майнерами)
+        else:
+            word_chunks = []
+
+        # Слова не из словаря в порядке добавления
+        words = [w for w in dict.fromkeys(words) if w not in headers and w not in self.headers_wordlist]
 
-        word_chunks = [wordlist[i:i + chunk_size] for i in range(0, len(wordlist), chunk_size)]
-        return word_chunks
+        return word_chunks + split_words(words, max_words=chunk_size)
 
     def set_bucket_size(self, info: RequestInfo):
         """ Устанавивает для запроса в `info` общее число хидеров """
         bucket_size = self.bucket_size_cache[info.netloc]['header_bucket'].get('size')
 
         if bucket_size:
-            info.header_bucket = bucket_size - len(info.request.headers.keys())
+            info.header_state.bucket = bucket_size - len(info.request.headers.keys())
         else:
-            info.header_bucket = None
+            info.header_state.bucket = None
 
     def setup_requests_info(self, info_list: List[RequestInfo]):
         for info in info_list:
-            info.base_header_value = ''.join(
+            info.header_state.base_value = ''.join(
                 [random.choice(CACHE_BUSTER_ALF) for _ in
-                 range(self.max_header_value - len(info.header_value_breaker))])
-            info.header_value = info.base_header_value + info.header_value_breaker
+                 range(self.max_header_value - len(info.header_state.value_breaker))])
+            info.header_state.value = info.header_state.base_value + info.header_state.value_breaker
 
     def is_info_searchable(self, info: RequestInfo):
         return True
@@ -8,6 +8,7 @@ import lib.checker as checker
 from lib.constants import CACHE_BUSTER_ALF, RETRY_WORDS, SPLIT_WORDS, DISCARD_WORDS, ParamType
 from lib.finders.base_finder import BaseFinder
 from lib.utils.request_helper import RequestInfo
+from lib.utils.wordlist import split_words
 
 
 class JsonFinder(BaseFinder):
@@ -15,8 +16,9 @@ class JsonFinder(BaseFinder):
         super().__init__(*args, **kwargs)
 
         self.params_wordlist = self.arguments.param_wordlist
+        self.body_cap = self.arguments.param_body_cap
 
-        self.max_json_param_name = max([len(w) for w in self.params_wordlist])
+        self.max_json_param_name = self.params_wordlist.max_length
         self.max_json_param_value = 35
         self.min_json_param_chunk = self.calc_chunk_size(self.max_json_param_name,
                                                          self.max_json_param_value)  # , "param": "value"
@@ -70,12 +72,12 @@ class JsonFinder(BaseFinder):
 
         :param info:
         :param words: Названия параметров
-        :return:    dict([(`param`, `reasons`)]) - если найдено конкретное слово
+        :return:    Finding - если найдено конкретное слово
                     int - если со словами требуется провести манипуляции
         """
         # Добавляем параметры в URL-строку
         request = info.copy_request()
-        params = [(k, v) for k, v in zip(words, [info.json_param_value] * len(words))]
+        params = [(k, v) for k, v in zip(words, [info.json_state.value] * len(words))]
         param_type = ParamType.JSON
 
         self.add_json_params(request, params)
@@ -97,8 +99,7 @@ class JsonFinder(BaseFinder):
             if len(words) == 1:
                 self.logger.success(f'Найден {param_type}-параметр "{words[0]}" к {info.origin_url}')
                 self.logger.debug(f'{param_type}-параметр "{words[0]}": reasons={reasons}')
-                return {words[0]: {'url': info.origin_url, 'reasons': reasons, 'type': param_type,
-                                   'response': response}}
+                return self.get_finding(info, words[0], param_type, reasons, response)
             # Иначе где-то среди слов есть искомые
             else:
                 return SPLIT_WORDS
@@ -117,35 +118,28 @@ class JsonFinder(BaseFinder):
         return reasons
 
     def get_bucket_size(self, info: RequestInfo):
-        return info.body_param_bucket
+        return info.body_state.bucket
 
     def get_optimal_bucket(self, info: RequestInfo, **kwargs):
         additional_size = lambda _info: len(info.request.body) if info.request.body else 0
         return super().get_optimal_bucket(info, self.min_json_param_chunk, self.add_random_json_param, additional_size, self.logger)
 
-    def get_word_chunks(self, info: RequestInfo):
-        chunks = []
-        current_chunk = []
-        current_chunk_len = 0
-
+    def get_word_chunks(self, info: RequestInfo, words: List[str] = None):
         json_params = set(json.loads(info.request.body).keys())
-        wordlist = list((set(self.params_wordlist) | set(info.additional_params)) - json_params)
-
-        for w in wordlist:
-            # &?param=value
-            current_chunk_len += self.calc_chunk_size(len(w), len(info.json_param_value))
+        # "param": "value",
+        overhead = self.calc_chunk_size(0, len(info.json_state.value))
 
-            if current_chunk_len > info.body_param_bucket:
-                chunks.append(current_chunk)
-                current_chunk = []
-                current_chunk_len = self.calc_chunk_size(len(w), len(info.json_param_value))
-
-            current_chunk.append(w)
+        if words is None:
+            chunks = self.params_wordlist.get_chunks(json_params, info.body_state.bucket, overhead)
+            words = info.additional_params
+        # Слова, добавленные после формирования основных порций (например, найденные майнерами)
+        else:
+            chunks = []
 
-        if len(current_chunk):
-            chunks.append(current_chunk)
+        # Слова не из словаря в порядке добавления
+        words = [w for w in dict.fromkeys(words) if w not in json_params and w not in self.params_wordlist]
 
-        return chunks
+        return chunks + split_words(words, info.body_state.bucket, overhead)
 
     def is_info_searchable(self, info: RequestInfo):
         try:
@@ -166,16 +160,16 @@ class JsonFinder(BaseFinder):
             if bucket_size < self.min_json_param_chunk:
                 bucket_size = self.min_json_param_chunk
 
-            info.body_param_bucket = bucket_size - (len(info.request.body) if info.request.body else 0)
+            info.body_state.bucket = bucket_size - (len(info.request.body) if info.request.body else 0)
         else:
-            info.body_param_bucket = None
+            info.body_state.bucket = None
 
     def setup_requests_info(self, info_list: List[RequestInfo]):
         for info in info_list:
-            if info.json_base_param_value and info.json_param_value:
+            if info.json_state.base_value and info.json_state.value:
                 continue
 
-            info.json_base_param_value = ''.join(
+            info.json_state.base_value = ''.join(
                 [random.choice(CACHE_BUSTER_ALF) for _ in
-                 range(self.max_json_param_value - len(info.json_param_value_breaker))])
-            info.json_param_value = info.json_base_param_value + info.json_param_value_breaker
+                 range(self.max_json_param_value - len(info.json_state.value_breaker))])
+            info.json_state.value = info.json_state.base_value + info.json_state.value_breaker
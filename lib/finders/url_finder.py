@@ -1,7 +1,7 @@
 import random
 import re
 from typing import List
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote
 
 from requests import PreparedRequest
 
@@ -9,6 +9,7 @@ import lib.checker as checker
 from lib.constants import CACHE_BUSTER_ALF, RETRY_WORDS, SPLIT_WORDS, DISCARD_WORDS, ParamType
 from lib.finders.base_finder import BaseFinder
 from lib.utils.request_helper import RequestInfo
+from lib.utils.wordlist import split_words
 
 
 class UrlFinder(BaseFinder):
@@ -16,8 +17,9 @@ class UrlFinder(BaseFinder):
         super().__init__(*args, **kwargs)
 
         self.params_wordlist = self.arguments.param_wordlist
+        self.body_cap = self.arguments.param_body_cap
 
-        self.max_url_param_name = max([len(w) for w in self.arguments.param_wordlist])
+        self.max_url_param_name = self.params_wordlist.max_length
         self.max_url_param_value = 35
         self.min_url_param_chunk = 1 + self.max_url_param_name + 1 + self.max_url_param_value
 
@@ -67,13 +69,13 @@ class UrlFinder(BaseFinder):
 
         :param info:
         :param words: Названия заголовков
-        :return:    dict([(`param`, `reasons`)]) - если найдено конкретное слово
+        :return:    Finding - если найдено конкретное слово
                     int - если со словами требуется провести манипуляции
         """
 
         # Добавляем параметры в URL-строку
         request = info.copy_request()
-        params = {k: v for k, v in zip(words, [info.url_param_value] * len(words))}
+        params = {k: v for k, v in zip(words, [info.url_state.value] * len(words))}
         param_type = ParamType.URL
 
         self.add_url_params(request, params)
@@ -95,8 +97,7 @@ class UrlFinder(BaseFinder):
             if len(words) == 1:
                 self.logger.success(f'Найден {param_type}-параметр "{words[0]}" к {info.origin_url}')
                 self.logger.debug(f'{param_type}-параметр "{words[0]}": reasons={reasons}')
-                return {words[0]: {'url': info.origin_url, 'reasons': reasons, 'type': param_type,
-                                   'response': response}}
+                return self.get_finding(info, words[0], param_type, reasons, response)
             # Иначе где-то среди слов есть искомые
             else:
                 return SPLIT_WORDS
@@ -105,36 +106,29 @@ class UrlFinder(BaseFinder):
             return DISCARD_WORDS
 
     def get_optimal_bucket(self, info: RequestInfo, **kwargs):
-        additional_size = lambda _info: len(urlparse(_info.origin_url).query)
+        additional_size = lambda _info: len(_info.parsed_url.query)
         return super().get_optimal_bucket(info, self.min_url_param_chunk, self.add_random_url_param, additional_size,
                                           self.logger)
 
     def get_bucket_size(self, info: RequestInfo):
-        return info.url_param_bucket
+        return info.url_state.bucket
 
-    def get_word_chunks(self, info: RequestInfo):
-        chunks = []
-        current_chunk = []
-        current_chunk_len = 0
+    def get_word_chunks(self, info: RequestInfo, words: List[str] = None):
+        url_params = {k for k, _ in self.split_url_params(info.parsed_url.query)}
+        # [?&]param=value
+        overhead = 1 + 1 + len(info.url_state.value)
 
-        url_params = set(self.split_url_params(urlparse(info.request.url).query))
-        wordlist = list((set(self.params_wordlist) | set(info.additional_params)) - url_params)
-
-        for w in wordlist:
-            # [?&]param=value
-            current_chunk_len += 1 + len(w) + 1 + len(info.url_param_value)
-
-            if current_chunk_len > info.url_param_bucket:
-                chunks.append(current_chunk)
-                current_chunk = []
-                current_chunk_len = 1 + len(w) + 1 + len(info.url_param_value)
-
-            current_chunk.append(w)
+        if words is None:
+            chunks = self.params_wordlist.get_chunks(url_params, info.url_state.bucket, overhead)
+            words = info.additional_params
+        # Слова, добавленные после формирования основных порций (например, найденные майнерами)
+        else:
+            chunks = []
 
-        if len(current_chunk):
-            chunks.append(current_chunk)
+        # Слова не из словаря в порядке добавления
+        words = [w for w in dict.fromkeys(words) if w not in url_params and w not in self.params_wordlist]
 
-        return chunks
+        return chunks + split_words(words, info.url_state.bucket, overhead)
 
     def is_info_searchable(self, info: RequestInfo):
         return True
@@ -143,19 +137,19 @@ class UrlFinder(BaseFinder):
         bucket_size = self.bucket_size_cache[info.netloc]['url_param_bucket'].get('size')
 
         if bucket_size:
-            info.url_param_bucket = bucket_size - len(urlparse(info.origin_url).query)
+            info.url_state.bucket = bucket_size - len(info.parsed_url.query)
         else:
-            info.url_param_bucket = None
+            info.url_state.bucket = None
 
     def setup_requests_info(self, info_list: List[RequestInfo]):
         for info in info_list:
-            if info.url_base_param_value and info.url_param_value:
+            if info.url_state.base_value and info.url_state.value:
                 continue
 
-            info.url_base_param_value = ''.join(
+            info.url_state.base_value = ''.join(
                 [random.choice(CACHE_BUSTER_ALF) for _ in
-                 range(self.max_url_param_value - len(info.url_param_value_breaker))])
-            info.url_param_value = info.url_base_param_value + info.url_param_value_breaker
+                 range(self.max_url_param_value - len(info.url_state.value_breaker))])
+            info.url_state.value = info.url_state.base_value + info.url_state.value_breaker
 
     def split_url_params(self, params: str):
         return [(match[0], match[2]) for match in re.findall('([^?:&=$]+)(=([^?:&=$]+))?', params)]
\ No newline at end of file
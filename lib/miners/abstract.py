@@ -1,30 +1,115 @@
 import re
 from argparse import Namespace
 from hashlib import md5
+from typing import Dict, Union
 
+from gevent.local import local
 from gevent.queue import Queue
 
+from lib.miners.cache import MiningCache
+from lib.miners.frontier import UrlFrontier
 from lib.utils.logger import Logger
 
 
+def is_streamed(resource) -> bool:
+    """ Проверяет, является ли ресурс итератором по строкам, читаемым по мере загрузки """
+    return resource is not None and not isinstance(resource, str)
+
+
 class AbstractMiner:
-    def __init__(self, args: Namespace, url_queue: Queue, resource_queue: Queue, param_queue: Queue, logger: Logger):
+    def __init__(self, args: Namespace, url_queue: UrlFrontier, resource_queue: Queue, param_queue: Queue, logger: Logger,
+                 cache: MiningCache = None):
         self.args = args
         self.url_queue = url_queue
         self.resource_queue = resource_queue
         self.param_queue = param_queue
         self.logger = logger
+        self.cache = cache
 
         self.resource_hashes = set()
         self.miner_name = self.get_miner_name()
 
+        # Ресурсы обрабатываются несколькими гринлетами одновременно, поэтому результат обработки текущего ресурса
+        # хранится отдельно для каждого гринлета
+        self._local = local()
+
+    @property
+    def _result(self) -> Union[Dict[str, list], None]:
+        """ Результат обработки текущего ресурса для сохранения в кэш:
+        {'params': [param_name], 'urls': [[url, force_content_type]], 'resources': [[content_type, resource]]}
+        """
+        return getattr(self._local, 'result', None)
+
+    @_result.setter
+    def _result(self, value: Union[Dict[str, list], None]):
+        self._local.result = value
+
     def parse_resource(self, resource: str):
         raise NotImplementedError
 
     def get_acceptable_content_types(self) -> set:
         raise NotImplementedError
 
+    def process_resource(self, resource_dict: dict):
+        """ Обрабатывает ресурс, используя результат его обработки в предыдущих запусках, если тот сохранен в кэше
+
+        Ресурс может прийти без тела (`resource` равен None) - если загрузчик убедился, что он не изменился,
+        в этом случае используется только кэш
+
+        :param resource_dict: {'netloc': str, 'content_type': str, 'resource': Union[str, Iterator[str]], 'url': str,
+                               'depth': int, 'body_hash': str}
+        :return:
+        """
+        # Кэшируются только загруженные и производные от них ресурсы, служебные ресурсы майнеров (без url)
+        # и ресурсы, читаемые построчно по мере загрузки, - нет
+        body_hash = None
+        if 'url' in resource_dict and (resource_dict.get('body_hash') or not is_streamed(resource_dict['resource'])):
+            body_hash = resource_dict.get('body_hash') or self.get_resource_hash(resource_dict['resource'] or '')
+
+            # Если ресурс ранее был обработан в этом запуске, то пропускаем
+            if self.check_resource_parsed(body_hash):
+                return
+
+        if body_hash and self.cache:
+            result = self.cache.get_result(body_hash, self.miner_name)
+
+            if result is not None:
+                self.logger.debug(f'{self.miner_name} использует сохраненный результат для {resource_dict["url"]}')
+                self.replay_result(resource_dict, result)
+                return
+
+        if not resource_dict['resource']:
+            return
+
+        self._result = {'params': [], 'urls': [], 'resources': []}
+
+        try:
+            self.parse_resource(resource_dict)
+        finally:
+            result, self._result = self._result, None
+
+        if body_hash and self.cache and result is not None:
+            self.cache.put_result(body_hash, self.miner_name, result)
+
+    def replay_result(self, resource_dict: dict, result: Dict[str, list]):
+        """ Повторяет действия майнера по сохраненному результату обработки ресурса """
+        for param in result['params']:
+            self.add_new_param(resource_dict['netloc'], param)
+
+        for url, force_content_type in result['urls']:
+            self.add_url(resource_dict, url, force_content_type)
+
+        for content_type, resource in result['resources']:
+            self.add_resource(resource_dict, content_type, resource)
+
+    def discard_result(self):
+        """ Отменяет сохранение результата обработки текущего ресурса (например, при ошибке разбора) """
+        self._result = None
+
     def add_new_param(self, netloc: str, param_name: str):
+        if self._result is not None:
+            self._result['params'].append(param_name)
+
         # Удаляем все не ASCII символы
         param_name = re.sub('[^\x00-\x7F]+', '', param_name)
         # Удаляем unicode последовательности
@@ -32,32 +117,57 @@ class AbstractMiner:
 
         self.param_queue.put({'netloc': netloc, 'miner_name': self.miner_name, 'param_name': param_name})
 
+    def add_url(self, resource_dict: dict, url: str, force_content_type: str = None):
+        """ Добавляет в очередь на загрузку адрес, найденный в ресурсе `resource_dict`
+
+        Служебные запросы майнеров (с `force_content_type`) не увеличивают глубину
+        """
+        if self._result is not None:
+            self._result['urls'].append([url, force_content_type])
+
+        depth = resource_dict.get('depth', 0) + (0 if force_content_type else 1)
+        item = {'netloc': resource_dict['netloc'], 'url': url, 'depth': depth}
+
+        if force_content_type:
+            item['force_content_type'] = force_content_type
+
+        self.url_queue.put(item)
+
+    def add_resource(self, resource_dict: dict, content_type: str, resource: str):
+        """ Добавляет в очередь ресурс, производный от `resource_dict` (например, inline-скрипт HTML страницы) """
+        if self._result is not None:
+            self._result['resources'].append([content_type, resource])
+
+        self.resource_queue.put({'netloc': resource_dict['netloc'], 'content_type': content_type, 'resource': resource,
+                                 'url': resource_dict['url'], 'depth': resource_dict.get('depth', 0)})
+
     def is_acceptable(self, content_type: str) -> bool:
         if content_type in self.get_acceptable_content_types():
             return True
 
         return False
 
-    def check_resource_parsed(self, resource: str) -> bool:
-        """ Проверяет, обрабатывался ли ранее данный ресурс.
+    def check_resource_parsed(self, resource_hash: str) -> bool:
+        """ Проверяет, обрабатывался ли ранее ресурс с хэшем `resource_hash` в этом запуске.
 
          Если ресурс не обрабатывался ранее, то заносит его хэш во множество `self.resource_hashes`
 
-        :param resource:
+        :param resource_hash:
         :return: True, если ресурс обрабатывался, иначе False
         """
-        # Если ресурс ранее был обработан, то пропускаем
-        resource_hash = self.get_resource_hash(resource)
         if resource_hash in self.resource_hashes:
             return True
 
         # Иначе помечаем как обработанный
         self.resource_hashes.add(resource_hash)
 
+        return False
+
     def get_miner_name(self):
         return self.__class__.__name__
 
-    def get_resource_hash(self, resource: str):
+    @staticmethod
+    def get_resource_hash(resource: str):
         md5_hash = md5()
         md5_hash.update(resource.encode('utf8'))
         return md5_hash.hexdigest()
@@ -0,0 +1,140 @@
+import json
+import os
+import sqlite3
+from time import time
+from typing import Dict, Union
+
+
+class CachedUrl:
+    __slots__ = ('url', 'etag', 'last_modified', 'content_type', 'body_hash', 'validated')
+
+    def __init__(self, url: str, etag: str, last_modified: str, content_type: str, body_hash: str, validated: float):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.body_hash = body_hash
+        self.validated = validated
+
+
+class MiningCache:
+    """ Персистентный кэш майнеров между запусками
+
+    Хранит две сущности:
+      * адреса загруженных ресурсов с валидаторами `ETag`/`Last-Modified` и хэшем тела ответа;
+      * результаты обработки ресурса каждым майнером, адресуемые хэшем тела: найденные параметры, адреса и
+        производные ресурсы (inline-скрипты).
+
+    Размер кэша ограничен, при превышении удаляются давно не использованные записи (LRU)
+    """
+
+    SCHEMA = [
+        'CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_type TEXT, '
+        'body_hash TEXT, validated REAL, accessed REAL, size INTEGER)',
+        'CREATE TABLE IF NOT EXISTS results (body_hash TEXT, miner TEXT, result TEXT, accessed REAL, size INTEGER, '
+        'PRIMARY KEY (body_hash, miner))',
+        'CREATE INDEX IF NOT EXISTS urls_accessed ON urls (accessed)',
+        'CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)',
+    ]
+
+    def __init__(self, path: str, max_size: int, ttl: int):
+        """
+        :param path: Путь до файла кэша
+        :param max_size: Максимальный суммарный размер записей в байтах
+        :param ttl: Время в секундах, в течение которого ресурс считается актуальным без повторного запроса
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+
+        for statement in self.SCHEMA:
+            self.db.execute(statement)
+
+        self.size = sum(self.db.execute('SELECT COALESCE(SUM(size), 0) FROM ' + table).fetchone()[0]
+                        for table in ('urls', 'results'))
+
+        self.statistics = {'cache_fresh': 0, 'cache_not_modified': 0, 'cache_result_hits': 0, 'cache_evictions': 0}
+
+    def get_url(self, url: str) -> Union[CachedUrl, None]:
+        """ Возвращает сохраненные сведения о ресурсе по адресу `url`, если для его тела есть результаты майнеров """
+        row = self.db.execute('SELECT u.url, u.etag, u.last_modified, u.content_type, u.body_hash, u.validated '
+                              'FROM urls u WHERE u.url = ? AND EXISTS '
+                              '(SELECT 1 FROM results r WHERE r.body_hash = u.body_hash)', (url,)).fetchone()
+
+        return CachedUrl(*row) if row else None
+
+    def is_fresh(self, cached_url: CachedUrl) -> bool:
+        """ Проверяет, можно ли использовать ресурс без повторного запроса """
+        return time() - cached_url.validated < self.ttl
+
+    def put_url(self, url: str, etag: str, last_modified: str, content_type: str, body_hash: str):
+        size = len(url) + len(etag or '') + len(last_modified or '') + len(content_type) + len(body_hash)
+
+        self._replace('urls', 'url = ?', (url,), size,
+                      'INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                      (url, etag, last_modified, content_type, body_hash, time(), time(), size))
+
+    def touch_url(self, url: str, validated: bool):
+        """ Обновляет время использования (и подтверждения актуальности, если `validated`) ресурса """
+        if validated:
+            self.db.execute('UPDATE urls SET validated = ?, accessed = ? WHERE url = ?', (time(), time(), url))
+        else:
+            self.db.execute('UPDATE urls SET accessed = ? WHERE url = ?', (time(), url))
+
+    def get_result(self, body_hash: str, miner: str) -> Union[Dict[str, list], None]:
+        """ Возвращает результат обработки ресурса с хэшем `body_hash` майнером `miner` """
+        row = self.db.execute('SELECT result FROM results WHERE body_hash = ? AND miner = ?',
+                              (body_hash, miner)).fetchone()
+
+        if row is None:
+            return None
+
+        self.db.execute('UPDATE results SET accessed = ? WHERE body_hash = ? AND miner = ?', (time(), body_hash, miner))
+        self.statistics['cache_result_hits'] += 1
+
+        return json.loads(row[0])
+
+    def put_result(self, body_hash: str, miner: str, result: Dict[str, list]):
+        data = json.dumps(result)
+        size = len(body_hash) + len(miner) + len(data)
+
+        self._replace('results', 'body_hash = ? AND miner = ?', (body_hash, miner), size,
+                      'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                      (body_hash, miner, data, time(), size))
+
+    def close(self):
+        self.db.close()
+
+    def _replace(self, table: str, condition: str, key: tuple, size: int, statement: str, values: tuple):
+        """ Добавляет или заменяет запись, учитывая ее размер в общем размере кэша """
+        row = self.db.execute(f'SELECT size FROM {table} WHERE {condition}', key).fetchone()
+
+        self.db.execute(statement, values)
+        self.size += size - (row[0] if row else 0)
+
+        if self.size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        """ Удаляет давно не использованные записи, пока размер кэша не станет меньше 90% от максимального """
+        rows = self.db.execute("SELECT 'urls', rowid, size, accessed FROM urls UNION ALL "
+                               "SELECT 'results', rowid, size, accessed FROM results ORDER BY accessed").fetchall()
+
+        self.db.execute('BEGIN')
+
+        for table, rowid, size, _ in rows:
+            if self.size <= self.max_size * 0.9:
+                break
+
+            self.db.execute(f'DELETE FROM {table} WHERE rowid = ?', (rowid,))
+            self.size -= size
+            self.statistics['cache_evictions'] += 1
+
+        self.db.execute('COMMIT')
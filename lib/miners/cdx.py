@@ -0,0 +1,102 @@
+import gzip
+from typing import Iterable, Iterator, List, Tuple, Union
+from urllib.parse import urlparse, parse_qsl, ParseResult
+
+from lib.miners.frontier import BloomFilter
+
+
+def parse_cdx_line(line: str) -> Union[str, None]:
+    """ Извлекает адрес из строки CDX-индекса или списка URL-адресов
+
+    Поддерживаются ответы CDX API с `fl=original` (одна колонка), полные строки CDX
+    (`urlkey timestamp original mimetype statuscode digest length`) и списки адресов, в том числе без схемы
+
+    :param line: Строка индекса
+    :return: Адрес или None, если строка не содержит адреса (пустая строка, заголовок CDX-файла)
+    """
+    fields = line.split()
+
+    if not fields or fields[0] == 'CDX':
+        return None
+
+    if len(fields) == 1:
+        url = fields[0]
+    # В полной строке CDX исходный адрес находится в третьей колонке, а первая - SURT-ключ вида com,example)/path
+    elif len(fields) > 2 and '://' in fields[2]:
+        url = fields[2]
+    else:
+        url = next((field for field in fields if '://' in field), None)
+
+        if url is None:
+            return None
+
+    if '://' not in url:
+        url = 'http://' + url
+
+    return url
+
+
+def iter_file_lines(path: str) -> Iterator[str]:
+    """ Построчно читает локальный CDX-индекс или список адресов, в том числе сжатый gzip """
+    opener = gzip.open if path.endswith('.gz') else open
+
+    with opener(path, 'rt', encoding='utf8', errors='replace') as file:
+        yield from file
+
+
+def iter_text_lines(text: str) -> Iterator[str]:
+    """ Построчно обходит текст без создания списка всех строк """
+    start = 0
+
+    while start < len(text):
+        end = text.find('\n', start)
+
+        if end == -1:
+            end = len(text)
+
+        yield text[start:end]
+        start = end + 1
+
+
+class CdxDeduplicator:
+    """ Отсеивает адреса индекса, совпадающие с ранее встреченными по хосту, пути и набору названий параметров
+
+    Архивные индексы содержат тысячи адресов, отличающихся только значениями параметров (`/item?id=1`, `/item?id=2`),
+    поэтому для поиска параметров и загрузки достаточно одного адреса из каждой группы
+    """
+
+    def __init__(self, use_bloom_filter: bool = False, bloom_capacity: int = 1000000):
+        self.seen = BloomFilter(bloom_capacity) if use_bloom_filter else set()
+        self.statistics = {'cdx_lines': 0, 'cdx_unique': 0, 'cdx_duplicates': 0, 'cdx_invalid': 0}
+
+    def filter(self, lines: Iterable[str]) -> Iterator[Tuple[str, ParseResult, List[str]]]:
+        """ Лениво обходит строки индекса, возвращая только уникальные адреса
+
+        :param lines: Строки CDX-индекса или списка адресов
+        :return: Итератор по кортежам `(url, url_obj, params)`
+        """
+        for line in lines:
+            self.statistics['cdx_lines'] += 1
+            url = parse_cdx_line(line)
+
+            try:
+                url_obj = urlparse(url) if url else None
+                hostname = url_obj.hostname if url_obj else None
+            except ValueError:
+                hostname = None
+
+            if not hostname:
+                self.statistics['cdx_invalid'] += 1
+                continue
+
+            params = list(dict.fromkeys(key for key, _ in parse_qsl(url_obj.query, keep_blank_values=True) if key))
+            key = '\n'.join([hostname, url_obj.path or '/'] + sorted(params))
+
+            if key in self.seen:
+                self.statistics['cdx_duplicates'] += 1
+                continue
+
+            self.seen.add(key)
+            self.statistics['cdx_unique'] += 1
+
+            yield url, url_obj, params
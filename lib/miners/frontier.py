@@ -0,0 +1,137 @@
+import math
+import re
+from collections import defaultdict
+from hashlib import md5
+from itertools import count
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+import requests
+from gevent.queue import PriorityQueue
+
+# Приоритеты загрузки (меньше - раньше)
+PRIORITY_SCRIPT = 0  # Скрипты с того же хоста
+PRIORITY_JSON = 1  # JSON-ресурсы, API и служебные запросы майнеров
+PRIORITY_SAME_ORIGIN = 2  # Прочие ресурсы с того же хоста
+PRIORITY_CROSS_ORIGIN = 3  # Ресурсы сторонних хостов
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class BloomFilter:
+    """ Вероятностное множество фиксированного размера для дедупликации большого числа адресов """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        # Оптимальные размер битового массива и число хэш-функций
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _get_positions(self, item: str):
+        digest = md5(item.encode('utf8')).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str):
+        for position in self._get_positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._get_positions(item))
+
+
+class UrlFrontier:
+    """ Очередь адресов на загрузку с дедупликацией, бюджетом загрузок на хост и ограничением глубины
+
+    Совместима по интерфейсу с `gevent.queue.Queue` (методы `put`, `get`, `qsize`) и принимает словари вида
+    `{'netloc': str, 'url': Union[str, requests.PreparedRequest], 'force_content_type': str, 'depth': int}`
+    """
+
+    def __init__(self, host_budget: int = 0, max_depth: int = None, use_bloom_filter: bool = False,
+                 bloom_capacity: int = 1000000):
+        self.host_budget = host_budget
+        self.max_depth = max_depth
+
+        self.seen = BloomFilter(bloom_capacity) if use_bloom_filter else set()
+        self.host_downloads = defaultdict(int)
+        self.statistics = {'queued': 0, 'duplicates': 0, 'over_budget': 0, 'too_deep': 0}
+
+        self._queue = PriorityQueue()
+        self._counter = count()
+
+    def put(self, item: dict) -> bool:
+        """ Добавляет адрес в очередь, если он не загружался ранее и укладывается в ограничения
+
+        :return: True, если адрес добавлен в очередь, иначе False
+        """
+        url = item['url'].url if isinstance(item['url'], requests.PreparedRequest) else item['url']
+        depth = item.get('depth', 0)
+
+        if self.max_depth is not None and depth > self.max_depth:
+            self.statistics['too_deep'] += 1
+            return False
+
+        normalized_url = self.normalize_url(url)
+        if normalized_url in self.seen:
+            self.statistics['duplicates'] += 1
+            return False
+
+        host = urlparse(normalized_url).netloc
+        # Служебные запросы майнеров (например, к CDX API) не расходуют бюджет хоста
+        if self.host_budget and not item.get('force_content_type'):
+            if self.host_downloads[host] >= self.host_budget:
+                self.statistics['over_budget'] += 1
+                return False
+
+            self.host_downloads[host] += 1
+
+        self.seen.add(normalized_url)
+        self.statistics['queued'] += 1
+
+        priority = self.get_priority(item['netloc'], url, item.get('force_content_type'))
+        self._queue.put((priority, depth, next(self._counter), item))
+
+        return True
+
+    def get(self, block: bool = True, timeout: float = None) -> dict:
+        return self._queue.get(block, timeout)[-1]
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    @staticmethod
+    def get_priority(netloc: str, url: str, force_content_type: str = None) -> int:
+        """ Возвращает приоритет загрузки адреса `url`, найденного для хоста `netloc` """
+        if force_content_type:
+            return PRIORITY_JSON
+
+        url_obj = urlparse(url)
+
+        if url_obj.netloc and url_obj.netloc != netloc:
+            return PRIORITY_CROSS_ORIGIN
+
+        path = url_obj.path.lower()
+
+        if re.search(r'\.m?js$', path):
+            return PRIORITY_SCRIPT
+
+        if path.endswith('.json') or re.search(r'/(api|graphql|rest)(/|$)', path):
+            return PRIORITY_JSON
+
+        return PRIORITY_SAME_ORIGIN
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """ Приводит адрес к каноническому виду: схема и хост в нижнем регистре, без порта по умолчанию и
+        фрагмента, с отсортированными параметрами запроса
+        """
+        url_obj = urlparse(url.strip())
+        scheme = url_obj.scheme.lower()
+        netloc = url_obj.netloc.lower()
+
+        if url_obj.port and DEFAULT_PORTS.get(scheme) == url_obj.port:
+            netloc = netloc.rsplit(':', 1)[0]
+
+        query = urlencode(sorted(parse_qsl(url_obj.query, keep_blank_values=True)))
+
+        return urlunparse([scheme, netloc, url_obj.path or '/', url_obj.params, query, ''])
@@ -1,10 +1,8 @@
 from urllib.parse import urlparse, urlunparse
 
-import bs4
-from gevent.queue import Queue
-
 from lib.miners.abstract import AbstractMiner
-from lib.utils.logger import Logger
+from lib.utils.cpu_executor import cpu_executor
+from lib.utils.html_parser import parse_html
 
 
 class HTMLMiner(AbstractMiner):
@@ -15,31 +13,21 @@ class HTMLMiner(AbstractMiner):
         return {'text/html'}
 
     def parse_resource(self, resource_dict: dict):
-        params = set()
-
-        # Если ресурс ранее был обработан, то пропускаем
-        if self.check_resource_parsed(resource_dict['resource']):
+        try:
+            params, scripts = cpu_executor.submit(parse_html, resource_dict['resource'])
+        except Exception as e:
+            self.logger.error(f'HTMLMiner\'у не удалось обработать ресурс {resource_dict["url"]}: {e}')
+            self.discard_result()
             return
 
-        html = bs4.BeautifulSoup(resource_dict['resource'], features='lxml')
-
-        # Собираем все значения аттрибутов name в HTML
-        for tag in html.find_all(attrs={'name': True}):
-            params.add(tag.attrs.get('name'))
-
-        params = list(params)
         self.logger.debug(f'Новые параметры: {params}')
 
         # Добавляем найденные параметры в очередь `self.param_queue`
         for param in params:
             self.add_new_param(resource_dict['netloc'], param)
 
-        scripts = html.find_all('script')
-
         # Разбиваем скрипты на src и inline
-        for script in scripts:
-            src = script.attrs.get('src')
-
+        for src, script in scripts:
             # Если указан адрес скрипта
             if src:
                 # То приводим его к общему виду
@@ -51,9 +39,7 @@ class HTMLMiner(AbstractMiner):
                      src.fragment])
 
                 # И добавляем в очередь `self.url_queue` на загрузку
-                self.url_queue.put({'netloc': resource_dict['netloc'], 'url': src_path})
+                self.add_url(resource_dict, src_path)
             # Иначе добавляем в очередь ресурсов `self.resource_queue`
-            else:
-                self.resource_queue.put(
-                    {'netloc': resource_dict['netloc'], 'content_type': 'application/javascript', 'resource': script.string,
-                     'url': resource_dict['url']})
\ No newline at end of file
+            elif script:
+                self.add_resource(resource_dict, 'application/javascript', script)
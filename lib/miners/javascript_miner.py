@@ -1,9 +1,11 @@
+from typing import List
+
 import gevent
-from esprima import esprima
-from gevent.queue import Queue
 
+from lib.constants import JavascriptParsers
 from lib.miners.abstract import AbstractMiner
-from lib.utils.logger import Logger
+from lib.utils.cpu_executor import cpu_executor, CPUJobTooLargeError, CPUJobTimeoutError
+from lib.utils.js_lexer import get_identifiers_fast, get_identifiers_precise, split_script
 
 
 class JavascriptMiner(AbstractMiner):
@@ -14,24 +16,53 @@ class JavascriptMiner(AbstractMiner):
         return {'application/javascript'}
 
     def parse_resource(self, resource_dict: dict):
-        params = set()
-        # Если ресурс ранее был обработан, то пропускаем
-        if self.check_resource_parsed(resource_dict['resource']):
-            return
-
         try:
-            tokens = esprima.tokenize(resource_dict['resource'])
-        except:
-            self.logger.error('Не удалось распарсить JS-скрипт по адресу ' + resource_dict['url'])
+            if self.args.js_parser == JavascriptParsers.ESPRIMA:
+                params = self.get_params_precise(resource_dict['resource'], resource_dict['url'])
+            else:
+                params = self.get_params_fast(resource_dict['resource'])
+        except Exception as e:
+            self.logger.error(f'Не удалось распарсить JS-скрипт по адресу {resource_dict["url"]}: {e}')
+            self.discard_result()
             return
 
-        for token in tokens:
-            if token.type == 'Identifier':
-                params.add(token.value)
-
-        params = list(params)
         self.logger.debug(f'Новые параметры: {params}')
 
         # Добавляем найденные параметры в очередь `self.param_queue`
         for param in params:
             self.add_new_param(resource_dict['netloc'], param)
+
+    def get_params_fast(self, script: str) -> List[str]:
+        """ Извлекает кандидатов в параметры линейным лексером
+
+        Большие скрипты разбиваются на части, которые разбираются параллельно в пуле процессов
+
+        :param script: Исходный код скрипта
+        :return: Список уникальных кандидатов
+        """
+        cpu_executor.check_job_size(script)
+        chunks = split_script(script, self.args.js_chunk_size)
+
+        if len(chunks) == 1:
+            return cpu_executor.submit(get_identifiers_fast, script)
+
+        jobs = [gevent.spawn(cpu_executor.submit, get_identifiers_fast, chunk) for chunk in chunks]
+        gevent.joinall(jobs, raise_error=True)
+
+        return list(set().union(*[job.value for job in jobs]))
+
+    def get_params_precise(self, script: str, url: str) -> List[str]:
+        """ Извлекает идентификаторы токенизатором esprima, при ошибке разбора использует линейный лексер
+
+        :param script: Исходный код скрипта
+        :param url: Адрес скрипта для журналирования
+        :return: Список уникальных идентификаторов
+        """
+        try:
+            return cpu_executor.submit(get_identifiers_precise, script)
+        except (CPUJobTooLargeError, CPUJobTimeoutError):
+            raise
+        except Exception as e:
+            self.logger.debug(f'esprima не удалось разобрать скрипт {url} ({e}), используется линейный лексер')
+
+        return self.get_params_fast(script)
@@ -1,6 +1,36 @@
-import json
+from itertools import chain
+from typing import Iterator, Union
 
-from lib.miners.abstract import AbstractMiner
+import gevent
+
+from lib.constants import JSON_CHUNK_SIZE
+from lib.miners.abstract import AbstractMiner, is_streamed
+from lib.utils.json_lexer import iter_json_keys, looks_like_json
+
+JSON_CONTENT_TYPES = {'application/json', 'text/json', 'application/x-ndjson', 'application/ndjson', 'application/jsonl',
+                      'application/x-jsonlines', 'application/json-seq'}
+
+
+def is_json_content_type(content_type: str) -> bool:
+    # Структурированные типы вида application/vnd.api+json, application/ld+json
+    return content_type in JSON_CONTENT_TYPES or content_type.endswith('+json')
+
+
+def iter_chunks(resource: Union[str, Iterator[str]]) -> Iterator[str]:
+    """ Возвращает части документа, уступая управление другим гринлетам перед разбором каждой следующей части
+
+    Документ, загруженный целиком, разбивается на части размером `JSON_CHUNK_SIZE`
+    """
+    if is_streamed(resource):
+        chunks = resource
+    else:
+        chunks = (resource[i:i + JSON_CHUNK_SIZE] for i in range(0, len(resource), JSON_CHUNK_SIZE))
+
+    for i, chunk in enumerate(chunks):
+        if i:
+            gevent.sleep(0)
+
+        yield chunk
 
 
 class JSONMiner(AbstractMiner):
@@ -8,35 +38,35 @@ class JSONMiner(AbstractMiner):
         super().__init__(*args, **kwargs)
 
     def get_acceptable_content_types(self):
-        return {'application/json'}
+        return JSON_CONTENT_TYPES
+
+    def is_acceptable(self, content_type: str) -> bool:
+        return is_json_content_type(content_type)
 
     def parse_resource(self, resource_dict: dict):
-        # Если ресурс ранее был обработан, то пропускаем
-        if self.check_resource_parsed(resource_dict['resource']):
+        # Документ разбирается по частям, без построения дерева и без передачи в пул процессов,
+        # поэтому размер документа не ограничен
+        chunks = iter_chunks(resource_dict['resource'])
+        first_chunk = next(chunks, '')
+
+        # Тип контента не гарантирует формат (например, HTML страница ошибки с типом application/json)
+        if not looks_like_json(first_chunk):
+            self.logger.debug(f'Ресурс {resource_dict["url"]} не является JSON-документом')
             return
 
+        params = set()
+
         try:
-            resource = json.loads(resource_dict['resource'])
+            for key in iter_json_keys(chain([first_chunk], chunks)):
+                if key in params:
+                    continue
+
+                # Добавляем найденные параметры в очередь `self.param_queue`
+                params.add(key)
+                self.add_new_param(resource_dict['netloc'], key)
         except Exception as e:
-            self.logger.error(f'JSONMiner\'у не удалось обработать ресурс: {e}')
+            self.logger.error(f'JSONMiner\'у не удалось обработать ресурс {resource_dict["url"]}: {e}')
+            self.discard_result()
             return
 
-        params = list(self.get_keys(resource))
         self.logger.debug(f'Новые параметры: {params}')
-
-        # Добавляем найденные параметры в очередь `self.param_queue`
-        for param in params:
-            self.add_new_param(resource_dict['netloc'], param)
-
-    def get_keys(self, item: object) -> set:
-        keys = set()
-
-        if isinstance(item, dict):
-            for key, value in item.items():
-                keys.add(key)
-                keys |= self.get_keys(value)
-        elif isinstance(item, list):
-            for value in item:
-                keys |= self.get_keys(value)
-
-        return keys
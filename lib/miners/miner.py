@@ -1,31 +1,56 @@
+import io
 import random
 import re
+import tempfile
 from collections import defaultdict
-from typing import List, Tuple, Union, Dict
+from hashlib import md5
+from typing import IO, Callable, List, Tuple, Union, Dict
 from urllib.parse import urlparse
 
 import gevent
 import requests
+from gevent.lock import BoundedSemaphore
 from gevent.queue import Queue
+from requests.adapters import HTTPAdapter
 
+from lib.miners.abstract import AbstractMiner
+from lib.miners.cache import MiningCache
+from lib.miners.frontier import UrlFrontier
 from lib.miners.html_miner import HTMLMiner
 from lib.miners.javascript_miner import JavascriptMiner
-from lib.miners.json_miner import JSONMiner
+from lib.miners.json_miner import JSONMiner, is_json_content_type
+from lib.miners.scoring import ParamScorer
 from lib.miners.webarchive_miner import WebArchiveMiner
 from lib.utils.logger import Logger
+from lib.utils.metrics import metrics
 from lib.utils.request_helper import RequestInfo
 from lib.workers.abstract import AbstractWorker
-from lib.constants import USER_AGENTS
+from lib.constants import JSON_CHUNK_SIZE, MAX_HOST_POOLS, STREAM_CHUNK_SIZE, USER_AGENTS
+
+# Ресурсы, передаваемые майнерам построчно, без чтения ответа в память целиком и без кэширования
+STREAMED_CONTENT_TYPES = {'webarchive/result'}
 
 
 class DownloadWorker(AbstractWorker):
-    def __init__(self, url_queue: Queue, resource_queue: Queue, proxies: dict, logger: Logger):
+    def __init__(self, url_queue: UrlFrontier, resource_queue: Queue, session: requests.Session,
+                 host_semaphores: Dict[str, BoundedSemaphore], statistics: Dict[str, int], timeout: int,
+                 logger: Logger, cache: MiningCache = None, resource_slots: BoundedSemaphore = None):
         super().__init__()
 
         self.url_queue = url_queue
         self.resource_queue = resource_queue
         self.logger = logger
-        self.proxies = proxies
+        # Общая для всех загрузчиков сессия с пулом keep-alive соединений
+        self.session = session
+        # Ограничение числа одновременных загрузок с одного хоста
+        self.host_semaphores = host_semaphores
+        self.statistics = statistics
+        self.timeout = timeout
+        # Кэш ресурсов, загруженных в предыдущих запусках
+        self.cache = cache
+        # Ограничение числа загруженных, но еще не обработанных ресурсов: загрузчики ждут, пока майнеры не освободят
+        # слот, чтобы не накапливать ресурсы в памяти, когда загрузка опережает разбор
+        self.resource_slots = resource_slots
 
     def run(self):
         # Переключения контекста для запуска других воркеров
@@ -38,6 +63,7 @@ class DownloadWorker(AbstractWorker):
             try:
                 d = self.url_queue.get(timeout=1)
                 netloc, url, force_content_type = d['netloc'], d['url'], d.get('force_content_type')
+                depth = d.get('depth', 0)
                 self._running = True
             except gevent.queue.Empty:
                 self._running = False
@@ -47,16 +73,23 @@ class DownloadWorker(AbstractWorker):
                 continue
 
             try:
-                content_type, resource = self.download(url, force_content_type)
+                content_type, resource, body_hash = self.download(url, force_content_type)
                 self.logger.debug(f'Загружен ресурс {url} типа {content_type}')
             except Exception as e:
-                self.logger.error(f'Не удалось загрузить ресурс {url} типа {content_type}: {e}')
+                self.logger.error(f'Не удалось загрузить ресурс {url}: {e}')
                 continue
 
-            if not content_type or not resource:
+            if not content_type or not (resource or body_hash):
                 continue
 
-            self.resource_queue.put({'netloc': netloc, 'content_type': content_type, 'resource': resource, 'url': url})
+            if self.resource_slots:
+                if self.resource_slots.locked():
+                    self.statistics['backpressure_waits'] += 1
+
+                self.resource_slots.acquire()
+
+            self.resource_queue.put({'netloc': netloc, 'content_type': content_type, 'resource': resource, 'url': url,
+                                     'depth': depth, 'body_hash': body_hash, 'downloaded': True})
 
         self._running = False
         self._stopped = True
@@ -74,137 +107,436 @@ class DownloadWorker(AbstractWorker):
 
         return True
 
-    def download(self, url: Union[str, requests.PreparedRequest], force_content_type: str = None) -> Tuple[str, str]:
+    def download(self, url: Union[str, requests.PreparedRequest],
+                 force_content_type: str = None) -> Tuple[str, Union[str, None], Union[str, None]]:
         """ Загружает ресурс согласно заданному аргументу `url`
 
         В случае, если url - это объект класса requests.PreparedRequest, он отправляется как есть, иначе используются
-        дефолтные настройки, выданные сессии методом `self.get_session`
+        дефолтные настройки, выданные сессии методом `self.get_session`.
+
+        Если ресурс по адресу `url` сохранен в кэше, то он не загружается повторно, пока не истек срок его
+        актуальности, а после - запрашивается условным запросом. Для неизмененного ресурса возвращается только хэш
+        его тела, по которому майнеры берут сохраненные результаты обработки.
+
+        Тело ресурсов типов из `STREAMED_CONTENT_TYPES` и JSON-документов не читается в память целиком: оно
+        записывается во временный файл, а майнеру передается итератор по строкам (по частям для JSON) этого файла
 
         :param url: URL-адрес или объект класса requests.PreparedRequest
         :param force_content_type: Перезаписывает `content_type`
-        :return: Кортеж `(content_type, resource)`
+        :return: Кортеж `(content_type, resource, body_hash)`
         """
-        session = self.get_session()
+        cached_url = None
 
         if isinstance(url, requests.PreparedRequest):
-            response = session.send(url, allow_redirects=True)
+            with self.host_semaphores[urlparse(url.url).netloc]:
+                response = self.session.send(url, allow_redirects=True, timeout=self.timeout)
+                resource = response.text
         elif isinstance(url, str):
             if self.is_url_blacklisted(url):
-                return '', ''
+                return '', None, None
+
+            if force_content_type in STREAMED_CONTENT_TYPES:
+                with self.host_semaphores[urlparse(url).netloc]:
+                    response = self.session.get(url, allow_redirects=True, timeout=self.timeout, stream=True)
+                    file, _ = self.spool_response(response)
+
+                return force_content_type, self.iter_spooled_text(file, response.encoding, lines=True), None
+
+            headers = {}
+            cached_url = self.cache.get_url(url) if self.cache else None
+
+            if cached_url:
+                if self.cache.is_fresh(cached_url):
+                    self.cache.touch_url(url, validated=False)
+                    self.cache.statistics['cache_fresh'] += 1
+                    return cached_url.content_type, None, cached_url.body_hash
+
+                if cached_url.etag:
+                    headers['If-None-Match'] = cached_url.etag
+                if cached_url.last_modified:
+                    headers['If-Modified-Since'] = cached_url.last_modified
+
+            with self.host_semaphores[urlparse(url).netloc]:
+                response = self.session.get(url, headers=headers, allow_redirects=True, timeout=self.timeout,
+                                            stream=True)
+                content_type = self.get_content_type(response, force_content_type)
+
+                if response.status_code != 304 and is_json_content_type(content_type):
+                    file, body_hash = self.spool_response(response)
+                    self.put_cached_url(url, response, content_type, body_hash)
+
+                    return content_type, self.iter_spooled_text(file, response.encoding), body_hash
 
-            response = session.get(url, allow_redirects=True)
+                resource = response.text
         else:
             raise TypeError(f'Тип аргумента url "{type(url)}" не соответствует Union[str, requests.PreparedRequest]')
 
+        self.update_statistics(response)
+
+        if cached_url and response.status_code == 304:
+            self.cache.touch_url(url, validated=True)
+            self.cache.statistics['cache_not_modified'] += 1
+            return cached_url.content_type, None, cached_url.body_hash
+
+        content_type = self.get_content_type(response, force_content_type)
+        body_hash = AbstractMiner.get_resource_hash(resource)
+
+        if isinstance(url, str):
+            self.put_cached_url(url, response, content_type, body_hash)
+
+        return content_type, resource, body_hash
+
+    def put_cached_url(self, url: str, response: requests.Response, content_type: str, body_hash: str):
+        """ Сохраняет в кэш сведения об успешно загруженном ресурсе для условных запросов в следующих запусках """
+        if self.cache and response.status_code == 200:
+            self.cache.put_url(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), content_type,
+                               body_hash)
+
+    def spool_response(self, response: requests.Response) -> Tuple[IO[bytes], str]:
+        """ Записывает тело ответа, загруженного в потоковом режиме, во временный файл и закрывает ответ
+
+        Вызывается внутри семафора хоста: соединение освобождается до того, как майнер начнет обработку ресурса
+
+        :return: Кортеж `(file, body_hash)` - временный файл с телом ответа и md5 хэш тела
+        """
+        file = tempfile.TemporaryFile()
+        body_hash = md5()
+
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                file.write(chunk)
+                body_hash.update(chunk)
+
+            self.update_statistics(response, file.tell())
+        except Exception:
+            file.close()
+            raise
+        finally:
+            response.close()
+
+        file.seek(0)
+
+        return file, body_hash.hexdigest()
+
+    @staticmethod
+    def iter_spooled_text(file: IO[bytes], encoding: str = None, lines: bool = False):
+        """ Читает текст временного файла построчно либо частями по `JSON_CHUNK_SIZE` символов и закрывает файл """
+        text = io.TextIOWrapper(file, encoding=encoding or 'utf8', errors='replace')
+
+        try:
+            if lines:
+                yield from text
+            else:
+                yield from iter(lambda: text.read(JSON_CHUNK_SIZE), '')
+        finally:
+            text.close()
+
+    @staticmethod
+    def get_content_type(response: requests.Response, force_content_type: str = None) -> str:
+        """ Возвращает тип контента ответа без параметров, либо `force_content_type`, если он задан """
         if force_content_type:
-            content_type = force_content_type
-        else:
-            content_type = re.search('[^\s/]+/[^\s;]+', response.headers.get('Content-Type', ''))
-            content_type = content_type.group(0) if content_type else 'unknown'
+            return force_content_type
 
-        return content_type, response.text
+        content_type = re.search('[^\s/]+/[^\s;]+', response.headers.get('Content-Type', ''))
+        return content_type.group(0) if content_type else 'unknown'
+
+    def update_statistics(self, response: requests.Response, body_length: int = None):
+        """ Учитывает объем загруженных данных и экономию за счет сжатия ответа
+
+        :param response:
+        :param body_length: Размер распакованного тела ответа, если оно было прочитано потоково
+        """
+        wire_bytes = response.raw.tell()
 
-    def get_session(self) -> requests.Session:
-        """ Создает сессионный объект с предустановленными настройками
+        if body_length is None:
+            body_length = len(response.content)
 
+        self.statistics['downloads'] += 1
+        self.statistics['bytes_received'] += wire_bytes
+        self.statistics['bytes_saved'] += max(body_length - wire_bytes, 0)
+
+        host = urlparse(response.url).netloc
+        metrics.inc('mining_responses', host=host, status=response.status_code)
+        metrics.inc('mining_response_bytes', wire_bytes, host=host)
+        metrics.observe('mining_download_duration_seconds', response.elapsed.total_seconds(), host=host)
+
+    @staticmethod
+    def get_session(proxies: dict, host_connections: int) -> requests.Session:
+        """ Создает сессионный объект с предустановленными настройками и пулом keep-alive соединений
+
+        :param proxies: Прокси для запросов
+        :param host_connections: Максимальное число сохраняемых соединений с одним хостом
         :return:
         """
         session = requests.Session()
 
         session.verify = False
-        session.proxies = self.proxies
+        session.proxies = proxies
         session.headers.update({'User-Agent': random.choice(USER_AGENTS),
                                 'Accept': '*/*',
                                 'Accept-Language': 'en-US;q=0.5,en;q=0.3',
                                 'Accept-Encoding': 'gzip, deflate',
                                 'Cache-Control': 'no-cache',
-                                'Connection': 'close'})
+                                'Connection': 'keep-alive'})
+
+        # pool_connections - число хранимых пулов (по одному на хост), pool_maxsize - соединений в пуле хоста
+        adapter = HTTPAdapter(pool_connections=MAX_HOST_POOLS, pool_maxsize=host_connections)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
 
         return session
 
+    @staticmethod
+    def get_handshakes_saved(session: requests.Session) -> int:
+        """ Возвращает число запросов, выполненных через ранее установленные соединения """
+        saved = 0
+
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+
+            for key in pools.keys():
+                pool = pools[key]
+                saved += max(pool.num_requests - pool.num_connections, 0)
+
+        return saved
+
+
+class ParseWorker(AbstractWorker):
+    def __init__(self, resource_queue: Queue, miners: List[AbstractMiner], resource_slots: BoundedSemaphore,
+                 on_parsed: Callable[[], None], logger: Logger):
+        super().__init__()
+
+        self.resource_queue = resource_queue
+        self.miners = miners
+        self.resource_slots = resource_slots
+        # Вызывается после обработки каждого ресурса
+        self.on_parsed = on_parsed
+        self.logger = logger
+
+    def run(self):
+        # Переключения контекста для запуска других воркеров
+        gevent.sleep(0)
+
+        self._running = True
+        self._stopped = False
+
+        while not self._finish:
+            # Пытаемся получить ресурс и его тип из очереди
+            try:
+                resource_dict = self.resource_queue.get(timeout=1)
+                self._running = True
+            except gevent.queue.Empty:
+                self._running = False
+                continue
+
+            try:
+                self.parse(resource_dict)
+            except Exception as e:
+                self.logger.error(f'Не удалось обработать ресурс {resource_dict.get("url", "")}: {e}')
+            finally:
+                # Освобождаем слот загруженного ресурса
+                if resource_dict.get('downloaded'):
+                    self.resource_slots.release()
+
+            # Передаем найденные параметры, не дожидаясь окончания поиска
+            self.on_parsed()
+
+        self._running = False
+        self._stopped = True
+
+    def parse(self, resource_dict: dict):
+        """ Предлагает каждому зарегистрированному майнеру обработать ресурс """
+        self.logger.debug('Получен новый ресурс типа ' + resource_dict['content_type'])
+
+        is_resource_accepted = False
+
+        for miner in self.miners:
+            if miner.is_acceptable(resource_dict['content_type']):
+                self.logger.debug(f'Майнер {miner.miner_name} принял ресурс')
+
+                is_resource_accepted = True
+                miner.process_resource(resource_dict)
+
+        if not is_resource_accepted:
+            self.logger.debug('Ресурс типа {} не обработан'.format(resource_dict['content_type']))
+
 
 class Miner:
-    def __init__(self, args, info_list: List[RequestInfo], logger: Logger):
+    def __init__(self, args, info_list: List[RequestInfo], logger: Logger,
+                 params_callback: Callable[[str, List[str], List[str]], None] = None):
         self.args = args
         self.info_list = info_list
         self.logger = logger
+        # Вызывается с новыми параметрами хоста по мере их нахождения: params_callback(netloc, params, dropped),
+        # где dropped - параметры, отброшенные при ранжировании
+        self.params_callback = params_callback
+
+        self.scorer = ParamScorer(args.mined_params_limit)
+        # Найденные параметры, прошедшие ранжирование
+        self.params = defaultdict(set)
+        # Все найденные параметры
+        self.mined_params = defaultdict(set)
+        self.miner_statistics = defaultdict(int)
 
         self.miners = []
+        self.cache: MiningCache = None
 
-        # {'netloc': str, 'url': Union[str, requests.PreparedRequest], 'force_content_type': str}
-        self.url_queue: Queue = None
-        # {'netloc': str, 'content_type': str, 'resource': str, 'url': str}
+        # {'netloc': str, 'url': Union[str, requests.PreparedRequest], 'force_content_type': str, 'depth': int}
+        self.url_queue: UrlFrontier = None
+        # {'netloc': str, 'content_type': str, 'resource': str, 'url': str, 'depth': int, 'body_hash': str}
         self.resource_queue: Queue = None
         # {'netloc': str, 'miner_name': str, 'param_name': str}
         self.param_queue: Queue = None
 
+        self.session: requests.Session = None
+        self.download_statistics = defaultdict(int)
+        self.workers: List[AbstractWorker] = []
+        self.worker_greenlets: List[gevent.Greenlet] = []
+        self.wait_greenlet: gevent.Greenlet = None
+        # Домены и хосты добавленных запросов
+        self.domains = set()
+        self.netlocs: List[str] = []
+        self.closed = False
+
     def run(self) -> Tuple[Dict[str, set], Dict[str, int]]:
-        """ Запускает майнеры параметров
+        """ Запускает майнеры параметров для всех запросов из `self.info_list`
 
         :return: Кортеж `(params, miner_statistics)`, где `params` - словарь параметров по каждому `netloc`,
                  `miner_statistict` - словарь со статистикой по числу найденных параметров майнерами
         """
+        self.start()
+
+        for info in self.info_list:
+            self.add_info(info)
+
+        self.close()
+
+        return self.join()
+
+    def start(self):
+        """ Запускает загрузчики и обработчики ресурсов, после чего запросы передаются в работающие майнеры
+        методом `add_info` по мере получения эталонных ответов
+        """
         self.setup_queues()
+        self.setup_cache()
         self.setup_miners()
 
         self.logger.info('Поиск параметров для заданных запросов модулями: {}'.format(
             ', '.join([m.miner_name for m in self.miners])))
 
         # Запуск загрузчиков ресурсов
-        loaders = [DownloadWorker(self.url_queue, self.resource_queue, self.args.proxy, self.logger) for _ in
-                   range(self.args.threads)]
-        jobs = [gevent.spawn(loader.run) for loader in loaders]
+        host_connections = self.args.mining_host_connections
+        self.session = DownloadWorker.get_session(self.args.proxy, host_connections)
+        host_semaphores = defaultdict(lambda: BoundedSemaphore(host_connections))
+
+        # Число загруженных ресурсов, ожидающих разбора
+        resource_slots = BoundedSemaphore(self.args.resource_queue_size)
+
+        loaders = [DownloadWorker(self.url_queue, self.resource_queue, self.session, host_semaphores,
+                                  self.download_statistics, self.args.timeout, self.logger, self.cache, resource_slots)
+                   for _ in range(self.args.threads)]
+        # Разбор ресурсов: CPU-ёмкие задачи майнеров выполняются в пуле процессов `cpu_executor`,
+        # поэтому несколько воркеров загружают все процессы пула
+        parsers = [ParseWorker(self.resource_queue, self.miners, resource_slots, self.collect_params, self.logger)
+                   for _ in range(self.args.parse_workers)]
+        self.workers = loaders + parsers
+        self.worker_greenlets = [gevent.spawn(worker.run) for worker in self.workers]
+        self.wait_greenlet = gevent.spawn(self.wait)
+
+    def add_info(self, info: RequestInfo):
+        """ Добавляет запрос с полученным эталонным ответом в поиск: его страница и архивные адреса хоста
+        загружаются сразу, не дожидаясь эталонных ответов остальных запросов
+        """
+        domain = re.sub(':\d+$', '', info.netloc)
+
+        # Добавляется ресурс специально для WebArchiveMiner
+        if domain not in self.domains:
+            self.domains.add(domain)
+            self.resource_queue.put({'netloc': info.netloc, 'content_type': 'webarchive/download', 'resource': domain,
+                                     'depth': 0})
+
+        self.netlocs.append(info.netloc)
+        self.url_queue.put({'netloc': info.netloc, 'url': info.origin_url, 'depth': 0})
+
+    def close(self):
+        """ Сообщает, что новых запросов не будет """
+        # Локальные CDX-индексы и списки адресов обрабатываются WebArchiveMiner для всех целей сразу,
+        # поэтому передаются после получения всех запросов
+        if self.args.cdx_files and self.netlocs:
+            targets = defaultdict(list)
+            for netloc in set(self.netlocs):
+                targets[urlparse('//' + netloc).hostname].append(netloc)
+
+            for path in re.split('\s*,\s*', self.args.cdx_files):
+                self.resource_queue.put({'netloc': self.netlocs[0], 'content_type': 'webarchive/file',
+                                         'resource': path, 'targets': dict(targets), 'depth': 0})
+
+        self.closed = True
+
+    def wait(self):
+        """ Дожидается, пока после вызова `close` очереди не опустеют и ни один воркер не будет занят """
+        with metrics.phase('mining'):
+            while not self.closed or self.resource_queue.qsize() or self.url_queue.qsize() \
+                    or any(w.is_running() for w in self.workers):
+                gevent.sleep(0.1)
+
+    def join(self) -> Tuple[Dict[str, set], Dict[str, int]]:
+        """ Дожидается окончания работы майнеров после вызова `close`
+
+        :return: Кортеж `(params, miner_statistics)`, как у метода `run`
+        """
+        self.wait_greenlet.get()
 
-        while True:
-            # Пытаемся получить ресурс и его тип из очереди
-            try:
-                resource_dict = self.resource_queue.get(timeout=1)
-            # Если очередь пуста
-            except gevent.queue.Empty:
-                # И если загрузчики не работают и очередь url-адресов пуста
-                if all([loader.is_running() == False for loader in loaders]) and not self.url_queue.qsize():
-                    # То выключаем очередь
-                    break
-                # Иначе ждём ресурсы от загрузчиков
-                continue
+        # Завершаем загрузчики и обработчики
+        for worker in self.workers:
+            worker.finish()
 
-            self.logger.debug('Получен новый ресурс типа ' + resource_dict['content_type'])
+        # Ждем завершения
+        gevent.joinall(self.worker_greenlets)
+        self.logger.debug('Майнеры завершили работу')
 
-            is_resource_accepted = False
+        self.download_statistics['handshakes_saved'] = DownloadWorker.get_handshakes_saved(self.session)
+        self.download_statistics.update(self.url_queue.statistics)
 
-            # Предлагаем каждому зарегистрированному майнеру обработать ресурс
-            for miner in self.miners:
-                if miner.is_acceptable(resource_dict['content_type']):
-                    self.logger.debug(f'Майнер {miner.miner_name} принял ресурс')
+        if self.cache:
+            self.download_statistics.update(self.cache.statistics)
+            self.cache.close()
+        self.session.close()
 
-                    is_resource_accepted = True
-                    miner.parse_resource(resource_dict)
+        self.logger.info('Статистика загрузки ресурсов:\n\t{}'.format(
+            ', '.join(['='.join([k, str(v)]) for k, v in self.download_statistics.items()])))
 
-            if not is_resource_accepted:
-                self.logger.debug('Ресурс типа {} не обработан'.format(resource_dict['content_type']))
+        self.collect_params(final=True)
+        self.logger.debug('Обработка результатов завершена')
 
-        # Завершаем загрузчики
-        for loader in loaders:
-            loader.finish()
+        self.logger.info('Статистика ранжирования параметров:\n\t{}'.format(
+            ', '.join(['='.join([k, str(v)]) for k, v in self.scorer.statistics.items()])))
 
-        # Ждем завершения
-        gevent.joinall(jobs)
-        self.logger.debug('Майнеры завершили работу')
+        return self.params, self.miner_statistics
 
-        params = defaultdict(set)
-        miner_statistics = defaultdict(int)
+    def collect_params(self, final: bool = False):
+        """ Забирает найденные параметры из очереди, ранжирует их и передает прошедшие в `self.params_callback`
 
+        :param final: Майнеры завершили работу - оставшиеся кандидаты принимаются или отбрасываются окончательно
+        :return:
+        """
         while self.param_queue.qsize():
             d = self.param_queue.get()
             netloc, miner_name, param_name = d['netloc'], d['miner_name'], d['param_name']
 
-            if param_name not in params[netloc]:
-                miner_statistics[miner_name] += 1
-                params[netloc].add(param_name)
+            if param_name not in self.mined_params[netloc]:
+                self.miner_statistics[miner_name] += 1
+                self.mined_params[netloc].add(param_name)
 
-        self.logger.debug('Обработка результатов завершена')
+            self.scorer.add(netloc, miner_name, param_name)
+
+        accepted, dropped = self.scorer.pop(final)
+
+        for netloc in set(accepted) | set(dropped):
+            self.params[netloc].update(accepted.get(netloc, []))
 
-        return params, miner_statistics
+            if self.params_callback:
+                self.params_callback(netloc, accepted.get(netloc, []), dropped.get(netloc, []))
 
     def setup_miners(self):
         """ Регистрирует майнеры
@@ -214,24 +546,29 @@ class Miner:
         builders = [HTMLMiner, JavascriptMiner, JSONMiner, WebArchiveMiner]
 
         for builder in builders:
-            self.miners.append(builder(self.args, self.url_queue, self.resource_queue, self.param_queue, self.logger))
+            self.miners.append(builder(self.args, self.url_queue, self.resource_queue, self.param_queue, self.logger,
+                                       self.cache))
+
+    def setup_cache(self):
+        """ Открывает персистентный кэш майнеров, если он не отключен
+
+        :return:
+        """
+        if self.args.disable_mining_cache:
+            return
+
+        try:
+            self.cache = MiningCache(self.args.mining_cache, self.args.mining_cache_size * 1024 * 1024,
+                                     self.args.mining_cache_ttl)
+        except Exception as e:
+            self.logger.error(f'Не удалось открыть кэш майнеров {self.args.mining_cache}: {e}')
 
     def setup_queues(self):
         """ Инициализирует очереди для майнеров
 
         :return:
         """
-        self.url_queue = Queue()
+        self.url_queue = UrlFrontier(self.args.mining_host_budget, self.args.mining_max_depth,
+                                     self.args.mining_bloom_filter)
         self.resource_queue = Queue()
         self.param_queue = Queue()
-
-        domains = set()
-        for info in self.info_list:
-            domain = re.sub(':\d+$', '', info.netloc)
-
-            # Добавляется ресурс специально для WebArchiveMiner
-            if domain not in domains:
-                domains.add(domain)
-                self.resource_queue.put({'netloc': info.netloc, 'content_type': 'webarchive/download', 'resource': domain})
-
-            self.url_queue.put({'netloc': info.netloc, 'url': info.origin_url})
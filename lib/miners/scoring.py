@@ -0,0 +1,169 @@
+import math
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Вес источника параметра: названия из query-строк и форм почти всегда являются параметрами,
+# идентификаторы JS - лишь кандидаты
+SOURCE_WEIGHTS = {'WebArchiveMiner': 4, 'HTMLMiner': 3, 'JSONMiner': 2, 'JavascriptMiner': 1}
+
+# Кандидат передается в поиск сразу, если его оценка не ниже EMIT_SCORE, иначе - по окончании работы майнеров,
+# если оценка не ниже MIN_SCORE и не исчерпан лимит хоста
+EMIT_SCORE = 3
+MIN_SCORE = 2
+
+# Части названий, характерные для параметров
+PARAM_TOKENS = {'id', 'key', 'token', 'name', 'user', 'page', 'sort', 'order', 'query', 'search', 'debug', 'admin',
+                'type', 'mode', 'callback', 'redirect', 'url', 'lang', 'limit', 'offset', 'filter', 'format', 'email',
+                'pass', 'password', 'auth', 'code', 'state', 'session', 'action', 'file', 'path', 'view', 'test',
+                'role', 'account', 'api', 'version', 'count', 'size', 'from', 'to', 'date', 'return', 'next'}
+
+# Мусор: минифицированные имена (a, t, e1), имена обфускаторов (_0x1f2a), числа, хэши и слишком длинные строки
+JUNK_REGEX = re.compile(r'^(?:[$_]?[A-Za-z][0-9]?|[$_]+|_0x[0-9a-f]+|\d+|[0-9a-f]{16,}|.{65,})$')
+# Майнеры, к находкам которых применяется фильтр мусора: названия из query-строк, форм и JSON являются параметрами
+# независимо от вида, а идентификаторы JS - часто результат минификации
+JUNK_FILTERED_MINERS = {'JavascriptMiner'}
+WORD_SPLIT_REGEX = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+')
+
+
+class Candidate:
+    __slots__ = ('weight', 'resources', 'name_score')
+
+    def __init__(self, name_score: int):
+        self.weight = 0
+        self.resources = 0
+        self.name_score = name_score
+
+    @property
+    def score(self) -> float:
+        return self.weight + math.log2(1 + self.resources) + self.name_score
+
+
+class ParamScorer:
+    """ Ранжирует найденные майнерами параметры и ограничивает их число для каждого хоста
+
+    Оценка кандидата складывается из веса источника (лучший из майнеров, нашедших параметр), частоты встречаемости
+    по ресурсам и эвристик именования
+    """
+
+    def __init__(self, limit: int):
+        """
+        :param limit: Максимальное число параметров для одного хоста (0 - без ограничений)
+        """
+        self.limit = limit
+
+        # {netloc: {param: Candidate}} - кандидаты, еще не переданные в поиск
+        self.candidates: Dict[str, Dict[str, Candidate]] = defaultdict(dict)
+        # {netloc: set(param)} - принятые и отброшенные кандидаты
+        self.accepted: Dict[str, set] = defaultdict(set)
+        self.dropped: Dict[str, set] = defaultdict(set)
+        # {netloc: set(param)} - мусор из JS, который еще может быть найден другими майнерами
+        self.junk: Dict[str, set] = defaultdict(set)
+
+        # Отброшенные, но еще не возвращенные через `pop`
+        self._new_dropped: Dict[str, List[str]] = defaultdict(list)
+        # Кандидаты, оценка которых изменилась с прошлого вызова `pop`
+        self._updated: Dict[str, set] = defaultdict(set)
+
+        self.statistics = {'mined': 0, 'accepted': 0, 'dropped_junk': 0, 'dropped_score': 0, 'dropped_limit': 0}
+
+    def add(self, netloc: str, miner_name: str, param: str):
+        """ Учитывает нахождение параметра `param` майнером `miner_name` в очередном ресурсе хоста `netloc` """
+        if param in self.accepted[netloc] or param in self.dropped[netloc]:
+            return
+
+        candidate = self.candidates[netloc].get(param)
+
+        if candidate is None:
+            if not param or miner_name in JUNK_FILTERED_MINERS and JUNK_REGEX.match(param):
+                if param not in self.junk[netloc]:
+                    self.junk[netloc].add(param)
+                    self.statistics['mined'] += 1
+                    self.statistics['dropped_junk'] += 1
+                return
+
+            if param in self.junk[netloc]:
+                # Отброшенное как мусор название найдено в другом источнике
+                self.junk[netloc].remove(param)
+                self.statistics['dropped_junk'] -= 1
+            else:
+                self.statistics['mined'] += 1
+
+            candidate = self.candidates[netloc][param] = Candidate(self.get_name_score(param))
+
+        candidate.weight = max(candidate.weight, SOURCE_WEIGHTS.get(miner_name, 1))
+        candidate.resources += 1
+        self._updated[netloc].add(param)
+
+    def pop(self, final: bool = False) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """ Возвращает кандидатов, готовых к передаче в поиск, и отброшенных с прошлого вызова
+
+        :param final: Майнеры завершили работу - оставшиеся кандидаты принимаются по убыванию оценки в пределах
+                      лимита хоста либо отбрасываются
+        :return: Кортеж `(accepted, dropped)` словарей вида `{netloc: [param, ...]}`
+        """
+        accepted = defaultdict(list)
+
+        for netloc, candidates in self.candidates.items():
+            # До окончания работы майнеров оценка остальных кандидатов не менялась и ниже порога
+            params = candidates.keys() if final else self._updated[netloc] & candidates.keys()
+            ranked = sorted([(param, candidates[param]) for param in params], key=lambda item: item[1].score,
+                            reverse=True)
+
+            for param, candidate in ranked:
+                if not final and candidate.score < EMIT_SCORE:
+                    break
+
+                if self.limit and len(self.accepted[netloc]) >= self.limit:
+                    if not final:
+                        break
+
+                    self.drop(netloc, param, 'dropped_limit')
+                elif candidate.score < MIN_SCORE:
+                    self.drop(netloc, param, 'dropped_score')
+                else:
+                    self.accepted[netloc].add(param)
+                    accepted[netloc].append(param)
+                    self.statistics['accepted'] += 1
+
+                del candidates[param]
+
+        if final:
+            # Мусор, не найденный другими майнерами, отбрасывается окончательно
+            for netloc, params in self.junk.items():
+                self.dropped[netloc].update(params)
+                self._new_dropped[netloc].extend(params)
+
+            self.junk.clear()
+
+        dropped, self._new_dropped = self._new_dropped, defaultdict(list)
+        self._updated.clear()
+
+        return accepted, dropped
+
+    def drop(self, netloc: str, param: str, reason: str):
+        self.dropped[netloc].add(param)
+        self._new_dropped[netloc].append(param)
+        self.statistics[reason] += 1
+
+    @staticmethod
+    def get_name_score(param: str) -> int:
+        """ Оценивает, насколько название `param` похоже на название параметра """
+        words = [word.lower() for word in WORD_SPLIT_REGEX.findall(param)]
+        score = 0
+
+        # Составные названия: userId, user_id, user-id
+        if len(words) > 1:
+            score += 1
+
+        if PARAM_TOKENS.intersection(words):
+            score += 1
+
+        # Короткие имена без гласных (fn, cb, xhr) и константы в верхнем регистре чаще являются частью кода
+        if len(param) <= 3 and not re.search('[aeiouAEIOU]', param):
+            score -= 1
+
+        if param.isupper() and len(param) > 3 or '$' in param:
+            score -= 1
+
+        return score
@@ -1,15 +1,24 @@
 import re
-from urllib.parse import urlparse
+from typing import Dict, Iterable, Iterator, List
+
+import gevent
 
 from lib.miners.abstract import AbstractMiner
+from lib.miners.cdx import CdxDeduplicator, iter_file_lines, iter_text_lines
+
+# Число строк индекса, после обработки которых управление передается другим гринлетам
+CDX_YIELD_LINES = 1000
 
 
 class WebArchiveMiner(AbstractMiner):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Общий для всех индексов фильтр повторяющихся пар (путь, набор параметров)
+        self.deduplicator = CdxDeduplicator(self.args.mining_bloom_filter)
+
     def get_acceptable_content_types(self):
-        return {'webarchive/download', 'webarchive/result'}
+        return {'webarchive/download', 'webarchive/result', 'webarchive/file'}
 
     def parse_resource(self, resource_dict: dict):
         # Если требуется сформировать запрос к sdx серверу webarchive
@@ -20,21 +29,68 @@ class WebArchiveMiner(AbstractMiner):
             domain = re.sub(':\d+$', '', netloc)
             url = f'http://web.archive.org/cdx/search/cdx?url={domain}&collapse=urlkey&matchType=prefix&fl=original&limit=-1000'
 
-            self.url_queue.put({'netloc': netloc, 'url': url, 'force_content_type': 'webarchive/result'})
+            self.add_url(resource_dict, url, 'webarchive/result')
+        # Локальный CDX-индекс или список адресов: адреса относятся к целям по имени хоста
+        elif resource_dict['content_type'] == 'webarchive/file':
+            try:
+                self.process_lines(resource_dict, iter_file_lines(resource), resource_dict['targets'])
+            except OSError as e:
+                self.logger.error(f'Не удалось прочитать файл {resource}: {e}')
+        # Ответ CDX API: все адреса относятся к хосту запроса
         else:
-            urls = re.split('\n', resource)
+            lines = iter_text_lines(resource) if isinstance(resource, str) else resource
 
-            for url in urls:
-                if not url:
-                    continue
+            try:
+                self.process_lines(resource_dict, lines)
+            except Exception as e:
+                self.logger.error(f'WebArchiveMiner\'у не удалось обработать ресурс {resource_dict["url"]}: {e}')
+                self.discard_result()
+
+    def process_lines(self, resource_dict: dict, lines: Iterable[str], targets: Dict[str, List[str]] = None):
+        """ Потоково обрабатывает строки индекса: находит параметры уникальных адресов и добавляет адреса на загрузку
 
-                url_obj = urlparse(url)
+        :param resource_dict: Ресурс, содержащий индекс
+        :param lines: Строки CDX-индекса или списка адресов
+        :param targets: Словарь `{hostname: [netloc]}` для отнесения адресов к целям, если не указан, то все адреса
+                        относятся к `resource_dict['netloc']`
+        :return:
+        """
+        statistics = dict(self.deduplicator.statistics)
+        mined = set()
+        foreign = 0
 
-                if url_obj.query:
-                    params = [match[0] for match in re.findall('([^?:&=$]+)(=([^?:&=$]+))?', url_obj.query)]
-                    self.logger.debug(f'Новые параметры: {params}')
+        for url, url_obj, params in self.deduplicator.filter(self.iter_cooperative(lines)):
+            if targets is None:
+                netlocs = [resource_dict['netloc']]
+            else:
+                netlocs = targets.get(url_obj.hostname)
 
-                    for param in params:
+                # Адреса хостов, не являющихся целями поиска
+                if not netlocs:
+                    foreign += 1
+                    continue
+
+            for netloc in netlocs:
+                for param in params:
+                    if (netloc, param) not in mined:
+                        mined.add((netloc, param))
                         self.add_new_param(netloc, param)
 
-                self.url_queue.put({'netloc': netloc, 'url': url})
+            netloc = url_obj.netloc if url_obj.netloc in netlocs else netlocs[0]
+            self.add_url(dict(resource_dict, netloc=netloc), url)
+
+        statistics = {k: v - statistics[k] for k, v in self.deduplicator.statistics.items()}
+        statistics['cdx_foreign'] = foreign
+
+        self.logger.debug('Статистика обработки индекса {}:\n\t{}'.format(
+            resource_dict.get('url', resource_dict['resource']),
+            ', '.join(['='.join([k, str(v)]) for k, v in statistics.items()])))
+
+    @staticmethod
+    def iter_cooperative(lines: Iterable[str]) -> Iterator[str]:
+        """ Периодически передает управление другим гринлетам при обработке больших локальных индексов """
+        for i, line in enumerate(lines):
+            if i % CDX_YIELD_LINES == 0:
+                gevent.sleep(0)
+
+            yield line
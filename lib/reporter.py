@@ -59,10 +59,10 @@ class Reporter:
                 max_type = len(type) if len(type) > max_type else max_type
 
                 for param_info in results[url][type]:
-                    name = param_info['param']
+                    name = param_info.param
                     max_name = len(name) if len(name) > max_name else max_name
 
-                    for reason_info in param_info['reasons']:
+                    for reason_info in param_info.reasons:
                         reason = str(reason_info['reason']) + ': ' + str(reason_info['value'])
 
                         max_reason = len(reason) if len(reason) > max_reason else max_reason
@@ -96,16 +96,13 @@ class Reporter:
         for url in results:
             for type in results[url]:
                 for param_info in results[url][type]:
-                    name = param_info['param']
-                    reasons = param_info['reasons']
-
                     if not results_copy.get(url):
                         results_copy[url] = dict()
 
                     if not results_copy[url].get(type):
                         results_copy[url][type] = list()
 
-                    results_copy[url][type].append({'param': name, 'reasons': reasons})
+                    results_copy[url][type].append(param_info.to_dict())
 
         return json.dumps(results_copy)
 
@@ -120,7 +117,7 @@ class Reporter:
 
             for param_type in results[url]:
                 for param_info in results[url][param_type]:
-                    name = param_info['param']
+                    name = param_info.param
 
                     if param_type == ParamType.HEADER:
                         type_color = Fore.YELLOW + param_type + Style.RESET_ALL
@@ -1,4 +1,10 @@
+import os
 from functools import total_ordering
+from hashlib import md5
+
+from requests import Response
+
+from lib.constants import ResponseRetention
 
 
 @total_ordering
@@ -15,4 +21,66 @@ class PrioritizedItem:
     def __lt__(self, other):
         if not isinstance(other, __class__):
             return NotImplemented
-        return self.priority < other.priority
\ No newline at end of file
+        return self.priority < other.priority
+
+
+class Finding:
+    """ Найденный скрытый параметр
+
+    Хранит только метаданные ответа, чтобы тела ответов не удерживались в памяти до конца сканирования
+    """
+    __slots__ = ('url', 'type', 'param', 'reasons', 'status', 'length', 'body_hash', 'body_truncated', 'body_path',
+                 'method')
+
+    def __init__(self, url: str, type: str, param: str, reasons: list, status: int = None, length: int = None,
+                 body_hash: str = None, body_truncated: bool = None, body_path: str = None, method: str = None):
+        self.url = url
+        # Метод запроса, для которого найден параметр: по адресу и методу находки сопоставляются с запросами
+        self.method = method
+        self.type = type
+        self.param = param
+        self.reasons = reasons
+        self.status = status
+        self.length = length
+        self.body_hash = body_hash
+        self.body_truncated = body_truncated
+        self.body_path = body_path
+
+    @classmethod
+    def from_response(cls, url: str, type: str, param: str, reasons: list, response: Response, retention: str,
+                      responses_dir: str = None, method: str = None) -> 'Finding':
+        """ Создает запись о параметре, сохраняя сведения об ответе `response` согласно политике `retention`
+
+        :param retention: `ResponseRetention.NONE` - ответ не сохраняется;
+                          `ResponseRetention.METADATA` - сохраняются код, длина и хэш тела ответа;
+                          `ResponseRetention.BODY` - дополнительно тело ответа записывается в `responses_dir`.
+                          Для усеченного тела в файл попадает только сохраненная часть, поэтому файл называется
+                          хэшем записанных байт, а не `body_hash`, и его размер может быть меньше `length`
+        """
+        finding = cls(url, type, param, reasons, method=method)
+
+        if retention == ResponseRetention.NONE:
+            return finding
+
+        finding.status = response.status_code
+        # Если тело читалось потоково, то учитываются длина и хэш всего прочитанного тела,
+        # хэш усеченного и не дочитанного тела неизвестен
+        finding.length = getattr(response, 'body_length', len(response.content))
+        finding.body_hash = response.body_hash if hasattr(response, 'body_hash') else md5(response.content).hexdigest()
+        finding.body_truncated = getattr(response, 'body_truncated', False)
+
+        if retention == ResponseRetention.BODY and responses_dir:
+            os.makedirs(responses_dir, exist_ok=True)
+            # Файл называется хэшем записанных байт: одинаковые тела записываются один раз
+            finding.body_path = os.path.join(responses_dir, md5(response.content).hexdigest() + '.bin')
+
+            if not os.path.exists(finding.body_path):
+                with open(finding.body_path, 'wb') as file:
+                    file.write(response.content)
+
+        return finding
+
+    def to_dict(self) -> dict:
+        """ Возвращает параметр в виде словаря без незаполненных полей """
+        return {attr: getattr(self, attr) for attr in self.__slots__
+                if attr not in ('url', 'type', 'method') and getattr(self, attr) is not None}
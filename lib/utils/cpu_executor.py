@@ -0,0 +1,182 @@
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from time import perf_counter
+from typing import Callable, Dict, Union
+
+import gevent
+from gevent.threadpool import ThreadPool
+
+from lib.constants import CPU_JOB_INLINE_SIZE, HUB_MONITOR_INTERVAL
+from lib.utils.logger import Logger
+
+
+class CPUJobTooLargeError(Exception):
+    pass
+
+
+class CPUJobTimeoutError(Exception):
+    pass
+
+
+class CPUExecutor:
+    """ Выполняет CPU-ёмкие задачи (парсинг HTML/JS) в пуле процессов, не блокируя gevent hub
+
+    Гринлет, отправивший задачу, ожидает результат кооперативно: блокирующее ожидание `Future` выполняется
+    в нативном потоке из пула gevent, поэтому остальные гринлеты продолжают работу с сетью
+    """
+
+    def __init__(self, workers: int = 0, max_job_size: int = 0, job_timeout: float = None, logger: Logger = None):
+        self.workers = workers
+        self.max_job_size = max_job_size
+        self.job_timeout = job_timeout
+        self.logger = logger
+
+        self._pool: Union[ProcessPoolExecutor, None] = None
+        self._waiters: Union[ThreadPool, None] = None
+        self._monitor: Union[gevent.Greenlet, None] = None
+
+        self.statistics = {'jobs': 0, 'inline_jobs': 0, 'rejected_jobs': 0, 'failed_jobs': 0, 'timeouts': 0,
+                           'pool_recycles': 0, 'job_time': 0.0, 'hub_block_time': 0.0, 'hub_block_max': 0.0}
+        # Время выполнения (вместе с ожиданием результата из пула) по функциям задач: {func.__name__: float}
+        self.job_times: Dict[str, float] = defaultdict(float)
+
+    def setup(self, workers: int, max_job_size: int, job_timeout: float, logger: Logger):
+        """ Устанавливает настройки исполнителя и запускает мониторинг блокировок gevent hub
+
+        Пул процессов создается лениво при отправке первой задачи
+        """
+        self.workers = workers
+        self.max_job_size = max_job_size
+        self.job_timeout = job_timeout
+        self.logger = logger
+
+        if self._monitor is None:
+            self._monitor = gevent.spawn(self._monitor_hub)
+
+    def submit(self, func: Callable, data: str, *args):
+        """ Выполняет `func(data, *args)` и возвращает результат
+
+        Небольшие задачи выполняются на месте, т.к. накладные расходы на передачу данных в процесс превышают
+        время их обработки
+
+        :param func: Функция уровня модуля (должна сериализоваться через pickle)
+        :param data: Обрабатываемый ресурс, по размеру которого принимается решение о месте выполнения
+        :raises CPUJobTooLargeError: если размер `data` превышает `self.max_job_size`
+        :raises CPUJobTimeoutError: если задача не выполнилась за `self.job_timeout` секунд
+        """
+        size = self.check_job_size(data)
+        start = perf_counter()
+
+        try:
+            if not self.workers or size < CPU_JOB_INLINE_SIZE:
+                self.statistics['inline_jobs'] += 1
+                return func(data, *args)
+
+            self.statistics['jobs'] += 1
+            pool = self._get_pool()
+            future = pool.submit(func, data, *args)
+
+            try:
+                return self._waiters.spawn(future.result, self.job_timeout).get()
+            except FutureTimeoutError:
+                self.statistics['timeouts'] += 1
+                # Выполняющуюся задачу нельзя отменить через `future.cancel()`, поэтому пересоздаем пул
+                self._recycle_pool(pool)
+                raise CPUJobTimeoutError(f'Задача не выполнилась за {self.job_timeout} сек')
+        except (CPUJobTooLargeError, CPUJobTimeoutError):
+            raise
+        except Exception:
+            self.statistics['failed_jobs'] += 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            self.statistics['job_time'] += elapsed
+            self.job_times[func.__name__] += elapsed
+
+    def check_job_size(self, data: str) -> int:
+        """ Проверяет, что размер ресурса `data` не превышает `self.max_job_size`
+
+        :return: Размер ресурса
+        :raises CPUJobTooLargeError: если размер `data` превышает `self.max_job_size`
+        """
+        size = len(data) if data else 0
+
+        if self.max_job_size and size > self.max_job_size:
+            self.statistics['rejected_jobs'] += 1
+            raise CPUJobTooLargeError(f'Размер задачи {size} превышает {self.max_job_size} байт')
+
+        return size
+
+    def shutdown(self):
+        """ Останавливает пул процессов и мониторинг gevent hub """
+        if self._monitor is not None:
+            self._monitor.kill()
+            self._monitor = None
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+        if self._waiters is not None:
+            self._waiters.kill()
+            self._waiters = None
+
+    def get_statistics(self) -> Dict[str, Union[int, float]]:
+        statistics = dict(self.statistics)
+
+        for key in ('job_time', 'hub_block_time', 'hub_block_max'):
+            statistics[key] = round(statistics[key], 3)
+
+        for name, job_time in self.job_times.items():
+            statistics['job_time_' + name] = round(job_time, 3)
+
+        return statistics
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn, т.к. fork процесса с запущенным gevent hub небезопасен
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+        # Потоки ожидания переживают пересоздание пула процессов: ожидания задач прежнего пула завершаются с ошибкой
+        if self._waiters is None:
+            self._waiters = ThreadPool(self.workers * 4)
+
+        return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor):
+        """ Останавливает процессы пула `pool`, зависшие на задачах, новый пул создается при отправке следующей задачи
+
+        Задачи, выполнявшиеся в пуле `pool` одновременно с зависшей, завершаются с ошибкой
+
+        :param pool: Пул, в котором задача превысила время выполнения
+        """
+        # Пул уже пересоздан по таймауту другой задачи
+        if pool is not self._pool:
+            return
+
+        self._pool = None
+        self.statistics['pool_recycles'] += 1
+
+        processes = list((getattr(pool, '_processes', None) or {}).values())
+        pool.shutdown(wait=False)
+
+        for process in processes:
+            process.terminate()
+
+        if self.logger:
+            self.logger.debug(f'Пул процессов пересоздан после таймаута задачи ({len(processes)} процессов остановлено)')
+
+    def _monitor_hub(self):
+        """ Замеряет задержку пробуждения гринлета относительно ожидаемой - время блокировки gevent hub """
+        while True:
+            start = perf_counter()
+            gevent.sleep(HUB_MONITOR_INTERVAL)
+            blocked = perf_counter() - start - HUB_MONITOR_INTERVAL
+
+            if blocked > 0:
+                self.statistics['hub_block_time'] += blocked
+                self.statistics['hub_block_max'] = max(self.statistics['hub_block_max'], blocked)
+
+
+cpu_executor = CPUExecutor()
@@ -0,0 +1,109 @@
+import json
+import re
+from collections import OrderedDict
+from typing import FrozenSet, List, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+# Сегменты пути, являющиеся идентификаторами объектов, и их замены в нормализованном пути
+PATH_SEGMENT_PATTERNS = [
+    (re.compile(r'^\d+$'), '{int}'),
+    (re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE), '{uuid}'),
+    # Хэши, ObjectId и подобные шестнадцатеричные идентификаторы
+    (re.compile(r'^(?=.*\d)[0-9a-f]{16,}$', re.IGNORECASE), '{hex}'),
+]
+
+
+class EndpointCluster:
+    """ Запросы к одному эндпоинту, различающиеся только идентификаторами в пути и значениями параметров
+
+    Поиск выполняется по первому запросу кластера, остальные используются для проверки найденных параметров
+    """
+    __slots__ = ('key', 'requests')
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.requests = []
+
+    @property
+    def representative(self):
+        return self.requests[0]
+
+    @property
+    def members(self) -> list:
+        return self.requests[1:]
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def __repr__(self):
+        return f'EndpointCluster({self.key[0]} {self.key[1]}{self.key[2]}, requests={len(self.requests)})'
+
+
+def normalize_path(path: str) -> str:
+    """ Заменяет сегменты пути, похожие на идентификаторы (числа, UUID, хэши), шаблонами `{int}`, `{uuid}`, `{hex}` """
+    segments = []
+
+    for segment in (path or '/').split('/'):
+        for pattern, replacement in PATH_SEGMENT_PATTERNS:
+            if pattern.match(segment):
+                segment = replacement
+                break
+
+        segments.append(segment)
+
+    return '/'.join(segments)
+
+
+def get_param_names(query: str, body: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """ Возвращает наборы названий параметров query-строки и тела запроса (JSON или x-www-form-urlencoded)
+
+    Тело другого формата целиком считается одним "параметром", поэтому такие запросы совпадают только
+    при одинаковом теле
+    """
+    body_params = set()
+
+    if body:
+        try:
+            body_json = json.loads(body)
+            body_params = set(body_json.keys()) if isinstance(body_json, dict) else {body}
+        except ValueError:
+            body_params = {key for key, _ in parse_qsl(body, keep_blank_values=True)} or {body}
+
+    return frozenset(key for key, _ in parse_qsl(query, keep_blank_values=True)), frozenset(body_params)
+
+
+def get_endpoint_key(method: str, url: str, body: str) -> tuple:
+    """ Возвращает ключ эндпоинта: метод, хост, нормализованный путь и наборы названий параметров """
+    url_obj = urlparse(url)
+
+    return (method.upper(), url_obj.netloc.lower(), normalize_path(url_obj.path)) + get_param_names(url_obj.query, body)
+
+
+class EndpointClusterer:
+    """ Потоковое объединение запросов в кластеры: первый запрос эндпоинта сразу становится представителем кластера,
+    поэтому поиск по нему можно начинать, не дожидаясь остальных запросов
+    """
+
+    def __init__(self):
+        self.clusters = OrderedDict()
+
+    def add(self, request) -> bool:
+        """ Добавляет объект `requests.PreparedRequest` в кластер его эндпоинта
+
+        :return: True - если запрос первый в кластере
+        """
+        body = request.body.decode('utf8', errors='replace') if isinstance(request.body, bytes) else request.body
+        key = get_endpoint_key(request.method or 'GET', request.url, body)
+
+        if key in self.clusters:
+            self.clusters[key].requests.append(request)
+            return False
+
+        self.clusters[key] = EndpointCluster(key)
+        self.clusters[key].requests.append(request)
+
+        return True
+
+    def get_clusters(self) -> List[EndpointCluster]:
+        return list(self.clusters.values())
+
@@ -0,0 +1,69 @@
+from typing import List, Tuple
+from urllib.parse import urlparse, parse_qsl
+
+from lxml import etree
+
+# Размер части HTML страницы, передаваемой парсеру за раз
+HTML_FEED_SIZE = 64 * 1024
+# Элементы форм, аттрибут id которых обычно совпадает с названием параметра
+FORM_TAGS = {'form', 'input', 'select', 'textarea', 'button', 'output', 'fieldset', 'datalist', 'keygen', 'object'}
+
+
+class HTMLCollector:
+    """ Цель событийного парсера lxml: собирает параметры и скрипты по событиям открытия и закрытия тэгов,
+    не строя дерево документа
+    """
+
+    def __init__(self):
+        self.params = set()
+        self.scripts = []
+
+        self._script_src = None
+        self._script_parts = None
+
+    def start(self, tag: str, attrib: dict):
+        for name, value in attrib.items():
+            if name == 'name' or name == 'id' and tag in FORM_TAGS:
+                self.params.add(value)
+            elif name.startswith('data-') and len(name) > 5:
+                self.params.add(name[5:])
+
+        if tag == 'form' and attrib.get('action'):
+            self.params.update(key for key, _ in parse_qsl(urlparse(attrib['action']).query, keep_blank_values=True))
+        elif tag == 'script':
+            self._script_src = attrib.get('src')
+            self._script_parts = []
+
+    def data(self, data: str):
+        if self._script_parts is not None:
+            self._script_parts.append(data)
+
+    def end(self, tag: str):
+        if tag == 'script' and self._script_parts is not None:
+            self.scripts.append((self._script_src, ''.join(self._script_parts)))
+            self._script_src = self._script_parts = None
+
+    def close(self) -> Tuple[List[str], List[Tuple[str, str]]]:
+        return [param for param in self.params if param], self.scripts
+
+
+def parse_html(html: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """ Собирает за один проход значения аттрибутов name и id элементов форм, параметры из action форм,
+    ключи data-* аттрибутов и скрипты HTML страницы `html`
+
+    :param html: Контент HTML страницы
+    :return: Кортеж `(params, scripts)`, где `scripts` - список пар `(src, inline-код)`
+    """
+    collector = HTMLCollector()
+    parser = etree.HTMLParser(target=collector, recover=True, no_network=True)
+
+    try:
+        for start in range(0, len(html), HTML_FEED_SIZE):
+            parser.feed(html[start:start + HTML_FEED_SIZE])
+
+        parser.close()
+    # Документ без элементов (пустой или состоящий из пробелов)
+    except etree.XMLSyntaxError:
+        pass
+
+    return collector.close()
@@ -0,0 +1,98 @@
+import re
+from typing import List, Set
+
+# Токены, значимые для поиска параметров. Комментарии и литералы поглощаются целиком, чтобы их содержимое
+# не принималось за идентификаторы
+TOKEN_REGEX = re.compile(r'''
+    ([A-Za-z_$][\w$]*)                                      # Идентификатор или ключ свойства
+  | "((?:[^"\\\n]|\\.)*)"                                   # Строка в двойных кавычках
+  | '((?:[^'\\\n]|\\.)*)'                                   # Строка в одинарных кавычках
+  | `((?:[^`\\]|\\.)*)`                                     # Шаблонная строка
+  | //[^\n]*                                                # Однострочный комментарий
+  | /\*.*?(?:\*/|\Z)                                        # Многострочный комментарий
+  | (?:(?<=[(,=:\[!&|?{};])|(?<=[(,=:\[!&|?{};][ ]))/(?![/*]) # Литерал регулярного выражения после пунктуатора
+      (?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*
+''', re.VERBOSE | re.DOTALL)
+
+# Строковый литерал, похожий на название параметра
+PARAM_LIKE_REGEX = re.compile(r'^[A-Za-z_$][\w$\-]{0,63}$')
+# Параметры в строках вида "/path?param1=...&param2="
+QUERY_PARAM_REGEX = re.compile(r'[?&]([A-Za-z_][\w\-\[\]]{0,63})=')
+
+KEYWORDS = {'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default', 'delete', 'do',
+            'else', 'export', 'extends', 'false', 'finally', 'for', 'function', 'if', 'import', 'in', 'instanceof',
+            'let', 'new', 'null', 'return', 'super', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'var',
+            'void', 'while', 'with', 'yield', 'enum', 'implements', 'interface', 'package', 'private', 'protected',
+            'public', 'static'}
+
+
+def get_identifiers_fast(script: str) -> List[str]:
+    """ Извлекает кандидатов в параметры из JS-скрипта `script` за один линейный проход
+
+    В отличие от полноценного токенизатора не проверяет синтаксис, поэтому не падает на современном синтаксисе и
+    обрывках кода. Помимо идентификаторов и ключей свойств собирает строковые литералы, похожие на названия
+    параметров, и параметры из строк с query-частью
+
+    :param script: Исходный код скрипта
+    :return: Список уникальных кандидатов
+    """
+    candidates: Set[str] = set()
+    strings = []
+
+    for identifier, double_quoted, single_quoted, template in TOKEN_REGEX.findall(script):
+        if identifier:
+            candidates.add(identifier)
+        elif double_quoted or single_quoted or template:
+            strings.append(double_quoted or single_quoted or template)
+
+    candidates -= KEYWORDS
+
+    for string in strings:
+        if PARAM_LIKE_REGEX.match(string):
+            candidates.add(string)
+        elif '=' in string:
+            candidates.update(QUERY_PARAM_REGEX.findall(string))
+
+    return list(candidates)
+
+
+def get_identifiers_precise(script: str) -> List[str]:
+    """ Возвращает список уникальных идентификаторов JS-скрипта `script`, полученных токенизатором esprima
+
+    Медленнее `get_identifiers_fast` и завершается ошибкой на неподдерживаемом синтаксисе
+    """
+    from esprima import esprima
+
+    return list({token.value for token in esprima.tokenize(script) if token.type == 'Identifier'})
+
+
+def split_script(script: str, chunk_size: int) -> List[str]:
+    """ Разбивает скрипт на части размером около `chunk_size` символов по границам строк или инструкций
+
+    :param script: Исходный код скрипта
+    :param chunk_size: Желаемый размер части
+    :return: Список частей скрипта
+    """
+    if not chunk_size or len(script) <= chunk_size:
+        return [script]
+
+    chunks = []
+    start = 0
+
+    while start < len(script):
+        end = start + chunk_size
+
+        if end >= len(script):
+            chunks.append(script[start:])
+            break
+
+        # Ищем ближайшую границу в пределах четверти части, иначе режем как есть
+        boundary = script.find('\n', end, end + chunk_size // 4)
+        if boundary == -1:
+            boundary = script.find(';', end, end + chunk_size // 4)
+
+        end = boundary + 1 if boundary != -1 else end
+        chunks.append(script[start:end])
+        start = end
+
+    return chunks
@@ -0,0 +1,89 @@
+import json
+import re
+from typing import Iterable, Iterator
+
+from lib.constants import JSON_MAX_KEY_SIZE
+
+# Строковый литерал JSON и следующее за ним двоеточие, если литерал является ключом объекта.
+# Вне строк двоеточие встречается только после ключа, поэтому разбор структуры документа не требуется.
+# Литерал без закрывающей кавычки совпадает до конца текста, чтобы его не сканировать заново с каждой кавычки внутри
+STRING_REGEX = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)(?:"[ \t\r\n]*(:)?|(\\?\Z))', re.DOTALL)
+# Окончание строкового литерала, начало которого осталось в предыдущих частях
+STRING_END_REGEX = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def iter_json_keys(chunks: Iterable[str]) -> Iterator[str]:
+    """ Извлекает ключи объектов из JSON-документа или JSON Lines, переданного частями, за один линейный проход
+
+    Дерево документа не строится: в памяти хранится только текущая часть и незавершенный на ее границе литерал
+    длиной не более `JSON_MAX_KEY_SIZE`, поэтому потребление памяти не зависит от размера документа. Содержимое
+    более длинного литерала отбрасывается, а до его закрывающей кавычки отслеживается только экранирование:
+    такие литералы не сканируются повторно, но и ключами, разорванными границей частей, не считаются.
+    Ключи разных частей могут повторяться
+
+    :param chunks: Части документа произвольного размера
+    :return: Итератор по ключам
+    """
+    tail = ''
+    # Внутри длинного литерала, содержимое которого отброшено, и экранирован ли первый символ следующей части
+    skipping = False
+    escaped = False
+
+    for chunk in chunks:
+        if skipping:
+            if escaped:
+                chunk, escaped = chunk[1:], False
+
+            match = STRING_END_REGEX.match(chunk)
+
+            if not match:
+                escaped = (len(chunk) - len(chunk.rstrip('\\'))) % 2 == 1
+                continue
+
+            chunk = chunk[match.end():]
+            skipping = False
+
+        data = tail + chunk
+        tail = ''
+        # Ключи части без повторов, чтобы не декодировать одинаковые ключи массивов объектов
+        keys = set()
+
+        for match in STRING_REGEX.finditer(data):
+            # Незавершенный литерал переносится в следующую часть
+            if match.group(3) is not None:
+                tail = data[match.start():]
+
+                if len(tail) > JSON_MAX_KEY_SIZE:
+                    skipping = True
+                    escaped = (len(tail) - len(tail.rstrip('\\'))) % 2 == 1
+                    tail = ''
+                break
+
+            # Двоеточие после литерала в конце части может оказаться в следующей части
+            if match.end() == len(data) and not match.group(2):
+                if len(match.group(1)) <= JSON_MAX_KEY_SIZE:
+                    tail = data[match.start():]
+                break
+
+            if match.group(2):
+                keys.add(match.group(1))
+
+        for key in keys:
+            yield decode_key(key)
+
+
+def decode_key(key: str) -> str:
+    if '\\' not in key:
+        return key
+
+    try:
+        return json.loads('"' + key + '"')
+    except ValueError:
+        return key
+
+
+def looks_like_json(document: str) -> bool:
+    """ Проверяет, что документ начинается как JSON-объект, массив или последовательность RFC 7464 """
+    start = document[:1024].lstrip(' \t\r\n\x1e')
+
+    return start[:1] in {'{', '['}
@@ -0,0 +1,314 @@
+import json
+import os
+import sys
+import tempfile
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter, time
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import gevent
+
+from lib.constants import METRICS_LATENCY_BUCKETS
+from lib.utils.logger import Logger
+
+# Префикс метрик в формате Prometheus
+PROMETHEUS_PREFIX = 'suseeker_'
+
+
+class Histogram:
+    """ Гистограмма с фиксированными границами корзин """
+    __slots__ = ('bounds', 'counts', 'sum', 'count', 'max')
+
+    def __init__(self, bounds: Tuple[float, ...] = METRICS_LATENCY_BUCKETS):
+        self.bounds = bounds
+        # Последняя корзина - значения больше всех границ
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def get_quantile(self, q: float) -> float:
+        """ Возвращает верхнюю границу корзины, в которую попадает квантиль `q` (оценка сверху) """
+        rank = q * self.count
+        total = 0
+
+        for bound, count in zip(self.bounds + (self.max,), self.counts):
+            total += count
+
+            if total >= rank and count:
+                return round(min(bound, self.max), 4)
+
+        return round(self.max, 4)
+
+    def to_dict(self) -> dict:
+        return {'count': self.count, 'sum': round(self.sum, 3),
+                'mean': round(self.sum / self.count, 4) if self.count else 0.0,
+                'p50': self.get_quantile(0.5), 'p90': self.get_quantile(0.9), 'p99': self.get_quantile(0.99),
+                'max': round(self.max, 4)}
+
+
+class Metrics:
+    """ Счетчики, гистограммы и таймеры этапов сканирования
+
+    Этапы выполняются конкурентно, поэтому для каждого этапа учитывается суммарное время выполнения его операций
+    (может превышать время работы программы) и время от начала первой операции до окончания последней.
+    Время операций по умолчанию измеряется по часам реального времени и включает ожидание в gevent hub - ввод-вывод,
+    результаты пула процессов и работу других гринлетов, выполнявшихся в это время. Для операций, не уступающих
+    управление, можно передать часы `thread_time`, чтобы учитывалось только их процессорное время.
+    Метрики записываются в JSON-файл по окончании работы и периодически - в файл в текстовом формате Prometheus
+    """
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, tuple], Union[int, float]] = defaultdict(int)
+        self.histograms: Dict[Tuple[str, tuple], Histogram] = {}
+        # Формат: {phase: {'time': float, 'calls': int, 'start': float, 'end': float}}
+        self.phases: Dict[str, dict] = {}
+        # Функции, возвращающие статистику других компонентов: {name: Callable[[], dict]}
+        self.collectors: Dict[str, Callable[[], dict]] = {}
+        # Стеки выполняемых этапов по корневому кадру гринлета: {id(frame): [phase, ...]}.
+        # Ведутся только при профилировании (`SamplingProfiler`)
+        self.frame_phases: Union[Dict[int, List[str]], None] = None
+
+        self.started = time()
+        self.json_path: Union[str, None] = None
+        self.prometheus_path: Union[str, None] = None
+        self.interval: float = 0
+        self.logger: Union[Logger, None] = None
+        self._writer: Union[gevent.Greenlet, None] = None
+
+    def setup(self, json_path: Union[str, None], prometheus_path: Union[str, None], interval: float, logger: Logger):
+        """ Устанавливает пути для выгрузки метрик и запускает периодическую запись файла Prometheus """
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self.interval = interval
+        self.logger = logger
+
+        if self.prometheus_path and self.interval > 0 and self._writer is None:
+            self._writer = gevent.spawn(self._write_periodically)
+
+    def inc(self, name: str, value: Union[int, float] = 1, **labels):
+        self.counters[(name, tuple(sorted(labels.items())))] += value
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+
+        histogram.observe(value)
+
+    @contextmanager
+    def phase(self, name: str, clock: Callable[[], float] = perf_counter) -> Iterator[None]:
+        """ Учитывает время выполнения блока кода как операцию этапа `name`
+
+        :param clock: Часы, по которым измеряется время операции. Начало и окончание этапа всегда отмечаются
+                      по часам реального времени
+        """
+        start = perf_counter()
+        clock_start = start if clock is perf_counter else clock()
+        frame_phases = self.frame_phases
+
+        if frame_phases is not None:
+            root = get_root_frame(sys._getframe())
+            frame_phases.setdefault(id(root), []).append(name)
+
+        try:
+            yield
+        finally:
+            end = perf_counter()
+            elapsed = end - start if clock is perf_counter else clock() - clock_start
+
+            if frame_phases is not None:
+                frame_phases[id(root)].pop()
+
+                if not frame_phases[id(root)]:
+                    del frame_phases[id(root)]
+
+            phase = self.phases.get(name)
+
+            if phase is None:
+                phase = self.phases[name] = {'time': 0.0, 'calls': 0, 'start': start, 'end': end}
+
+            phase['time'] += elapsed
+            phase['calls'] += 1
+            phase['start'] = min(phase['start'], start)
+            phase['end'] = max(phase['end'], end)
+
+    def timed(self, name: str, clock: Callable[[], float] = perf_counter) -> Callable:
+        """ Декоратор, учитывающий время выполнения функции по часам `clock` как операцию этапа `name` """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.phase(name, clock):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def add_collector(self, name: str, collector: Callable[[], dict]):
+        self.collectors[name] = collector
+
+    def get_summary(self) -> dict:
+        """ Возвращает сводку метрик: этапы, счетчики по хостам, гистограммы, доли результатов проверки порций
+        и статистику зарегистрированных компонентов
+        """
+        summary = {'elapsed': round(time() - self.started, 3), 'phases': {}, 'hosts': defaultdict(dict),
+                   'counters': {}, 'histograms': {}}
+
+        for name, phase in self.phases.items():
+            summary['phases'][name] = {'time': round(phase['time'], 3), 'calls': phase['calls'],
+                                       'wall': round(phase['end'] - phase['start'], 3)}
+
+        for (name, labels), value in self.counters.items():
+            labels = dict(labels)
+            host = labels.pop('host', None)
+            key = '.'.join([name] + [f'{k}={v}' for k, v in labels.items()])
+
+            if host is None:
+                summary['counters'][key] = round(value, 3)
+            else:
+                summary['hosts'][host][key] = round(value, 3)
+
+        for (name, labels), histogram in self.histograms.items():
+            labels = dict(labels)
+            host = labels.pop('host', None)
+
+            if host is None:
+                summary['histograms'][name] = histogram.to_dict()
+            else:
+                summary['hosts'][host][name] = histogram.to_dict()
+
+        # Доли результатов проверки порций слов
+        results = {dict(labels).get('result'): value for (name, labels), value in self.counters.items()
+                   if name == 'chunk_results'}
+        total = sum(results.values())
+        summary['chunk_result_ratios'] = {result: round(value / total, 4) for result, value in results.items()}
+
+        for name, collector in self.collectors.items():
+            summary[name] = collector()
+
+        return summary
+
+    def to_prometheus(self) -> str:
+        """ Возвращает метрики в текстовом формате Prometheus """
+        lines = []
+
+        def add(name: str, metric_type: str, labels: tuple, value: Union[int, float]):
+            lines.append((PROMETHEUS_PREFIX + name, metric_type, format_labels(labels), value))
+
+        for (name, labels), value in self.counters.items():
+            add(name + '_total', 'counter', labels, value)
+
+        for name, phase in self.phases.items():
+            add('phase_seconds_total', 'counter', (('phase', name),), round(phase['time'], 6))
+            add('phase_calls_total', 'counter', (('phase', name),), phase['calls'])
+            add('phase_wall_seconds', 'gauge', (('phase', name),), round(phase['end'] - phase['start'], 6))
+
+        for (name, labels), histogram in self.histograms.items():
+            cumulative = 0
+
+            for bound, count in zip(histogram.bounds + ('+Inf',), histogram.counts):
+                cumulative += count
+                add(name + '_bucket', 'histogram', labels + (('le', str(bound)),), cumulative)
+
+            add(name + '_sum', 'histogram', labels, round(histogram.sum, 6))
+            add(name + '_count', 'histogram', labels, histogram.count)
+
+        for collector_name, collector in self.collectors.items():
+            for key, value in collector().items():
+                if isinstance(value, (int, float)):
+                    add(f'{collector_name}_{key}', 'gauge', (), value)
+
+        add('elapsed_seconds', 'gauge', (), round(time() - self.started, 3))
+
+        return render_prometheus(lines)
+
+    def write(self):
+        """ Записывает метрики в указанные файлы """
+        if self.prometheus_path:
+            write_atomic(self.prometheus_path, self.to_prometheus())
+
+        if self.json_path:
+            write_atomic(self.json_path, json.dumps(self.get_summary(), indent=2))
+
+    def shutdown(self):
+        """ Останавливает периодическую запись и записывает итоговые метрики """
+        if self._writer is not None:
+            self._writer.kill()
+            self._writer = None
+
+        try:
+            self.write()
+        except OSError as e:
+            if self.logger:
+                self.logger.error(f'Не удалось записать метрики: {e}')
+
+    def _write_periodically(self):
+        while True:
+            gevent.sleep(self.interval)
+
+            try:
+                write_atomic(self.prometheus_path, self.to_prometheus())
+            except OSError as e:
+                self.logger.error(f'Не удалось записать метрики в {self.prometheus_path}: {e}')
+
+
+def get_root_frame(frame):
+    """ Возвращает корневой кадр стека - кадр функции, с которой начал выполняться гринлет """
+    while frame.f_back is not None:
+        frame = frame.f_back
+
+    return frame
+
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+
+    escaped = [(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for k, v in labels]
+    return '{' + ','.join([f'{k}="{v}"' for k, v in escaped]) + '}'
+
+
+def render_prometheus(lines: List[tuple]) -> str:
+    """ Группирует строки `(name, type, labels, value)` по семействам метрик с комментарием # TYPE """
+    families = defaultdict(list)
+    family_types = {}
+
+    for name, metric_type, labels, value in lines:
+        family = name
+        if metric_type == 'histogram':
+            family = name.rsplit('_', 1)[0]
+
+        family_types.setdefault(family, metric_type)
+        families[family].append(f'{name}{labels} {value}')
+
+    output = []
+    for family, samples in families.items():
+        output.append(f'# TYPE {family} {family_types[family]}')
+        output.extend(samples)
+
+    return '\n'.join(output) + '\n'
+
+
+def write_atomic(path: str, data: str):
+    """ Записывает файл через временный файл, чтобы читатель не увидел его частично записанным """
+    directory = os.path.dirname(os.path.abspath(path))
+
+    with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as file:
+        file.write(data)
+
+    os.replace(file.name, path)
+
+
+metrics = Metrics()
@@ -0,0 +1,260 @@
+import os
+import sys
+import threading
+from collections import defaultdict
+from time import perf_counter
+from typing import Dict, List, Tuple, Union
+
+from lib.utils.logger import Logger
+from lib.utils.metrics import metrics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FINDERS_DIR = os.path.join(ROOT, 'lib', 'finders')
+
+# Этап выборок, сделанных во время ожидания ввода-вывода и обработки событий в gevent hub
+HUB_PHASE = 'hub'
+# Этап выборок вне этапов метрик и модулей из `MODULE_PHASES`
+OTHER_PHASE = 'other'
+
+# Этапы гринлетов, не входящих в явно отмеченные этапы метрик (например, гринлетов, порожденных внутри этапа),
+# определяются по самому внешнему кадру стека из этих модулей
+MODULE_PHASES = [
+    (os.path.join(ROOT, 'lib', 'miners'), 'mining'),
+    (os.path.join(ROOT, 'lib', 'workers'), 'search'),
+    (FINDERS_DIR, 'search'),
+    (os.path.join(ROOT, 'lib', 'utils', 'raw_requests.py'), 'ingest'),
+]
+
+# Функции, доля которых выводится отдельно: подсчет тэгов, поиск отражений регулярными выражениями и лексер esprima
+TARGET_FUNCTIONS = ['count_html_tags', 'check_header_value_reflection_reason', 'check_cookie_value_reflection_reason',
+                    'check_param_value_reflection_reason', 'tokenize']
+
+
+class SamplingProfiler:
+    """ Семплирующий профилировщик с учетом гринлетов gevent
+
+    Отдельный поток через равные интервалы снимает стек основного потока - стек выполняющегося в этот момент гринлета.
+    Выборка относится к этапу сканирования, отмеченному `metrics.phase` в этом гринлете, и к классу модуля поиска,
+    метод которого находится в стеке. По окончании работы для каждого этапа записывается файл со свернутыми стеками
+    (формат flamegraph.pl, speedscope) и таблица самых затратных функций.
+    Разбор ресурсов в процессах `cpu_executor` не учитывается, для его профилирования используется --cpu-workers 0
+    """
+
+    def __init__(self):
+        # Формат: {(phase, finder, (code, ...)): count}, кадры стека от вложенного к внешнему
+        self.samples: Dict[Tuple[str, str, tuple], int] = defaultdict(int)
+        self.statistics = {'sampling_time': 0.0}
+
+        self.path: Union[str, None] = None
+        self.interval: float = 0.005
+        self.top: int = 30
+        self.logger: Union[Logger, None] = None
+
+        self._labels = {}
+        self._thread_id: Union[int, None] = None
+        self._thread: Union[threading.Thread, None] = None
+        self._stopped = threading.Event()
+
+    def start(self, path: str, interval: float, top: int, logger: Logger):
+        """ Запускает поток снятия выборок стека текущего (основного) потока
+
+        :param path: папка для файлов профиля
+        :param interval: интервал между выборками в секундах
+        :param top: число строк в таблице самых затратных функций
+        :param logger:
+        """
+        self.path = path
+        self.interval = interval
+        self.top = top
+        self.logger = logger
+
+        # Включаем учет этапов по гринлетам
+        metrics.frame_phases = {}
+
+        self._thread_id = threading.get_ident()
+        # Поток ОС: модуль threading не патчится gevent
+        self._thread = threading.Thread(target=self._run, name='suseeker-profiler', daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """ Останавливает снятие выборок и записывает профиль """
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        metrics.frame_phases = None
+
+        try:
+            self.write()
+        except OSError as e:
+            self.logger.error(f'Не удалось записать профиль в {self.path}: {e}')
+            return
+
+        self.logger.info('Профиль записан в {}:\n{}'.format(self.path, self.get_report()))
+
+    def sample(self):
+        """ Снимает стек основного потока и относит выборку к этапу и модулю поиска """
+        frame = sys._current_frames().get(self._thread_id)
+
+        if frame is None:
+            return
+
+        codes = []
+        root = frame
+
+        while frame is not None:
+            codes.append(frame.f_code)
+            root = frame
+            frame = frame.f_back
+
+        self.samples[(self.get_phase(root, codes), self.get_finder(codes), tuple(codes))] += 1
+
+    @staticmethod
+    def get_phase(root, codes: list) -> str:
+        # Корневой кадр основного цикла gevent - гринлеты в этот момент не выполняются
+        if root.f_code.co_name == 'run' and os.path.basename(root.f_code.co_filename) == 'hub.py':
+            return HUB_PHASE
+
+        # Гарантий против изменения списка основным потоком нет, поэтому копируем его
+        phases = list((metrics.frame_phases or {}).get(id(root), ()))
+        if phases:
+            return phases[-1]
+
+        for code in reversed(codes):
+            for path, phase in MODULE_PHASES:
+                if code.co_filename.startswith(path):
+                    return phase
+
+        return OTHER_PHASE
+
+    @staticmethod
+    def get_finder(codes: list) -> str:
+        """ Возвращает название класса модуля поиска по самому вложенному кадру из его файла
+
+        Методы `BaseFinder` выполняются для одного из классов-наследников, поэтому пропускаются
+        """
+        for code in codes:
+            if os.path.dirname(code.co_filename) == FINDERS_DIR:
+                name = os.path.splitext(os.path.basename(code.co_filename))[0]
+
+                if name != 'base_finder':
+                    return ''.join([part.capitalize() for part in name.split('_')])
+
+        return ''
+
+    def get_label(self, code) -> str:
+        """ Возвращает название кадра для свернутого стека: `<функция> (<файл>:<строка>)` """
+        label = self._labels.get(code)
+
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(ROOT):
+                filename = os.path.relpath(filename, ROOT)
+            else:
+                # Модули библиотек - с названием пакета
+                filename = os.path.join(*filename.split(os.sep)[-2:])
+
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = self._labels[code] = f'{name} ({filename}:{code.co_firstlineno})'.replace(';', ',')
+
+        return label
+
+    def get_collapsed_stacks(self) -> Dict[str, Dict[str, int]]:
+        """ Возвращает свернутые стеки по этапам: {phase: {'[Finder];frame;...;frame': count}} """
+        stacks = defaultdict(lambda: defaultdict(int))
+
+        for (phase, finder, codes), count in self.samples.items():
+            frames = [self.get_label(code) for code in reversed(codes)]
+
+            if finder:
+                frames.insert(0, f'[{finder}]')
+
+            stacks[phase][';'.join(frames)] += count
+
+        return stacks
+
+    def get_hotspots(self) -> List[Tuple[str, int, int]]:
+        """ Возвращает функции, отсортированные по числу выборок с учетом вложенных вызовов: [(label, self, total)] """
+        self_samples = defaultdict(int)
+        total_samples = defaultdict(int)
+
+        for (phase, _, codes), count in self.samples.items():
+            if phase == HUB_PHASE:
+                continue
+
+            self_samples[codes[0]] += count
+
+            # Рекурсивные вызовы учитываются в выборке один раз
+            for code in set(codes):
+                total_samples[code] += count
+
+        hotspots = sorted(total_samples, key=lambda code: (total_samples[code], self_samples[code]), reverse=True)
+        return [(self.get_label(code), self_samples[code], total_samples[code]) for code in hotspots]
+
+    def get_report(self) -> str:
+        """ Возвращает отчет: доли этапов и модулей поиска, доли целевых функций и таблицу самых затратных функций """
+        total = sum(self.samples.values()) or 1
+        phases = defaultdict(int)
+        finders = defaultdict(int)
+
+        for (phase, finder, _), count in self.samples.items():
+            phases[phase] += count
+            if finder:
+                finders[finder] += count
+
+        def percent(count: int) -> str:
+            return f'{count * 100 / total:.1f}%'
+
+        lines = ['Этапы: ' + ', '.join(['='.join([k, percent(v)]) for k, v in sorted(phases.items(),
+                                                                                     key=lambda i: -i[1])])]
+
+        if finders:
+            lines.append('Модули поиска: ' + ', '.join(['='.join([k, percent(v)])
+                                                        for k, v in sorted(finders.items(), key=lambda i: -i[1])]))
+
+        hotspots = self.get_hotspots()
+        targets = [(label, own, inclusive) for label, own, inclusive in hotspots
+                   if label.split(' ', 1)[0].rsplit('.', 1)[-1] in TARGET_FUNCTIONS]
+
+        if targets:
+            lines.append('Целевые функции: ' + ', '.join([f'{label}={percent(inclusive)}'
+                                                         for label, _, inclusive in targets]))
+
+        width = max([len(label) for label, _, _ in hotspots[:self.top]] + [len('Функция')])
+        lines.append(f'{"Функция":<{width}}  {"Собств.":>8}  {"Всего":>8}')
+
+        for label, own, inclusive in hotspots[:self.top]:
+            lines.append(f'{label:<{width}}  {percent(own):>8}  {percent(inclusive):>8}')
+
+        statistics = {'samples': sum(self.samples.values()), 'sampling_time': round(self.statistics['sampling_time'], 3)}
+        lines.append(', '.join(['='.join([k, str(v)]) for k, v in statistics.items()]))
+
+        return '\n'.join(['\t' + line for line in lines])
+
+    def write(self):
+        """ Записывает свернутые стеки каждого этапа в `<phase>.collapsed`, всех этапов - в `all.collapsed`
+        (этап - корневой кадр) и отчет в `top.txt`
+        """
+        os.makedirs(self.path, exist_ok=True)
+        stacks = self.get_collapsed_stacks()
+
+        with open(os.path.join(self.path, 'all.collapsed'), 'w') as all_file:
+            for phase, phase_stacks in stacks.items():
+                with open(os.path.join(self.path, f'{phase}.collapsed'), 'w') as file:
+                    for stack, count in phase_stacks.items():
+                        file.write(f'{stack} {count}\n')
+                        all_file.write(f'{phase};{stack} {count}\n')
+
+        with open(os.path.join(self.path, 'top.txt'), 'w') as file:
+            file.write(self.get_report() + '\n')
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            start = perf_counter()
+            self.sample()
+            self.statistics['sampling_time'] += perf_counter() - start
+
+
+profiler = SamplingProfiler()
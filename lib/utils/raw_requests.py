@@ -0,0 +1,221 @@
+import os
+import re
+from base64 import b64decode
+from itertools import count
+from typing import Iterator, List, Tuple, Union
+
+import gevent
+from gevent.queue import Queue
+
+from lib.utils.logger import Logger
+from lib.utils.metrics import metrics
+from lib.utils.request_helper import parse_raw_request
+
+# Экспорт Burp Suite определяется по XML-декларации в начале файла
+BURP_EXPORT_HEAD_SIZE = 1024
+BURP_EXPORT_PATTERN = re.compile(r'\s*<\?xml.*\?>')
+# Число файлов, читаемых за одно обращение к пулу потоков: накладные расходы на передачу задачи в поток
+# сопоставимы со временем чтения небольшого файла
+RAW_REQUESTS_BATCH_SIZE = 32
+# Число запросов экспорта Burp Suite, после разбора которых управление передается другим гринлетам
+BURP_YIELD_ITEMS = 100
+
+
+def iter_raw_request_paths(path: str) -> Iterator[str]:
+    """ Лениво обходит файл или папку `path` с сырыми запросами
+
+    В отличие от `os.walk` пути возвращаются по мере чтения папки, а не после получения всего ее содержимого
+
+    :param path: Путь до файла или папки
+    :return: Итератор по путям до файлов
+    """
+    if os.path.isfile(path):
+        yield path
+        return
+
+    directories = [path]
+
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def read_raw_request(path: str) -> Tuple[bool, Union[list, None]]:
+    """ Читает и разбирает файл с сырым запросом
+
+    :return: Кортеж `(is_burp_export, parsed_request)`, где parsed_request - список `[method, url, headers, body]`
+             или None, если файл пуст либо является экспортом Burp Suite
+    """
+    with open(path, errors='replace') as file:
+        head = file.read(BURP_EXPORT_HEAD_SIZE)
+
+        if BURP_EXPORT_PATTERN.match(head):
+            return True, None
+
+        content = head + file.read()
+
+    return False, parse_raw_request(content) if content else None
+
+
+def read_raw_requests(paths: List[str]) -> List[tuple]:
+    """ Читает и разбирает файлы `paths`, выполняется в пуле потоков gevent
+
+    :return: Список кортежей `(path, is_burp_export, parsed_request, error)`
+    """
+    results = []
+
+    for path in paths:
+        try:
+            results.append((path, *read_raw_request(path), None))
+        except Exception as e:
+            results.append((path, False, None, e))
+
+    return results
+
+
+def iter_burp_requests(path: str, logger: Logger) -> Iterator[list]:
+    """ Потоково разбирает XML-экспорт Burp Suite `path`, возвращая запросы по одному
+
+    Обработанные элементы `item` (вместе с ответами) удаляются из дерева сразу после разбора, поэтому потребление
+    памяти не зависит от размера экспорта
+
+    :param path: Путь до экспорта
+    :param logger:
+    :return: Итератор по спискам `[method, url, headers, body]`
+    """
+    from lxml import etree
+
+    events = etree.iterparse(path, events=('end',), tag=('request', 'item'), huge_tree=True, resolve_entities=False)
+
+    for _, element in events:
+        if element.tag == 'request':
+            content = element.text or ''
+
+            try:
+                if element.get('base64') == 'true':
+                    content = b64decode(content).decode('utf8', errors='replace')
+
+                if content:
+                    yield parse_raw_request(content)
+            except Exception as e:
+                logger.warning(f'Не удалось разобрать запрос из {path} (строка {element.sourceline}): {e}')
+        else:
+            element.clear()
+
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+class RawRequestReader:
+    """ Конвейер чтения сырых запросов из файла или папки
+
+    Обход папки, чтение и разбор файлов выполняются гринлетами параллельно с потреблением запросов, а очереди
+    между этапами ограничены, поэтому подготовка первых запросов начинается до окончания чтения папки,
+    а память не зависит от числа файлов. Файлы читаются и разбираются в пуле потоков gevent, чтобы блокирующие
+    операции с диском не останавливали работу с сетью
+    """
+
+    def __init__(self, path: str, workers: int, queue_size: int, logger: Logger):
+        """
+        :param path: Путь до файла или папки с сырыми запросами и экспортами Burp Suite
+        :param workers: Число гринлетов, одновременно читающих файлы
+        :param queue_size: Максимальное число порций путей и разобранных запросов, ожидающих обработки
+        :param logger:
+        """
+        self.path = path
+        self.workers = max(workers, 1)
+        self.queue_size = queue_size
+        self.logger = logger
+
+        self.statistics = {'files': 0, 'burp_exports': 0, 'requests': 0, 'errors': 0}
+
+    def __iter__(self) -> Iterator[list]:
+        paths = Queue(self.queue_size)
+        requests = Queue(self.queue_size)
+
+        greenlets = [gevent.spawn(self.walk, paths)]
+        greenlets += [gevent.spawn(self.read, paths, requests) for _ in range(self.workers)]
+
+        try:
+            finished = 0
+
+            # Каждый читающий гринлет по завершении помещает в очередь None
+            while finished < self.workers:
+                parsed_request = requests.get()
+
+                if parsed_request is None:
+                    finished += 1
+                    continue
+
+                self.statistics['requests'] += 1
+                yield parsed_request
+        finally:
+            gevent.killall(greenlets)
+
+        self.logger.info('Статистика чтения сырых запросов:\n\t{}'.format(
+            ', '.join(['='.join([k, str(v)]) for k, v in self.statistics.items()])))
+
+    def walk(self, paths: Queue):
+        batch = []
+
+        try:
+            for path in iter_raw_request_paths(self.path):
+                batch.append(path)
+
+                if len(batch) >= RAW_REQUESTS_BATCH_SIZE:
+                    paths.put(batch)
+                    batch = []
+        except OSError as e:
+            self.statistics['errors'] += 1
+            self.logger.error(f'Не удалось прочитать папку {self.path}: {e}')
+        finally:
+            if batch:
+                paths.put(batch)
+
+            for _ in range(self.workers):
+                paths.put(None)
+
+    def read(self, paths: Queue, requests: Queue):
+        threadpool = gevent.get_hub().threadpool
+
+        try:
+            for batch in iter(paths.get, None):
+                with metrics.phase('ingest'):
+                    results = threadpool.apply(read_raw_requests, (batch,))
+
+                for path, is_burp_export, parsed_request, error in results:
+                    self.statistics['files'] += 1
+
+                    try:
+                        if error is not None:
+                            raise error
+
+                        if parsed_request is not None:
+                            requests.put(parsed_request)
+                        elif is_burp_export:
+                            self.read_burp_export(path, requests)
+                    except Exception as e:
+                        self.statistics['errors'] += 1
+                        self.logger.warning(f'Не удалось разобрать сырой запрос {path}: {e}')
+        finally:
+            requests.put(None)
+
+    def read_burp_export(self, path: str, requests: Queue):
+        self.statistics['burp_exports'] += 1
+        burp_requests = iter_burp_requests(path, self.logger)
+
+        for i in count():
+            if i % BURP_YIELD_ITEMS == 0:
+                gevent.sleep(0)
+
+            with metrics.phase('ingest'):
+                parsed_request = next(burp_requests, None)
+
+            if parsed_request is None:
+                break
+
+            requests.put(parsed_request)
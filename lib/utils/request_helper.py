@@ -2,99 +2,204 @@ import argparse
 import logging
 import random
 import re
-from typing import List, Union, Callable, Tuple
+from hashlib import md5
+from http.cookiejar import DefaultCookiePolicy
+from time import perf_counter
+from typing import Iterable, Iterator, List, Union, Callable, Tuple
 from urllib.parse import urlparse, quote_plus
 
 import gevent
+from gevent.pool import Pool
 import lxml.html
-import math
+from lxml import etree
 import requests
-from bs4 import BeautifulSoup
 from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
 from requests.cookies import cookiejar_from_dict
 from requests.utils import super_len
 
-from lib.constants import CACHE_BUSTER_ALF
+from lib.constants import CACHE_BUSTER_ALF, MAX_HOST_POOLS, STREAM_CHUNK_SIZE
+from lib.utils.cpu_executor import CPUJobTimeoutError, cpu_executor
 from lib.utils.logger import Logger
+from lib.utils.metrics import metrics
+from lib.utils.simhash import get_simhash, hamming_distance
+
+
+class FinderState:
+    """ Состояние поиска параметров одного типа для запроса """
+    __slots__ = ('bucket', 'value_breaker', 'base_value', 'value')
+
+    def __init__(self, value_breaker: str):
+        self.bucket: int = None  # Размер порции искомых параметров
+        self.value_breaker = value_breaker  # Суффикс `self.base_value` для определения аномалий
+        self.base_value: str = None  # Базовое значение всех значений параметров
+        self.value: str = None  # Актуальное значение всех значений параметров
+
+
+class OriginResponse:
+    """ Эталонный ответ, сокращенный до полей, которые используются при проверках ответов """
+    __slots__ = ('url', 'status_code', 'headers', 'encoding', 'text')
+
+    def __init__(self, response: Response):
+        self.url = response.url
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.encoding = response.encoding or response.apparent_encoding or 'utf-8'
+        self.text = response.text
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode(self.encoding, errors='replace')
 
 
 class RequestInfo:
+    __slots__ = ('request', '_response', 'origin_url', '_parsed_url', 'response_html_tags_count', 'response_simhash',
+                 'simhash_threshold', '_origin_views', 'additional_params', 'url_state', 'body_state', 'json_state',
+                 'header_state', 'cookie_state')
+
+    # Суффиксы значений параметров, общие для всех запросов
+    URL_VALUE_BREAKER = quote_plus('\'"`%${{|\\')
+    BODY_VALUE_BREAKER = quote_plus('\'"`%${{|\\')
+    JSON_VALUE_BREAKER = '\'"`%${{|\\'
+    HEADER_VALUE_BREAKER = '\'"`%${{|\\'
+    COOKIE_VALUE_BREAKER = '\'"`%${{|\\'  # кодировать символы ,;
+
     def __init__(self, request: PreparedRequest):
         self.request = request
 
-        self._response: Response = None
+        self._response: OriginResponse = None
         self.origin_url = request.url
-        self.netloc = urlparse(request.url).netloc
-        self.response_html_tags_count: int = None
+        self._parsed_url = None
+        self.response_html_tags_count: Union[int, None] = None
+        self.response_simhash: int = None  # Отпечаток структуры эталонной HTML страницы
+        self.simhash_threshold: int = None  # Максимальное расстояние между отпечатками похожих страниц
+        # Эталонные ответы, усеченные до размеров ответов с ограниченным телом
+        # Формат: {body_cap: {'text': str, 'html_tags_count': Union[int, None], 'simhash': Union[int, None]}, ...}
+        self._origin_views: dict = None
 
         self.additional_params: list = []  # Список дополнительных параметров для данного запроса
 
-        self.url_param_bucket: int = None  # Размер порции искомых параметров в URL (в байтах)
-        self.url_param_value_breaker = quote_plus('\'"`%${{|\\')
-        self.url_base_param_value: str = None  # Базовое значение всех значений URL параметров
-        self.url_param_value: str = None  # Актуальное значение всех значений URL параметров
+        self.url_state = FinderState(self.URL_VALUE_BREAKER)  # Порция - размер URL параметров (в байтах)
+        # Порция - размер параметров в теле запроса (в байтах), общая для x-www-form-urlencoded и json
+        self.body_state = FinderState(self.BODY_VALUE_BREAKER)
+        self.json_state = FinderState(self.JSON_VALUE_BREAKER)
+        self.header_state = FinderState(self.HEADER_VALUE_BREAKER)  # Порция - число проверяемых хидеров
+        self.cookie_state = FinderState(self.COOKIE_VALUE_BREAKER)  # Порция - размер параметров в Cookie (в байтах)
 
-        self.body_param_bucket: int = None  # Размер порции искомых параметров в теле запроса (в байтах)
-        self.body_param_value_breaker = quote_plus('\'"`%${{|\\')
-        self.body_base_param_value: str = None  # Базовое значение всех значений body параметров
-        self.body_param_value: str = None  # Актуальное значение всех значений body параметров
-
-        self.json_param_value_breaker = '\'"`%${{|\\'
-        self.json_base_param_value: str = None  # Базовое значение всех значений body параметров
-        self.json_param_value: str = None  # Актуальное значение всех значений body параметров
+    @property
+    def parsed_url(self):
+        """ Результат `urlparse(self.origin_url)`, вычисляемый однократно """
+        if self._parsed_url is None:
+            self._parsed_url = urlparse(self.origin_url)
 
-        self.header_bucket: int = None  # Размер порции проверяемых хидеров (количество)
-        self.header_value_breaker = '\'"`%${{|\\'  # Суффикс `self.base_header_value` для определения аномалий
-        self.base_header_value: str = None  # Базовое значение всех заголовков
-        self.header_value: str = None  # Актуальное значение всех заголовков
+        return self._parsed_url
 
-        self.cookie_bucket: int = None  # Размер порции проверяемых параметров в Cookie (в байтах)
-        self.cookie_value_breaker = '\'"`%${{|\\'  # кодировать символы ,;
-        self.base_cookie_value: str = None
-        self.cookie_value: str = None
+    @property
+    def netloc(self) -> str:
+        return self.parsed_url.netloc
 
     @property
-    def response(self):
+    def response(self) -> OriginResponse:
         return self._response
 
     @response.setter
     def response(self, value: Response):
+        # После получения эталонного ответа сохраняются только необходимые для проверок поля
         if isinstance(value, Response):
-            self._response = value
-            self.response_html_tags_count: int = self.count_html_tags(value.text)
+            self._response = OriginResponse(value)
+            self.response_html_tags_count: Union[int, None] = self.count_html_tags(self._response.text)
+
+            if self.response_html_tags_count:
+                self.response_simhash = get_simhash(self._response.text)
 
     def copy_request(self):
         return self.request.copy()
 
-    def count_html_tags(self, html: str) -> int:
-        """ Возвращает число тэгов в HTML странице `html`
+    def get_origin_view(self, body_cap: int = 0) -> dict:
+        """ Возвращает текст, число тэгов и отпечаток эталонного ответа, усеченного до `body_cap` байт
+
+        Ответы на запросы с ограничением тела сравниваются с эталоном, усеченным до того же размера
+
+        :param body_cap: Размер тела в байтах (0 - без усечения)
+        :return: Словарь `{'text': str, 'html_tags_count': Union[int, None], 'simhash': Union[int, None]}`,
+                 где `html_tags_count` равен None, если подсчет тэгов не уложился в --cpu-job-timeout
+        """
+        # Символ в кодировке занимает не более 4 байт, поэтому короткий ответ заведомо не усекается
+        if not body_cap or len(self.response.text) <= body_cap // 4:
+            return {'text': self.response.text, 'html_tags_count': self.response_html_tags_count,
+                    'simhash': self.response_simhash}
+
+        if self._origin_views is None:
+            self._origin_views = {}
+
+        if body_cap not in self._origin_views:
+            content = self.response.content
+
+            if len(content) <= body_cap:
+                text = self.response.text
+                html_tags_count = self.response_html_tags_count
+            else:
+                text = str(content[:body_cap], self.response.encoding, errors='replace')
+                html_tags_count = self.count_html_tags(text)
+
+            self._origin_views[body_cap] = {'text': text, 'html_tags_count': html_tags_count,
+                                            'simhash': get_simhash(text) if html_tags_count else None}
+
+        return self._origin_views[body_cap]
+
+    def count_html_tags(self, html: str) -> Union[int, None]:
+        """ Возвращает число тэгов в HTML странице `html`, выполняя подсчет в пуле процессов
+
+        Если страница превышает --cpu-job-max-size или пул процессов недоступен (например, пересоздан после
+        таймаута другой задачи), то подсчет выполняется на месте
 
         :param html: Контент HTML страницы
-        :return: int
+        :return: Число тэгов или None, если подсчет не уложился в --cpu-job-timeout
         """
         try:
-            if lxml.html.fromstring(html).find('.//*') is None:
-                return 0
+            return cpu_executor.submit(count_html_tags, html)
+        except CPUJobTimeoutError:
+            return None
+        except Exception:
+            return count_html_tags(html)
 
-            soup = BeautifulSoup(html, features='lxml')
-            return len(soup.find_all())
-        except Exception as e:
-            return 0
+    def is_html_similar(self, html: str, body_cap: int = 0) -> bool:
+        """ Проверяет, совпадает ли структура HTML страницы `html` со структурой эталонного ответа
+
+        Страницы считаются похожими, если расстояние Хэмминга между их simhash-отпечатками не превышает
+        `self.simhash_threshold`. Отрицательный порог отключает проверку
+
+        :param html: Контент HTML страницы
+        :param body_cap: Размер, до которого было усечено тело ответа `html` (0 - без усечения)
+        :return: True, если страницы похожи, иначе False
+        """
+        origin_simhash = self.get_origin_view(body_cap)['simhash']
+
+        if origin_simhash is None or self.simhash_threshold is None or self.simhash_threshold < 0:
+            return False
+
+        return hamming_distance(origin_simhash, get_simhash(html)) <= self.simhash_threshold
 
     def setup_header_properties(self, max_header_value):
-        """ Устанавливает свойства `self.base_header_value` и `self.header_value` """
-        self.base_header_value = ''.join(
-            [random.choice(CACHE_BUSTER_ALF) for _ in range(max_header_value - len(self.header_value_breaker))])
-        self.header_value = self.base_header_value + self.header_value_breaker
+        """ Устанавливает свойства `self.header_state.base_value` и `self.header_state.value` """
+        state = self.header_state
+        state.base_value = ''.join(
+            [random.choice(CACHE_BUSTER_ALF) for _ in range(max_header_value - len(state.value_breaker))])
+        state.value = state.base_value + state.value_breaker
 
     def setup_param_properties(self, max_param_value):
-        """ Устанавливает свойства `self.url_base_param_value` и `self.url_param_value` """
-        self.url_base_param_value = ''.join(
-            [random.choice(CACHE_BUSTER_ALF) for _ in range(max_param_value - len(self.url_param_value_breaker))])
-        self.url_param_value = self.url_base_param_value + self.url_param_value_breaker
+        """ Устанавливает свойства `self.url_state.base_value` и `self.url_state.value` """
+        state = self.url_state
+        state.base_value = ''.join(
+            [random.choice(CACHE_BUSTER_ALF) for _ in range(max_param_value - len(state.value_breaker))])
+        state.value = state.base_value + state.value_breaker
 
 
 class RequestHelper:
+    # Общие сессии по набору прокси и размер пула соединений с одним хостом в них
+    _sessions = {}
+    host_connections = 10
+
     def __init__(self, info_list: List[RequestInfo], arguments: argparse.Namespace, logger: logging.Logger):
         self.info_list = info_list
         self.arguments = arguments
@@ -114,32 +219,131 @@ class RequestHelper:
 
     @staticmethod
     def do_request(prepared_request: PreparedRequest, retry: int, timeout: int, delay: int, proxies: dict, allow_redirects: bool,
-                   logger: Logger, propagate_exceptions: bool = False) -> Union[Response, None]:
+                   logger: Logger, propagate_exceptions: bool = False, body_cap: int = 0,
+                   drain_body: bool = False) -> Union[Response, None]:
         """ Выполняет подготовленных запрос
 
+        :param body_cap: Максимальный размер сохраняемого тела ответа в байтах (0 - без ограничений)
+        :param drain_body: Дочитывать тело ответа сверх `body_cap` для подсчета его хэша
         :return:    `None` - если по истечении `retry` попыток не удалось получить ответ от сервера
                     `Response` - если удалось получить ответ от сервера
         """
-        # Создается объект сессии, через которых отправляются PreparedRequest'ы
-        with RequestHelper.make_session(proxies) as session:
-            # Пытаемся получить ответ в течении `retry` раз
-            while retry:
-                retry -= 1
-
-                try:
-                    gevent.sleep(delay)
-                    response = session.send(prepared_request, allow_redirects=allow_redirects, timeout=timeout)
-                    return response
-                except Exception as e:
-                    # В случае дебаг режима выводим текст ошибки в stdout
-                    # Поднимаем исключение "вверх"
-                    if propagate_exceptions:
-                        raise e
-
-                    continue
+        host = urlparse(prepared_request.url).netloc
+        attempts = 0
+
+        # Общая сессия, через которую отправляются PreparedRequest'ы, хранит keep-alive соединения между вызовами
+        session = RequestHelper.get_session(proxies)
+
+        # Пытаемся получить ответ в течении `retry` раз
+        while retry:
+            retry -= 1
+
+            if attempts:
+                metrics.inc('retries', host=host)
+            attempts += 1
+
+            try:
+                gevent.sleep(delay)
+
+                start = perf_counter()
+                response = session.send(prepared_request, allow_redirects=allow_redirects, timeout=timeout,
+                                        stream=bool(body_cap))
+
+                if body_cap:
+                    RequestHelper.read_capped_body(response, body_cap, drain_body)
+
+                metrics.observe('request_duration_seconds', perf_counter() - start, host=host)
+                metrics.inc('responses', host=host, status=response.status_code)
+                metrics.inc('request_bytes', get_request_size(prepared_request), host=host)
+                metrics.inc('response_body_bytes', response.body_length if body_cap else len(response.content),
+                            host=host)
+
+                return response
+            except Exception as e:
+                metrics.inc('request_errors', host=host)
+
+                # В случае дебаг режима выводим текст ошибки в stdout
+                # Поднимаем исключение "вверх"
+                if propagate_exceptions:
+                    raise e
+
+                continue
 
         return None
 
+    @staticmethod
+    def read_capped_body(response: Response, body_cap: int, drain_body: bool = False):
+        """ Потоково читает тело ответа `response`, сохраняя не более `body_cap` байт
+
+        При превышении ограничения соединение закрывается, либо, если указан `drain_body`, оставшаяся часть
+        тела дочитывается без сохранения. В ответ добавляются свойства:
+            `body_cap` - ограничение, с которым было прочитано тело;
+            `body_truncated` - было ли тело усечено;
+            `body_length` - число прочитанных байт тела;
+            `body_hash` - md5 хэш всего тела, либо `None`, если тело усечено и не дочитано: хэш прочитанного
+                начала тела не совпадал бы у ответов, различающихся только за пределами ограничения
+
+        :param response: Ответ, полученный с `stream=True`
+        :param body_cap: Максимальный размер сохраняемого тела ответа в байтах
+        :param drain_body: Дочитывать тело ответа для подсчета хэша
+        """
+        body = bytearray()
+        body_hash = md5()
+        body_length = 0
+        body_truncated = False
+        body_consumed = False
+
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                if len(body) < body_cap:
+                    body += chunk[:body_cap - len(body)]
+
+                body_hash.update(chunk)
+                body_length += len(chunk)
+
+                if body_length > body_cap:
+                    body_truncated = True
+
+                    if not drain_body:
+                        break
+            else:
+                body_consumed = True
+        finally:
+            # Закрываем соединение, если тело прочитано не полностью, иначе оно возвращается в пул keep-alive
+            if not body_consumed:
+                response.close()
+
+        response._content = bytes(body)
+        response._content_consumed = True
+
+        response.body_cap = body_cap
+        response.body_truncated = body_truncated
+        response.body_length = body_length
+        response.body_hash = None if body_truncated and not drain_body else body_hash.hexdigest()
+
+    @staticmethod
+    def setup_sessions(host_connections: int):
+        """ Задает размер пула keep-alive соединений с одним хостом для общих сессий
+
+        :param host_connections: Максимальное число сохраняемых соединений с одним хостом
+        """
+        RequestHelper.host_connections = host_connections
+
+        for session in RequestHelper._sessions.values():
+            session.close()
+
+        RequestHelper._sessions.clear()
+
+    @staticmethod
+    def get_session(proxies=None) -> Session:
+        """ Возвращает общую для всех запросов сессию с заданными прокси, создавая ее при первом обращении """
+        key = tuple(sorted(proxies.items())) if proxies else None
+
+        if key not in RequestHelper._sessions:
+            RequestHelper._sessions[key] = RequestHelper.make_session(proxies)
+
+        return RequestHelper._sessions[key]
+
     @staticmethod
     def make_session(proxies=None) -> Session:
         """ Создаёт сессию для отправки подготовленных запросов """
@@ -149,6 +353,14 @@ class RequestHelper:
         if proxies:
             session.proxies = proxies
 
+        # Сессия общая для всех запросов, поэтому куки из ответов в ней не сохраняются
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        # pool_connections - число хранимых пулов (по одному на хост), pool_maxsize - соединений в пуле хоста
+        adapter = HTTPAdapter(pool_connections=MAX_HOST_POOLS, pool_maxsize=RequestHelper.host_connections)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
         return session
 
     @staticmethod
@@ -164,24 +376,30 @@ class RequestHelper:
         return RequestHelper.do_request(origin_request.copy(), retry, timeout, delay, proxies, allow_redirects, logger)
 
     @staticmethod
-    def set_origin_responses(requests_list: List[RequestInfo], threads: int, retry: int, timeout: int, delay: int,
-                             proxies: dict, allow_redirects: bool, logger: Logger):
-        """ Помещает изначальные ответы от сервера в соответствующие объекты из `info_list` """
-        worker = lambda chunk: [
-            RequestHelper.get_origin_response(request, retry, timeout, delay, proxies, allow_redirects, logger) for
-            request in chunk]
-        prepared_requests = [info.request for info in requests_list]
+    def iter_origin_responses(requests_list: Iterable[RequestInfo], threads: int, retry: int, timeout: int, delay: int,
+                              proxies: dict, allow_redirects: bool, logger: Logger) -> Iterator[RequestInfo]:
+        """ Получает изначальные ответы от сервера для запросов из `requests_list` не более чем в `threads` гринлетах
 
-        chunk_size = math.ceil(len(prepared_requests) / threads)
-        request_chunks = [prepared_requests[i:i + chunk_size] for i in
-                          range(0, len(prepared_requests), chunk_size)]
+        Освободившийся гринлет забирает следующий запрос, поэтому медленный хост не задерживает остальные запросы,
+        а запросы возвращаются по мере получения ответов. `requests_list` может быть ленивым итератором
 
-        jobs = [gevent.spawn(worker, request_chunk) for request_chunk in request_chunks]
-        gevent.joinall(jobs)
+        :return: Итератор по объектам из `requests_list` с установленным `response` (None, если ответ не получен)
+        """
+        def worker(info: RequestInfo) -> RequestInfo:
+            with metrics.phase('baseline'):
+                info.response = RequestHelper.get_origin_response(info.request, retry, timeout, delay, proxies,
+                                                                  allow_redirects, logger)
+            return info
+
+        return Pool(threads).imap_unordered(worker, requests_list, maxsize=threads)
 
-        origin_responses = sum([job.value for job in jobs], [])
-        for request_info, origin_response in zip(requests_list, origin_responses):
-            request_info.response = origin_response
+    @staticmethod
+    def set_origin_responses(requests_list: List[RequestInfo], threads: int, retry: int, timeout: int, delay: int,
+                             proxies: dict, allow_redirects: bool, logger: Logger):
+        """ Помещает изначальные ответы от сервера в соответствующие объекты из `info_list` """
+        for _ in RequestHelper.iter_origin_responses(requests_list, threads, retry, timeout, delay, proxies,
+                                                     allow_redirects, logger):
+            pass
 
     @staticmethod
     def filter_requests(requests_list: List[RequestInfo], bad_condition: Callable,
@@ -215,6 +433,50 @@ class RequestHelper:
         return filtered_requests
 
 
+class TagCounter:
+    """ Цель парсера lxml, считающая открывающие тэги без построения дерева """
+
+    def __init__(self):
+        self.count = 0
+
+    def start(self, tag: str, attrib: dict):
+        self.count += 1
+
+    def close(self) -> int:
+        return self.count
+
+
+def count_html_tags(html: str) -> int:
+    """ Возвращает число тэгов в HTML странице `html`
+
+    Парсер lxml передает цели те же события, что и построителю дерева BeautifulSoup с features='lxml',
+    поэтому число тэгов совпадает с `len(BeautifulSoup(html, features='lxml').find_all())`
+
+    :param html: Контент HTML страницы
+    :return: int
+    """
+    try:
+        if lxml.html.fromstring(html).find('.//*') is None:
+            return 0
+
+        parser = etree.HTMLParser(target=TagCounter())
+        parser.feed(html)
+        return parser.close()
+    except Exception as e:
+        return 0
+
+
+def get_request_size(request: PreparedRequest) -> int:
+    """ Возвращает примерный размер запроса в байтах: стартовая строка, заголовки и тело """
+    size = len(request.method or '') + len(request.url or '') + 12
+    size += sum([len(k) + len(str(v)) + 4 for k, v in request.headers.items()])
+
+    if request.body:
+        size += len(request.body)
+
+    return size
+
+
 def parse_raw_request(raw_request: str) -> list:
     """ Парсит сырой запрос и вычленяет из него метод, url-адрес, заголовки и тело запроса
 
@@ -238,6 +500,7 @@ def parse_raw_request(raw_request: str) -> list:
     return [method, url, headers, body]
 
 
+@metrics.timed('scheme_detection')
 def get_request_object(method: str, url: str, headers: dict, body: str, retry: int, timeout: int, delay: int,
                        proxies: dict, allow_redirects: bool, logger: Logger) -> Union[requests.PreparedRequest, None]:
     """ Формирует из кортежа `(method, url, headers, body)` объект класса PreparedRequest
@@ -265,70 +528,44 @@ def get_request_object(method: str, url: str, headers: dict, body: str, retry: i
     return prepared_request
 
 
-def get_request_objects(parsed_requests: list, arguments: argparse.Namespace, logger: Logger) -> Tuple:
-    """ Применяет функцию `get_request_object` на запросы из `parsed_requests` с числом потоков `threads`
+def iter_request_objects(parsed_requests: Iterable[list], arguments: argparse.Namespace,
+                         logger: Logger) -> Iterator[Tuple[list, Union[PreparedRequest, None]]]:
+    """ Применяет функцию `get_request_object` на запросы из `parsed_requests` не более чем в `arguments.threads`
+    гринлетах
 
-    :param parsed_requests:
-    :param arguments:
-    :param logger:
+    Запросы забираются из `parsed_requests` по мере освобождения гринлетов, поэтому итератор может быть ленивым,
+    а подготовленные запросы возвращаются по мере готовности, не дожидаясь медленных хостов
 
-    :return:    Кортеж `(prepared_requests, not_prepared_requests)`, где prepared_requests - список объектов класса
-                `requests.PreparedRequest`, а not_prepared_requests - список неподготовленных URL'ов типа `str`
+    :return: Итератор по кортежам `(parsed_request, prepared_request)`, где prepared_request - объект класса
+             `requests.PreparedRequest` или None, если запрос подготовить не удалось
     """
-    threads = arguments.threads
     retry = arguments.retry
     timeout = arguments.timeout
     delay = arguments.delay
     proxies = arguments.proxy
     allow_redirects = arguments.allow_redirects
 
-    def worker(requests_chunk):
-        return [get_request_object(*parsed_request, retry=retry, timeout=timeout, delay=delay, proxies=proxies,
-                                   allow_redirects=allow_redirects, logger=logger) for parsed_request in
-                requests_chunk]
-
-    # Если требуется установить тело запроса
-    if arguments.body is not None:
-        _parsed_requests = []
-
-        for parsed_request in parsed_requests:
-            # Если метод запроса не отвечает за "действие", то пропускаем
-            if parsed_request[0].upper() in {'GET', 'HEAD', 'OPTIONS', 'TRACE', 'CONNECT'}:
-                _parsed_requests.append(parsed_request)
-                continue
-
-            # Если тело запроса установлено, то пропускаем
-            if parsed_request[3]:
-                _parsed_requests.append(parsed_request)
-                continue
-
-            # Иначе меняем тело запроса и тип контента
-            parsed_request[3] = arguments.body
-            parsed_request[2]['Content-Type'] = 'application/x-www-form-urlencoded'
-
-            _parsed_requests.append(parsed_request)
-
-        parsed_requests = _parsed_requests
+    def worker(parsed_request):
+        # Если требуется установить тело запроса
+        if arguments.body is not None:
+            set_request_body(parsed_request, arguments.body)
 
-    # Создаем порции с распаршенными запросами
-    chunk_size = math.ceil(len(parsed_requests) / threads)
-    req_chunks = [parsed_requests[i:i + chunk_size] for i in range(0, len(parsed_requests), chunk_size)]
+        return parsed_request, get_request_object(*parsed_request, retry=retry, timeout=timeout, delay=delay,
+                                                  proxies=proxies, allow_redirects=allow_redirects, logger=logger)
 
-    # Запускаем воркеры
-    jobs = [gevent.spawn(worker, chunk) for chunk in req_chunks]
-    gevent.joinall(jobs)
+    return Pool(arguments.threads).imap_unordered(worker, parsed_requests, maxsize=arguments.threads)
 
-    # Получаем результаты
-    _requests = sum([job.value for job in jobs], [])
 
-    prepared_requests = []
-    not_prepared_requests = []
+def set_request_body(parsed_request: list, body: str):
+    """ Устанавливает тело `body` типа x-www-form-urlencoded запросу `[method, url, headers, body]` """
+    # Если метод запроса не отвечает за "действие", то пропускаем
+    if parsed_request[0].upper() in {'GET', 'HEAD', 'OPTIONS', 'TRACE', 'CONNECT'}:
+        return
 
-    # Разбиваем запросы на подготовленные и неподготовленные
-    for prepared_request, parsed_request in zip(_requests, parsed_requests):
-        if prepared_request is None:
-            not_prepared_requests.append(parsed_request[1])
-        else:
-            prepared_requests.append(prepared_request)
+    # Если тело запроса установлено, то пропускаем
+    if parsed_request[3]:
+        return
 
-    return prepared_requests, not_prepared_requests
+    # Иначе меняем тело запроса и тип контента
+    parsed_request[3] = body
+    parsed_request[2]['Content-Type'] = 'application/x-www-form-urlencoded'
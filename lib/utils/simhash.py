@@ -0,0 +1,68 @@
+import re
+from functools import lru_cache
+from hashlib import md5
+
+# Открывающий тэг: имя тэга и строка с его аттрибутами
+TAG_REGEX = re.compile(r'<([a-zA-Z][a-zA-Z0-9:-]*)([^>]*)>')
+# Название аттрибута тэга (значения аттрибутов не учитываются, т.к. содержат токены, id и т.п.)
+ATTR_REGEX = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]*))?')
+
+SIMHASH_BITS = 64
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hash(shingle: str) -> int:
+    """ Возвращает 64-битный хэш шингла `shingle` """
+    return int.from_bytes(md5(shingle.encode('utf8')).digest()[:8], 'big')
+
+
+def get_dom_shingles(html: str) -> list:
+    """ Разбивает HTML страницу `html` на шинглы вида `(тэг1[аттрибуты], тэг2[аттрибуты])` из соседних тэгов
+
+    Учитывается только структура документа: имена тэгов и названия их аттрибутов
+
+    :param html: Контент HTML страницы
+    :return: Список шинглов
+    """
+    tokens = []
+
+    for match in TAG_REGEX.finditer(html):
+        attrs = ','.join(sorted(set(ATTR_REGEX.findall(match.group(2)))))
+        tokens.append(match.group(1).lower() + '[' + attrs + ']')
+
+    if len(tokens) < 2:
+        return tokens
+
+    return [' '.join(pair) for pair in zip(tokens, tokens[1:])]
+
+
+def get_simhash(html: str) -> int:
+    """ Вычисляет simhash структуры HTML страницы `html` за линейное от размера страницы время
+
+    :param html: Контент HTML страницы
+    :return: 64-битный отпечаток
+    """
+    weights = [0] * SIMHASH_BITS
+
+    # Вес шингла равен числу его повторений, поэтому изменение числа однотипных элементов
+    # (строк таблиц, пунктов списков и т.п.) отражается на отпечатке
+    for shingle in get_dom_shingles(html):
+        shingle_hash = _shingle_hash(shingle)
+
+        for bit in range(SIMHASH_BITS):
+            if shingle_hash >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """ Возвращает число различающихся бит у отпечатков `a` и `b` """
+    return bin(a ^ b).count('1')
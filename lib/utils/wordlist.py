@@ -0,0 +1,309 @@
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+from hashlib import md5
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# Формат скомпилированного словаря:
+#   MAGIC | count, max_length, groups_count | groups_count * (length, start, offset) | слова
+# Слова уникальны, отсортированы по длине в байтах UTF-8, а внутри группы одной длины - лексикографически,
+# и записаны подряд без разделителей: положение слова вычисляется по таблице групп
+MAGIC = b'SUSWL01\n'
+HEADER = struct.Struct('<III')
+GROUP = struct.Struct('<IIQ')
+
+
+class WordChunk(Sequence):
+    """ Порция подряд идущих слов скомпилированного словаря без исключенных слов
+
+    Слова декодируются только при обращении к порции, поэтому формирование порций не зависит от размера словаря
+    """
+    __slots__ = ('wordlist', 'start', 'end', 'excluded')
+
+    def __init__(self, wordlist: 'Wordlist', start: int, end: int, excluded: Tuple[int, ...] = ()):
+        self.wordlist = wordlist
+        self.start = start
+        self.end = end
+        self.excluded = excluded
+
+    def __len__(self) -> int:
+        return self.end - self.start - len(self.excluded)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.start, self.end):
+            if i not in self.excluded:
+                yield self.wordlist[i]
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            return list(self)[key]
+
+        if key < 0:
+            key += len(self)
+
+        if not 0 <= key < len(self):
+            raise IndexError('Индекс слова вне порции')
+
+        # Исключенные слова отсортированы: каждое, стоящее не дальше искомого, сдвигает его на одну позицию
+        index = self.start + key
+        for excluded in self.excluded:
+            if excluded > index:
+                break
+            index += 1
+
+        return self.wordlist[index]
+
+    def __repr__(self):
+        return f'WordChunk({list(self)})'
+
+
+class Wordlist(Sequence):
+    """ Скомпилированный словарь, загружаемый через mmap
+
+    Страницы файла разделяются всеми искателями и процессами, а проверка вхождения слова выполняется
+    бинарным поиском без построения множества
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError('Файл не является скомпилированным словарем')
+
+        self._buffer = buffer
+        self._count, self.max_length, groups_count = HEADER.unpack_from(buffer, len(MAGIC))
+
+        position = len(MAGIC) + HEADER.size
+        self._groups = [GROUP.unpack_from(buffer, position + i * GROUP.size) for i in range(groups_count)]
+        self._data_start = position + groups_count * GROUP.size
+
+        self._starts = [start for _, start, _ in self._groups]
+        self._lengths = {length: i for i, (length, _, _) in enumerate(self._groups)}
+
+    @classmethod
+    def open(cls, path: str) -> 'Wordlist':
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                raise ValueError(f'Файл {path} пуст')
+
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'Wordlist':
+        return cls(build_wordlist(words))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError('Индекс слова вне словаря')
+
+        return self._get_raw(index).decode('utf8')
+
+    def __iter__(self) -> Iterator[str]:
+        for length, start, offset in self._groups:
+            end = self._get_group_end(start)
+            position = self._data_start + offset
+
+            for _ in range(start, end):
+                yield self._buffer[position:position + length].decode('utf8')
+                position += length
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.index_of(word) is not None
+
+    def index_of(self, word: str) -> Union[int, None]:
+        """ Возвращает индекс слова `word` в словаре или None, если его там нет """
+        data = word.encode('utf8')
+        group = self._lengths.get(len(data))
+
+        if group is None:
+            return None
+
+        low, high = self._groups[group][1], self._get_group_end(self._groups[group][1])
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._get_raw(middle) < data:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low if low < self._get_group_end(self._groups[group][1]) and self._get_raw(low) == data else None
+
+    def get_chunks(self, exclude: Iterable[str] = (), bucket: int = 0, overhead: int = 0,
+                   max_words: int = 0) -> List[WordChunk]:
+        """ Разбивает словарь на порции без слов из `exclude`
+
+        Порция вмещает слова, суммарный размер которых (длина слова в байтах + `overhead`) не превышает `bucket`,
+        но не менее одного слова. Длина слов внутри группы одинакова, поэтому границы порций вычисляются
+        арифметически за время, пропорциональное числу порций
+
+        :param exclude: Слова, которые не нужно проверять (например, уже присутствующие в запросе)
+        :param bucket: Максимальный размер порции (0 - без ограничений)
+        :param overhead: Дополнительный размер каждого слова в запросе (разделители, значение)
+        :param max_words: Максимальное число слов в порции (0 - без ограничений)
+        :return: Список порций
+        """
+        indices = (self.index_of(word) for word in set(exclude))
+        excluded = sorted(index for index in indices if index is not None)
+
+        chunks = []
+        chunk_start, used, count = 0, 0, 0
+
+        def add_chunk(end: int):
+            skipped = excluded[bisect_left(excluded, chunk_start):bisect_left(excluded, end)]
+            chunk = WordChunk(self, chunk_start, end, tuple(skipped))
+
+            if len(chunk):
+                chunks.append(chunk)
+
+        for length, start, _ in self._groups:
+            cost = length + overhead
+            i, end = start, self._get_group_end(start)
+
+            while i < end:
+                fit = (bucket - used) // cost if bucket else end - i
+                if max_words:
+                    fit = min(fit, max_words - count)
+
+                if fit <= 0:
+                    # Слово, не помещающееся в порцию целиком, проверяется отдельной порцией
+                    if not count:
+                        fit = 1
+                    else:
+                        add_chunk(i)
+                        chunk_start, used, count = i, 0, 0
+                        continue
+
+                taken = min(fit, end - i)
+                used += taken * cost
+                count += taken
+                i += taken
+
+        if count:
+            add_chunk(self._count)
+
+        return chunks
+
+    def _get_group_end(self, start: int) -> int:
+        group = bisect_right(self._starts, start)
+        return self._starts[group] if group < len(self._starts) else self._count
+
+    def _get_raw(self, index: int) -> bytes:
+        length, start, offset = self._groups[bisect_right(self._starts, index) - 1]
+        position = self._data_start + offset + (index - start) * length
+
+        return self._buffer[position:position + length]
+
+
+def split_words(words: Iterable[str], bucket: int = 0, overhead: int = 0, max_words: int = 0) -> List[List[str]]:
+    """ Разбивает список слов на порции по тем же правилам, что и `Wordlist.get_chunks` """
+    chunks = []
+    current_chunk = []
+    current_chunk_len = 0
+
+    for word in words:
+        cost = len(word.encode('utf8')) + overhead
+
+        if current_chunk and (bucket and current_chunk_len + cost > bucket or
+                              max_words and len(current_chunk) >= max_words):
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_chunk_len = 0
+
+        current_chunk.append(word)
+        current_chunk_len += cost
+
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    return chunks
+
+
+def build_wordlist(words: Iterable[str]) -> bytes:
+    """ Компилирует слова в формат `Wordlist` """
+    unique = set(words)
+    unique.discard('')
+
+    # Длина в символах может быть меньше длины в байтах
+    max_length = max(map(len, unique), default=0)
+
+    # Устойчивая сортировка по длине сохраняет лексикографический порядок внутри групп
+    encoded = sorted(word.encode('utf8') for word in unique)
+    encoded.sort(key=len)
+
+    groups = []
+    offset = 0
+    for i, data in enumerate(encoded):
+        if not groups or groups[-1][0] != len(data):
+            groups.append((len(data), i, offset))
+        offset += len(data)
+
+    return b''.join([MAGIC, HEADER.pack(len(encoded), max_length, len(groups))] +
+                    [GROUP.pack(*group) for group in groups] + encoded)
+
+
+def iter_words(path: str) -> Iterator[str]:
+    """ Построчно читает слова из текстового или скомпилированного словаря """
+    with open(path, 'rb') as file:
+        compiled = file.read(len(MAGIC)) == MAGIC
+
+    if compiled:
+        yield from Wordlist.open(path)
+        return
+
+    with open(path, encoding='utf8', errors='replace') as file:
+        for line in file:
+            word = line.strip()
+
+            if word:
+                yield word
+
+
+def load_wordlist(paths: List[str], cache_dir: str, kind: str,
+                  word_filter: Callable[[str], bool] = None) -> Wordlist:
+    """ Загружает словари `paths` в виде скомпилированного словаря
+
+    Результат компиляции сохраняется в `cache_dir` под ключом, зависящим от путей, размеров и времени изменения
+    исходных файлов, поэтому повторные запуски только отображают готовый файл в память
+
+    :param paths: Пути до текстовых или скомпилированных словарей
+    :param cache_dir: Папка для скомпилированных словарей
+    :param kind: Тип словаря - часть ключа, т.к. фильтры слов различаются
+    :param word_filter: Функция отбора слов, вызывается только при компиляции
+    :return:
+    """
+    key = md5(kind.encode('utf8'))
+    for path in paths:
+        stat = os.stat(path)
+        key.update(f'{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}'.encode('utf8'))
+
+    compiled_path = os.path.join(cache_dir, f'{kind}-{key.hexdigest()}.swl')
+
+    if os.path.isfile(compiled_path):
+        try:
+            return Wordlist.open(compiled_path)
+        except (OSError, ValueError):
+            pass
+
+    words = (word for path in paths for word in iter_words(path))
+    data = build_wordlist(filter(word_filter, words) if word_filter else words)
+
+    # Если сохранить скомпилированный словарь не удалось, то используем его из памяти
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as file:
+            file.write(data)
+
+        os.replace(file.name, compiled_path)
+    except OSError:
+        return Wordlist(data)
+
+    return Wordlist.open(compiled_path)
@@ -1,2 +1 @@
 from lib.workers.find_secrets import FindSecretsWorker
-from lib.workers.set_bucket import SetBucketWorker
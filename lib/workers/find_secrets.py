@@ -3,8 +3,9 @@ import heapq
 import gevent
 
 from lib.constants import DISCARD_WORDS, RETRY_WORDS, SPLIT_WORDS
-from lib.structures import PrioritizedItem
+from lib.structures import Finding, PrioritizedItem
 from lib.utils.logger import Logger
+from lib.utils.metrics import metrics
 from lib.workers.abstract import AbstractWorker
 
 
@@ -29,12 +30,17 @@ class FindSecretsWorker(AbstractWorker):
 
             self._running = True
 
-            result = work(info, words)
+            # Время этапа включает ожидание ответов сервера в gevent hub
+            with metrics.phase('search'):
+                result = work(info, words)
             # Переключаем контекст после выполненной работы
             gevent.sleep(0)
 
             # Если среди заголовков или параметров нет секретных, то переходим к следующей пачке
             if isinstance(result, int):
+                metrics.inc('chunk_results', result={DISCARD_WORDS: 'discard', RETRY_WORDS: 'retry',
+                                                     SPLIT_WORDS: 'split'}.get(result, 'unknown'))
+
                 if result == DISCARD_WORDS:
                     continue
                 # Если не удалось выполнить запрос, то возвращаем аргументы в очередь
@@ -48,7 +54,8 @@ class FindSecretsWorker(AbstractWorker):
                 else:
                     raise NotImplementedError
             # Если найден конкретный заголовок или параметр
-            elif isinstance(result, dict):
+            elif isinstance(result, Finding):
+                metrics.inc('chunk_results', result='finding')
                 self.results.append(result)
             else:
                 raise NotImplementedError
@@ -1,18 +1,25 @@
-import __init__
-
 import sys
 from time import time
 
-from lib.arguments import parse_args, is_args_valid, prepare_args
-from lib.finders.finder import Finder
-from lib.miners import Miner
-from lib.reporter import Reporter
-from lib.utils.logger import Logger
-from lib.utils.request_helper import RequestHelper, RequestInfo, get_request_objects
+from lib.arguments.parse import parse_args
 
 if __name__ == '__main__':
     # Обработка аргументов командной строки
     args = parse_args()
+
+    # Остальные модули загружаются после разбора аргументов, чтобы --help и ошибки в аргументах не требовали
+    # их импорта. Процессы `cpu_executor` повторно импортируют этот модуль и также не загружают их.
+    # Патчинг gevent должен предшествовать импорту модулей, использующих сеть
+    import __init__
+    from lib.arguments import is_args_valid, prepare_args
+    from lib.finders.finder import Finder
+    from lib.reporter import Reporter
+    from lib.utils.cpu_executor import cpu_executor
+    from lib.utils.endpoints import EndpointClusterer
+    from lib.utils.logger import Logger
+    from lib.utils.metrics import metrics
+    from lib.utils.request_helper import RequestHelper, RequestInfo, iter_request_objects
+
     logger = Logger(args)
 
     # Проверка переданных аргументов на валидность и достаточность
@@ -21,14 +28,79 @@ if __name__ == '__main__':
     # Преобразование аргументов под вид, удобный для работы скрипта
     prepare_args(args, logger)
 
+    # Запускаем исполнитель CPU-ёмких задач (разбор HTML и JS)
+    cpu_executor.setup(args.cpu_workers, args.cpu_job_max_size, args.cpu_job_timeout, logger)
+
+    # Пул keep-alive соединений общей сессии рассчитан на все потоки, одновременно обращающиеся к одному хосту
+    RequestHelper.setup_sessions(args.threads)
+
+    # Запускаем периодическую запись метрик
+    metrics.setup(args.metrics_json, args.metrics_prometheus, args.metrics_interval, logger)
+    metrics.add_collector('cpu_executor', cpu_executor.get_statistics)
+
+    # Запускаем семплирующий профилировщик
+    if args.profile_dir:
+        from lib.utils.profiler import profiler
+
+        profiler.start(args.profile_dir, args.profile_interval / 1000, args.profile_top, logger)
+
     logger.info('Обработка сырых запросов')
 
     start = time()
 
-    # Преобразовываем сырые запросы в объекты типа `requests.PreparedRequest`
-    prepared_requests, not_prepared_requests = get_request_objects(args.raw_requests, args, logger)
+    prepared_requests = []
+    not_prepared_requests = []
+    clusterer = EndpointClusterer()
+
+    def iter_request_infos():
+        """ Подготавливает запросы и возвращает представителей кластеров эндпоинтов по мере готовности """
+        # Преобразовываем сырые запросы в объекты типа `requests.PreparedRequest`
+        for parsed_request, request in iter_request_objects(args.raw_requests, args, logger):
+            if request is None:
+                not_prepared_requests.append(parsed_request[1])
+                continue
+
+            prepared_requests.append(request)
+
+            # Добавляем заголовки в запросы, переданные через командную строку
+            if args.additional_headers:
+                RequestHelper.add_headers(request, args.additional_headers)
+
+            # Объединяем запросы к одному эндпоинту в кластеры, поиск выполняется по первому запросу кластера
+            if args.disable_clustering or clusterer.add(request):
+                yield RequestInfo(request)
+
+    # Поиск по словарю запускается сразу, запросы добавляются в него по мере получения эталонных ответов,
+    # а найденные майнерами параметры - по мере нахождения
+    requests_list = []
+    failed_requests = []
+
+    finder = Finder(requests_list, args, logger)
+    finder.start()
+    metrics.add_collector('finder', lambda: dict(finder.statistics))
 
-    if len(prepared_requests) == 0:
+    # Майнеры также запускаются сразу и загружают страницы запросов по мере получения их эталонных ответов
+    miner = None
+    if not args.disable_mining:
+        from lib.miners import Miner
+
+        miner = Miner(args, requests_list, logger, finder.add_params)
+        miner.start()
+
+    # Получаем эталонный ответ от сервера для каждого из запросов
+    for info in RequestHelper.iter_origin_responses(iter_request_infos(), args.threads, args.retry, args.timeout,
+                                                    args.delay, args.proxy, args.allow_redirects, logger):
+        if info.response is None:
+            failed_requests.append(info.request.method + ' ' + info.origin_url)
+            continue
+
+        requests_list.append(info)
+        finder.add_info(info)
+
+        if miner:
+            miner.add_info(info)
+
+    if not prepared_requests:
         logger.error('Не удалось обработать запросы')
         sys.exit(1)
 
@@ -37,43 +109,51 @@ if __name__ == '__main__':
 
     logger.info(f'Подготовлено запросов: {len(prepared_requests)}')
 
-    # Добавляем заголовки в запросы, переданные через командную строку
-    if args.additional_headers:
-        logger.info('Добавление заголовков -H к запросам')
-        for request in prepared_requests:
-            RequestHelper.add_headers(request, args.additional_headers)
+    clusters = clusterer.get_clusters()
+    if not args.disable_clustering and len(clusters) < len(prepared_requests):
+        logger.info(f'Запросы объединены в кластеры эндпоинтов: {len(prepared_requests)} -> {len(clusters)}')
 
-    # Преобразуем список PreparedRequest в список RequestInfo
-    requests_list = [RequestInfo(request) for request in prepared_requests]
+        for cluster in clusters:
+            if len(cluster) > 1:
+                logger.debug(f'{cluster}: {[request.url for request in cluster.members]}')
 
-    # Получаем эталонный ответ от сервера для каждого из запросов
-    logger.info('Получение эталонного ответа от сервера для каждого из запросов')
-    RequestHelper.set_origin_responses(requests_list, args.threads, args.retry, args.timeout, args.delay, args.proxy,
-                                       args.allow_redirects, logger)
+    # Запросы, на которые не удалость получить ответы
+    if failed_requests:
+        logger.warning(f'Следующие запросы не получили изначальный ответ от сервера: {failed_requests}')
 
-    # Фильтруем запросы, на которые не удалость получить ответы
-    requests_list = RequestHelper.filter_requests(requests_list, lambda x: x.response is None,
-                                                  'Следующие запросы не получили изначальный ответ от сервера',
-                                                  'Не удалось получить изначальные ответы на все запросы', logger)
-    if requests_list is None:
-        exit()
+    if not requests_list:
+        logger.error('Не удалось получить изначальные ответы на все запросы')
+        sys.exit(1)
 
     # Если требуется собрать параметры со страниц
-    if not args.disable_mining:
-        miner = Miner(args, requests_list, logger)
-        params, miner_statistics = miner.run()
+    if miner:
+        miner.close()
+        params, miner_statistics = miner.join()
 
         if params:
             miner_statistics = ', '.join(['='.join([k, str(v)]) for k, v in miner_statistics.items()])
             logger.info('Статистика по найденным параметрам:\n\t{}'.format(miner_statistics))
 
-            for info in requests_list:
-                info.additional_params = list(params.get(info.netloc, {}))
+    finder.close()
+    results = finder.join()
 
-    results = Finder(requests_list, args, logger).run()
+    # Проверяем найденные параметры на остальных запросах кластеров
+    if args.verify_clusters:
+        with metrics.phase('verification'):
+            results = finder.verify_clusters(clusters)
 
     stop = time()
 
+    cpu_executor.shutdown()
+    cpu_statistics = ', '.join(['='.join([k, str(v)]) for k, v in cpu_executor.get_statistics().items()])
+    logger.info('Статистика разбора ресурсов:\n\t{}'.format(cpu_statistics))
+
+    # Записываем итоговые метрики и профиль
+    metrics.shutdown()
+
+    if args.profile_dir:
+        profiler.shutdown()
+
     reporter = Reporter(args, results)
     reporter.report()
 